@@ -1,9 +1,14 @@
 """
 Application configuration using Pydantic Settings.
 """
+from pathlib import Path
+
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# 백엔드 디렉토리 (상대 경로 설정의 기준 - 서버 실행 위치와 무관)
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
 
 class Settings(BaseSettings):
     """Application settings"""
@@ -35,6 +40,23 @@ class Settings(BaseSettings):
     # NAS 설정
     nas_mount_path: str = "Z:\\ARCHIVE"  # Windows: Z:\ARCHIVE, Linux: /mnt/nas
     nas_use_real_data: bool = True  # True: 실제 NAS, False: Mock 데이터
+    nas_manifest_path: str = "data/nas_scan_manifest.db"  # 증분 스캔 매니페스트 (상대 경로는 백엔드 디렉토리 기준, 빈 값이면 미사용)
+    nas_watch_enabled: bool = False  # True: 시작 시 NAS 감시 모드 실행
+    nas_watch_backend: str = "auto"  # auto | inotify | polling (네트워크 마운트는 polling)
+    nas_watch_poll_interval: float = 30.0  # polling 주기 (초)
+
+    # UDM Viewer 설정
+    udm_file_path: str = ""  # 시작 시 로드할 UDM JSON 파일 (빈 값이면 미사용)
+    udm_watch_enabled: bool = False  # True: 파일 교체 / 델타 변경셋 자동 반영
+    udm_watch_interval: float = 5.0  # 감시 주기 (초)
+
+    @field_validator("nas_manifest_path")
+    @classmethod
+    def resolve_backend_path(cls, v: str) -> str:
+        """상대 경로 → 백엔드 디렉토리 기준 절대 경로 (빈 값은 그대로)"""
+        if v and not Path(v).is_absolute():
+            return str(BACKEND_DIR / v)
+        return v
 
     # Database (for future use)
     database_url: str = "postgresql://user:pass@db:5432/archive"
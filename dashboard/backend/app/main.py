@@ -1,17 +1,74 @@
 """
 FastAPI application entry point for Archive Dashboard Backend.
 """
+import threading
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
 from .routers import matching_router, nas_router, udm_viewer_router, pattern_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 처리 (초기 NAS 스캔, 감시 모드, UDM 파일 로드)"""
+    nas_service = None
+    udm_store = None
+
+    if settings.nas_use_real_data:
+        from .services.nas_service import get_nas_service
+
+        # 첫 요청이 스캔을 기다리지 않도록 시작 시 백그라운드 스캔
+        get_nas_service(settings.nas_mount_path, settings.nas_manifest_path or None).request_scan(
+            "incremental" if settings.nas_manifest_path else "full"
+        )
+
+    if settings.nas_use_real_data and settings.nas_watch_enabled:
+        from .routers.pattern import handle_nas_delta as pattern_delta
+        from .routers.udm_viewer import handle_nas_delta as udm_delta
+        from .services.nas_service import get_nas_service
+
+        nas_service = get_nas_service(settings.nas_mount_path, settings.nas_manifest_path or None)
+        nas_service.add_delta_listener(pattern_delta)
+        nas_service.add_delta_listener(udm_delta)
+        try:
+            nas_service.start_watch(
+                backend=settings.nas_watch_backend,
+                poll_interval=settings.nas_watch_poll_interval,
+            )
+        except Exception as e:
+            print(f"Failed to start NAS watch: {e}")
+
+    if settings.udm_file_path:
+        from .routers.udm_viewer import get_data_store
+
+        # 로드가 끝나야 감시를 시작할 수 있으므로 감시 모드면 워커 스레드에서 기다림
+        udm_store = get_data_store()
+        if settings.udm_watch_enabled:
+            def load_and_watch():
+                if udm_store.load_from_file(settings.udm_file_path):
+                    udm_store.start_watch(settings.udm_watch_interval)
+
+            threading.Thread(target=load_and_watch, name="udm-loader", daemon=True).start()
+        else:
+            udm_store.start_load(settings.udm_file_path)
+
+    yield
+
+    if nas_service is not None:
+        nas_service.stop_watch()
+    if udm_store is not None:
+        udm_store.stop_watch()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     debug=settings.debug,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -17,7 +17,7 @@ from ..schemas.matching import (
 # Mock 또는 Real 서비스 선택
 if settings.nas_use_real_data:
     from ..services.nas_service import get_nas_service
-    data_service = get_nas_service(settings.nas_mount_path)
+    data_service = get_nas_service(settings.nas_mount_path, settings.nas_manifest_path or None)
 else:
     from ..services.mock_data import MockDataService
     data_service = MockDataService()
@@ -3,6 +3,7 @@ NAS API endpoints.
 Provides folder tree and file listing functionality.
 """
 from fastapi import APIRouter, Query, HTTPException
+from starlette.concurrency import run_in_threadpool
 
 from ..config import settings
 from ..schemas.nas import NasFolderTreeResponse, NasFileListResponse
@@ -10,7 +11,7 @@ from ..schemas.nas import NasFolderTreeResponse, NasFileListResponse
 # Mock 또는 Real 서비스 선택
 if settings.nas_use_real_data:
     from ..services.nas_service import get_nas_service
-    data_service = get_nas_service(settings.nas_mount_path)
+    data_service = get_nas_service(settings.nas_mount_path, settings.nas_manifest_path or None)
 else:
     from ..services.mock_data import MockDataService
     data_service = MockDataService()
@@ -83,17 +84,19 @@ async def get_nas_status():
 @router.post("/refresh")
 async def refresh_nas_scan(
     mode: str = Query("full", description="Scan mode: 'full' or 'incremental'"),
+    wait: bool = Query(False, description="Wait for the scan to finish"),
 ):
     """
-    Force refresh NAS scan.
+    Queue a NAS rescan on the background worker.
 
     Args:
         mode: Scan mode
             - "full": Full rescan of all files
             - "incremental": Only scan new/modified files since last scan
+        wait: Run the scan in a worker thread and return its summary
 
     Returns:
-        dict: Scan result summary
+        dict: Queue status, or scan result summary when wait=true
     """
     if not settings.nas_use_real_data:
         return {"message": "Mock mode - no refresh needed", "mode": mode}
@@ -101,8 +104,16 @@ async def refresh_nas_scan(
     if mode not in ("full", "incremental"):
         raise HTTPException(status_code=400, detail="Invalid mode. Use 'full' or 'incremental'")
 
+    if not wait:
+        queued = data_service.request_scan(mode)
+        return {
+            "message": "Scan queued" if queued else "Scan already queued",
+            "mode": mode,
+            "status": data_service.get_scan_status(),
+        }
+
     try:
-        stats = data_service.refresh_scan(force=True, mode=mode)
+        stats = await run_in_threadpool(data_service.refresh_scan, force=True, mode=mode)
         return {
             "message": "Scan completed",
             "mode": stats.scan_mode,
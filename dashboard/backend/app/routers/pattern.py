@@ -4,7 +4,9 @@ Pattern Matching API Router
 파일명 패턴 매칭 통계 및 분석 API
 """
 
+import os
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -17,12 +19,17 @@ from ..config import settings
 project_root = Path(__file__).parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.models.udm import FILENAME_PATTERNS, parse_filename
+from src.models.udm import (
+    FILENAME_PATTERNS,
+    clear_parse_filename_cache,
+    parse_filename_cache_info,
+    parse_filename_with_pattern,
+)
 
 # NAS 서비스 import
 if settings.nas_use_real_data:
     from ..services.nas_service import get_nas_service
-    _nas_service = get_nas_service(settings.nas_mount_path)
+    _nas_service = get_nas_service(settings.nas_mount_path, settings.nas_manifest_path or None)
 else:
     from ..services.mock_data import MockDataService
     _nas_service = MockDataService()
@@ -106,53 +113,91 @@ class PatternTestResponse(BaseModel):
 
 
 class PatternDataStore:
-    """패턴 데이터 캐시"""
+    """패턴 데이터 캐시
+
+    NAS 감시 스레드(apply_delta)와 API 요청(조회)이 동시에 접근하므로
+    상태 변경과 조회는 모두 _lock 안에서 수행합니다.
+    """
 
     def __init__(self):
+        self._lock = threading.RLock()
         self._file_patterns: dict[str, str] = {}  # file_name -> pattern_name
         self._pattern_counts: dict[str, int] = {}  # pattern_name -> count
-        self._unmatched_files: list[str] = []
+        self._unmatched_files: dict[str, None] = {}  # 순서 유지 집합 (O(1) 제거)
         self._total_files: int = 0
         self._initialized: bool = False
 
     def initialize_from_nas_service(self):
         """NAS 서비스에서 파일 목록을 가져와 초기화"""
-        if self._initialized:
-            return
-
-        # Mock 데이터에서 파일명 추출
-        try:
-            items = _nas_service.get_matching_items()
-            file_names = [item.file_name for item in items]
-            self.update_from_files(file_names)
-            self._initialized = True
-        except Exception as e:
-            print(f"Failed to initialize pattern store: {e}")
+        with self._lock:
+            if self._initialized:
+                return
+
+            # Mock 데이터에서 파일명 추출
+            try:
+                items = _nas_service.get_matching_items()
+                file_names = [item.file_name for item in items]
+                self.update_from_files(file_names)
+                # 백그라운드 스캔이 끝나기 전이면 다음 조회 때 다시 초기화
+                self._initialized = getattr(_nas_service, "is_ready", True)
+            except Exception as e:
+                print(f"Failed to initialize pattern store: {e}")
 
     def update_from_files(self, file_names: list[str]):
         """파일 목록에서 패턴 매칭 결과 업데이트"""
-        self._file_patterns = {}
-        self._pattern_counts = {name: 0 for name in FILENAME_PATTERNS.keys()}
-        self._unmatched_files = []
-        self._total_files = len(file_names)
-
-        for file_name in file_names:
-            meta = parse_filename(file_name)
-            if meta.pattern_matched:
-                self._file_patterns[file_name] = meta.pattern_matched
-                self._pattern_counts[meta.pattern_matched] = (
-                    self._pattern_counts.get(meta.pattern_matched, 0) + 1
-                )
-            else:
-                self._unmatched_files.append(file_name)
+        with self._lock:
+            self._file_patterns = {}
+            self._pattern_counts = {name: 0 for name in FILENAME_PATTERNS.keys()}
+            self._unmatched_files = {}
+            self._total_files = len(file_names)
+
+            for file_name in file_names:
+                self._add_file(file_name)
+
+    def _add_file(self, file_name: str):
+        """단일 파일 패턴 매칭 결과 추가 (파싱 캐시 사용, _lock 보유 상태에서 호출)"""
+        pattern_name, _ = parse_filename_with_pattern(file_name)
+        if pattern_name:
+            self._file_patterns[file_name] = pattern_name
+            self._pattern_counts[pattern_name] = self._pattern_counts.get(pattern_name, 0) + 1
+        else:
+            self._unmatched_files[file_name] = None
+
+    def _remove_file(self, file_name: str):
+        """단일 파일 패턴 매칭 결과 제거 (_lock 보유 상태에서 호출)"""
+        pattern_name = self._file_patterns.pop(file_name, None)
+        if pattern_name is not None:
+            self._pattern_counts[pattern_name] = max(0, self._pattern_counts.get(pattern_name, 0) - 1)
+        else:
+            self._unmatched_files.pop(file_name, None)
+
+    def apply_delta(self, added: list[str], removed: list[str]):
+        """
+        NAS 증분 변경 반영 (전체 재매칭 없이 변경 파일만 처리)
+
+        Args:
+            added: 추가된 파일명
+            removed: 삭제된 파일명
+        """
+        with self._lock:
+            if not self._initialized:
+                # 아직 초기화 전이면 다음 조회 시 전체 목록으로 초기화
+                return
+
+            for file_name in removed:
+                self._remove_file(file_name)
+            for file_name in added:
+                self._add_file(file_name)
+            self._total_files = max(0, self._total_files + len(added) - len(removed))
 
     def get_stats(self) -> PatternStatsResponse:
         """통계 반환"""
-        self.initialize_from_nas_service()
+        with self._lock:
+            self.initialize_from_nas_service()
 
-        matched = len(self._file_patterns)
-        unmatched = len(self._unmatched_files)
-        total = self._total_files or (matched + unmatched)
+            matched = len(self._file_patterns)
+            unmatched = len(self._unmatched_files)
+            total = self._total_files or (matched + unmatched)
         rate = (matched / total * 100) if total > 0 else 0.0
 
         return PatternStatsResponse(
@@ -166,18 +211,26 @@ class PatternDataStore:
 
     def get_pattern_for_file(self, file_name: str) -> Optional[str]:
         """파일의 매칭된 패턴 반환"""
-        self.initialize_from_nas_service()
-        return self._file_patterns.get(file_name)
+        with self._lock:
+            self.initialize_from_nas_service()
+            return self._file_patterns.get(file_name)
 
     def get_pattern_counts(self) -> dict[str, int]:
-        """패턴별 매칭 수 반환"""
-        self.initialize_from_nas_service()
-        return self._pattern_counts
+        """패턴별 매칭 수 반환 (스냅샷)"""
+        with self._lock:
+            self.initialize_from_nas_service()
+            return dict(self._pattern_counts)
 
     def get_unmatched_files(self) -> list[str]:
-        """미매칭 파일 목록 반환"""
-        self.initialize_from_nas_service()
-        return self._unmatched_files
+        """미매칭 파일 목록 반환 (스냅샷)"""
+        with self._lock:
+            self.initialize_from_nas_service()
+            return list(self._unmatched_files)
+
+    def invalidate(self):
+        """다음 조회 시 NAS 파일 목록으로 다시 초기화"""
+        with self._lock:
+            self._initialized = False
 
 
 # Global store instance
@@ -189,6 +242,16 @@ def get_store() -> PatternDataStore:
     return _store
 
 
+def handle_nas_delta(delta):
+    """NAS 감시 증분 변경 리스너 (ScanDelta)"""
+    added = [f.filename for f in delta.added]
+    removed = [os.path.basename(rel_path) for rel_path in delta.deleted]
+    for old_path, f in delta.moved:
+        removed.append(os.path.basename(old_path))
+        added.append(f.filename)
+    _store.apply_delta(added, removed)
+
+
 # =============================================================================
 # Pattern Category Mapping
 # =============================================================================
@@ -356,9 +419,9 @@ async def get_file_pattern_match(file_name: str):
     Args:
         file_name: 파일명
     """
-    meta = parse_filename(file_name)
+    pattern_name, meta = parse_filename_with_pattern(file_name)
 
-    if meta.pattern_matched:
+    if pattern_name:
         extracted = {
             "code_prefix": meta.code_prefix,
             "year_code": meta.year_code,
@@ -372,7 +435,7 @@ async def get_file_pattern_match(file_name: str):
         return PatternMatchDetail(
             file_name=file_name,
             matched=True,
-            pattern_name=meta.pattern_matched,
+            pattern_name=pattern_name,
             confidence=98.0,
             extracted_fields=extracted,
         )
@@ -394,10 +457,10 @@ async def test_pattern(request: PatternTestRequest):
     파일명에 대해 패턴 매칭을 테스트합니다.
     """
     try:
-        meta = parse_filename(request.file_name)
+        pattern_name, meta = parse_filename_with_pattern(request.file_name)
 
         extracted = {}
-        if meta.pattern_matched:
+        if pattern_name:
             extracted = {
                 "code_prefix": meta.code_prefix,
                 "year_code": meta.year_code,
@@ -409,8 +472,8 @@ async def test_pattern(request: PatternTestRequest):
 
         return PatternTestResponse(
             success=True,
-            matched=meta.pattern_matched is not None,
-            pattern_name=meta.pattern_matched,
+            matched=pattern_name is not None,
+            pattern_name=pattern_name,
             extracted_groups=extracted,
         )
     except Exception as e:
@@ -428,5 +491,27 @@ async def refresh_pattern_cache():
 
     NAS 스캔 후 패턴 매칭 결과를 갱신합니다.
     """
-    # This would be called after NAS scan to update pattern statistics
-    return {"status": "refreshed", "message": "Pattern cache will be updated on next NAS scan"}
+    # 파싱 캐시는 유지되므로 변경 없는 파일명은 캐시에서 바로 반환
+    store = get_store()
+    store.invalidate()
+    stats = store.get_stats()
+
+    return {
+        "status": "refreshed",
+        "total_files": stats.total_files,
+        "matched_files": stats.matched_files,
+        "parse_cache": parse_filename_cache_info(),
+    }
+
+
+@router.get("/cache")
+async def get_parse_cache_info():
+    """파일명 파싱 캐시 통계 (hits, misses, size, maxsize, patterns_version)"""
+    return parse_filename_cache_info()
+
+
+@router.delete("/cache")
+async def clear_parse_cache():
+    """파일명 파싱 캐시 초기화"""
+    clear_parse_filename_cache()
+    return parse_filename_cache_info()
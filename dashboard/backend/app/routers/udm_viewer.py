@@ -4,16 +4,33 @@ UDM JSON Viewer API Router
 NAS에서 추출된 UDM JSON 데이터를 대시보드에서 조회하기 위한 API
 """
 
-import json
+import sys
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.extractors.path_inference import KeywordRules, PathInferenceEngine
+from src.extractors.serializer import get_serializer
+
+from ..services.udm_columns import ARROW_STREAM_MEDIA_TYPE, parse_fields
+from ..services.udm_index import DEFAULT_SORT, SORT_FIELDS, UdmIndex, segment_count
+from ..services.udm_loader import LoadProgress, load_udm_index, read_changeset
+from ..services.udm_reload import UdmFileWatcher
+
 router = APIRouter(prefix="/udm", tags=["UDM Viewer"])
 
+_SERIALIZER = get_serializer()
+
 
 # =============================================================================
 # Schemas
@@ -43,14 +60,23 @@ class UdmMetadata(BaseModel):
     total_segments: int
 
 
+class UdmPageInfo(BaseModel):
+    """목록 페이지 정보"""
+    total: int  # 필터 결과 수 (전체 페이지 합)
+    sort: str
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+
+
 class UdmDocumentResponse(BaseModel):
     """UDM 문서 응답"""
     metadata: UdmMetadata
     assets: list[UdmAssetSummary]
+    page: Optional[UdmPageInfo] = None
 
 
 class UdmStatsResponse(BaseModel):
     """UDM 통계 응답"""
+    version: Optional[str] = None  # 데이터 버전 ID (바뀌면 캐시 무효화)
     total_assets: int
     total_segments: int
     brand_distribution: dict[str, int]
@@ -79,134 +105,324 @@ class UdmAssetDetail(BaseModel):
 
 
 class UdmDataStore:
-    """UDM 데이터 저장소 (인메모리)"""
+    """
+    UDM 데이터 저장소 (인메모리)
+
+    로드 시 UdmIndex로 인덱싱하며, 변경 시 새 인덱스로 교체합니다
+    (참조 교체는 원자적이므로 조회 중인 요청은 이전 인덱스를 계속 사용).
+    파일 로드는 스트리밍으로 읽으며, 백그라운드 로드 중에도 이전 데이터로 응답합니다.
+    교체할 때마다 새 버전 ID를 부여합니다 (프론트엔드 캐시 키).
+    """
 
     def __init__(self):
-        self._data: dict | None = None
+        self._index: UdmIndex | None = None
         self._loaded_at: datetime | None = None
         self._file_path: str | None = None
-
-    def load_from_file(self, file_path: str) -> bool:
-        """JSON 파일에서 로드"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                self._data = json.load(f)
+        self._load_progress: LoadProgress | None = None
+        self._load_lock = threading.Lock()
+        self._write_lock = threading.RLock()  # 인덱스 교체 직렬화 (로드 / 변경 반영)
+        self._sync_lock = threading.RLock()  # 파일 로드 / 감시 확인 직렬화 (쓰기 잠금보다 먼저)
+        self._watcher: UdmFileWatcher | None = None
+
+        # 버전 ID: 프로세스 시작 시각 + 교체 순번 (재시작 후에도 겹치지 않음)
+        self._epoch = f"{int(time.time()):x}"
+        self._sequence = 0
+
+    def _swap(self, index: UdmIndex):
+        """새 인덱스 게시 (버전 부여 후 참조 교체)"""
+        with self._write_lock:
+            self._sequence += 1
+            index.version = f"{self._epoch}-{self._sequence}"
+            self._index = index
             self._loaded_at = datetime.now()
-            self._file_path = file_path
+
+    def _publish(self, data: dict):
+        self._swap(UdmIndex(data.get("_metadata", {}), data.get("assets", [])))
+
+    def load_from_file(self, file_path: str, progress: LoadProgress | None = None) -> bool:
+        """
+        JSON 파일에서 로드 (.json.gz / .json.zst 압축 파일도 그대로 읽음)
+
+        파싱은 쓰기 잠금 밖에서 하므로 그동안 변경 반영은 이전 인덱스에 적용되고,
+        교체 시 파일 내용으로 대체됩니다 (로드 직전에 반영된 변경과 같음).
+        감시 확인과는 sync 잠금으로 직렬화됩니다.
+        """
+        progress = progress or LoadProgress(file_path)
+        self._load_progress = progress
+        with self._sync_lock:
+            try:
+                index = load_udm_index(file_path, progress)
+            except Exception as e:
+                print(f"Error loading UDM file: {e}")
+                progress.finish(error=str(e))
+                return False
+
+            with self._write_lock:
+                self._swap(index)
+                self._file_path = file_path
+            # 감시 기준점 갱신은 쓰기 잠금 밖에서 (감시 확인과 같은 잠금 순서)
+            if self._watcher is not None:
+                self._watcher.reset(file_path, index.metadata.get("generated_at"))
+        progress.finish()
+        return True
+
+    def start_load(self, file_path: str) -> bool:
+        """
+        백그라운드 스레드에서 파일 로드
+
+        Returns:
+            시작 여부 (이미 로드 중이면 False)
+        """
+        with self._load_lock:
+            if self.is_loading:
+                return False
+            progress = LoadProgress(file_path)
+            self._load_progress = progress
+            threading.Thread(
+                target=self.load_from_file,
+                args=(file_path, progress),
+                name="udm-loader",
+                daemon=True,
+            ).start()
             return True
-        except Exception as e:
-            print(f"Error loading UDM file: {e}")
-            return False
+
+    @property
+    def is_loading(self) -> bool:
+        return self._load_progress is not None and self._load_progress.is_running
+
+    def load_status(self) -> dict:
+        """로드 / 감시 상태 (진행 중이면 진행률 포함)"""
+        progress = self._load_progress
+        return {
+            "loaded": self.is_loaded,
+            "file_path": self._file_path,
+            "loaded_at": self._loaded_at,
+            "version": self.version,
+            "total_assets": self.total_assets,
+            "loading": self.is_loading,
+            "load_progress": progress.to_dict() if progress is not None else None,
+            "watch": self._watcher.status() if self._watcher is not None else None,
+        }
 
     def load_from_dict(self, data: dict) -> bool:
         """딕셔너리에서 로드"""
-        self._data = data
-        self._loaded_at = datetime.now()
-        self._file_path = None
+        with self._write_lock:
+            self._publish(data)
+            self._file_path = None
         return True
 
     @property
     def is_loaded(self) -> bool:
-        return self._data is not None
+        return self._index is not None
+
+    @property
+    def index(self) -> UdmIndex | None:
+        """현재 인덱스"""
+        return self._index
+
+    @property
+    def version(self) -> str | None:
+        """현재 데이터 버전 ID"""
+        return self._index.version if self._index is not None else None
 
     @property
     def metadata(self) -> dict | None:
-        if not self._data:
+        if self._index is None:
             return None
-        return self._data.get("_metadata", {})
+        return self._index.metadata
+
+    @property
+    def total_assets(self) -> int:
+        return len(self._index) if self._index is not None else 0
 
     @property
     def assets(self) -> list[dict]:
-        if not self._data:
+        """현재 Asset 목록 (요약일 수 있음)"""
+        if self._index is None:
             return []
-        return self._data.get("assets", [])
+        return list(self._index.iter_assets())
 
     def get_asset(self, asset_uuid: str) -> dict | None:
-        for asset in self.assets:
-            if asset.get("asset_uuid") == asset_uuid:
-                return asset
-        return None
+        """원본 Asset 조회 (요약만 보관 중이면 파일에서 읽음)"""
+        if self._index is None:
+            return None
+        return self._index.get(asset_uuid)
 
-    def search_assets(
+    def page_assets(
         self,
         brand: str | None = None,
         asset_type: str | None = None,
         year: int | None = None,
         search: str | None = None,
+        sort: str = DEFAULT_SORT,
+        cursor: str | None = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[dict]:
-        """Asset 검색"""
-        results = []
-
-        for asset in self.assets:
-            # 브랜드 필터
-            if brand:
-                asset_brand = asset.get("event_context", {}).get("brand", "")
-                if asset_brand.upper() != brand.upper():
-                    continue
-
-            # Asset Type 필터
-            if asset_type:
-                if asset.get("asset_type", "").upper() != asset_type.upper():
-                    continue
-
-            # 연도 필터
-            if year:
-                asset_year = asset.get("event_context", {}).get("year")
-                if asset_year != year:
-                    continue
-
-            # 검색어 필터
-            if search:
-                file_name = asset.get("file_name", "").lower()
-                if search.lower() not in file_name:
-                    continue
-
-            results.append(asset)
-
-        # 페이징
-        return results[offset:offset + limit]
+        full: bool = False,
+    ) -> tuple[list[dict], int, str | None]:
+        """
+        키셋 페이지 조회 (한 인덱스 버전에서 페이지와 결과 수를 함께 구함)
+
+        Returns:
+            (Asset 목록, 필터 결과 수, 다음 페이지 커서)
+
+        Raises:
+            ValueError: 알 수 없는 정렬 필드 또는 잘못된 커서
+        """
+        index = self._index
+        if index is None:
+            return [], 0, None
+        assets, next_cursor = index.page(
+            brand, asset_type, year, search, sort, cursor, limit, offset, full,
+        )
+        return assets, index.count(brand, asset_type, year, search), next_cursor
+
+    def page_columns(
+        self,
+        fields: list[str],
+        brand: str | None = None,
+        asset_type: str | None = None,
+        year: int | None = None,
+        search: str | None = None,
+        sort: str = DEFAULT_SORT,
+        cursor: str | None = None,
+        limit: int = 100,
+        arrow: bool = False,
+    ) -> tuple[dict | bytes, dict]:
+        """
+        키셋 페이지의 열 조회 (로드 시 추출한 열에서 잘라냄)
+
+        Args:
+            fields: 열 이름 (udm_columns.COLUMN_SPECS)
+            arrow: Arrow IPC 스트림으로 반환 (pyarrow 필요)
+
+        Returns:
+            ({열 이름: 값 목록} 또는 Arrow IPC 바이트,
+             페이지 정보 {version, filtered, rows, next_cursor} - 열과 같은 인덱스 버전)
+
+        Raises:
+            ValueError: 알 수 없는 정렬 필드 또는 잘못된 커서
+            ImportError: arrow인데 pyarrow 미설치
+        """
+        index = self._index
+        if index is None:
+            index = UdmIndex({}, [])
+        positions, next_cursor = index.page_positions(
+            brand, asset_type, year, search, sort, cursor, limit,
+        )
+        if arrow:
+            data = index.columns.to_arrow_ipc(fields, positions)
+        else:
+            data = index.columns.project(fields, positions)
+        return data, {
+            "version": index.version,
+            "filtered": index.count(brand, asset_type, year, search),
+            "rows": len(positions),
+            "next_cursor": next_cursor,
+        }
+
+    def apply_changes(self, upserts: list[dict], removed_uuids: set[str]) -> bool:
+        """
+        asset_uuid 기준 변경 반영 (바뀐 부분만 다시 인덱싱한 새 버전으로 교체)
+
+        Args:
+            upserts: 추가/수정된 원본 Asset
+            removed_uuids: 삭제된 asset_uuid
+
+        Returns:
+            반영 여부 (로드된 데이터 없음 = False)
+        """
+        with self._write_lock:
+            current = self._index
+            if current is None:
+                return False
+
+            index = current.with_changes(dict(current.metadata), upserts, removed_uuids)
+            index.metadata["total_assets"] = len(index)
+            index.metadata["total_segments"] = index.total_segments
+            index.metadata["updated_at"] = datetime.now().isoformat()
+            self._swap(index)
+        return True
+
+    def apply_changeset(self, changeset_path: str | Path):
+        """델타 내보내기 변경셋(JSONL) 반영"""
+        upserts, removed = read_changeset(changeset_path)
+        self.apply_changes(upserts, removed)
+
+    def apply_delta(self, upserts: list[dict], removed_paths: set[str]) -> bool:
+        """
+        NAS 증분 변경 반영
+
+        NAS 스캔으로 생성된 데이터(source == "nas_scan")에만 적용하며,
+        file_path_nas가 같은 Asset을 삭제/교체합니다.
+
+        Args:
+            upserts: 추가/수정된 Asset
+            removed_paths: 삭제된 파일의 NAS 경로
+
+        Returns:
+            반영 여부
+        """
+        with self._write_lock:
+            if self._index is None or (self.metadata or {}).get("source") != "nas_scan":
+                return False
+
+            replaced = {a["file_path_nas"] for a in upserts} | removed_paths
+            removed_uuids = {
+                a["asset_uuid"] for a in self._index.iter_assets()
+                if a.get("file_path_nas") in replaced
+            }
+            return self.apply_changes(upserts, removed_uuids)
+
+    # -------------------------------------------------------------------------
+    # 핫 리로드
+    # -------------------------------------------------------------------------
+
+    def _reload(self, file_path: str):
+        if not self.load_from_file(file_path):
+            raise RuntimeError(f"Failed to reload {file_path}")
+
+    def start_watch(self, interval: float = 5.0) -> bool:
+        """
+        로드한 파일 감시 시작 (파일 교체 시 다시 로드, 파일 생성 이후 델타 변경셋은 증분 반영)
+
+        Returns:
+            시작 여부 (파일에서 로드한 데이터가 없으면 False)
+        """
+        with self._write_lock:
+            if self._file_path is None:
+                return False
+            if self._watcher is None:
+                self._watcher = UdmFileWatcher(
+                    self._file_path, self._reload, self.apply_changeset, interval,
+                    baseline=self._index.metadata.get("generated_at"),
+                    sync_lock=self._sync_lock,
+                )
+            else:
+                self._watcher.interval = interval
+            self._watcher.start()
+            return True
+
+    def stop_watch(self):
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    @property
+    def is_watching(self) -> bool:
+        return self._watcher is not None and self._watcher.is_running
 
     def get_stats(self) -> dict:
-        """통계 계산"""
-        if not self.assets:
+        """통계 (로드 시 미리 계산)"""
+        if self._index is None:
             return {
+                "version": None,
                 "total_assets": 0,
                 "total_segments": 0,
                 "brand_distribution": {},
                 "asset_type_distribution": {},
                 "year_distribution": {},
             }
-
-        brand_counts: dict[str, int] = {}
-        asset_type_counts: dict[str, int] = {}
-        year_counts: dict[str, int] = {}
-        total_segments = 0
-
-        for asset in self.assets:
-            # 브랜드
-            brand = asset.get("event_context", {}).get("brand", "unknown")
-            brand_counts[brand] = brand_counts.get(brand, 0) + 1
-
-            # Asset Type
-            asset_type = asset.get("asset_type", "unknown")
-            asset_type_counts[asset_type] = asset_type_counts.get(asset_type, 0) + 1
-
-            # 연도
-            year = str(asset.get("event_context", {}).get("year", "unknown"))
-            year_counts[year] = year_counts.get(year, 0) + 1
-
-            # Segment
-            total_segments += len(asset.get("segments", []))
-
-        return {
-            "total_assets": len(self.assets),
-            "total_segments": total_segments,
-            "brand_distribution": brand_counts,
-            "asset_type_distribution": asset_type_counts,
-            "year_distribution": year_counts,
-        }
+        return {"version": self._index.version, **self._index.stats()}
 
 
 # Global data store
@@ -218,6 +434,21 @@ def get_data_store() -> UdmDataStore:
     return _data_store
 
 
+def handle_nas_delta(delta):
+    """NAS 감시 증분 변경 리스너 (ScanDelta)"""
+    from ..config import settings
+    from ..services.nas_service import get_nas_service
+
+    nas_service = get_nas_service(settings.nas_mount_path, settings.nas_manifest_path or None)
+
+    changed = delta.added + delta.modified + [f for _, f in delta.moved]
+    upserts = [_parse_nas_file_to_udm(nas_service.to_matching_item(f)) for f in changed]
+    removed_paths = {nas_service.absolute_path(p) for p in delta.deleted}
+    removed_paths |= {nas_service.absolute_path(old_path) for old_path, _ in delta.moved}
+
+    _data_store.apply_delta(upserts, removed_paths)
+
+
 # =============================================================================
 # Demo Data Generator
 # =============================================================================
@@ -281,6 +512,14 @@ def generate_demo_data() -> dict:
 # =============================================================================
 
 
+def _page_assets(store: UdmDataStore, *args, **kwargs) -> tuple[list[dict], int, Optional[str]]:
+    """키셋 페이지 조회 (잘못된 정렬/커서는 400)"""
+    try:
+        return store.page_assets(*args, **kwargs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/", response_model=UdmDocumentResponse)
 async def get_udm_document(
     brand: Optional[str] = Query(None, description="브랜드 필터"),
@@ -288,9 +527,15 @@ async def get_udm_document(
     year: Optional[int] = Query(None, description="연도 필터"),
     search: Optional[str] = Query(None, description="파일명 검색"),
     limit: int = Query(100, ge=1, le=500, description="결과 수 제한"),
-    offset: int = Query(0, ge=0, description="오프셋"),
+    sort: str = Query(DEFAULT_SORT, description=f"정렬 ({', '.join(SORT_FIELDS)}, '-' 접두사는 내림차순)"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    offset: int = Query(0, ge=0, description="오프셋 (커서 다음에서 건너뛸 수, cursor 권장)"),
 ):
-    """UDM 문서 조회"""
+    """
+    UDM 문서 조회 (키셋 페이지)
+
+    다음 페이지는 응답의 page.next_cursor를 cursor로 넘겨 조회합니다.
+    """
     store = get_data_store()
 
     # 데이터가 없으면 데모 데이터 로드
@@ -298,13 +543,8 @@ async def get_udm_document(
         store.load_from_dict(generate_demo_data())
 
     metadata = store.metadata or {}
-    assets = store.search_assets(
-        brand=brand,
-        asset_type=asset_type,
-        year=year,
-        search=search,
-        limit=limit,
-        offset=offset,
+    assets, total, next_cursor = _page_assets(
+        store, brand, asset_type, year, search, sort, cursor, limit, offset,
     )
 
     # Asset 요약 변환
@@ -321,7 +561,7 @@ async def get_udm_document(
             season=ctx.get("season"),
             episode=ctx.get("episode"),
             source_origin=asset.get("source_origin", ""),
-            segment_count=len(asset.get("segments", [])),
+            segment_count=segment_count(asset),
         )
         asset_summaries.append(summary)
 
@@ -334,6 +574,7 @@ async def get_udm_document(
             total_segments=metadata.get("total_segments", 0),
         ),
         assets=asset_summaries,
+        page=UdmPageInfo(total=total, sort=sort, next_cursor=next_cursor),
     )
 
 
@@ -344,10 +585,12 @@ async def get_full_assets(
     year: Optional[int] = Query(None, description="연도 필터"),
     search: Optional[str] = Query(None, description="파일명 검색"),
     limit: int = Query(500, ge=1, le=1000, description="결과 수 제한"),
-    offset: int = Query(0, ge=0, description="오프셋"),
+    sort: str = Query(DEFAULT_SORT, description=f"정렬 ({', '.join(SORT_FIELDS)}, '-' 접두사는 내림차순)"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    offset: int = Query(0, ge=0, description="오프셋 (커서 다음에서 건너뛸 수, cursor 권장)"),
 ):
     """
-    전체 Asset 데이터 조회 (매트릭스 뷰용)
+    전체 Asset 데이터 조회 (매트릭스 뷰용, 키셋 페이지)
     모든 중첩 필드 포함
     """
     store = get_data_store()
@@ -356,23 +599,72 @@ async def get_full_assets(
     if not store.is_loaded:
         store.load_from_dict(generate_demo_data())
 
-    assets = store.search_assets(
-        brand=brand,
-        asset_type=asset_type,
-        year=year,
-        search=search,
-        limit=limit,
-        offset=offset,
+    assets, filtered, next_cursor = _page_assets(
+        store, brand, asset_type, year, search, sort, cursor, limit, offset, full=True,
     )
 
     # 전체 데이터 반환 (중첩 필드 포함)
     return {
-        "total": len(store.assets),
-        "filtered": len(assets),
+        "total": store.total_assets,
+        "filtered": filtered,
+        "sort": sort,
+        "next_cursor": next_cursor,
         "assets": assets,
     }
 
 
+@router.get("/columns")
+async def get_asset_columns(
+    fields: Optional[str] = Query(None, description="열 이름 (쉼표 구분, 예: file_name,event_context.brand / 없으면 전체)"),
+    brand: Optional[str] = Query(None, description="브랜드 필터"),
+    asset_type: Optional[str] = Query(None, description="Asset Type 필터"),
+    year: Optional[int] = Query(None, description="연도 필터"),
+    search: Optional[str] = Query(None, description="파일명 검색"),
+    limit: int = Query(50000, ge=1, le=100000, description="결과 수 제한"),
+    sort: str = Query(DEFAULT_SORT, description=f"정렬 ({', '.join(SORT_FIELDS)}, '-' 접두사는 내림차순)"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    format: str = Query("json", pattern="^(json|arrow)$", description="json | arrow (Arrow IPC 스트림)"),
+):
+    """
+    Asset 열 조회 (매트릭스 뷰용 컬럼형 응답)
+
+    요청한 열만 열 단위 배열로 반환하며, Enum 열(brand, asset_type 등)은
+    {"dictionary": [...], "indices": [...]}로 딕셔너리 인코딩합니다.
+    format=arrow이면 같은 내용을 Arrow IPC 스트림으로 반환하고
+    페이지 정보는 X-Total-Count / X-Next-Cursor / X-Udm-Version 헤더로 전달합니다.
+    """
+    store = get_data_store()
+
+    if not store.is_loaded:
+        store.load_from_dict(generate_demo_data())
+
+    try:
+        names = parse_fields(fields)
+        data, page = store.page_columns(
+            names, brand, asset_type, year, search, sort, cursor, limit, arrow=format == "arrow",
+        )
+    except ImportError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if format == "arrow":
+        headers = {"X-Total-Count": str(page["filtered"]), "X-Udm-Version": page["version"] or ""}
+        if page["next_cursor"]:
+            headers["X-Next-Cursor"] = page["next_cursor"]
+        return Response(data, media_type=ARROW_STREAM_MEDIA_TYPE, headers=headers)
+
+    # 열 배열을 그대로 직렬화 (응답 모델 검증/변환 생략)
+    content = {
+        **page,
+        "total": store.total_assets,
+        "sort": sort,
+        "fields": names,
+        "columns": data,
+    }
+    return Response(_SERIALIZER.dumps(content), media_type="application/json")
+
+
 @router.get("/stats", response_model=UdmStatsResponse)
 async def get_udm_stats():
     """UDM 통계 조회"""
@@ -384,6 +676,7 @@ async def get_udm_stats():
     stats = store.get_stats()
 
     return UdmStatsResponse(
+        version=stats["version"],
         total_assets=stats["total_assets"],
         total_segments=stats["total_segments"],
         brand_distribution=stats["brand_distribution"],
@@ -421,23 +714,68 @@ async def get_asset_detail(asset_uuid: str):
 
 
 @router.post("/load")
-async def load_udm_file(file_path: str):
-    """UDM JSON 파일 로드"""
+async def load_udm_file(
+    file_path: str,
+    background: bool = Query(False, description="Load in the background and return immediately"),
+):
+    """
+    UDM JSON 파일 로드 (스트리밍)
+
+    기본은 로드가 끝난 뒤 반환합니다. background=true이면 백그라운드 로드 후 바로
+    반환하며, 진행 상황은 GET /udm/load/status로 조회합니다.
+    어느 쪽이든 로드가 끝날 때까지 이전 데이터로 응답합니다.
+    """
     store = get_data_store()
 
     if not Path(file_path).exists():
         raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
 
-    if not store.load_from_file(file_path):
+    if background:
+        if not store.start_load(file_path):
+            raise HTTPException(status_code=409, detail="Another file is already loading")
+        return {
+            "success": True,
+            "message": f"Loading {file_path}",
+            "status": store.load_status(),
+        }
+
+    if store.is_loading:
+        raise HTTPException(status_code=409, detail="Another file is already loading")
+    if not await run_in_threadpool(store.load_from_file, file_path):
         raise HTTPException(status_code=500, detail="Failed to load file")
 
     return {
         "success": True,
-        "message": f"Loaded {len(store.assets)} assets from {file_path}",
-        "total_assets": len(store.assets),
+        "message": f"Loaded {store.total_assets} assets from {file_path}",
+        "total_assets": store.total_assets,
     }
 
 
+@router.get("/load/status")
+async def get_load_status():
+    """UDM 파일 로드 진행 상황 (감시 중이면 감시 상태 포함)"""
+    return get_data_store().load_status()
+
+
+@router.post("/watch")
+async def set_udm_watch(
+    enabled: bool = True,
+    interval: float = Query(5.0, gt=0, description="Polling interval (seconds)"),
+):
+    """
+    로드한 UDM 파일 핫 리로드 켜기/끄기
+
+    파일이 교체되면 다시 로드하고, 같은 디렉토리의 델타 내보내기 변경셋은
+    바뀐 Asset만 반영합니다. 반영할 때마다 /udm/stats의 version이 바뀝니다.
+    """
+    store = get_data_store()
+    if not enabled:
+        store.stop_watch()
+    elif not store.start_watch(interval):
+        raise HTTPException(status_code=409, detail="No UDM file loaded from disk")
+    return store.load_status()
+
+
 @router.post("/demo")
 async def load_demo_data():
     """데모 데이터 로드"""
@@ -446,8 +784,8 @@ async def load_demo_data():
 
     return {
         "success": True,
-        "message": f"Loaded {len(store.assets)} demo assets",
-        "total_assets": len(store.assets),
+        "message": f"Loaded {store.total_assets} demo assets",
+        "total_assets": store.total_assets,
     }
 
 
@@ -462,15 +800,15 @@ async def load_from_nas():
     # NAS 서비스 가져오기
     if settings.nas_use_real_data:
         from ..services.nas_service import get_nas_service
-        nas_service = get_nas_service(settings.nas_mount_path)
+        nas_service = get_nas_service(settings.nas_mount_path, settings.nas_manifest_path or None)
     else:
         from ..services.mock_data import MockDataService
         nas_service = MockDataService()
 
-    # NAS 스캔 실행
+    # NAS 스캔 실행 (이벤트 루프를 막지 않도록 워커 스레드에서 실행)
     try:
         if hasattr(nas_service, 'refresh_scan'):
-            nas_service.refresh_scan(force=True)
+            await run_in_threadpool(nas_service.refresh_scan, force=True)
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"NAS scan failed: {e}")
 
@@ -504,6 +842,39 @@ async def load_from_nas():
     }
 
 
+# 경로 추론 규칙 (선언 순서 = 우선순위)
+_PATH_INFERENCE = PathInferenceEngine(
+    # 파일명에서 먼저 확인, 없으면 경로에서
+    brand=KeywordRules(
+        {
+            "WSOP": ["WSOP", "WSOPC", "WSOPE", "WSOPP"],
+            "HCL": ["HCL", "HUSTLER"],
+            "PAD": ["PAD", "POKERAFTERDARK"],
+            "GGMillions": ["GGMILLIONS", "GGM"],
+            "MPP": ["MPP", "MAJOR"],
+            "GOG": ["GOG", "GAMEOFGOLD"],
+            "WPT": ["WPT"],
+            "EPT": ["EPT"],
+        },
+        scope="filename_first",
+    ),
+    asset_type=KeywordRules(
+        {
+            "STREAM": ["STREAM"],
+            "SUBCLIP": ["SUBCLIP", "SUB"],
+            "HAND_CLIP": ["HAND"],
+            "MASTER": ["MASTER"],
+            "CLEAN": ["CLEAN"],
+            "RAW": ["RAW"],
+            "MOV": ["MOV"],
+            "MXF": ["MXF"],
+        },
+        default="GENERIC",
+    ),
+    event_type=KeywordRules({"CIRCUIT": ["CIRCUIT", "WCLA"]}, scope="filename"),
+)
+
+
 def _parse_nas_file_to_udm(item) -> dict:
     """NAS 파일 정보를 UDM Asset으로 변환"""
     import re
@@ -521,14 +892,17 @@ def _parse_nas_file_to_udm(item) -> dict:
     file_name_upper = file_name.upper()
     path_upper = nas_info.path.upper()
 
+    # 브랜드 / Asset Type / 이벤트 키워드 추론 (한 번에)
+    inference = _PATH_INFERENCE.infer(nas_info.path)
+
     # 브랜드 추출 (경로 또는 파일명에서)
-    brand = nas_info.inferred_brand or _extract_brand(path_upper, file_name_upper)
+    brand = nas_info.inferred_brand or inference.brand
 
     # 연도 추출
     year = _extract_year(nas_info.path, file_name)
 
     # Asset Type 추출 (경로에서)
-    asset_type = _extract_asset_type(path_upper)
+    asset_type = inference.asset_type
 
     # 시즌/에피소드 추출 (파일명에서)
     season, episode = _extract_season_episode(file_name)
@@ -559,7 +933,7 @@ def _parse_nas_file_to_udm(item) -> dict:
         "event_context": {
             "year": year,
             "brand": brand,
-            "event_type": _infer_event_type(brand, file_name_upper),
+            "event_type": _infer_event_type(brand, inference.event_type, file_name_upper),
             "location": location,
             "venue": None,
             "event_number": event_number,
@@ -586,34 +960,6 @@ def _parse_nas_file_to_udm(item) -> dict:
     }
 
 
-def _extract_brand(path_upper: str, file_name_upper: str) -> Optional[str]:
-    """브랜드 추출"""
-    brands = {
-        "WSOP": ["WSOP", "WSOPC", "WSOPE", "WSOPP"],
-        "HCL": ["HCL", "HUSTLER"],
-        "PAD": ["PAD", "POKERAFTERDARK"],
-        "GGMillions": ["GGMILLIONS", "GGM"],
-        "MPP": ["MPP", "MAJOR"],
-        "GOG": ["GOG", "GAMEOFGOLD"],
-        "WPT": ["WPT"],
-        "EPT": ["EPT"],
-    }
-
-    # 파일명에서 먼저 확인
-    for brand, keywords in brands.items():
-        for kw in keywords:
-            if kw in file_name_upper:
-                return brand
-
-    # 경로에서 확인
-    for brand, keywords in brands.items():
-        for kw in keywords:
-            if kw in path_upper:
-                return brand
-
-    return None
-
-
 def _extract_year(path: str, file_name: str) -> Optional[int]:
     """연도 추출"""
     import re
@@ -633,27 +979,6 @@ def _extract_year(path: str, file_name: str) -> Optional[int]:
     return None
 
 
-def _extract_asset_type(path_upper: str) -> str:
-    """Asset Type 추출"""
-    if "STREAM" in path_upper:
-        return "STREAM"
-    elif "SUBCLIP" in path_upper or "SUB" in path_upper:
-        return "SUBCLIP"
-    elif "HAND" in path_upper:
-        return "HAND_CLIP"
-    elif "MASTER" in path_upper:
-        return "MASTER"
-    elif "CLEAN" in path_upper:
-        return "CLEAN"
-    elif "RAW" in path_upper:
-        return "RAW"
-    elif "MOV" in path_upper:
-        return "MOV"
-    elif "MXF" in path_upper:
-        return "MXF"
-    return "GENERIC"
-
-
 def _extract_season_episode(file_name: str) -> tuple[Optional[int], Optional[int]]:
     """시즌/에피소드 추출"""
     import re
@@ -744,14 +1069,18 @@ def _extract_location(path_upper: str, file_name_upper: str) -> Optional[str]:
     return None
 
 
-def _infer_event_type(brand: Optional[str], file_name_upper: str) -> Optional[str]:
-    """이벤트 타입 추론"""
+def _infer_event_type(
+    brand: Optional[str],
+    event_keyword: Optional[str],
+    file_name_upper: str,
+) -> Optional[str]:
+    """이벤트 타입 추론 (event_keyword: 추론 엔진의 파일명 키워드 결과)"""
     if not brand:
         return None
 
     if brand in ["HCL", "PAD"]:
         return "CASH_GAME_SHOW"
-    elif "CIRCUIT" in file_name_upper or "WCLA" in file_name_upper:
+    elif event_keyword == "CIRCUIT":
         return "CIRCUIT"
     elif "MAIN" in file_name_upper and "EVENT" in file_name_upper:
         return "BRACELET"
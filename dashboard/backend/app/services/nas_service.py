@@ -3,28 +3,34 @@ NAS 실시간 스캐너 서비스
 
 실제 NAS 파일시스템과 대시보드를 연결합니다.
 기존 src/extractors/nas_scanner.py를 활용합니다.
+매니페스트 경로가 설정되면 스캔 상태를 디스크에 저장하여
+재시작 후에도 증분 스캔을 이어갑니다.
+감시 모드에서는 NAS 변경을 증분 반영하고 리스너에 전달합니다.
+
+스캔은 백그라운드 워커에서 실행되며, 완료 시 새 NasSnapshot으로
+교체됩니다. 조회 메서드는 항상 현재 스냅샷을 즉시 반환합니다.
 """
+import os
 import sys
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
-
-# src/extractors/nas_scanner.py 직접 import (패키지 __init__ 우회)
-_nas_scanner_path = Path(__file__).parent.parent.parent.parent.parent / "src" / "extractors"
-sys.path.insert(0, str(_nas_scanner_path))
-
-# nas_scanner 모듈만 직접 import (extractors 패키지의 __init__.py 우회)
-import importlib.util
-_spec = importlib.util.spec_from_file_location(
-    "nas_scanner",
-    _nas_scanner_path / "nas_scanner.py"
+from typing import Callable, Literal
+
+# 프로젝트 루트를 경로에 추가 (src.extractors 패키지 import)
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.extractors.nas_scanner import (
+    NasScanner,
+    NasFileInfo as SrcNasFileInfo,
+    ScanDelta,
+    ScanProgress,
+    ScanResult,
 )
-_nas_scanner_module = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_nas_scanner_module)
-
-NasScanner = _nas_scanner_module.NasScanner
-SrcNasFileInfo = _nas_scanner_module.NasFileInfo
-ScanResult = _nas_scanner_module.ScanResult
+from src.extractors.nas_watcher import NasWatcher, WatchBackend
+from src.extractors.scan_manifest import ScanManifest
 
 from ..schemas.matching import (
     NasFileInfo,
@@ -34,20 +40,64 @@ from ..schemas.matching import (
 )
 from ..schemas.nas import NasFolder, NasFile
 
+# 증분 변경 리스너 (감시 스레드에서 호출)
+DeltaListener = Callable[[ScanDelta], None]
+
+ScanMode = Literal["full", "incremental"]
+
+
+@dataclass(frozen=True)
+class NasSnapshot:
+    """
+    스캔 결과 스냅샷 (불변)
+
+    스캔 완료 시 새 인스턴스로 통째로 교체되므로 조회 측은
+    참조 하나만 읽으면 일관된 파일 목록/통계를 얻습니다.
+    """
+
+    files: tuple[SrcNasFileInfo, ...] = ()
+    stats: ScanResult = field(default_factory=ScanResult)
+    scanned_at: datetime | None = None
+    version: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        """아직 스캔 결과가 없는지 여부"""
+        return self.version == 0
+
 
 class NasRealTimeService:
     """실제 NAS 파일시스템 서비스"""
 
-    def __init__(self, nas_path: str = "Z:\\ARCHIVE"):
+    def __init__(
+        self,
+        nas_path: str = "Z:\\ARCHIVE",
+        manifest_path: str | None = None,
+    ):
         """
         Args:
             nas_path: NAS 마운트 경로 (기본값: Z:\\ARCHIVE)
+            manifest_path: 스캔 매니페스트 SQLite 경로 (None이면 메모리 캐시만 사용)
         """
         self.nas_path = nas_path
+        self.manifest_path = manifest_path
         self._scanner: NasScanner | None = None
-        self._cached_files: list[SrcNasFileInfo] = []
-        self._cached_stats: ScanResult | None = None
-        self._last_scan: datetime | None = None
+        self._manifest: ScanManifest | None = None
+
+        # 현재 스냅샷 (교체만 하고 수정하지 않음)
+        self._snapshot = NasSnapshot()
+
+        # 스캔/감시 스레드 간 매니페스트 접근 직렬화
+        self._scan_lock = threading.RLock()
+        self._watcher: NasWatcher | None = None
+        self._delta_listeners: list[DeltaListener] = []
+
+        # 백그라운드 스캔 워커
+        self._worker: threading.Thread | None = None
+        self._worker_cond = threading.Condition()
+        self._pending_mode: ScanMode | None = None
+        self._progress: ScanProgress | None = None
+        self._last_error: str | None = None
 
     @property
     def scanner(self) -> NasScanner:
@@ -60,13 +110,46 @@ class NasRealTimeService:
             )
         return self._scanner
 
+    @property
+    def manifest(self) -> ScanManifest | None:
+        """스캔 매니페스트 (지연 초기화, 미설정 시 None)"""
+        if self._manifest is None and self.manifest_path:
+            self._manifest = ScanManifest(self.manifest_path, root_path=self.nas_path)
+        return self._manifest
+
+    @property
+    def snapshot(self) -> NasSnapshot:
+        """현재 스냅샷"""
+        return self._snapshot
+
+    @property
+    def is_ready(self) -> bool:
+        """스캔 결과가 한 번 이상 게시되었는지 여부"""
+        return not self._snapshot.is_empty
+
+    def _publish(self, files: list[SrcNasFileInfo], stats: ScanResult):
+        """새 스냅샷 게시 (참조 교체는 원자적)"""
+        self._snapshot = NasSnapshot(
+            files=tuple(files),
+            stats=stats,
+            scanned_at=datetime.now(),
+            version=self._snapshot.version + 1,
+        )
+
+    # =========================================================================
+    # 스캔
+    # =========================================================================
+
     def refresh_scan(
         self,
         force: bool = False,
-        mode: Literal["full", "incremental"] = "full",
+        mode: ScanMode = "full",
     ) -> ScanResult:
         """
-        NAS 스캔 실행/갱신
+        NAS 스캔 실행/갱신 (동기, 호출 스레드에서 실행)
+
+        요청 경로에서는 request_scan()으로 백그라운드 워커에 맡기고,
+        CLI/스크립트 등 결과를 기다려야 하는 곳에서만 사용합니다.
 
         Args:
             force: 강제 갱신 여부
@@ -78,38 +161,284 @@ class NasRealTimeService:
             ScanResult: 스캔 결과
         """
         # 캐시가 있고 강제 갱신이 아니면 캐시 반환
-        if not force and self._cached_stats is not None:
-            return self._cached_stats
+        if not force and not self._snapshot.is_empty:
+            return self._snapshot.stats
+
+        with self._scan_lock:
+            progress = ScanProgress()
+            self._progress = progress
+            try:
+                # 매니페스트 기반 스캔 (디스크에 상태 유지)
+                if self.manifest is not None:
+                    self._refresh_with_manifest(mode, progress=progress)
+                else:
+                    self._refresh_full(mode, progress)
+            finally:
+                progress.finish()
+
+        return self._snapshot.stats
+
+    def _refresh_full(self, mode: ScanMode, progress: ScanProgress):
+        """매니페스트 없이 os.scandir 전체 스캔"""
+        current = self._snapshot
 
         # 증분 스캔 파라미터 준비
         since = None
         known_files: set[str] = set()
 
-        if mode == "incremental" and self._last_scan is not None:
-            since = self._last_scan
-            known_files = {f.path for f in self._cached_files}
+        if mode == "incremental" and current.scanned_at is not None:
+            since = current.scanned_at
+            known_files = {f.path for f in current.files}
 
         # 스캔 실행
         new_files, stats = self.scanner.scan_with_stats(
             video_only=True,
             since=since,
             known_files=known_files,
+            progress=progress,
         )
 
-        # 증분 모드: 새 파일을 기존 캐시에 추가
-        if mode == "incremental" and self._cached_files:
-            # 기존 파일 + 새 파일 (중복 제거)
-            existing_paths = {f.path for f in self._cached_files}
+        # 증분 모드: 새 파일을 기존 목록에 추가
+        if mode == "incremental" and current.files:
+            files = list(current.files)
             for f in new_files:
-                if f.path not in existing_paths:
-                    self._cached_files.append(f)
+                if f.path not in known_files:
+                    files.append(f)
         else:
-            # 전체 스캔: 캐시 교체
-            self._cached_files = new_files
+            # 전체 스캔: 목록 교체
+            files = new_files
+
+        self._publish(files, stats)
+
+    def _refresh_with_manifest(
+        self,
+        mode: ScanMode,
+        verify_dirs: set[str] | None = None,
+        progress: ScanProgress | None = None,
+    ):
+        """
+        매니페스트 기반 스캔
+
+        - 재시작 직후: 매니페스트에서 파일 목록 복원 후 증분 스캔
+        - incremental: mtime이 바뀐 디렉토리만 다시 조회
+        - full: 모든 디렉토리를 다시 조회하여 파일 size/mtime 비교
+
+        기준 스캔 (빈 매니페스트 / 스냅샷 복원)은 리스너에 전달하지 않습니다.
+        전체 아카이브가 "추가"로 나오거나 리스너가 아직 반영 전이기 때문입니다.
+        """
+        manifest = self.manifest
+        baseline = manifest.is_empty or self._snapshot.is_empty
+
+        files = list(self._snapshot.files)
+        if self._snapshot.is_empty and not manifest.is_empty:
+            files = self.scanner.files_from_manifest(manifest)
+
+        delta = self.scanner.scan_delta(
+            manifest,
+            video_only=True,
+            verify_files=(mode == "full"),
+            verify_dirs=verify_dirs,
+            progress=progress,
+        )
+        files = self._apply_delta(files, delta)
+
+        stats = self._build_stats(manifest, files)
+        stats.scan_mode = mode
+        stats.scan_duration_sec = delta.scan_duration_sec
+        stats.new_files = len(delta.added)
+        stats.modified_files = len(delta.modified)
+        stats.errors = list(delta.errors)
+
+        self._publish(files, stats)
+        if not baseline:
+            self._notify_delta(delta)
+
+    def _apply_delta(
+        self,
+        files: list[SrcNasFileInfo],
+        delta: ScanDelta,
+    ) -> list[SrcNasFileInfo]:
+        """증분 스캔 결과를 반영한 새 파일 목록"""
+        if not delta.has_changes:
+            return files
 
-        self._cached_stats = stats
-        self._last_scan = datetime.now()
-        return self._cached_stats
+        by_path = {f.relative_path: f for f in files}
+        for rel_path in delta.deleted:
+            by_path.pop(rel_path, None)
+        for old_path, f in delta.moved:
+            by_path.pop(old_path, None)
+            by_path[f.relative_path] = f
+        for f in delta.added:
+            by_path[f.relative_path] = f
+        for f in delta.modified:
+            by_path[f.relative_path] = f
+
+        return sorted(by_path.values(), key=lambda f: f.relative_path)
+
+    def _build_stats(
+        self,
+        manifest: ScanManifest,
+        files: list[SrcNasFileInfo],
+    ) -> ScanResult:
+        """매니페스트 집계 + 비디오 파일 목록으로 ScanResult 구성"""
+        summary = manifest.summary()
+
+        stats = ScanResult(
+            total_files=summary["total_files"],
+            total_size_bytes=summary["total_size_bytes"],
+            video_files=len(files),
+            other_files=summary["total_files"] - len(files),
+            folders_scanned=summary["folders"],
+            extension_counts=summary["extension_counts"],
+        )
+        for f in files:
+            if f.inferred_brand:
+                stats.brand_counts[f.inferred_brand] = stats.brand_counts.get(f.inferred_brand, 0) + 1
+
+        return stats
+
+    # =========================================================================
+    # 백그라운드 스캔 워커
+    # =========================================================================
+
+    @property
+    def is_scanning(self) -> bool:
+        return self._progress is not None and self._progress.is_running
+
+    def request_scan(self, mode: ScanMode = "full") -> bool:
+        """
+        백그라운드 스캔 요청 (즉시 반환)
+
+        실행 중인 스캔이 있으면 완료 후 한 번 더 실행하며, 대기 중인
+        요청은 하나로 합쳐집니다 (full 요청이 incremental보다 우선).
+
+        Returns:
+            새로 대기열에 추가되었는지 여부 (이미 대기 중이면 False)
+        """
+        with self._worker_cond:
+            queued = self._pending_mode is None
+            if queued or mode == "full":
+                self._pending_mode = mode
+
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._worker_loop,
+                    name="nas-scan-worker",
+                    daemon=True,
+                )
+                self._worker.start()
+
+            self._worker_cond.notify()
+            return queued
+
+    def _worker_loop(self):
+        """대기 중인 스캔 요청을 순서대로 처리"""
+        while True:
+            with self._worker_cond:
+                while self._pending_mode is None:
+                    self._worker_cond.wait()
+                mode = self._pending_mode
+                self._pending_mode = None
+
+            try:
+                self.refresh_scan(force=True, mode=mode)
+                self._last_error = None
+            except Exception as e:
+                self._last_error = str(e)
+                print(f"NAS background scan failed: {e}")
+
+    def _current_snapshot(self) -> NasSnapshot:
+        """조회용 스냅샷 (스캔 결과가 없으면 백그라운드 스캔 시작)"""
+        snapshot = self._snapshot
+        if snapshot.is_empty and not self.is_scanning and self._pending_mode is None:
+            self.request_scan("incremental" if self.manifest is not None else "full")
+        return snapshot
+
+    # =========================================================================
+    # 증분 변경 리스너
+    # =========================================================================
+
+    def _notify_delta(self, delta: ScanDelta):
+        """등록된 리스너에 변경 전달 (리스너 오류는 다른 리스너에 영향 없음)"""
+        if not delta.has_changes:
+            return
+
+        for listener in list(self._delta_listeners):
+            try:
+                listener(delta)
+            except Exception as e:
+                print(f"NAS delta listener failed: {e}")
+
+    def add_delta_listener(self, listener: DeltaListener):
+        """증분 변경 리스너 등록 (패턴 캐시, UDM 저장소 등)"""
+        if listener not in self._delta_listeners:
+            self._delta_listeners.append(listener)
+
+    def remove_delta_listener(self, listener: DeltaListener):
+        """증분 변경 리스너 해제"""
+        if listener in self._delta_listeners:
+            self._delta_listeners.remove(listener)
+
+    # =========================================================================
+    # 감시 모드
+    # =========================================================================
+
+    @property
+    def is_watching(self) -> bool:
+        return self._watcher is not None and self._watcher.is_running
+
+    def start_watch(
+        self,
+        backend: WatchBackend = "auto",
+        poll_interval: float = NasWatcher.DEFAULT_POLL_INTERVAL,
+    ):
+        """
+        NAS 감시 시작
+
+        변경이 감지되면 전체 재스캔 없이 매니페스트 기반 증분 스캔을 실행하고
+        결과를 스냅샷과 리스너에 반영합니다. 매니페스트 경로가 없으면
+        메모리 매니페스트를 사용합니다. 기준 스캔은 백그라운드 워커에서
+        실행되므로 즉시 반환합니다.
+
+        Args:
+            backend: "auto" (로컬: inotify, 네트워크 마운트: polling) | "inotify" | "polling"
+            poll_interval: polling 주기 (초)
+        """
+        if self.is_watching:
+            return
+
+        if self.manifest is None:
+            self._manifest = ScanManifest(":memory:", root_path=self.nas_path)
+
+        # 기준 상태 확보 (이후 변경만 증분 반영)
+        self.request_scan("incremental")
+
+        self._watcher = NasWatcher(
+            str(self.scanner.root_path),
+            on_change=self._on_watch_change,
+            backend=backend,
+            poll_interval=poll_interval,
+        )
+        self._watcher.start()
+
+    def stop_watch(self):
+        """NAS 감시 중지"""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def _on_watch_change(self, dirs: set[str] | None):
+        """감시기 콜백: 변경된 디렉토리만 다시 조회"""
+        with self._scan_lock:
+            self._refresh_with_manifest("incremental", verify_dirs=dirs)
+
+    def absolute_path(self, relative_path: str) -> str:
+        """상대 경로 -> NAS 절대 경로 (NasFileInfo.path와 동일 형식)"""
+        return os.path.join(str(self.scanner.root_path), relative_path)
+
+    # =========================================================================
+    # 조회 (항상 현재 스냅샷 사용, 스캔 대기 없음)
+    # =========================================================================
 
     def get_matching_items(
         self,
@@ -117,40 +446,15 @@ class NasRealTimeService:
         search: str | None = None,
     ) -> list[MatchingItem]:
         """매칭 매트릭스 항목 반환 (MockDataService 호환)"""
-        # 스캔 실행 (캐시 사용)
-        self.refresh_scan()
+        snapshot = self._current_snapshot()
 
         items = []
-        for src_file in self._cached_files:
+        for src_file in snapshot.files:
             # 검색 필터
             if search and search.lower() not in src_file.filename.lower():
                 continue
 
-            # NasFileInfo 변환
-            nas_info = NasFileInfo(
-                exists=True,
-                path=src_file.path,
-                size_mb=round(src_file.size_mb, 2),
-                duration_sec=None,  # 실제 duration은 ffprobe 필요
-                modified_at=src_file.modified_at,
-                inferred_brand=src_file.inferred_brand,
-            )
-
-            # 현재는 메타데이터 없이 Asset 정보만 표시
-            # 향후 Sheet 연동 시 세그먼트 추가
-            status: Literal["complete", "partial", "pending", "warning", "no_metadata", "orphan"] = "no_metadata"
-
-            item = MatchingItem(
-                file_name=src_file.filename,
-                nas=nas_info,
-                segment_count=0,
-                udm_count=0,
-                segments=[],
-                status=status,
-                status_detail="No metadata",
-                warnings=[],
-                is_expanded=False,
-            )
+            item = self.to_matching_item(src_file)
 
             # 상태 필터
             if status_filter and status_filter != "all":
@@ -161,11 +465,38 @@ class NasRealTimeService:
 
         return items
 
+    def to_matching_item(self, src_file: SrcNasFileInfo) -> MatchingItem:
+        """스캐너 파일 정보를 MatchingItem으로 변환"""
+        nas_info = NasFileInfo(
+            exists=True,
+            path=src_file.path,
+            size_mb=round(src_file.size_mb, 2),
+            duration_sec=None,  # 실제 duration은 ffprobe 필요
+            modified_at=src_file.modified_at,
+            inferred_brand=src_file.inferred_brand,
+        )
+
+        # 현재는 메타데이터 없이 Asset 정보만 표시
+        # 향후 Sheet 연동 시 세그먼트 추가
+        status: Literal["complete", "partial", "pending", "warning", "no_metadata", "orphan"] = "no_metadata"
+
+        return MatchingItem(
+            file_name=src_file.filename,
+            nas=nas_info,
+            segment_count=0,
+            udm_count=0,
+            segments=[],
+            status=status,
+            status_detail="No metadata",
+            warnings=[],
+            is_expanded=False,
+        )
+
     def get_file_segments(self, file_name: str) -> dict | None:
         """특정 파일의 세그먼트 정보 (현재는 메타데이터 없음)"""
-        self.refresh_scan()
+        snapshot = self._current_snapshot()
 
-        for src_file in self._cached_files:
+        for src_file in snapshot.files:
             if src_file.filename == file_name:
                 return {
                     "file_name": src_file.filename,
@@ -187,7 +518,8 @@ class NasRealTimeService:
 
     def get_stats(self) -> dict:
         """통계 데이터 반환 (MockDataService 호환)"""
-        stats = self.refresh_scan()
+        snapshot = self._current_snapshot()
+        stats = snapshot.stats
 
         # 브랜드별 파일 수
         brand_counts = stats.brand_counts
@@ -197,7 +529,7 @@ class NasRealTimeService:
                 "nas": {
                     "total_files": stats.video_files,
                     "total_size_gb": round(stats.total_size_gb, 2),
-                    "scanned_at": self._last_scan,
+                    "scanned_at": snapshot.scanned_at,
                     "brand_counts": brand_counts,
                 },
                 "archive_metadata": {
@@ -308,13 +640,35 @@ class NasRealTimeService:
         return files
 
     def get_scan_status(self) -> dict:
-        """스캔 상태 반환"""
+        """스캔 상태 반환 (진행 중이면 진행률 포함)"""
+        snapshot = self._snapshot
+        progress = self._progress
+
+        scan = None
+        if progress is not None:
+            scan = {
+                "state": "running" if progress.is_running else "idle",
+                "dirs_scanned": progress.dirs_scanned,
+                "dirs_skipped": progress.dirs_skipped,
+                "files_seen": progress.files_seen,
+                "elapsed_sec": round(progress.elapsed_sec, 2),
+                "files_per_sec": round(progress.files_per_sec, 1),
+            }
+
         return {
-            "last_scan": self._last_scan,
-            "cached_files": len(self._cached_files),
-            "is_cached": self._cached_stats is not None,
+            "last_scan": snapshot.scanned_at,
+            "cached_files": len(snapshot.files),
+            "is_cached": not snapshot.is_empty,
+            "snapshot_version": snapshot.version,
+            "scanning": self.is_scanning,
+            "queued_scan": self._pending_mode,
+            "scan_progress": scan,
+            "last_error": self._last_error,
             "nas_path": self.nas_path,
             "nas_accessible": Path(self.nas_path).exists(),
+            "manifest_path": self.manifest_path,
+            "watching": self.is_watching,
+            "watch_backend": self._watcher.backend if self._watcher else None,
         }
 
 
@@ -322,9 +676,12 @@ class NasRealTimeService:
 _nas_service: NasRealTimeService | None = None
 
 
-def get_nas_service(nas_path: str = "Z:\\ARCHIVE") -> NasRealTimeService:
+def get_nas_service(
+    nas_path: str = "Z:\\ARCHIVE",
+    manifest_path: str | None = None,
+) -> NasRealTimeService:
     """NasRealTimeService 싱글톤 반환"""
     global _nas_service
     if _nas_service is None:
-        _nas_service = NasRealTimeService(nas_path=nas_path)
+        _nas_service = NasRealTimeService(nas_path=nas_path, manifest_path=manifest_path)
     return _nas_service
@@ -0,0 +1,246 @@
+"""
+UDM 열 저장소 (매트릭스 뷰 컬럼형 조회)
+
+UdmIndex와 같은 위치 순서로 Asset 필드를 열 단위로 보관합니다.
+로드 시 원본 Asset에서 한 번 추출하므로 조회 시 Asset을 다시 읽거나
+중첩 객체를 직렬화하지 않고 요청한 열만 위치 목록으로 잘라 반환합니다.
+
+- 열 구성은 Asset 모델에서 생성 (중첩 모델은 event_context.brand처럼 점으로 연결,
+  segments는 segment_count 열)
+- Enum 열은 딕셔너리 인코딩: Enum 멤버 순서의 딕셔너리 + 코드 열
+  (src.extractors.columnar_exporter와 같은 방식, 모델에 없는 값은 딕셔너리 뒤에 추가)
+- Arrow IPC 스트림 변환 (pyarrow 설치 시)
+"""
+
+import io
+import sys
+import types
+from array import array
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+# 프로젝트 루트를 경로에 추가 (src.models 패키지 import)
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.udm import Asset
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:  # pragma: no cover - 선택 의존성
+    pa = None
+
+# Arrow IPC 스트림 MIME 타입
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# 코드 열에서 값이 없는 경우
+_NO_CODE = -1
+
+
+def pyarrow_available() -> bool:
+    """pyarrow 설치 여부"""
+    return pa is not None
+
+
+# =============================================================================
+# Asset 모델 → 열 정의
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """열 하나 (name = 점으로 연결한 필드 경로)"""
+
+    name: str
+    path: tuple[str, ...]
+    kind: str  # dictionary | int | float | bool | string
+    members: tuple[str, ...] = ()  # dictionary 열의 Enum 멤버 값
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Optional[X] → X"""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _column_specs(model_cls: type[BaseModel], prefix: tuple[str, ...] = ()) -> list[ColumnSpec]:
+    specs = []
+    for name, field in model_cls.model_fields.items():
+        annotation = _unwrap_optional(field.annotation)
+        path = prefix + (name,)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            specs.extend(_column_specs(annotation, path))
+        elif get_origin(annotation) is list:
+            continue  # 목록 필드는 개수 열로 대체 (segment_count)
+        elif isinstance(annotation, type) and issubclass(annotation, Enum):
+            specs.append(ColumnSpec(
+                ".".join(path), path, "dictionary", tuple(m.value for m in annotation),
+            ))
+        else:
+            kind = {bool: "bool", int: "int", float: "float"}.get(annotation, "string")
+            specs.append(ColumnSpec(".".join(path), path, kind))
+    return specs
+
+
+COLUMN_SPECS: dict[str, ColumnSpec] = {
+    spec.name: spec
+    for spec in [*_column_specs(Asset), ColumnSpec("segment_count", ("segments",), "int")]
+}
+
+
+def parse_fields(fields: str | None) -> list[str]:
+    """fields 파라미터 (쉼표 구분) → 열 이름 목록 (None/빈 값이면 전체 열)"""
+    if not fields:
+        return list(COLUMN_SPECS)
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in COLUMN_SPECS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return list(dict.fromkeys(names))
+
+
+def _value(asset: dict, spec: ColumnSpec):
+    if spec.name == "segment_count":
+        return len(asset.get("segments") or [])
+    value = asset
+    for key in spec.path:
+        value = value.get(key) if isinstance(value, dict) else None
+        if value is None:
+            return None
+    return value
+
+
+# =============================================================================
+# 열 저장소
+# =============================================================================
+
+
+class UdmColumns:
+    """위치별 Asset 열 (위치 = UdmIndex 위치)"""
+
+    def __init__(self):
+        self.dictionaries: dict[str, list[str]] = {}
+        self._codes: dict[str, dict[str, int]] = {}
+        self._columns: dict[str, array | list] = {}
+
+        for name, spec in COLUMN_SPECS.items():
+            if spec.kind == "dictionary":
+                self.dictionaries[name] = list(spec.members)
+                self._codes[name] = {value: code for code, value in enumerate(spec.members)}
+                self._columns[name] = array("i")
+            else:
+                self._columns[name] = []
+
+    @classmethod
+    def from_assets(cls, assets: list[dict]) -> "UdmColumns":
+        columns = cls()
+        for asset in assets:
+            columns.append(asset)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self._columns["file_name"])
+
+    def append(self, asset: dict):
+        """원본 Asset 하나의 열 값 추가"""
+        for name, spec in COLUMN_SPECS.items():
+            value = _value(asset, spec)
+            if spec.kind != "dictionary":
+                self._columns[name].append(value)
+                continue
+
+            if value is None:
+                code = _NO_CODE
+            else:
+                codes = self._codes[name]
+                code = codes.get(value)
+                if code is None:
+                    # 모델에 없는 값 (이전 버전 데이터 등)
+                    code = codes[value] = len(codes)
+                    self.dictionaries[name].append(value)
+            self._columns[name].append(code)
+
+    def copy(self) -> "UdmColumns":
+        """추가용 복사본 (변경 반영 시 이전 인덱스의 열은 그대로 둠)"""
+        new = object.__new__(UdmColumns)
+        new.dictionaries = {name: list(values) for name, values in self.dictionaries.items()}
+        new._codes = {name: dict(codes) for name, codes in self._codes.items()}
+        new._columns = {name: column[:] for name, column in self._columns.items()}
+        return new
+
+    def select(self, positions: list[int]) -> "UdmColumns":
+        """주어진 위치만 남긴 새 열 저장소 (인덱스 재구성용, 딕셔너리는 유지)"""
+        new = object.__new__(UdmColumns)
+        new.dictionaries = {name: list(values) for name, values in self.dictionaries.items()}
+        new._codes = {name: dict(codes) for name, codes in self._codes.items()}
+        new._columns = {}
+        for name, column in self._columns.items():
+            values = [column[p] for p in positions]
+            new._columns[name] = array("i", values) if name in self.dictionaries else values
+        return new
+
+    def project(self, fields: list[str], positions: list[int]) -> dict[str, Any]:
+        """
+        요청한 열을 위치 순서로 잘라 반환 (JSON 응답용)
+
+        Returns:
+            {열 이름: 값 목록} (딕셔너리 열은 {"dictionary": [...], "indices": [...]},
+            값이 없으면 indices에 None)
+        """
+        result: dict[str, Any] = {}
+        for name in fields:
+            column = self._columns[name]
+            if name in self.dictionaries:
+                indices = [column[p] for p in positions]
+                result[name] = {
+                    "dictionary": self.dictionaries[name],
+                    "indices": [code if code != _NO_CODE else None for code in indices],
+                }
+            else:
+                result[name] = [column[p] for p in positions]
+        return result
+
+    def to_arrow_ipc(self, fields: list[str], positions: list[int]) -> bytes:
+        """
+        요청한 열을 Arrow IPC 스트림으로 변환 (배치 하나)
+
+        Raises:
+            ImportError: pyarrow 미설치
+        """
+        if pa is None:
+            raise ImportError("pyarrow is not installed (pip install pyarrow)")
+
+        arrays = []
+        for name in fields:
+            spec = COLUMN_SPECS[name]
+            column = self._columns[name]
+            if spec.kind == "dictionary":
+                indices = [column[p] for p in positions]
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array([code if code != _NO_CODE else None for code in indices], type=pa.int32()),
+                    pa.array(self.dictionaries[name], type=pa.string()),
+                ))
+                continue
+
+            values = [column[p] for p in positions]
+            if spec.kind == "string":
+                arrays.append(pa.array(
+                    [None if v is None else str(v) for v in values], type=pa.string(),
+                ))
+            else:
+                arrow_type = {"int": pa.int64(), "float": pa.float64(), "bool": pa.bool_()}[spec.kind]
+                arrays.append(pa.array(values, type=arrow_type))
+
+        batch = pa.RecordBatch.from_arrays(arrays, names=fields)
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+        return sink.getvalue()
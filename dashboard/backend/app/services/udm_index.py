@@ -0,0 +1,611 @@
+"""
+UDM 문서 인덱스
+
+UDM Viewer가 조회하는 Asset 목록을 로드 시점에 한 번 인덱싱합니다.
+요청마다 전체 Asset을 훑지 않도록 다음을 미리 만들어 둡니다.
+
+- asset_uuid → 위치 해시맵
+- brand / asset_type / year 포스팅 리스트 (위치 오름차순 array)
+- (brand, asset_type, year) 조합별 포스팅 리스트 (복합 필터)
+- 위치별 brand / asset_type 코드, year 열 (검색 후보 확인용)
+- 파일명 3-gram 포스팅 리스트 (부분 문자열 검색 후보)
+- 브랜드 / Asset Type / 연도 분포, 전체 세그먼트 수
+- 위치별 Asset 필드 열 (udm_columns.UdmColumns, 매트릭스 뷰 컬럼형 조회)
+
+필터 조회는 조건에 정확히 맞는 포스팅 리스트(복합 필터는 해당 조합들의 병합)를
+순회하고, 검색어는 가장 드문 3-gram 포스팅과 비교해 더 짧은 쪽을 순회하므로
+비용은 전체 Asset 수가 아니라 결과/후보 수에 비례합니다.
+
+목록 페이지(page())는 정렬 키(값, asset_uuid) 기준 키셋 페이지이며, 필드별 정렬 순서는
+처음 조회할 때 한 번 만들어 둡니다. 결과가 적으면 조건에 맞는 위치에서 필요한 만큼
+고르고, 많으면 정렬 순서를 커서 위치부터 순회하므로 깊은 페이지도 첫 페이지와 비용이
+같습니다. 필터 결과 수(count())는 조합별 Asset 수에서 바로 구합니다.
+
+Asset은 원본 또는 요약(udm_loader.summarize_asset)이며, 요약이면 spans에 기록된
+파일 위치에서 원본을 읽습니다 (details()).
+
+인덱스는 불변이며 변경 시 새 인스턴스로 교체합니다 (조회 중인 요청은 이전 인덱스 사용).
+변경(with_changes)은 바뀐 Asset의 이전 위치를 삭제 표시하고 새 내용을 끝에 추가하며,
+건드린 포스팅 리스트만 복사합니다 (나머지는 이전 인덱스와 공유).
+삭제 표시가 COMPACT_RATIO를 넘으면 살아 있는 Asset만으로 다시 만듭니다.
+"""
+
+import base64
+import heapq
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Iterator
+
+from .udm_columns import UdmColumns
+
+# 부분 문자열 검색 n-gram 길이 (이보다 짧은 검색어는 파일명 열을 순회)
+NGRAM_SIZE = 3
+
+# 삭제 표시 비율이 이보다 크면 변경 시 인덱스를 새로 만듦
+COMPACT_RATIO = 0.25
+
+# 코드 열에서 값이 없는 경우 (브랜드 / Asset Type 미지정)
+_NO_CODE = -1
+
+# 정렬 필드 (동률은 asset_uuid 순) / 기본 정렬
+SORT_FIELDS = ("file_name", "year", "brand", "asset_type", "asset_uuid")
+DEFAULT_SORT = "file_name"
+
+# 검색어 포함 조건별 결과 수 캐시 크기 (인덱스별)
+COUNT_CACHE_SIZE = 256
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def _count(counts: dict, key, delta: int = 1):
+    value = counts.get(key, 0) + delta
+    if value:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
+
+
+def segment_count(asset: dict) -> int:
+    """세그먼트 수 (요약 Asset은 segment_count 필드)"""
+    if "segment_count" in asset:
+        return asset["segment_count"]
+    return len(asset.get("segments") or [])
+
+
+def parse_sort(sort: str) -> tuple[str, bool]:
+    """정렬 파라미터 → (필드, 내림차순 여부)"""
+    field = sort[1:] if sort.startswith("-") else sort
+    if field not in SORT_FIELDS:
+        raise ValueError(f"Unknown sort field: {field} (expected one of {', '.join(SORT_FIELDS)})")
+    return field, sort.startswith("-")
+
+
+def encode_cursor(sort: str, key: tuple) -> str:
+    """키셋 커서 (정렬 파라미터 + 마지막 Asset의 정렬 키, URL-safe base64)"""
+    raw = json.dumps([sort, *key], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple:
+    """키셋 커서 → 정렬 키 (다른 정렬로 만든 커서면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, value, uuid = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if cursor_sort != sort or not isinstance(uuid, str):
+        raise ValueError(f"Cursor does not match sort: {sort}")
+    return value, uuid
+
+
+def _fields(asset: dict) -> tuple:
+    ctx = asset.get("event_context") or {}
+    return ctx.get("brand"), asset.get("asset_type"), ctx.get("year")
+
+
+class UdmIndex:
+    """UDM 문서 인덱스 (불변)"""
+
+    def __init__(
+        self,
+        metadata: dict,
+        assets: list[dict],
+        spans=None,
+        columns: UdmColumns | None = None,
+    ):
+        """
+        Args:
+            metadata: UDM 문서 _metadata
+            assets: Asset 목록 (순서 = 조회 결과 순서)
+            spans: 요약 Asset의 원본 위치 (udm_loader.AssetSpans, None = 원본 Asset)
+            columns: 원본 Asset에서 추출한 열 (None이면 assets에서 추출, 요약이면 필수)
+        """
+        self.metadata = metadata
+        self.assets = assets
+        self.spans = spans
+        self.columns = columns if columns is not None else UdmColumns.from_assets(assets)
+        self.version: str | None = None  # 저장소가 게시할 때 부여
+
+        self.positions: dict[str, int] = {}
+        self.total_segments = 0
+        self.brand_distribution: dict[str, int] = {}
+        self.asset_type_distribution: dict[str, int] = {}
+        self.year_distribution: dict[str, int] = {}
+
+        # 코드 사전 (대문자 키 → 코드) / 포스팅 리스트
+        self._brand_codes: dict[str, int] = {}
+        self._type_codes: dict[str, int] = {}
+        self._brand_postings: dict[int, array] = {}
+        self._type_postings: dict[int, array] = {}
+        self._year_postings: dict[int, array] = {}
+        self._group_postings: dict[tuple[int, int, int | None], array] = {}
+        self._group_counts: dict[tuple[int, int, int | None], int] = {}  # 조합별 Asset 수
+        self._ngram_postings: dict[str, array] = {}
+
+        # 위치별 열
+        self._brand_column = array("i")
+        self._type_column = array("i")
+        self._year_column: list[int | None] = []
+        self._names: list[str] = []  # 소문자 파일명
+
+        # 삭제 표시 (1 = 삭제/교체된 위치)
+        self._dead = bytearray()
+        self._dead_count = 0
+
+        # 이 인스턴스가 만든 포스팅 리스트 (변경 중 복사 없이 추가 가능)
+        self._owned: set[int] = set()
+
+        # 조회 시 생성하는 캐시 (인덱스가 불변이므로 무효화 없음)
+        self._sort_value_cache: dict[str, list] = {}
+        self._order_cache: dict[str, array] = {}
+        self._count_cache: dict[tuple, int] = {}
+
+        for position, asset in enumerate(assets):
+            self._add(position, asset)
+        self._owned = set()
+
+    # =========================================================================
+    # 구성
+    # =========================================================================
+
+    def _code(self, codes: dict[str, int], value) -> int:
+        if not value:
+            return _NO_CODE
+        key = str(value).upper()
+        code = codes.get(key)
+        if code is None:
+            code = codes[key] = len(codes)
+        return code
+
+    def _post(self, postings: dict, key, position: int):
+        """포스팅 추가 (이전 인덱스와 공유 중인 리스트는 복사 후 추가)"""
+        current = postings.get(key)
+        if current is None or id(current) not in self._owned:
+            current = array("I") if current is None else array("I", current)
+            postings[key] = current
+            self._owned.add(id(current))
+        current.append(position)
+
+    def _add(self, position: int, asset: dict):
+        brand, asset_type, year = _fields(asset)
+
+        uuid = asset.get("asset_uuid")
+        if uuid is not None:
+            self.positions[uuid] = position
+
+        brand_code = self._code(self._brand_codes, brand)
+        if brand_code != _NO_CODE:
+            self._post(self._brand_postings, brand_code, position)
+        self._brand_column.append(brand_code)
+
+        type_code = self._code(self._type_codes, asset_type)
+        if type_code != _NO_CODE:
+            self._post(self._type_postings, type_code, position)
+        self._type_column.append(type_code)
+
+        if year:
+            self._post(self._year_postings, year, position)
+        self._year_column.append(year)
+        self._post(self._group_postings, (brand_code, type_code, year), position)
+        _count(self._group_counts, (brand_code, type_code, year))
+
+        name = (asset.get("file_name") or "").lower()
+        self._names.append(name)
+        for gram in _ngrams(name):
+            self._post(self._ngram_postings, gram, position)
+
+        self._dead.append(0)
+        self._tally(asset, 1)
+
+    def _tally(self, asset: dict, delta: int):
+        brand, asset_type, year = _fields(asset)
+        _count(self.brand_distribution, brand or "unknown", delta)
+        _count(self.asset_type_distribution, asset_type or "unknown", delta)
+        _count(self.year_distribution, str(year if year is not None else "unknown"), delta)
+        self.total_segments += delta * segment_count(asset)
+
+    def _kill(self, position: int):
+        self._dead[position] = 1
+        self._dead_count += 1
+        group = (self._brand_column[position], self._type_column[position], self._year_column[position])
+        _count(self._group_counts, group, -1)
+        self._tally(self.assets[position], -1)
+
+    def with_changes(
+        self,
+        metadata: dict,
+        upserts: list[dict],
+        removed_uuids: set[str],
+    ) -> "UdmIndex":
+        """
+        변경을 반영한 새 인덱스 (이 인덱스는 그대로)
+
+        Args:
+            metadata: 새 문서 _metadata
+            upserts: 추가/수정된 원본 Asset (asset_uuid 기준으로 교체)
+            removed_uuids: 삭제된 asset_uuid
+        """
+        new = object.__new__(UdmIndex)
+        new.metadata = metadata
+        new.assets = list(self.assets)
+        new.spans = self.spans
+        new.columns = self.columns.copy()
+        new.version = None
+        new.positions = dict(self.positions)
+        new.total_segments = self.total_segments
+        new.brand_distribution = dict(self.brand_distribution)
+        new.asset_type_distribution = dict(self.asset_type_distribution)
+        new.year_distribution = dict(self.year_distribution)
+        new._brand_codes = dict(self._brand_codes)
+        new._type_codes = dict(self._type_codes)
+        new._brand_postings = dict(self._brand_postings)
+        new._type_postings = dict(self._type_postings)
+        new._year_postings = dict(self._year_postings)
+        new._group_postings = dict(self._group_postings)
+        new._group_counts = dict(self._group_counts)
+        new._ngram_postings = dict(self._ngram_postings)
+        new._brand_column = array("i", self._brand_column)
+        new._type_column = array("i", self._type_column)
+        new._year_column = list(self._year_column)
+        new._names = list(self._names)
+        new._dead = bytearray(self._dead)
+        new._dead_count = self._dead_count
+        new._owned = set()
+        new._sort_value_cache = {}
+        new._order_cache = {}
+        new._count_cache = {}
+
+        replaced = set(removed_uuids)
+        replaced.update(a.get("asset_uuid") for a in upserts)
+        for uuid in replaced:
+            position = new.positions.pop(uuid, None)
+            if position is not None:
+                new._kill(position)
+
+        for asset in upserts:
+            new._add(len(new.assets), asset)
+            new.assets.append(asset)
+            new.columns.append(asset)
+        new._owned = set()
+
+        if new._dead_count > len(new.assets) * COMPACT_RATIO:
+            return new.compacted()
+        return new
+
+    def compacted(self) -> "UdmIndex":
+        """삭제 표시된 위치를 뺀 새 인덱스"""
+        live = [p for p in range(len(self.assets)) if not self._dead[p]]
+        spans = self.spans.select(live) if self.spans is not None else None
+        return UdmIndex(self.metadata, [self.assets[p] for p in live], spans, self.columns.select(live))
+
+    # =========================================================================
+    # 조회
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self.assets) - self._dead_count
+
+    def iter_assets(self) -> Iterator[dict]:
+        """살아 있는 Asset 순회 (위치 순, 요약일 수 있음)"""
+        if not self._dead_count:
+            return iter(self.assets)
+        dead = self._dead
+        return (asset for position, asset in enumerate(self.assets) if not dead[position])
+
+    def get(self, asset_uuid: str) -> dict | None:
+        """원본 Asset 조회"""
+        position = self.positions.get(asset_uuid)
+        return self.details([position])[0] if position is not None else None
+
+    def details(self, positions: list[int]) -> list[dict]:
+        """
+        원본 Asset 목록
+
+        요약만 보관 중이면 파일에서 읽으며, 파일이 바뀌어 읽을 수 없으면 요약을 반환
+        """
+        if self.spans is None:
+            return [self.assets[p] for p in positions]
+        results = []
+        for position, asset in zip(positions, self.spans.read(positions)):
+            summary = self.assets[position]
+            if asset is None or asset.get("asset_uuid") != summary.get("asset_uuid"):
+                asset = summary
+            results.append(asset)
+        return results
+
+    def _checks(
+        self,
+        brand: str | None,
+        asset_type: str | None,
+        year: int | None,
+    ) -> list[tuple[int, object, int]] | None:
+        """구조 필터 조건 (그룹 키 slot, 열, 값) 목록 (맞는 Asset이 없으면 None)"""
+        checks = []
+        if brand:
+            code = self._brand_codes.get(brand.upper())
+            if code is None or code not in self._brand_postings:
+                return None
+            checks.append((0, self._brand_column, code))
+        if asset_type:
+            code = self._type_codes.get(asset_type.upper())
+            if code is None or code not in self._type_postings:
+                return None
+            checks.append((1, self._type_column, code))
+        if year:
+            if year not in self._year_postings:
+                return None
+            checks.append((2, self._year_column, year))
+        return checks
+
+    def iter_matches(
+        self,
+        brand: str | None = None,
+        asset_type: str | None = None,
+        year: int | None = None,
+        search: str | None = None,
+    ) -> Iterator[int]:
+        """
+        조건에 맞는 Asset 위치 (오름차순, 지연 생성)
+
+        brand / asset_type은 대소문자 무시 일치, search는 파일명 부분 문자열 (대소문자 무시)
+        """
+        checks = self._checks(brand, asset_type, year)
+        if checks is None:
+            return
+
+        # 구조 필터 후보: 조건 하나면 해당 포스팅, 둘 이상이면 맞는 조합 포스팅 병합
+        if not checks:
+            driver, size = range(len(self.assets)), len(self.assets)
+        elif len(checks) == 1:
+            slot, _, value = checks[0]
+            driver = (self._brand_postings, self._type_postings, self._year_postings)[slot][value]
+            size = len(driver)
+        else:
+            groups = [
+                group for key, group in self._group_postings.items()
+                if all(key[slot] == value for slot, _, value in checks)
+            ]
+            size = sum(len(group) for group in groups)
+            driver = groups[0] if len(groups) == 1 else heapq.merge(*groups)
+
+        query = search.lower() if search else None
+        names = self._names
+
+        if query and len(query) >= NGRAM_SIZE:
+            grams = [self._ngram_postings.get(gram) for gram in _ngrams(query)]
+            if any(gram is None for gram in grams):
+                return
+            rarest = min(grams, key=len)
+            if len(rarest) < size:
+                # 검색 후보가 더 적으면 후보를 순회하며 구조 필터를 열로 확인
+                driver = (
+                    position for position in rarest
+                    if all(column[position] == value for _, column, value in checks)
+                )
+
+        if self._dead_count:
+            dead = self._dead
+            driver = (position for position in driver if not dead[position])
+
+        if query:
+            for position in driver:
+                if query in names[position]:
+                    yield position
+        else:
+            yield from driver
+
+    def count(
+        self,
+        brand: str | None = None,
+        asset_type: str | None = None,
+        year: int | None = None,
+        search: str | None = None,
+    ) -> int:
+        """
+        조건에 맞는 Asset 수
+
+        구조 필터만 있으면 조합별 Asset 수의 합, 검색어가 있으면 후보를 세고 캐시
+        """
+        checks = self._checks(brand, asset_type, year)
+        if checks is None:
+            return 0
+        if not search:
+            if not checks:
+                return len(self)
+            return sum(
+                count for key, count in self._group_counts.items()
+                if all(key[slot] == value for slot, _, value in checks)
+            )
+
+        cache_key = (brand, asset_type, year, search)
+        total = self._count_cache.get(cache_key)
+        if total is None:
+            total = sum(1 for _ in self.iter_matches(brand, asset_type, year, search))
+            if len(self._count_cache) >= COUNT_CACHE_SIZE:
+                self._count_cache.clear()
+            self._count_cache[cache_key] = total
+        return total
+
+    # =========================================================================
+    # 정렬 / 키셋 페이지
+    # =========================================================================
+
+    def _sort_values(self, field: str) -> list:
+        """위치별 정렬 값 (캐시)"""
+        values = self._sort_value_cache.get(field)
+        if values is not None:
+            return values
+
+        if field == "file_name":
+            values = self._names
+        elif field == "year":
+            values = [year or 0 for year in self._year_column]
+        elif field in ("brand", "asset_type"):
+            codes, column = (
+                (self._brand_codes, self._brand_column) if field == "brand"
+                else (self._type_codes, self._type_column)
+            )
+            labels = sorted(codes, key=codes.get)
+            values = [labels[code] if code != _NO_CODE else "" for code in column]
+        elif field == "asset_uuid":
+            values = [asset.get("asset_uuid") or "" for asset in self.assets]
+        else:
+            raise ValueError(f"Unknown sort field: {field}")
+
+        self._sort_value_cache[field] = values
+        return values
+
+    def _sort_key(self, field: str):
+        """위치 → (정렬 값, asset_uuid) 함수 (asset_uuid로 동률 해소)"""
+        values = self._sort_values(field)
+        uuids = self._sort_values("asset_uuid")
+        return lambda position: (values[position], uuids[position])
+
+    def _order(self, field: str) -> array:
+        """살아 있는 위치를 정렬 키 순으로 (캐시, 필드별 첫 조회 시 생성)"""
+        order = self._order_cache.get(field)
+        if order is None:
+            live = (
+                range(len(self.assets)) if not self._dead_count
+                else (p for p in range(len(self.assets)) if not self._dead[p])
+            )
+            order = array("I", sorted(live, key=self._sort_key(field)))
+            self._order_cache[field] = order
+        return order
+
+    def page_positions(
+        self,
+        brand: str | None = None,
+        asset_type: str | None = None,
+        year: int | None = None,
+        search: str | None = None,
+        sort: str = DEFAULT_SORT,
+        cursor: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[int], str | None]:
+        """
+        정렬 키 기준 키셋 페이지의 위치 목록
+
+        cursor 다음(정렬 키가 더 큰, 내림차순이면 더 작은) Asset부터 limit개를 반환하며,
+        비용은 페이지 깊이와 무관합니다. 커서는 위치가 아니라 정렬 키 값이므로
+        인덱스가 교체된 뒤에도 이어서 조회할 수 있습니다.
+
+        Args:
+            sort: 정렬 필드 (SORT_FIELDS, "-" 접두사는 내림차순)
+            cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+            offset: 커서 다음에서 건너뛸 Asset 수 (키셋 이전 방식 호환)
+
+        Returns:
+            (위치 목록, 다음 페이지 커서 / 마지막 페이지면 None)
+
+        Raises:
+            ValueError: 알 수 없는 정렬 필드 또는 잘못된 커서
+        """
+        field, descending = parse_sort(sort)
+        after = decode_cursor(cursor, sort) if cursor else None
+        wanted = offset + limit + 1  # 다음 페이지 존재 여부 확인용 1개
+
+        checks = self._checks(brand, asset_type, year)
+        if checks is None:
+            return [], None
+        total = self.count(brand, asset_type, year, search)
+        key = self._sort_key(field)
+
+        if total * total < wanted * len(self):
+            # 결과가 적으면 조건에 맞는 위치에서 필요한 만큼만 선택
+            candidates = self.iter_matches(brand, asset_type, year, search)
+            if after is not None:
+                candidates = (
+                    p for p in candidates
+                    if (key(p) < after if descending else key(p) > after)
+                )
+            pick = heapq.nlargest if descending else heapq.nsmallest
+            positions = pick(wanted, candidates, key=key)
+        else:
+            # 결과가 많으면 정렬 순서대로 순회하며 조건 확인
+            order = self._order(field)
+            if descending:
+                start = len(order) if after is None else bisect_left(order, after, key=key)
+                walk = (order[i] for i in range(start - 1, -1, -1))
+            else:
+                start = 0 if after is None else bisect_right(order, after, key=key)
+                walk = (order[i] for i in range(start, len(order)))
+
+            query = search.lower() if search else None
+            names = self._names
+            positions = list(islice(
+                (
+                    p for p in walk
+                    if all(column[p] == value for _, column, value in checks)
+                    and (query is None or query in names[p])
+                ),
+                wanted,
+            ))
+
+        has_more = len(positions) == wanted
+        positions = positions[offset:offset + limit]
+        next_cursor = encode_cursor(sort, key(positions[-1])) if has_more and positions else None
+        return positions, next_cursor
+
+    def page(
+        self,
+        brand: str | None = None,
+        asset_type: str | None = None,
+        year: int | None = None,
+        search: str | None = None,
+        sort: str = DEFAULT_SORT,
+        cursor: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        full: bool = False,
+    ) -> tuple[list[dict], str | None]:
+        """
+        정렬 키 기준 키셋 페이지 (page_positions 참고)
+
+        Args:
+            full: 원본 Asset 반환 (False면 보관 중인 Asset, 요약일 수 있음)
+
+        Returns:
+            (Asset 목록, 다음 페이지 커서 / 마지막 페이지면 None)
+        """
+        positions, next_cursor = self.page_positions(
+            brand, asset_type, year, search, sort, cursor, limit, offset,
+        )
+        if full:
+            return self.details(positions), next_cursor
+        return [self.assets[p] for p in positions], next_cursor
+
+    def stats(self) -> dict:
+        """미리 계산된 통계"""
+        return {
+            "total_assets": len(self),
+            "total_segments": self.total_segments,
+            "brand_distribution": self.brand_distribution,
+            "asset_type_distribution": self.asset_type_distribution,
+            "year_distribution": self.year_distribution,
+        }
@@ -0,0 +1,220 @@
+"""
+UDM 파일 스트리밍 로더
+
+대용량 UDM 내보내기 파일을 Asset 하나씩 읽어 UdmIndex를 만듭니다.
+문서 전체를 한 번에 파싱하지 않으므로 로드 중 메모리가 문서 크기만큼 늘지 않습니다.
+
+- 압축하지 않은 파일: Asset 요약(목록/필터에 필요한 필드)만 메모리에 두고,
+  원본 Asset은 파일 내 바이트 범위를 기록해 상세 조회 시 그 부분만 다시 읽음
+- 압축 파일(.json.gz / .json.zst): 임의 위치를 읽을 수 없으므로 원본 Asset을 그대로 보관
+- 매트릭스 뷰 열(UdmColumns)은 두 경우 모두 원본 Asset을 읽는 동안 추출
+
+진행 상황(LoadProgress)은 로더 스레드가 갱신하고 API는 읽기만 합니다.
+"""
+
+import os
+import sys
+import time
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가 (src.extractors 패키지 import)
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.extractors.compression import decompress_stream, detect_compression, open_compressed
+from src.extractors.json_stream import JsonArrayReader
+from src.extractors.serializer import get_serializer
+
+from .udm_columns import UdmColumns
+from .udm_index import UdmIndex
+
+_SERIALIZER = get_serializer()
+
+# 요약에 남기는 event_context 필드
+SUMMARY_CONTEXT_FIELDS = ("brand", "year", "season", "episode")
+
+# 진행 상황 갱신 주기 (Asset 수)
+PROGRESS_INTERVAL = 1000
+
+
+def summarize_asset(asset: dict) -> dict:
+    """목록/필터용 Asset 요약 (segments는 개수만)"""
+    ctx = asset.get("event_context") or {}
+    return {
+        "asset_uuid": asset.get("asset_uuid"),
+        "file_name": asset.get("file_name"),
+        "file_path_nas": asset.get("file_path_nas"),
+        "asset_type": asset.get("asset_type"),
+        "source_origin": asset.get("source_origin"),
+        "event_context": {key: ctx.get(key) for key in SUMMARY_CONTEXT_FIELDS},
+        "segment_count": len(asset.get("segments") or []),
+    }
+
+
+@dataclass
+class LoadProgress:
+    """UDM 파일 로드 진행 상황"""
+
+    file_path: str
+    total_bytes: int = 0
+    bytes_read: int = 0  # 디스크에서 읽은 바이트 (압축 파일은 압축된 크기 기준)
+    assets_loaded: int = 0
+    started_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    error: str | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.finished_at is None
+
+    @property
+    def elapsed_sec(self) -> float:
+        return (self.finished_at or time.time()) - self.started_at
+
+    @property
+    def percent(self) -> float:
+        if not self.total_bytes:
+            return 0.0
+        return min(100.0, self.bytes_read * 100 / self.total_bytes)
+
+    def finish(self, error: str | None = None):
+        self.error = error
+        if error is None:
+            self.bytes_read = self.total_bytes
+        self.finished_at = time.time()
+
+    def to_dict(self) -> dict:
+        return {
+            "state": "running" if self.is_running else ("failed" if self.error else "done"),
+            "file_path": self.file_path,
+            "total_bytes": self.total_bytes,
+            "bytes_read": self.bytes_read,
+            "percent": round(self.percent, 1),
+            "assets_loaded": self.assets_loaded,
+            "elapsed_sec": round(self.elapsed_sec, 2),
+            "error": self.error,
+        }
+
+
+class AssetSpans:
+    """
+    원본 Asset의 파일 내 바이트 범위 (위치 = 인덱스 위치)
+
+    범위가 없는 위치(길이 0 또는 목록 밖)는 변경으로 추가된 원본 Asset이 메모리에 있음
+    """
+
+    def __init__(self, file_path: str, size: int, mtime_ns: int):
+        """
+        Args:
+            file_path: 압축하지 않은 UDM JSON 파일
+            size / mtime_ns: 로드 시점 파일 상태 (바뀌면 범위를 신뢰하지 않음)
+        """
+        self.file_path = file_path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.offsets = array("Q")
+        self.lengths = array("I")
+
+    def append(self, offset: int, length: int):
+        self.offsets.append(offset)
+        self.lengths.append(length)
+
+    def select(self, positions: list[int]) -> "AssetSpans":
+        """주어진 위치만 남긴 새 범위 목록 (인덱스 재구성용)"""
+        selected = AssetSpans(self.file_path, self.size, self.mtime_ns)
+        count = len(self.offsets)
+        for position in positions:
+            if position < count:
+                selected.append(self.offsets[position], self.lengths[position])
+            else:
+                selected.append(0, 0)
+        return selected
+
+    def is_current(self) -> bool:
+        """파일이 로드 후 바뀌지 않았는지 여부"""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+    def read(self, positions: list[int]) -> list[dict | None]:
+        """
+        원본 Asset 읽기 (파일을 한 번 열고 위치 순서대로 읽음)
+
+        Returns:
+            positions 순서의 Asset (범위가 없거나 파일이 바뀌었으면 None)
+        """
+        count = len(self.offsets)
+        wanted = sorted({p for p in positions if p < count and self.lengths[p]})
+        if not wanted or not self.is_current():
+            return [None] * len(positions)
+
+        results: dict[int, dict] = {}
+        with open(self.file_path, "rb") as f:
+            for position in wanted:
+                f.seek(self.offsets[position])
+                results[position] = _SERIALIZER.loads(f.read(self.lengths[position]))
+        return [results.get(p) for p in positions]
+
+
+def read_changeset(path: str | Path) -> tuple[list[dict], set[str]]:
+    """
+    델타 내보내기 변경셋(JSONL) 읽기
+
+    Returns:
+        (추가/수정된 원본 Asset, 삭제된 asset_uuid)
+    """
+    upserts: list[dict] = []
+    removed: set[str] = set()
+    with open_compressed(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            change = _SERIALIZER.loads(line)
+            if change["op"] == "removed":
+                removed.add(change["asset_uuid"])
+            else:
+                upserts.append(change["asset"])
+    return upserts, removed
+
+
+def load_udm_index(file_path: str, progress: LoadProgress | None = None) -> UdmIndex:
+    """
+    UDM JSON 파일을 스트리밍으로 읽어 인덱스 생성
+
+    Args:
+        file_path: UDM JSON 파일 (.json.gz / .json.zst 포함)
+        progress: 진행 상황 (로더 스레드에서 갱신)
+
+    Returns:
+        UdmIndex (압축하지 않은 파일이면 요약 + 바이트 범위)
+    """
+    path = Path(file_path)
+    stat = path.stat()
+    compression = detect_compression(path)
+    progress = progress or LoadProgress(str(path))
+    progress.total_bytes = stat.st_size
+
+    spans = AssetSpans(str(path), stat.st_size, stat.st_mtime_ns) if compression is None else None
+    assets: list[dict] = []
+    columns = UdmColumns()
+
+    with open(path, "rb") as raw:
+        reader = JsonArrayReader(decompress_stream(raw, compression), "assets")
+        for item in reader:
+            columns.append(item.value)
+            if spans is None:
+                assets.append(item.value)
+            else:
+                assets.append(summarize_asset(item.value))
+                spans.append(item.offset, item.length)
+
+            if len(assets) % PROGRESS_INTERVAL == 0:
+                progress.bytes_read = raw.tell()
+                progress.assets_loaded = len(assets)
+
+    progress.assets_loaded = len(assets)
+    return UdmIndex(reader.members.get("_metadata") or {}, assets, spans, columns)
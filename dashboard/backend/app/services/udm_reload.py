@@ -0,0 +1,310 @@
+"""
+UDM 파일 핫 리로드
+
+로드한 UDM 파일과 같은 디렉토리의 델타 Asset 인덱스(udm_asset_index.json)를
+주기적으로 확인하여 저장소에 반영합니다 (네트워크 드라이브에서도 동작하도록 polling).
+
+- UDM 파일 교체: 크기/mtime이 바뀐 뒤 다음 확인에서도 같으면 (쓰기 완료)
+  on_file_changed 호출 → 저장소가 스트리밍으로 다시 로드
+- 델타 인덱스 갱신 (--delta 내보내기 실행): 인덱스 history에서 마지막으로 반영한
+  시점 이후의 변경셋을 순서대로 on_changeset 호출 → 저장소가 asset_uuid 기준으로 적용
+  (인덱스는 변경셋을 다 쓴 뒤 원자적으로 교체되므로 바로 적용)
+
+반영 기준점은 로드한 파일의 _metadata.generated_at입니다. 그 이후에 기록된 변경셋을
+적용하며, 변경셋의 base_generated_at이 직전 변경셋과 이어지지 않으면 (중간 변경셋 누락,
+첫 델타 실행 등) 적용하지 않고 파일을 다시 로드합니다.
+
+잠금 순서: sync 잠금(저장소 로드와 공유) → 저장소 쓰기 잠금 → _lock.
+_lock은 상태 읽기/기록에만 잡고 콜백 호출 중에는 잡지 않습니다.
+"""
+
+import json
+import sys
+import threading
+import time
+from contextlib import AbstractContextManager
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+# 프로젝트 루트를 경로에 추가 (src.extractors 패키지 import)
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.extractors.delta_exporter import ASSET_INDEX_FILENAME
+
+# (크기, mtime_ns) / None = 파일 없음
+FileSignature = tuple[int, int] | None
+
+
+def file_signature(path: Path) -> FileSignature:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _read_delta_index(path: Path) -> dict | None:
+    """델타 인덱스의 변경셋 이력 (Asset 해시 목록은 버림)"""
+    try:
+        with open(path, "rb") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    history = index.get("history")
+    if history is None:
+        # history 도입 전 인덱스: 마지막 변경셋만 있음
+        history = [{
+            "generated_at": index.get("generated_at"),
+            "base_generated_at": index.get("base_generated_at"),
+            "changeset": index.get("changeset"),
+        }]
+    return {"generated_at": index.get("generated_at"), "history": history}
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def _is_after(value: str | None, marker: str | None) -> bool:
+    """value 시각이 marker 이후인지 (해석할 수 없으면 이후로 봄)"""
+    value_time, marker_time = _parse_time(value), _parse_time(marker)
+    if value_time is None or marker_time is None:
+        return value != marker
+    try:
+        return value_time > marker_time
+    except TypeError:  # 시간대 유무가 다른 값
+        return value > marker
+
+
+class UdmFileWatcher:
+    """로드한 UDM 파일 / 델타 인덱스 감시 스레드"""
+
+    def __init__(
+        self,
+        file_path: str,
+        on_file_changed: Callable[[str], None],
+        on_changeset: Callable[[Path], None],
+        interval: float = 5.0,
+        baseline: str | None = None,
+        sync_lock: AbstractContextManager | None = None,
+    ):
+        """
+        Args:
+            file_path: 로드한 UDM JSON 파일
+            on_file_changed: 파일이 교체되었을 때 / 변경셋을 이어서 적용할 수 없을 때 (파일 경로)
+            on_changeset: 적용할 델타 변경셋 (변경셋 경로, 기록 순서대로 호출)
+            interval: 확인 주기 (초)
+            baseline: 로드한 파일의 generated_at (None이면 현재 델타 인덱스를 반영된 것으로 봄)
+            sync_lock: 확인~콜백 동안 보유하는 잠금 (저장소의 파일 로드와 공유, 재진입 가능)
+        """
+        self.on_file_changed = on_file_changed
+        self.on_changeset = on_changeset
+        self.interval = interval
+
+        self.checks = 0
+        self.reloads = 0
+        self.changesets_applied = 0
+        self.last_change_at: float | None = None
+        self.last_error: str | None = None
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._sync = sync_lock or threading.RLock()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.reset(file_path, baseline)
+
+    def reset(self, file_path: str, baseline: str | None = None):
+        """
+        감시 대상 / 기준점 변경 (파일을 새로 로드한 뒤 호출)
+
+        Args:
+            file_path: 로드한 UDM JSON 파일
+            baseline: 로드한 파일의 generated_at (이후 변경셋은 다음 확인에서 적용)
+        """
+        with self._lock:
+            self._generation += 1
+            self.file_path = Path(file_path)
+            self.delta_index_path = self.file_path.parent / ASSET_INDEX_FILENAME
+            self.baseline = baseline
+            self._file_signature = file_signature(self.file_path)
+            self._pending_signature: FileSignature = None
+            # 마지막으로 반영한 델타 변경셋 (None = 파일 기준점까지만 반영)
+            self.delta_generated_at: str | None = None
+            self._delta_signature: FileSignature = None
+            # 이어서 적용할 수 없어 파일을 다시 로드한 인덱스 (같은 인덱스로 반복 로드 방지)
+            self._rejected_delta_signature: FileSignature = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="udm-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self):
+        """
+        한 번 확인 (감시 스레드에서 주기적으로 호출)
+
+        할 일은 _lock 안에서 정하고, 콜백은 _lock을 놓은 뒤 호출합니다
+        (콜백은 저장소 쓰기 잠금을 잡고, 저장소는 로드 후 reset()을 호출하므로).
+        """
+        with self._sync:
+            with self._lock:
+                self.checks += 1
+                generation = self._generation
+                try:
+                    action = self._check_file() or self._check_delta()
+                except Exception as e:
+                    self.last_error = str(e)
+                    return
+
+            if action is None:
+                return
+            try:
+                action(generation)
+            except Exception as e:
+                with self._lock:
+                    self.last_error = str(e)
+
+    # -------------------------------------------------------------------------
+    # 확인 (_lock 보유 상태, 콜백 없이 할 일만 반환)
+    # -------------------------------------------------------------------------
+
+    def _check_file(self) -> Callable[[int], None] | None:
+        signature = file_signature(self.file_path)
+        if signature == self._file_signature or signature is None:
+            self._pending_signature = None
+            return None
+        if signature != self._pending_signature:
+            # 쓰는 중일 수 있으므로 다음 확인까지 대기
+            self._pending_signature = signature
+            return None
+        return partial(self._reload_file, self.file_path, signature)
+
+    def _check_delta(self) -> Callable[[int], None] | None:
+        signature = file_signature(self.delta_index_path)
+        if signature is None or signature in (self._delta_signature, self._rejected_delta_signature):
+            return None
+
+        delta = _read_delta_index(self.delta_index_path)
+        if delta is None:
+            return None  # 다음 확인에서 다시 시도
+
+        if self.delta_generated_at is None and self.baseline is None:
+            # 파일 생성 시점을 알 수 없음: 현재 인덱스까지 반영된 것으로 봄
+            self.delta_generated_at = delta["generated_at"]
+            self._delta_signature = signature
+            return None
+
+        history = [entry for entry in delta["history"] if entry.get("changeset")]
+        if self.delta_generated_at is not None:
+            marker, expected_base = self.delta_generated_at, self.delta_generated_at
+        else:
+            marker, expected_base = self.baseline, None
+            # 파일 생성 전 마지막 변경셋 = 첫 변경셋의 기준
+            for entry in history:
+                if not _is_after(entry["generated_at"], self.baseline):
+                    expected_base = entry["generated_at"]
+
+        pending = [entry for entry in history if _is_after(entry["generated_at"], marker)]
+        if not pending:
+            self._delta_signature = signature
+            return None
+
+        paths = []
+        for entry in pending:
+            path = self.delta_index_path.parent / entry["changeset"]
+            if expected_base is None or entry["base_generated_at"] != expected_base:
+                reason = (
+                    f"Changeset {entry['changeset']} base {entry['base_generated_at']} "
+                    f"does not follow {expected_base or self.baseline}; reloaded {self.file_path.name}"
+                )
+                return partial(self._reload_for_delta, self.file_path, signature, reason)
+            if not path.exists():
+                reason = f"Changeset {entry['changeset']} is missing; reloaded {self.file_path.name}"
+                return partial(self._reload_for_delta, self.file_path, signature, reason)
+            paths.append((path, entry["generated_at"]))
+            expected_base = entry["generated_at"]
+
+        return partial(self._apply_changesets, paths, signature)
+
+    # -------------------------------------------------------------------------
+    # 작업 (_lock 없이 콜백 호출, 결과만 _lock 안에서 기록)
+    # -------------------------------------------------------------------------
+
+    def _reload_file(self, path: Path, signature: FileSignature, generation: int):
+        self.on_file_changed(str(path))
+        with self._lock:
+            if generation == self._generation:
+                # 콜백이 reset()을 호출했다면 이미 새 상태가 기록됨
+                self._file_signature = signature
+                self._pending_signature = None
+            self.reloads += 1
+            self.last_change_at = time.time()
+            self.last_error = None
+
+    def _reload_for_delta(self, path: Path, signature: FileSignature, reason: str, generation: int):
+        self.on_file_changed(str(path))
+        with self._lock:
+            self._rejected_delta_signature = signature
+            self.reloads += 1
+            self.last_change_at = time.time()
+            self.last_error = reason
+
+    def _apply_changesets(
+        self,
+        changesets: list[tuple[Path, str]],
+        signature: FileSignature,
+        generation: int,
+    ):
+        for path, generated_at in changesets:
+            self.on_changeset(path)
+            with self._lock:
+                if generation != self._generation:
+                    return  # 그 사이 파일을 다시 로드함 (다음 확인에서 새 기준점으로)
+                self.delta_generated_at = generated_at
+                self.changesets_applied += 1
+                self.last_change_at = time.time()
+
+        with self._lock:
+            if generation == self._generation:
+                self._delta_signature = signature
+                self.last_error = None
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "watching": self.is_running,
+                "file_path": str(self.file_path),
+                "baseline_generated_at": self.baseline,
+                "delta_index": str(self.delta_index_path) if self._delta_signature else None,
+                "delta_generated_at": self.delta_generated_at,
+                "interval_sec": self.interval,
+                "checks": self.checks,
+                "reloads": self.reloads,
+                "changesets_applied": self.changesets_applied,
+                "last_change_at": self.last_change_at,
+                "last_error": self.last_error,
+            }
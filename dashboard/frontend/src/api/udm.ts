@@ -1,6 +1,14 @@
 // UDM Viewer API - Real NAS Data Connection
 import { apiGet, apiPost } from './client'
-import type { Asset, Segment, UdmStats, UdmFilters } from '@/types/udm'
+import type {
+  Asset,
+  Segment,
+  UdmAssetPage,
+  UdmColumn,
+  UdmColumnPage,
+  UdmStats,
+  UdmFilters,
+} from '@/types/udm'
 
 const API_PREFIX = '/api/udm'
 
@@ -371,6 +379,21 @@ export interface UdmDocumentResponse {
     total_segments: number
   }
   assets: Asset[]
+  page?: {
+    total: number
+    sort: string
+    next_cursor: string | null
+  }
+}
+
+function buildFilterParams(filters?: UdmFilters): URLSearchParams {
+  const params = new URLSearchParams()
+  if (filters?.brand) params.append('brand', filters.brand)
+  if (filters?.asset_type) params.append('asset_type', filters.asset_type)
+  if (filters?.year) params.append('year', String(filters.year))
+  if (filters?.search) params.append('search', filters.search)
+  if (filters?.sort) params.append('sort', filters.sort)
+  return params
 }
 
 export async function fetchUdmAssets(filters?: UdmFilters): Promise<Asset[]> {
@@ -380,25 +403,62 @@ export async function fetchUdmAssets(filters?: UdmFilters): Promise<Asset[]> {
     return filterMockAssets(filters)
   }
 
-  // Build query params
-  const params = new URLSearchParams()
-  if (filters?.brand) params.append('brand', filters.brand)
-  if (filters?.asset_type) params.append('asset_type', filters.asset_type)
-  if (filters?.year) params.append('year', String(filters.year))
-  if (filters?.search) params.append('search', filters.search)
+  const page = await fetchUdmAssetPage(filters)
+  return page.assets
+}
+
+/**
+ * 전체 Asset 키셋 페이지 조회 (다음 페이지는 이전 응답의 next_cursor 전달)
+ */
+export async function fetchUdmAssetPage(
+  filters?: UdmFilters,
+  cursor?: string | null,
+  limit?: number
+): Promise<UdmAssetPage> {
+  if (USE_MOCK) {
+    const assets = filterMockAssets(filters)
+    return {
+      total: MOCK_ASSETS.length,
+      filtered: assets.length,
+      sort: filters?.sort ?? 'file_name',
+      next_cursor: null,
+      assets,
+    }
+  }
+
+  const params = buildFilterParams(filters)
   if (filters?.hasSegments) params.append('has_segments', 'true')
+  if (cursor) params.append('cursor', cursor)
+  if (limit) params.append('limit', String(limit))
 
   const queryString = params.toString()
   const url = queryString ? `${API_PREFIX}/assets/full?${queryString}` : `${API_PREFIX}/assets/full`
+  return apiGet<UdmAssetPage>(url)
+}
 
-  // Fetch full asset data
-  const response = await apiGet<{
-    total: number
-    filtered: number
-    assets: Asset[]
-  }>(url)
+/**
+ * Asset 열 조회 (매트릭스 뷰용 컬럼형 응답, fields 미지정 시 전체 열)
+ */
+export async function fetchUdmColumns(
+  fields?: string[],
+  filters?: UdmFilters,
+  cursor?: string | null,
+  limit?: number
+): Promise<UdmColumnPage> {
+  const params = buildFilterParams(filters)
+  if (fields?.length) params.append('fields', fields.join(','))
+  if (cursor) params.append('cursor', cursor)
+  if (limit) params.append('limit', String(limit))
+  return apiGet<UdmColumnPage>(`${API_PREFIX}/columns?${params.toString()}`)
+}
 
-  return response.assets
+/**
+ * 컬럼형 응답의 row 번째 값 (딕셔너리 열은 디코딩)
+ */
+export function getColumnValue(column: UdmColumn, row: number): unknown {
+  if (Array.isArray(column)) return column[row]
+  const index = column.indices[row]
+  return index === null ? null : column.dictionary[index]
 }
 
 export async function fetchUdmDocument(filters?: UdmFilters): Promise<UdmDocumentResponse> {
@@ -417,12 +477,7 @@ export async function fetchUdmDocument(filters?: UdmFilters): Promise<UdmDocumen
     }
   }
 
-  const params = new URLSearchParams()
-  if (filters?.brand) params.append('brand', filters.brand)
-  if (filters?.asset_type) params.append('asset_type', filters.asset_type)
-  if (filters?.year) params.append('year', String(filters.year))
-  if (filters?.search) params.append('search', filters.search)
-
+  const params = buildFilterParams(filters)
   const queryString = params.toString()
   const url = queryString ? `${API_PREFIX}?${queryString}` : API_PREFIX
   return apiGet<UdmDocumentResponse>(url)
@@ -436,6 +491,7 @@ export async function fetchUdmStats(): Promise<UdmStats> {
 
   // Get stats from real API
   const response = await apiGet<{
+    version: string | null
     total_assets: number
     total_segments: number
     brand_distribution: Record<string, number>
@@ -444,6 +500,7 @@ export async function fetchUdmStats(): Promise<UdmStats> {
   }>(`${API_PREFIX}/stats`)
 
   return {
+    version: response.version,
     total_assets: response.total_assets,
     total_segments: response.total_segments,
     by_brand: response.brand_distribution,
@@ -498,13 +555,36 @@ export async function loadDemoData(): Promise<{
   return apiPost(`${API_PREFIX}/demo`)
 }
 
+export interface UdmLoadStatus {
+  loaded: boolean
+  file_path: string | null
+  loaded_at: string | null
+  total_assets: number
+  loading: boolean
+  load_progress: {
+    state: 'running' | 'done' | 'failed'
+    file_path: string
+    total_bytes: number
+    bytes_read: number
+    percent: number
+    assets_loaded: number
+    elapsed_sec: number
+    error: string | null
+  } | null
+}
+
+// Starts a background load; poll getLoadStatus() for progress
 export async function loadUdmFile(filePath: string): Promise<{
   success: boolean
   message: string
-  total_assets: number
+  status: UdmLoadStatus
 }> {
   return apiPost(`${API_PREFIX}/load?file_path=${encodeURIComponent(filePath)}`)
 }
 
+export async function getLoadStatus(): Promise<UdmLoadStatus> {
+  return apiGet<UdmLoadStatus>(`${API_PREFIX}/load/status`)
+}
+
 // Export mock data for testing
 export { MOCK_ASSETS, MOCK_SEGMENTS }
@@ -166,6 +166,7 @@ export interface Asset {
 // =============================================================================
 
 export interface UdmStats {
+  version?: string | null // 데이터 버전 ID (바뀌면 캐시 무효화)
   total_assets: number
   total_segments: number
   by_brand: Record<string, number>
@@ -179,6 +180,34 @@ export interface UdmFilters {
   year?: number
   search?: string
   hasSegments?: boolean
+  sort?: string // file_name | year | brand | asset_type | asset_uuid ('-' 접두사: 내림차순)
+}
+
+// 컬럼형 응답의 딕셔너리 인코딩 열 (Enum: brand, asset_type 등)
+export interface UdmDictionaryColumn {
+  dictionary: string[]
+  indices: (number | null)[]
+}
+
+export type UdmColumn = unknown[] | UdmDictionaryColumn
+
+export interface UdmColumnPage {
+  version: string | null
+  total: number // 전체 Asset 수
+  filtered: number // 필터 결과 수 (전체 페이지 합)
+  rows: number
+  sort: string
+  next_cursor: string | null
+  fields: string[]
+  columns: Record<string, UdmColumn> // 열 이름 = 필드 경로 (예: event_context.brand)
+}
+
+export interface UdmAssetPage {
+  total: number // 전체 Asset 수
+  filtered: number // 필터 결과 수 (전체 페이지 합)
+  sort: string
+  next_cursor: string | null // 다음 페이지 커서 (마지막 페이지면 null)
+  assets: Asset[]
 }
 
 // =============================================================================
@@ -0,0 +1,190 @@
+"""
+경로 추론 마이크로벤치마크
+
+브랜드/Asset Type 추론 방식별 경로당 비용 비교 (기본 100k 경로)
+- legacy: 키워드마다 .upper() + in (기존 NasScanner 방식)
+- regex: 카테고리별 단일 alternation 정규식 (lookahead로 겹치는 매칭까지 수집)
+- aho-corasick: 순수 Python Aho-Corasick 오토마톤
+- engine: PathInferenceEngine (사전 대문자 테이블 + 폴더 LRU 캐시)
+
+사용법:
+    python scripts/bench_path_inference.py
+    python scripts/bench_path_inference.py --paths-file nas_paths.txt
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.extractors.nas_scanner import NasScanner
+from src.extractors.path_inference import KeywordRules, PathInferenceEngine
+
+BRAND_RULES = NasScanner.BRAND_FOLDERS
+ASSET_TYPE_RULES = NasScanner.ASSET_TYPE_FOLDERS
+
+
+def generate_corpus(count: int, seed: int = 42) -> list[str]:
+    """NAS 구조를 흉내 낸 합성 경로 (폴더당 수십 개 파일)"""
+    rng = random.Random(seed)
+    brands = ["WSOP", "WSOPE", "HCL", "PAD", "GGMillions", "GOG", "MPP", "Misc"]
+    kinds = ["STREAM", "SUBCLIP", "EPISODES", "Mastered", "Clean", "RAW", "Hand Clip"]
+
+    paths = []
+    while len(paths) < count:
+        folder = "/".join([
+            rng.choice(brands),
+            f"{rng.choice(brands)} {rng.randint(1973, 2025)}",
+            rng.choice(kinds),
+            f"Day {rng.randint(1, 9)}",
+        ])
+        for i in range(rng.randint(10, 80)):
+            paths.append(f"{folder}/{rng.choice(brands)}_{rng.randint(10, 99)}-{i:03d}_final_table.mp4")
+    return paths[:count]
+
+
+def legacy_infer(path: str) -> tuple[str | None, str | None]:
+    path_upper = path.upper()
+    result = []
+    for rules in (BRAND_RULES, ASSET_TYPE_RULES):
+        found = None
+        for label, keywords in rules.items():
+            if any(kw.upper() in path_upper for kw in keywords):
+                found = label
+                break
+        result.append(found)
+    return tuple(result)
+
+
+def build_regex_infer():
+    """카테고리별 단일 정규식: 모든 매칭 위치의 규칙 중 우선순위 최소값 선택"""
+    compiled = []
+    for rules in (BRAND_RULES, ASSET_TYPE_RULES):
+        priority = {}
+        for index, keywords in enumerate(rules.values()):
+            for kw in keywords:
+                priority.setdefault(kw.upper(), index)
+        alternation = "|".join(sorted(map(re.escape, priority), key=len, reverse=True))
+        compiled.append((re.compile(f"(?=({alternation}))"), priority, list(rules)))
+
+    def infer(path: str):
+        path_upper = path.upper()
+        result = []
+        for pattern, priority, labels in compiled:
+            best = min((priority[m] for m in pattern.findall(path_upper)), default=None)
+            result.append(None if best is None else labels[best])
+        return tuple(result)
+
+    return infer
+
+
+def build_aho_corasick_infer():
+    """카테고리별 Aho-Corasick 오토마톤 (노드별 최소 규칙 인덱스 전파)"""
+    automata = []
+    for rules in (BRAND_RULES, ASSET_TYPE_RULES):
+        goto: list[dict[str, int]] = [{}]
+        output: list[int | None] = [None]
+        for index, keywords in enumerate(rules.values()):
+            for kw in keywords:
+                node = 0
+                for ch in kw.upper():
+                    if ch not in goto[node]:
+                        goto.append({})
+                        output.append(None)
+                        goto[node][ch] = len(goto) - 1
+                    node = goto[node][ch]
+                if output[node] is None or index < output[node]:
+                    output[node] = index
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0) if goto[f].get(ch, 0) != child else 0
+                inherited = output[fail[child]]
+                if inherited is not None and (output[child] is None or inherited < output[child]):
+                    output[child] = inherited
+        automata.append((goto, fail, output, list(rules)))
+
+    def infer(path: str):
+        path_upper = path.upper()
+        result = []
+        for goto, fail, output, labels in automata:
+            node, best = 0, None
+            for ch in path_upper:
+                while node and ch not in goto[node]:
+                    node = fail[node]
+                node = goto[node].get(ch, 0)
+                hit = output[node]
+                if hit is not None and (best is None or hit < best):
+                    best = hit
+            result.append(None if best is None else labels[best])
+        return tuple(result)
+
+    return infer
+
+
+def build_engine_infer():
+    engine = PathInferenceEngine(
+        brand=KeywordRules(BRAND_RULES),
+        asset_type=KeywordRules(ASSET_TYPE_RULES),
+    )
+
+    def infer(path: str):
+        result = engine.infer(path)
+        return result.brand, result.asset_type
+
+    return infer
+
+
+def bench(name: str, func, paths: list[str], repeat: int) -> list:
+    best = float("inf")
+    results = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [func(p) for p in paths]
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<14} {best * 1e6 / len(paths):8.2f} us/path   total {best:7.3f}s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Path inference microbenchmark")
+    parser.add_argument("--paths-file", help="File with one relative path per line")
+    parser.add_argument("--count", type=int, default=100_000, help="Synthetic corpus size")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best is reported)")
+    args = parser.parse_args()
+
+    if args.paths_file:
+        with open(args.paths_file, "r", encoding="utf-8") as f:
+            paths = [line.rstrip("\n") for line in f if line.strip()]
+    else:
+        paths = generate_corpus(args.count)
+
+    print(f"Corpus: {len(paths):,} paths\n")
+
+    expected = bench("legacy", legacy_infer, paths, args.repeat)
+    for name, builder in [
+        ("regex", build_regex_infer),
+        ("aho-corasick", build_aho_corasick_infer),
+        ("engine", build_engine_infer),
+    ]:
+        # engine은 반복마다 새로 생성하지 않으므로 2회차부터 폴더 캐시가 적중함
+        results = bench(name, builder(), paths, args.repeat)
+        if results != expected:
+            print(f"  !! {name} results differ from legacy")
+
+
+if __name__ == "__main__":
+    main()
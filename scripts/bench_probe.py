@@ -0,0 +1,137 @@
+"""
+기술 메타데이터 프로브 벤치마크
+
+MP4 헤더 리더(mp4_reader) vs ffprobe 프로세스의 초당 파일 수 비교
+(경로를 주지 않으면 moov가 끝에 있는 합성 MP4를 생성)
+
+사용법:
+    python scripts/bench_probe.py
+    python scripts/bench_probe.py --path "Z:/ARCHIVE/WSOP" --limit 500 --workers 4
+"""
+
+import argparse
+import shutil
+import struct
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.extractors.mp4_reader import MP4_EXTENSIONS, Mp4ParseError, read_mp4_info
+from src.extractors.tech_spec import ProbeTimeout, run_ffprobe
+
+
+def _box(box_type: bytes, *payloads: bytes) -> bytes:
+    payload = b"".join(payloads)
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def generate_files(directory: Path, count: int, media_bytes: int) -> list[Path]:
+    """moov가 mdat 뒤에 있는 합성 MP4 (1080p H.264, 29.97fps)"""
+    stbl = _box(
+        b"stbl",
+        _box(b"stsd", bytes(4), struct.pack(">I", 1), _box(
+            b"avc1", bytes(6), struct.pack(">H", 1), bytes(16),
+            struct.pack(">HH", 1920, 1080), bytes(50),
+        )),
+        _box(b"stts", bytes(4), struct.pack(">III", 1, 107892, 1001)),
+    )
+    moov = _box(
+        b"moov",
+        _box(b"mvhd", bytes(4), struct.pack(">IIII", 0, 0, 1000, 3600000), bytes(80)),
+        _box(
+            b"trak",
+            _box(b"tkhd", bytes(76), struct.pack(">II", 1920 << 16, 1080 << 16)),
+            _box(
+                b"mdia",
+                _box(b"mdhd", bytes(4), struct.pack(">IIII", 0, 0, 30000, 107999892), bytes(4)),
+                _box(b"hdlr", bytes(8), b"vide", bytes(13)),
+                _box(b"minf", stbl),
+            ),
+        ),
+    )
+    ftyp = _box(b"ftyp", b"isom", bytes(4), b"isomavc1")
+    mdat = struct.pack(">I4s", 8 + media_bytes, b"mdat") + bytes(media_bytes)
+    data = ftyp + mdat + moov
+
+    files = []
+    for i in range(count):
+        path = directory / f"clip_{i:05d}.mp4"
+        path.write_bytes(data)
+        files.append(path)
+    return files
+
+
+def find_files(root: Path, limit: int) -> list[Path]:
+    files = []
+    for path in root.rglob("*"):
+        if path.suffix.lower() in MP4_EXTENSIONS and path.is_file():
+            files.append(path)
+            if len(files) >= limit:
+                break
+    return files
+
+
+def bench(name: str, probe, files: list[Path], workers: int) -> float:
+    """초당 파일 수"""
+    ok = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for info in executor.map(probe, files):
+            ok += info is not None
+    elapsed = time.perf_counter() - start
+    rate = len(files) / elapsed if elapsed > 0 else 0.0
+    print(f"  {name:<10} {elapsed:8.2f} sec  {rate:10,.1f} files/sec  ({ok}/{len(files)} read)")
+    return rate
+
+
+def native_probe(path: Path) -> dict | None:
+    try:
+        return read_mp4_info(str(path))
+    except (Mp4ParseError, OSError):
+        return None
+
+
+def ffprobe_probe(path: Path) -> dict | None:
+    try:
+        return run_ffprobe(str(path))
+    except (ProbeTimeout, OSError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MP4 header reader vs ffprobe")
+    parser.add_argument("--path", help="Directory with MP4/MOV files (default: synthetic files)")
+    parser.add_argument("--limit", type=int, default=500, help="Max files")
+    parser.add_argument("--media-mb", type=int, default=8, help="mdat size of synthetic files (MB)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent probes")
+    args = parser.parse_args()
+
+    temp_dir = None
+    if args.path:
+        files = find_files(Path(args.path), args.limit)
+    else:
+        temp_dir = Path(tempfile.mkdtemp(prefix="bench_probe_"))
+        files = generate_files(temp_dir, args.limit, args.media_mb * 1024 * 1024)
+
+    try:
+        print(f"Files: {len(files):,}  workers: {args.workers}")
+        native = bench("native", native_probe, files, args.workers)
+
+        if shutil.which("ffprobe") is None:
+            print("  ffprobe    (not installed)")
+            return
+        ffprobe = bench("ffprobe", ffprobe_probe, files, args.workers)
+        if ffprobe:
+            print(f"\n  native / ffprobe: {native / ffprobe:.1f}x")
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
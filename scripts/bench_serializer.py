@@ -0,0 +1,84 @@
+"""
+JSON 직렬화 백엔드 벤치마크
+
+100k Asset 문서 기준 내보내기/로드 처리량(MB/s) 비교
+- stdlib: 표준 json
+- orjson: orjson 백엔드 (설치 시)
+
+사용법:
+    python scripts/bench_serializer.py
+    python scripts/bench_serializer.py --count 20000 --format jsonl
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from bench_transform import generate_files
+
+from src.extractors.json_exporter import ExportConfig, JsonExporter
+from src.extractors.serializer import get_serializer, orjson_available
+from src.extractors.udm_transformer import UdmTransformer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON serializer benchmark")
+    parser.add_argument("--count", type=int, default=100_000, help="Synthetic asset count")
+    parser.add_argument("--format", choices=["json", "jsonl"], default="json", help="Export format")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best is reported)")
+    args = parser.parse_args()
+
+    assets, _ = UdmTransformer(trusted=True).transform_batch(generate_files(args.count))
+    print(f"Corpus: {len(assets):,} assets ({args.format})\n")
+
+    backends = ["stdlib"] + (["orjson"] if orjson_available() else [])
+    baseline = None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in backends:
+            config = ExportConfig(
+                format=args.format,
+                output_dir=str(Path(tmp) / backend),
+                include_timestamp=False,
+                serializer=backend,
+                chunk_size=0,
+                max_file_size_mb=0,
+            )
+            exporter = JsonExporter(config)
+
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                result = exporter.export(assets)
+                best = min(best, time.perf_counter() - start)
+
+            mb = result.file_size_bytes / (1024 * 1024)
+            baseline = baseline or best
+
+            # 로드 (단일 JSON 문서만)
+            load_info = ""
+            if args.format == "json":
+                serializer = get_serializer(backend)
+                data = Path(result.output_files[0]).read_bytes()
+                start = time.perf_counter()
+                serializer.loads(data)
+                load_sec = time.perf_counter() - start
+                load_info = f"   load {mb / load_sec:7.1f} MB/s"
+
+            print(
+                f"{backend:<8} export {mb / best:7.1f} MB/s ({best:6.2f}s, {mb:.1f} MB)"
+                f"{load_info}   x{baseline / best:.2f}"
+            )
+
+    if not orjson_available():
+        print("\norjson is not installed (pip install orjson)")
+
+
+if __name__ == "__main__":
+    main()
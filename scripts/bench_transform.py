@@ -0,0 +1,132 @@
+"""
+UDM 변환 벤치마크
+
+UdmTransformer 검증 경로 vs trusted(model_construct) 경로의 초당 Asset 수 비교
+(기본 100k 합성 NasFileInfo)
+
+사용법:
+    python scripts/bench_transform.py
+    python scripts/bench_transform.py --count 20000 --repeat 5
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.extractors.nas_scanner import NasFileInfo
+from src.extractors.udm_transformer import UdmTransformer
+from src.models.udm import clear_parse_filename_cache
+
+FILENAME_TEMPLATES = [
+    "WCLA{yy}-{n:02d}.mp4",
+    "WP{yy}-PE-{n:02d}.mp4",
+    "PAD_S{s}_EP{n:02d}_GGPoker-001.mp4",
+    "{n}-wsop-20{yy}-be-ev-{n:02d}-25k-nlh-hr-ft-description.mp4",
+    "WSOP{yy}_ME{n:02d}_NB.mp4",
+    "HCL_20{yy}_EP{n:02d}.mp4",
+    "random_clip_{n}.mov",
+]
+
+FOLDERS = [
+    ("WSOP/WSOP Bracelet Event/STREAM", "WSOP", "STREAM"),
+    ("WSOP/WSOP Circuit Event/SUBCLIP", "WSOP", "SUBCLIP"),
+    ("PAD/Season {s}", "PAD", None),
+    ("HCL/20{yy}", "HCL", None),
+    ("Misc/Unsorted", None, None),
+]
+
+
+def generate_files(count: int, seed: int = 42) -> list[NasFileInfo]:
+    """NasScanner 결과를 흉내 낸 합성 파일 목록"""
+    rng = random.Random(seed)
+    now = datetime.now()
+    files = []
+
+    for i in range(count):
+        values = {"yy": rng.randint(10, 25), "n": rng.randint(1, 99), "s": rng.randint(1, 14)}
+        folder, brand, asset_type = rng.choice(FOLDERS)
+        folder = folder.format(**values)
+        # 파일명이 겹치지 않도록 인덱스 폴더 추가 (파싱 캐시 영향 최소화)
+        folder = f"{folder}/{i // 50:05d}"
+        filename = rng.choice(FILENAME_TEMPLATES).format(**values)
+
+        files.append(NasFileInfo(
+            path=f"/ARCHIVE/{folder}/{filename}",
+            filename=filename,
+            extension=Path(filename).suffix.lower(),
+            size_bytes=rng.randint(10**6, 10**10),
+            modified_at=now,
+            folder_path=f"/ARCHIVE/{folder}",
+            relative_path=f"{folder}/{filename}",
+            inferred_brand=brand,
+            inferred_asset_type=asset_type,
+        ))
+
+    return files
+
+
+def bench(
+    name: str,
+    transformer: UdmTransformer,
+    files: list[NasFileInfo],
+    repeat: int,
+    workers: int = 1,
+):
+    best = float("inf")
+    assets = []
+    for _ in range(repeat):
+        assets = None  # 이전 반복 결과 해제
+        clear_parse_filename_cache()
+        gc.collect()
+        start = time.perf_counter()
+        assets, _ = transformer.transform_batch(files, workers=workers)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<22} {len(files) / best:>10,.0f} assets/sec   total {best:7.3f}s")
+    return assets, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UDM transform benchmark")
+    parser.add_argument("--count", type=int, default=100_000, help="Synthetic file count")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best is reported)")
+    parser.add_argument("--workers", type=int, nargs="*", default=[], help="Also time process-pool transform with N workers")
+    args = parser.parse_args()
+
+    files = generate_files(args.count)
+    print(f"Corpus: {len(files):,} files\n")
+
+    validated, validated_sec = bench("validated", UdmTransformer(), files, args.repeat)
+    trusted_transformer = UdmTransformer(trusted=True)
+    trusted, trusted_sec = bench("trusted", trusted_transformer, files, args.repeat)
+
+    start = time.perf_counter()
+    _, validation = trusted_transformer.validate_assets(trusted)
+    validate_sec = time.perf_counter() - start
+    print(f"{'trusted + validate':<22} {len(files) / (trusted_sec + validate_sec):>10,.0f} assets/sec"
+          f"   (validation {validate_sec:.3f}s, {validation.failed} invalid)")
+
+    print(f"\nSpeedup (trusted): {validated_sec / trusted_sec:.2f}x")
+
+    expected = [a.model_dump(mode="json") for a in validated]
+    actual = [a.model_dump(mode="json") for a in trusted]
+    if expected != actual:
+        print("  !! trusted output differs from validated output")
+
+    for workers in args.workers:
+        parallel, parallel_sec = bench(
+            f"trusted x{workers} procs", trusted_transformer, files, args.repeat, workers=workers,
+        )
+        print(f"  scaling vs 1 process: {trusted_sec / parallel_sec:.2f}x")
+        if [a.model_dump(mode="json") for a in parallel] != expected:
+            print("  !! parallel output differs from sequential output")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,26 +3,18 @@ NAS 파일 목록을 CSV로 내보내기
 """
 
 import csv
-import importlib.util
+import sys
 from pathlib import Path
 
 BASE_DIR = Path(r"D:\AI\claude01\Archive_Converter")
 OUTPUT_DIR = BASE_DIR / "data" / "sheets_export"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-# nas_scanner 모듈 직접 로드 (패키지 __init__ 우회)
-_nas_scanner_path = BASE_DIR / "src" / "extractors" / "nas_scanner.py"
-_spec = importlib.util.spec_from_file_location("nas_scanner", _nas_scanner_path)
-_nas_scanner_module = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_nas_scanner_module)
-NasScanner = _nas_scanner_module.NasScanner
-
-# udm 모듈 직접 로드
-_udm_path = BASE_DIR / "src" / "models" / "udm.py"
-_spec_udm = importlib.util.spec_from_file_location("udm", _udm_path)
-_udm_module = importlib.util.module_from_spec(_spec_udm)
-_spec_udm.loader.exec_module(_udm_module)
-parse_filename = _udm_module.parse_filename
+# 프로젝트 루트 추가 (nas_scanner는 패키지 내 상대 import 사용)
+sys.path.insert(0, str(BASE_DIR))
+
+from src.extractors.nas_scanner import NasScanner
+from src.models.udm import parse_filename
 
 
 def export_nas_files():
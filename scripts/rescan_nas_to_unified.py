@@ -19,6 +19,7 @@ PROJECT_ROOT = Path(r"D:\AI\claude01\Archive_Converter")
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.extractors.nas_scanner import NasScanner, NasFileInfo
+from src.extractors.path_inference import KeywordRules, PathInferenceEngine
 from src.models.udm import parse_filename, Brand, AssetType
 
 DATA_DIR = PROJECT_ROOT / "data"
@@ -29,40 +30,22 @@ NAS_ROOT = Path(r"Z:\ARCHIVE")  # 마운트된 NAS 경로
 # NAS_ROOT = Path(r"\\10.10.100.122\docker\GGPNAs\ARCHIVE")  # UNC 경로
 
 
-def infer_brand_from_path(relative_path: str, filename: str) -> str:
-    """경로와 파일명에서 브랜드 추론"""
-    path_upper = relative_path.upper()
-    filename_upper = filename.upper()
-
-    # 경로 기반 추론
-    brand_patterns = {
-        "WSOP": ["WSOP", "WSOPE", "WSOPC", "WSOPP"],
-        "HCL": ["HCL", "HUSTLER"],
-        "PAD": ["PAD", "POKERAFTERDARK", "POKER AFTER DARK"],
-        "GGMillions": ["GGMILLIONS", "GGM"],
-        "MPP": ["MPP", "MALTA"],
-        "GOG": ["GOG", "GAMEOFGOLD", "GAME OF GOLD"],
-        "WPT": ["WPT"],
-        "EPT": ["EPT"],
-    }
-
-    combined = path_upper + " " + filename_upper
-
-    for brand, patterns in brand_patterns.items():
-        for pattern in patterns:
-            if pattern in combined:
-                return brand
-
-    return "OTHER"
-
-
-def infer_asset_type_from_path(relative_path: str, filename: str) -> str:
-    """경로와 파일명에서 AssetType 추론"""
-    path_upper = relative_path.upper()
-    filename_upper = filename.upper()
-    combined = path_upper + " " + filename_upper
-
-    asset_type_patterns = {
+# 경로 추론 규칙 (선언 순서 = 우선순위)
+PATH_INFERENCE = PathInferenceEngine(
+    brand=KeywordRules(
+        {
+            "WSOP": ["WSOP", "WSOPE", "WSOPC", "WSOPP"],
+            "HCL": ["HCL", "HUSTLER"],
+            "PAD": ["PAD", "POKERAFTERDARK", "POKER AFTER DARK"],
+            "GGMillions": ["GGMILLIONS", "GGM"],
+            "MPP": ["MPP", "MALTA"],
+            "GOG": ["GOG", "GAMEOFGOLD", "GAME OF GOLD"],
+            "WPT": ["WPT"],
+            "EPT": ["EPT"],
+        },
+        default="OTHER",
+    ),
+    asset_type=KeywordRules({
         "STREAM": ["STREAM", "STREAMS"],
         "SUBCLIP": ["SUBCLIP", "SUBCLIPS", "SUB_"],
         "MASTER": ["MASTERED", "MASTER"],
@@ -70,12 +53,20 @@ def infer_asset_type_from_path(relative_path: str, filename: str) -> str:
         "CLEAN": ["CLEAN"],
         "RAW": ["RAW"],
         "GENERIC": ["GENERIC"],
-    }
+    }),
+)
+
+
+def infer_brand_from_path(relative_path: str) -> str:
+    """경로에서 브랜드 추론"""
+    return PATH_INFERENCE.infer(relative_path).brand
 
-    for asset_type, patterns in asset_type_patterns.items():
-        for pattern in patterns:
-            if pattern in combined:
-                return asset_type
+
+def infer_asset_type_from_path(relative_path: str, filename: str) -> str:
+    """경로와 파일명에서 AssetType 추론"""
+    asset_type = PATH_INFERENCE.infer(relative_path).asset_type
+    if asset_type:
+        return asset_type
 
     # 확장자 기반 추론
     ext = Path(filename).suffix.lower()
@@ -134,7 +125,7 @@ def file_info_to_asset(file_info: NasFileInfo) -> dict:
         pass
 
     # 브랜드 추론
-    brand = infer_brand_from_path(file_info.relative_path, file_info.filename)
+    brand = infer_brand_from_path(file_info.relative_path)
 
     # AssetType 추론
     asset_type = infer_asset_type_from_path(file_info.relative_path, file_info.filename)
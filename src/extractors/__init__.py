@@ -4,21 +4,45 @@ NAS-to-UDM Extractor 모듈
 NAS 파일시스템 스캔 → 메타데이터 추출 → UDM JSON 변환
 """
 
-from .nas_scanner import NasScanner, NasFileInfo, ScanResult
+from .nas_scanner import IncompleteScanError, NasScanner, NasFileInfo, ScanResult
 from .udm_transformer import UdmTransformer, TransformResult
-from .json_exporter import JsonExporter, ExportConfig
+from .tech_spec import TechSpecService, ProbeCache
+from .mp4_reader import read_mp4_info
+from .json_exporter import JsonExporter, ExportConfig, verify_export_manifest
+from .compression import open_compressed, read_compressed
+from .json_stream import JsonArrayReader
+from .delta_exporter import DeltaExporter, DeltaExportResult
+from .columnar_exporter import ColumnarExporter, ColumnarExportConfig, read_columnar
 
 __all__ = [
     # NAS Scanner
     "NasScanner",
     "NasFileInfo",
     "ScanResult",
+    "IncompleteScanError",
     # UDM Transformer
     "UdmTransformer",
     "TransformResult",
+    # Tech Spec (ffprobe)
+    "TechSpecService",
+    "ProbeCache",
+    "read_mp4_info",
     # JSON Exporter
     "JsonExporter",
     "ExportConfig",
+    "verify_export_manifest",
+    # Delta Exporter
+    "DeltaExporter",
+    "DeltaExportResult",
+    # Columnar Exporter (pyarrow)
+    "ColumnarExporter",
+    "ColumnarExportConfig",
+    "read_columnar",
+    # Compression
+    "open_compressed",
+    "read_compressed",
+    # Incremental JSON reading
+    "JsonArrayReader",
 ]
 
 __version__ = "1.0.0"
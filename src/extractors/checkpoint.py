@@ -0,0 +1,167 @@
+"""
+추출 실행 체크포인트
+
+JSONL 샤드 내보내기 중 샤드가 닫힐 때마다 진행 상황을 저장하여,
+중단된 실행(SMB 연결 끊김, 절전 등)을 같은 run id로 이어서 실행합니다.
+
+저장 내용:
+- 닫힌 샤드 목록 (매니페스트 항목 그대로) 과 누적 통계
+- 모든 Asset이 닫힌 샤드에 기록된 디렉토리 목록
+- 진행 중이던 디렉토리와 그 디렉토리에서 이미 기록된 파일명
+
+이어서 실행할 때는 스캔은 처음부터 다시 하되 (스캔 통계가 같도록)
+기록된 파일은 변환 전에 건너뛰고, 마지막 닫힌 샤드 다음 번호부터 기록하므로
+최종 매니페스트가 중단 없이 실행한 결과와 같습니다.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from ..models.udm import Asset
+from .json_exporter import ExportStats
+from .nas_scanner import NasFileInfo
+
+
+def checkpoint_path(output_dir: str | Path, run_id: str) -> Path:
+    """run id의 체크포인트 파일 경로"""
+    return Path(output_dir) / f"{run_id}_checkpoint.json"
+
+
+def pending_runs(output_dir: str | Path) -> list[str]:
+    """체크포인트가 남아 있는 (완료되지 않은) run id 목록"""
+    suffix = "_checkpoint.json"
+    return sorted(
+        path.name[: -len(suffix)] for path in Path(output_dir).glob(f"*{suffix}")
+    )
+
+
+def _split_relative(relative_path: str) -> tuple[str, str]:
+    """상대 경로 → (디렉토리, 파일명)"""
+    relative_path = relative_path.strip()
+    return os.path.dirname(relative_path), os.path.basename(relative_path)
+
+
+@dataclass
+class RunCheckpoint:
+    """추출 실행 체크포인트"""
+
+    run_id: str
+    nas_root: str
+    output_dir: str
+    settings: dict = field(default_factory=dict)  # 샤드 분할에 영향을 주는 내보내기 설정
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    updated_at: str | None = None
+
+    # 닫힌 샤드 (매니페스트 shards 항목)와 누적 통계
+    shards: list[dict] = field(default_factory=list)
+    stats: dict = field(default_factory=dict)
+
+    # 진행 위치
+    completed_dirs: list[str] = field(default_factory=list)
+    partial_dir: str | None = None
+    partial_files: list[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        # 현재 샤드에 기록 중인 위치 (다음 commit에서 저장)
+        self._pending_dirs: list[str] = []
+        self._current_dir = self.partial_dir
+        self._current_files = list(self.partial_files)
+
+    @property
+    def path(self) -> Path:
+        return checkpoint_path(self.output_dir, self.run_id)
+
+    @property
+    def last_completed_dir(self) -> str | None:
+        return self.completed_dirs[-1] if self.completed_dirs else None
+
+    # =========================================================================
+    # 저장 / 로드
+    # =========================================================================
+
+    def save(self):
+        """원자적 저장 (임시 파일에 쓴 뒤 교체)"""
+        self.updated_at = datetime.now().isoformat()
+        data = asdict(self)
+        data["last_completed_dir"] = self.last_completed_dir
+
+        tmp_file = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.path)
+
+    @classmethod
+    def load(cls, output_dir: str | Path, run_id: str) -> "RunCheckpoint":
+        """
+        체크포인트 로드
+
+        Raises:
+            FileNotFoundError: 체크포인트 없음 (완료된 실행 포함)
+        """
+        path = checkpoint_path(output_dir, run_id)
+        if not path.exists():
+            raise FileNotFoundError(f"No checkpoint for run '{run_id}' in {output_dir}")
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        data.pop("last_completed_dir", None)
+        return cls(**data)
+
+    def remove(self):
+        """완료 후 체크포인트 삭제"""
+        self.path.unlink(missing_ok=True)
+
+    # =========================================================================
+    # 내보내기 중 갱신
+    # =========================================================================
+
+    def restore_stats(self, stats: ExportStats):
+        """저장된 누적 통계를 stats에 복원"""
+        for key, value in self.stats.items():
+            setattr(stats, key, value)
+
+    def track(self, asset: Asset):
+        """현재 샤드에 기록한 Asset 반영 (디렉토리 단위로 연속해서 들어옴)"""
+        if not asset.file_path_rel:
+            return
+
+        directory, filename = _split_relative(asset.file_path_rel)
+        if directory != self._current_dir:
+            if self._current_dir is not None:
+                self._pending_dirs.append(self._current_dir)
+            self._current_dir = directory
+            self._current_files = []
+        self._current_files.append(filename)
+
+    def commit(self, shards: list[dict], stats: ExportStats):
+        """샤드가 닫힌 시점의 진행 상황 저장"""
+        self.shards = list(shards)
+        self.stats = asdict(stats)
+        self.completed_dirs.extend(self._pending_dirs)
+        self._pending_dirs = []
+        self.partial_dir = self._current_dir
+        self.partial_files = list(self._current_files)
+        self.save()
+
+    # =========================================================================
+    # 이어서 실행
+    # =========================================================================
+
+    def skip_exported(self, files: Iterable[NasFileInfo]) -> Iterator[NasFileInfo]:
+        """이미 닫힌 샤드에 기록된 파일 건너뛰기"""
+        completed = set(self.completed_dirs)
+        partial_files = set(self.partial_files)
+
+        for file_info in files:
+            directory, filename = _split_relative(file_info.relative_path)
+            if directory in completed:
+                continue
+            if directory == self.partial_dir and filename in partial_files:
+                continue
+            yield file_info
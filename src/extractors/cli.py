@@ -24,6 +24,7 @@ def cmd_scan(args):
             args.path,
             include_hidden=args.include_hidden,
             compute_hash=args.hash,
+            workers=args.workers,
         )
 
         files, result = scanner.scan_with_stats(
@@ -103,11 +104,20 @@ def cmd_extract(args):
             output_dir=args.output,
             include_tech_spec=args.tech_spec,
             export_format=args.format,
+            scan_workers=args.workers,
+            validate=args.validate,
+            transform_workers=args.transform_workers,
+            compression=args.compress,
+            delta=args.delta,
+            streaming=args.streaming,
+            queue_size=args.queue_size,
+            probe_workers=args.probe_workers,
         )
 
         result = pipeline.run(
             video_only=not args.all_files,
             max_files=args.max_files,
+            resume=args.resume,
         )
 
         # 결과 출력
@@ -116,21 +126,76 @@ def cmd_extract(args):
         print(f"    Files scanned:  {result['scan']['total_files']:,}")
         print(f"    Video files:    {result['scan']['video_files']:,}")
         print(f"    Total size:     {result['scan']['total_size_gb']:.2f} GB")
+        if result['scan']['errors']:
+            print(f"    Unlisted dirs:  {len(result['scan']['errors']):,}")
+            for error in result['scan']['errors'][:10]:
+                print(f"      - {error}")
 
         print("\n  Transform Phase:")
         print(f"    Success:        {result['transform']['success']:,}")
         print(f"    Failed:         {result['transform']['failed']:,}")
 
+        if "tech_spec" in result:
+            probe = result["tech_spec"]
+            print("\n  Tech Spec:")
+            print(f"    Cache hits:     {probe['cache_hits']:,}")
+            print(f"    Probed:         {probe['probed']:,}")
+            print(f"    No video:       {probe['failed']:,}")
+            print(f"    Errors:         {probe['errors']:,}")
+
+        if "validation" in result:
+            print("\n  Validation Phase:")
+            print(f"    Valid:          {result['validation']['success']:,}")
+            print(f"    Invalid:        {result['validation']['failed']:,}")
+            for error in result['validation']['errors']:
+                print(f"      - {error}")
+
+        if "delta" in result:
+            delta = result["delta"]
+            print("\n  Delta Phase:")
+            print(f"    Base:           {delta['base_generated_at'] or '(first run)'}")
+            print(f"    Added:          {delta['added']:,}")
+            print(f"    Changed:        {delta['changed']:,}")
+            print(f"    Removed:        {delta['removed']:,}")
+            print(f"    Unchanged:      {delta['unchanged']:,}")
+
         print("\n  Export Phase:")
         print("    Output files:")
         for f in result['export']['files']:
             print(f"      - {f}")
 
-        print(f"\n✅ Done in {result['scan']['duration_sec'] + result['export']['duration_sec']:.2f} sec")
-
-    except FileNotFoundError as e:
+        if "pipeline" in result:
+            print("\n  Pipeline Stages:")
+            for name, stage in result["pipeline"]["stages"].items():
+                print(
+                    f"    {name:<10} {stage['items']:>9,} items  {stage['items_per_sec']:>10,.0f}/s"
+                    f"  blocked {stage['blocked_sec']:.2f}s  starved {stage['starved_sec']:.2f}s"
+                )
+            for name, q in result["pipeline"]["queues"].items():
+                print(f"    {name:<20} depth max {q['max_depth']}/{q['maxsize']}  mean {q['mean_depth']:.1f}")
+
+        if "run" in result:
+            print(f"\n  Run ID: {result['run']['run_id']}")
+            if result["run"]["checkpoint"]:
+                print("    Export did not finish; continue with:")
+                print(f"    --resume {result['run']['run_id']}")
+
+        # streaming은 단계가 겹치므로 내보내기 시간이 전체 시간
+        total_sec = result['export']['duration_sec']
+        if "pipeline" not in result:
+            total_sec += result['scan']['duration_sec']
+        print(f"\n✅ Done in {total_sec:.2f} sec")
+
+    except (FileNotFoundError, ValueError) as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
+    except (KeyboardInterrupt, OSError) as e:
+        from .checkpoint import pending_runs
+
+        print(f"\n❌ Interrupted: {e!r}")
+        for run_id in pending_runs(args.output):
+            print(f"   Resume with: --resume {run_id}")
+        sys.exit(1)
 
 
 def cmd_schema(args):
@@ -151,6 +216,8 @@ def cmd_schema(args):
 
 def main():
     """CLI 메인 엔트리포인트"""
+    from .nas_scanner import NasScanner
+
     parser = argparse.ArgumentParser(
         description="NAS-to-UDM Extractor",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -165,6 +232,7 @@ def main():
     scan_parser.add_argument("--include-hidden", action="store_true", help="Include hidden files")
     scan_parser.add_argument("--hash", action="store_true", help="Compute file hashes")
     scan_parser.add_argument("--max-files", type=int, help="Max files to scan (for testing)")
+    scan_parser.add_argument("--workers", type=int, default=NasScanner.DEFAULT_WORKERS, help="Concurrent directory listings")
     scan_parser.add_argument("--list", action="store_true", help="List files")
     scan_parser.add_argument("-o", "--output", help="Output JSON file")
 
@@ -172,10 +240,19 @@ def main():
     extract_parser = subparsers.add_parser("extract", help="Extract UDM from NAS")
     extract_parser.add_argument("path", help="NAS root path")
     extract_parser.add_argument("-o", "--output", default="./output", help="Output directory")
-    extract_parser.add_argument("--format", choices=["json", "jsonl"], default="json", help="Output format")
-    extract_parser.add_argument("--tech-spec", action="store_true", help="Extract tech metadata (requires ffprobe)")
+    extract_parser.add_argument("--format", choices=["json", "jsonl", "parquet", "arrow"], default="json", help="Output format (parquet/arrow require pyarrow)")
+    extract_parser.add_argument("--tech-spec", action="store_true", help="Extract tech metadata (requires ffprobe, cached in the output directory)")
+    extract_parser.add_argument("--probe-workers", type=int, default=4, help="Concurrent ffprobe processes (--tech-spec)")
     extract_parser.add_argument("--all-files", action="store_true", help="Include non-video files")
     extract_parser.add_argument("--max-files", type=int, help="Max files to process (for testing)")
+    extract_parser.add_argument("--workers", type=int, default=NasScanner.DEFAULT_WORKERS, help="Concurrent directory listings")
+    extract_parser.add_argument("--validate", action="store_true", help="Run full Pydantic validation on transformed assets")
+    extract_parser.add_argument("--transform-workers", type=int, default=1, help="Transform processes (0 = all cores)")
+    extract_parser.add_argument("--compress", choices=["gzip", "zstd"], help="Compress JSON/JSONL output while writing")
+    extract_parser.add_argument("--streaming", action="store_true", help="Run scan/transform/export as concurrent stages with bounded queues")
+    extract_parser.add_argument("--queue-size", type=int, default=16, help="Max batches buffered between streaming stages")
+    extract_parser.add_argument("--resume", metavar="RUN_ID", help="Continue an interrupted jsonl run from its checkpoint")
+    extract_parser.add_argument("--delta", action="store_true", help="Export only added/changed/removed assets since the previous --delta run")
 
     # schema 명령
     schema_parser = subparsers.add_parser("schema", help="Generate JSON schema")
@@ -0,0 +1,391 @@
+"""
+Columnar Exporter
+
+UDM Asset → Parquet / Arrow IPC 파일 내보내기 (분석용)
+
+- assets 테이블: Asset 필드 + event_context.* / tech_spec.* / file_name_meta.* 평탄화 컬럼
+- segments 테이블: Segment 필드 (시간 범위, players, tags_*, situation_flags.*)
+- Enum 컬럼은 딕셔너리 인코딩 (Enum 멤버 순서의 고정 딕셔너리)
+- batch_size 단위 레코드 배치로 기록하므로 Asset 수와 관계없이 메모리 사용량이 일정
+
+컬럼 구성은 Pydantic 모델 정의에서 생성하므로 모델 필드가 바뀌면 자동으로 반영됩니다.
+
+pyarrow가 필요합니다 (pip install pyarrow).
+"""
+
+import json
+import time
+import types
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Iterable, Literal, Union, get_args, get_origin
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from ..models.udm import Asset, Segment
+from .json_exporter import ExportResult, ExportStats, export_filename
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - 선택 의존성
+    pa = None
+    pq = None
+
+
+def pyarrow_available() -> bool:
+    """pyarrow 설치 여부"""
+    return pa is not None
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow is not installed (pip install pyarrow)")
+
+
+@dataclass
+class ColumnarExportConfig:
+    """컬럼형 내보내기 설정"""
+
+    # 출력 형식 (parquet | arrow = Arrow IPC 파일)
+    format: Literal["parquet", "arrow"] = "parquet"
+
+    # 파일 옵션
+    output_dir: str = "./output"
+    filename_prefix: str = "udm_export"
+    include_timestamp: bool = True
+
+    # 레코드 배치 크기 (Parquet row group 크기)
+    batch_size: int = 10000
+
+    # 압축 코덱 (parquet: zstd/snappy/gzip..., arrow: zstd/lz4, None = 비압축)
+    compression: str | None = "zstd"
+
+
+# =============================================================================
+# 모델 → 컬럼 정의
+# =============================================================================
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Optional[X] → X"""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _is_enum(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, Enum)
+
+
+def _to_python(value: Any) -> Any:
+    """중첩 값(모델, Enum, UUID)을 Arrow가 받는 기본 타입으로 변환"""
+    if value is None:
+        return None
+    if isinstance(value, BaseModel):
+        return {name: _to_python(getattr(value, name)) for name in type(value).model_fields}
+    if isinstance(value, list):
+        return [_to_python(v) for v in value]
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _arrow_type(annotation: Any):
+    """모델 필드 타입 → Arrow 타입"""
+    annotation = _unwrap_optional(annotation)
+
+    if _is_enum(annotation):
+        return pa.dictionary(pa.int16(), pa.string())
+    if get_origin(annotation) is list:
+        (item,) = get_args(annotation)
+        return pa.list_(_arrow_type(item))
+    if _is_model(annotation):
+        return pa.struct([
+            (name, _arrow_type(field.annotation))
+            for name, field in annotation.model_fields.items()
+        ])
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation is float:
+        return pa.float64()
+    if annotation is datetime:
+        return pa.timestamp("us")
+    return pa.string()
+
+
+@dataclass
+class _Column:
+    """평탄화된 컬럼 하나 (name = 점으로 연결한 필드 경로)"""
+
+    name: str
+    path: tuple[str, ...]
+    annotation: Any
+
+    def __post_init__(self):
+        self.annotation = _unwrap_optional(self.annotation)
+        if _is_enum(self.annotation):
+            members = list(self.annotation)
+            self._enum_dictionary = pa.array([m.value for m in members], type=pa.string())
+            # use_enum_values 모델은 문자열, model_construct 결과는 Enum일 수 있음
+            self._enum_index = {m.value: i for i, m in enumerate(members)}
+            self._enum_index.update({m: i for i, m in enumerate(members)})
+
+    def values(self, items: list[BaseModel]) -> list:
+        """items에서 이 컬럼 값 추출 (중간 객체가 None이면 None)"""
+        if len(self.path) == 1:
+            (attr,) = self.path
+            return [getattr(item, attr) for item in items]
+
+        values = []
+        for item in items:
+            value = item
+            for attr in self.path:
+                value = getattr(value, attr, None)
+                if value is None:
+                    break
+            values.append(value)
+        return values
+
+    def array(self, items: list[BaseModel]):
+        """Arrow 배열 생성"""
+        values = self.values(items)
+
+        if _is_enum(self.annotation):
+            # 고정 딕셔너리 (배치마다 같은 딕셔너리 → Arrow IPC 파일 호환)
+            indices = [None if v is None else self._enum_index[v] for v in values]
+            return pa.DictionaryArray.from_arrays(
+                pa.array(indices, type=pa.int16()), self._enum_dictionary,
+            )
+
+        if self.annotation is UUID:
+            values = [None if v is None else str(v) for v in values]
+        elif get_origin(self.annotation) is list:
+            values = [_to_python(v) for v in values]
+
+        return pa.array(values, type=_arrow_type(self.annotation))
+
+
+def _model_columns(
+    model_cls: type[BaseModel],
+    prefix: tuple[str, ...] = (),
+    exclude: frozenset[str] = frozenset(),
+) -> list[_Column]:
+    """모델 필드를 평탄화한 컬럼 목록 (중첩 모델은 prefix.field)"""
+    columns = []
+    for name, field in model_cls.model_fields.items():
+        if name in exclude:
+            continue
+        annotation = _unwrap_optional(field.annotation)
+        path = prefix + (name,)
+        if _is_model(annotation):
+            columns.extend(_model_columns(annotation, path))
+        else:
+            columns.append(_Column(".".join(path), path, annotation))
+    return columns
+
+
+class _TableWriter:
+    """컬럼 정의에 따라 레코드 배치를 Parquet/Arrow 파일에 기록"""
+
+    def __init__(
+        self,
+        path: Path,
+        columns: list[_Column],
+        extra: list[tuple[str, Any, Callable[[list], list]]],
+        config: ColumnarExportConfig,
+        metadata: dict[str, str] | None = None,
+    ):
+        """
+        Args:
+            path: 출력 파일
+            columns: 모델에서 생성한 컬럼
+            extra: 추가 컬럼 [(이름, Arrow 타입, items → 값 목록)]
+            config: 내보내기 설정
+            metadata: 스키마 메타데이터 (파일에 함께 저장)
+        """
+        self.path = path
+        self.columns = columns
+        self.extra = extra
+        self.schema = pa.schema(
+            [(c.name, _arrow_type(c.annotation)) for c in columns]
+            + [(name, arrow_type) for name, arrow_type, _ in extra],
+            metadata=metadata,
+        )
+        self.rows = 0
+
+        if config.format == "parquet":
+            self._writer = pq.ParquetWriter(
+                path, self.schema, compression=config.compression or "none",
+            )
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=config.compression)
+            self._writer = pa.ipc.new_file(path, self.schema, options=options)
+
+    def write(self, items: list[BaseModel]):
+        """레코드 배치 하나 기록"""
+        if not items:
+            return
+        arrays = [c.array(items) for c in self.columns]
+        arrays += [
+            pa.array(fn(items), type=arrow_type) for _, arrow_type, fn in self.extra
+        ]
+        self._writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+        self.rows += len(items)
+
+    def close(self):
+        self._writer.close()
+
+
+# =============================================================================
+# Exporter
+# =============================================================================
+
+
+class ColumnarExporter:
+    """UDM Parquet / Arrow IPC Exporter"""
+
+    # 테이블별 컬럼 (segments는 별도 테이블)
+    ASSET_EXCLUDE = frozenset({"segments"})
+
+    def __init__(self, config: ColumnarExportConfig | None = None):
+        """
+        Args:
+            config: 내보내기 설정
+        """
+        _require_pyarrow()
+        self.config = config or ColumnarExportConfig()
+        self.asset_columns = _model_columns(Asset, exclude=self.ASSET_EXCLUDE)
+        self.segment_columns = _model_columns(Segment)
+
+    def export(
+        self,
+        assets: Iterable[Asset],
+        metadata: dict | None = None,
+    ) -> ExportResult:
+        """
+        Asset 목록을 assets / segments 두 테이블로 내보내기
+
+        이터레이터를 넘기면 한 번만 순회하며 batch_size 단위로 기록합니다.
+
+        Args:
+            assets: Asset 목록 또는 이터레이터
+            metadata: 추가 메타데이터 (스키마 메타데이터 "udm_metadata"에 JSON으로 저장)
+
+        Returns:
+            ExportResult (output_files = [assets 파일, segments 파일])
+        """
+        start_time = time.time()
+        result = ExportResult()
+        stats = ExportStats()
+
+        writers: list[_TableWriter] = []
+        try:
+            output_dir = Path(self.config.output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            filename = export_filename(self.config.filename_prefix, self.config.include_timestamp)
+            suffix = ".parquet" if self.config.format == "parquet" else ".arrow"
+            schema_metadata = {
+                "udm_metadata": json.dumps({
+                    "version": "3.1.0",
+                    "generated_at": datetime.now().isoformat(),
+                    "source": "nas_extractor",
+                    "custom": metadata or {},
+                }, ensure_ascii=False, default=str),
+            }
+
+            asset_writer = _TableWriter(
+                output_dir / f"{filename}_assets{suffix}",
+                self.asset_columns,
+                [("segment_count", pa.int32(), lambda items: [len(a.segments) for a in items])],
+                self.config,
+                schema_metadata,
+            )
+            writers.append(asset_writer)
+            segment_writer = _TableWriter(
+                output_dir / f"{filename}_segments{suffix}",
+                self.segment_columns,
+                [],
+                self.config,
+                schema_metadata,
+            )
+            writers.append(segment_writer)
+
+            batch_size = max(1, self.config.batch_size)
+            asset_batch: list[Asset] = []
+            segment_batch: list[Segment] = []
+
+            for asset in assets:
+                asset_batch.append(asset)
+                segment_batch.extend(asset.segments)
+                stats.add(asset)
+
+                if len(asset_batch) >= batch_size:
+                    asset_writer.write(asset_batch)
+                    asset_batch = []
+                if len(segment_batch) >= batch_size:
+                    segment_writer.write(segment_batch)
+                    segment_batch = []
+
+            asset_writer.write(asset_batch)
+            segment_writer.write(segment_batch)
+
+            for writer in writers:
+                writer.close()
+            writers = []
+
+            output_files = [asset_writer.path, segment_writer.path]
+            result.output_files.extend(str(f) for f in output_files)
+            result.file_size_bytes = sum(f.stat().st_size for f in output_files)
+            result.success = True
+
+        except Exception as e:
+            result.errors.append(str(e))
+            result.success = False
+        finally:
+            for writer in writers:
+                writer.close()
+
+        result.stats = stats
+        result.total_assets = stats.total_assets
+        result.total_segments = stats.total_segments
+        result.export_duration_sec = time.time() - start_time
+
+        return result
+
+
+def read_columnar(path: str | Path, columns: list[str] | None = None):
+    """
+    컬럼형 내보내기 파일 읽기 (필요한 컬럼만)
+
+    Args:
+        path: .parquet 또는 .arrow 파일
+        columns: 읽을 컬럼 (None = 전체)
+
+    Returns:
+        pyarrow.Table (pandas가 필요하면 .to_pandas())
+    """
+    _require_pyarrow()
+    path = Path(path)
+
+    if path.suffix == ".parquet":
+        return pq.read_table(path, columns=columns)
+
+    # Arrow IPC 파일은 메모리 매핑 (선택하지 않은 컬럼은 읽지 않음)
+    table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+    return table.select(columns) if columns is not None else table
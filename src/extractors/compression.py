@@ -0,0 +1,202 @@
+"""
+내보내기 파일 압축
+
+JSON/JSONL 내보내기의 스트리밍 압축 쓰기와 압축 파일 투명 읽기
+- gzip: 표준 라이브러리
+- zstd: zstandard 패키지 (설치 시)
+
+쓰는 동안 디스크에 기록되는 (압축된) 바이트의 크기와 SHA-256을 함께 계산합니다.
+"""
+
+import gzip
+import hashlib
+from pathlib import Path
+from typing import BinaryIO, Literal
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+Compression = Literal["gzip", "zstd"]
+
+# 압축 방식별 파일 확장자
+COMPRESSION_SUFFIXES: dict[str, str] = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+# 파일 시그니처 (확장자가 없어도 감지)
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# 기본 압축 레벨 (속도 우선: 반복이 많은 텍스트라 낮은 레벨로도 압축률이 높음)
+DEFAULT_LEVELS: dict[str, int] = {
+    "gzip": 6,
+    "zstd": 3,
+}
+
+
+def zstd_available() -> bool:
+    """zstandard 설치 여부"""
+    return zstandard is not None
+
+
+def compression_suffix(compression: Compression | None) -> str:
+    """압축 방식에 맞는 추가 확장자 ("" = 비압축)"""
+    if compression is None:
+        return ""
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression: {compression}")
+    return COMPRESSION_SUFFIXES[compression]
+
+
+class _HashingWriter:
+    """디스크에 기록되는 바이트 수와 SHA-256을 계산하는 파일 래퍼"""
+
+    def __init__(self, raw: BinaryIO):
+        self.raw = raw
+        self.digest = hashlib.sha256()
+        self.bytes_written = 0
+
+    def write(self, data) -> int:
+        self.digest.update(data)
+        self.bytes_written += len(data)
+        return self.raw.write(data)
+
+    def flush(self):
+        self.raw.flush()
+
+    def close(self):
+        self.raw.close()
+
+    @property
+    def closed(self) -> bool:
+        return self.raw.closed
+
+
+class CompressedWriter:
+    """
+    스트리밍 압축 쓰기 (비압축도 같은 인터페이스)
+
+    Attributes:
+        path: 출력 파일 경로
+        raw_bytes: 압축 전 바이트 수
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        compression: Compression | None = None,
+        level: int | None = None,
+        exclusive: bool = False,
+    ):
+        """
+        Args:
+            path: 출력 파일 경로
+            compression: None | "gzip" | "zstd"
+            level: 압축 레벨 (None = 기본값)
+            exclusive: True면 새 파일만 생성 (이미 있으면 FileExistsError)
+        """
+        self.path = Path(path)
+        self.compression = compression
+        self.raw_bytes = 0
+
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstandard is not installed (pip install zstandard)")
+        compression_suffix(compression)  # 지원 여부 확인
+
+        self._file = _HashingWriter(open(self.path, "xb" if exclusive else "wb"))
+        if compression is None:
+            self._stream = self._file
+        else:
+            level = DEFAULT_LEVELS[compression] if level is None else level
+            if compression == "gzip":
+                # mtime=0: 같은 내용이면 같은 체크섬
+                self._stream = gzip.GzipFile(
+                    fileobj=self._file, mode="wb", compresslevel=level, mtime=0,
+                )
+            else:
+                self._stream = zstandard.ZstdCompressor(level=level).stream_writer(self._file)
+
+    def write(self, data: bytes) -> int:
+        self.raw_bytes += len(data)
+        return self._stream.write(data)
+
+    def close(self):
+        """압축 스트림 마무리 후 파일 닫기"""
+        if self._file.closed:
+            return
+        if self._stream is not self._file:
+            self._stream.close()
+        if not self._file.closed:
+            self._file.close()
+
+    @property
+    def bytes_written(self) -> int:
+        """디스크에 기록된 (압축 후) 바이트 수"""
+        return self._file.bytes_written
+
+    @property
+    def sha256(self) -> str:
+        """디스크에 기록된 바이트의 SHA-256"""
+        return self._file.digest.hexdigest()
+
+    def __enter__(self) -> "CompressedWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def detect_compression(path: str | Path) -> Compression | None:
+    """파일 시그니처로 압축 방식 감지"""
+    with open(path, "rb") as f:
+        head = f.read(4)
+    if head.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(_ZSTD_MAGIC):
+        return "zstd"
+    return None
+
+
+def decompress_stream(raw: BinaryIO, compression: Compression | None) -> BinaryIO:
+    """
+    열린 파일을 압축 해제 스트림으로 감싸기
+
+    원본 파일 객체의 tell()은 압축된 파일에서 읽은 위치이므로 진행률 계산에 사용할 수 있습니다.
+    (원본 파일은 호출 측에서 닫음)
+    """
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    if compression == "zstd":
+        if zstandard is None:
+            raise ImportError("zstandard is not installed (pip install zstandard)")
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=False)
+    return raw
+
+
+def open_compressed(path: str | Path) -> BinaryIO:
+    """
+    압축 여부와 관계없이 읽기용으로 열기 (압축 해제 스트림)
+
+    Args:
+        path: JSON/JSONL 파일 (.gz / .zst 포함)
+
+    Returns:
+        바이너리 읽기 스트림
+    """
+    compression = detect_compression(path)
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "zstd":
+        if zstandard is None:
+            raise ImportError("zstandard is not installed (pip install zstandard)")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return open(path, "rb")
+
+
+def read_compressed(path: str | Path) -> bytes:
+    """압축 여부와 관계없이 전체 내용 읽기"""
+    with open_compressed(path) as f:
+        return f.read()
@@ -0,0 +1,256 @@
+"""
+Delta Exporter
+
+이전 실행의 Asset 인덱스(asset_uuid → 내용 해시)와 비교하여
+추가/변경/삭제된 Asset만 변경셋(JSONL)으로 내보내기
+
+- asset_uuid는 경로 기반 결정적 UUID (UdmTransformer._generate_uuid)
+- 내용 해시는 Pydantic 직렬화(model_dump_json, 필드 선언 순서의 compact JSON) SHA-256
+  (직렬화 백엔드와 무관하게 같은 값 / 모델 필드가 바뀌면 전체가 changed로 한 번 기록됨)
+- 변경셋 기록이 끝난 뒤에만 인덱스를 교체하므로 실패한 실행은 기준점을 바꾸지 않음
+- 인덱스의 history에 최근 변경셋 목록(generated_at / base_generated_at / 파일명)을 유지
+
+변경셋 줄 형식:
+    {"op": "added" | "changed", "asset_uuid": ..., "content_hash": ..., "asset": {...}}
+    {"op": "removed", "asset_uuid": ..., "content_hash": <이전 해시>}
+"""
+
+import hashlib
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+
+from ..models.udm import Asset
+from .compression import CompressedWriter, compression_suffix
+from .json_exporter import ExportConfig, ExportResult, ExportStats, export_filename
+from .serializer import get_serializer
+
+# 출력 디렉토리의 Asset 인덱스 (다음 실행의 비교 기준)
+ASSET_INDEX_FILENAME = "udm_asset_index.json"
+
+# 내용 해시에서 제외하는 필드 (실행마다 달라지는 값)
+HASH_EXCLUDE_FIELDS = frozenset({"created_at"})
+
+# 인덱스에 저장하는 해시 길이 (hex, 128비트)
+HASH_LENGTH = 32
+
+# 인덱스에 남기는 변경셋 이력 수 (대시보드가 로드한 파일 이후 변경셋을 순서대로 적용)
+CHANGESET_HISTORY_LIMIT = 100
+
+
+def asset_content(asset: Asset) -> bytes:
+    """해시 대상 직렬화 (HASH_EXCLUDE_FIELDS 제외, None 필드 생략)"""
+    return asset.model_dump_json(exclude_none=True, exclude=HASH_EXCLUDE_FIELDS).encode("utf-8")
+
+
+def asset_content_hash(asset: Asset) -> str:
+    """
+    Asset 내용 해시
+
+    Returns:
+        SHA-256 hex 앞 HASH_LENGTH자리
+    """
+    return hashlib.sha256(asset_content(asset)).hexdigest()[:HASH_LENGTH]
+
+
+@dataclass
+class ChangeCounts:
+    """변경셋 통계"""
+
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+    unchanged: int = 0
+
+    @property
+    def total_changes(self) -> int:
+        return self.added + self.changed + self.removed
+
+
+@dataclass
+class DeltaExportResult(ExportResult):
+    """델타 내보내기 결과 (output_files = [변경셋], manifest_file = Asset 인덱스)"""
+
+    changes: ChangeCounts = field(default_factory=ChangeCounts)
+    base_generated_at: str | None = None  # 비교 기준 인덱스 생성 시각 (None = 첫 실행)
+
+
+class DeltaExporter:
+    """이전 Asset 인덱스 대비 변경셋 내보내기"""
+
+    def __init__(self, config: ExportConfig | None = None):
+        """
+        Args:
+            config: 내보내기 설정 (output_dir, filename_prefix, include_timestamp,
+                serializer, compression 사용 / format, indent는 무시하고 항상 compact JSONL)
+        """
+        self.config = config or ExportConfig()
+        self.serializer = get_serializer(self.config.serializer)
+
+    @property
+    def index_file(self) -> Path:
+        """Asset 인덱스 경로"""
+        return Path(self.config.output_dir) / ASSET_INDEX_FILENAME
+
+    def load_index(self) -> dict:
+        """이전 Asset 인덱스 (없으면 빈 인덱스)"""
+        if not self.index_file.exists():
+            return {"generated_at": None, "assets": {}}
+        return self.serializer.loads(self.index_file.read_bytes())
+
+    def export(
+        self,
+        assets: Iterable[Asset],
+        metadata: dict | None = None,
+    ) -> DeltaExportResult:
+        """
+        변경셋 내보내기
+
+        Asset을 한 건씩 해시하여 이전 인덱스와 비교하고,
+        추가/변경된 Asset과 삭제된 asset_uuid만 변경셋에 기록합니다.
+
+        Args:
+            assets: 이번 실행의 전체 Asset 목록 또는 이터레이터
+            metadata: 추가 메타데이터 (인덱스 파일에 기록)
+
+        Returns:
+            DeltaExportResult
+        """
+        start_time = time.time()
+
+        result = DeltaExportResult()
+        stats = ExportStats()
+        changes = result.changes
+        changeset_file = None
+
+        try:
+            output_dir = Path(self.config.output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            previous = self.load_index()
+            previous_hashes: dict[str, str] = previous["assets"]
+            result.base_generated_at = previous["generated_at"]
+            history: list[dict] = previous.get("history", [])
+            current_hashes: dict[str, str] = {}
+
+            writer = self._open_changeset(output_dir)
+            changeset_file = writer.path
+
+            with writer as f:
+                for asset in assets:
+                    content = asset_content(asset)
+                    content_hash = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+                    asset_uuid = str(asset.asset_uuid)
+                    current_hashes[asset_uuid] = content_hash
+                    stats.add(asset)
+
+                    old_hash = previous_hashes.get(asset_uuid)
+                    if old_hash == content_hash:
+                        changes.unchanged += 1
+                        continue
+
+                    if old_hash is None:
+                        op = "added"
+                        changes.added += 1
+                    else:
+                        op = "changed"
+                        changes.changed += 1
+                    # 해시 대상 JSON을 그대로 기록 (제외 필드가 있을 때만 다시 직렬화)
+                    if any(getattr(asset, name, None) is not None for name in HASH_EXCLUDE_FIELDS):
+                        content = asset.model_dump_json(exclude_none=True).encode("utf-8")
+                    f.write(
+                        f'{{"op":"{op}","asset_uuid":"{asset_uuid}",'
+                        f'"content_hash":"{content_hash}","asset":'.encode()
+                        + content + b"}\n"
+                    )
+
+                for asset_uuid, old_hash in previous_hashes.items():
+                    if asset_uuid not in current_hashes:
+                        changes.removed += 1
+                        f.write(self.serializer.dumps({
+                            "op": "removed",
+                            "asset_uuid": asset_uuid,
+                            "content_hash": old_hash,
+                        }) + b"\n")
+
+            self._write_index(current_hashes, changeset_file, result, metadata, history)
+
+            result.output_files.append(str(changeset_file))
+            result.manifest_file = str(self.index_file)
+            result.file_size_bytes = changeset_file.stat().st_size
+            result.success = True
+
+        except Exception as e:
+            result.errors.append(str(e))
+            result.success = False
+            # 중단된 변경셋은 남기지 않음 (인덱스도 그대로)
+            if changeset_file is not None and changeset_file.exists():
+                changeset_file.unlink()
+
+        result.stats = stats
+        result.total_assets = stats.total_assets
+        result.total_segments = stats.total_segments
+        result.export_duration_sec = time.time() - start_time
+
+        return result
+
+    def _write_index(
+        self,
+        hashes: dict[str, str],
+        changeset_file: Path,
+        result: DeltaExportResult,
+        metadata: dict | None,
+        history: list[dict],
+    ):
+        """Asset 인덱스 교체 (임시 파일에 쓴 뒤 원자적 교체)"""
+        generated_at = datetime.now().isoformat()
+        entry = {
+            "generated_at": generated_at,
+            "base_generated_at": result.base_generated_at,
+            "changeset": changeset_file.name,
+        }
+        index = {
+            "version": "3.1.0",
+            "generated_at": generated_at,
+            "source": "nas_extractor",
+            "base_generated_at": result.base_generated_at,
+            "changeset": changeset_file.name,
+            "history": (history + [entry])[-CHANGESET_HISTORY_LIMIT:],
+            "changes": {
+                "added": result.changes.added,
+                "changed": result.changes.changed,
+                "removed": result.changes.removed,
+                "unchanged": result.changes.unchanged,
+            },
+            "custom": metadata or {},
+            "total_assets": len(hashes),
+            "assets": hashes,
+        }
+
+        tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        tmp_file.write_bytes(self.serializer.dumps(index))
+        os.replace(tmp_file, self.index_file)
+
+    def _open_changeset(self, output_dir: Path) -> CompressedWriter:
+        """
+        새 변경셋 파일 생성
+
+        같은 초에 실행되거나 include_timestamp=False이면 이름이 겹치므로
+        이미 있는 파일은 덮어쓰지 않고 순번(_2, _3, ...)을 붙입니다.
+        """
+        filename = export_filename(self.config.filename_prefix, self.config.include_timestamp)
+        suffix = compression_suffix(self.config.compression)
+        seq = 1
+        while True:
+            name = filename if seq == 1 else f"{filename}_{seq}"
+            try:
+                return CompressedWriter(
+                    output_dir / f"{name}_changeset.jsonl{suffix}",
+                    self.config.compression, self.config.compression_level,
+                    exclusive=True,
+                )
+            except FileExistsError:
+                seq += 1
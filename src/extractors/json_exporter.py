@@ -4,14 +4,19 @@ JSON Exporter
 UDM Asset → JSON 파일 내보내기
 """
 
+import hashlib
 import json
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Literal
-
+from typing import TYPE_CHECKING, Iterable, Literal
 
 from ..models.udm import Asset, generate_json_schema
+from .compression import Compression, CompressedWriter, compression_suffix
+from .serializer import SerializerName, get_serializer
+
+if TYPE_CHECKING:
+    from .checkpoint import RunCheckpoint
 
 
 @dataclass
@@ -30,9 +35,44 @@ class ExportConfig:
     filename_prefix: str = "udm_export"
     include_timestamp: bool = True
 
-    # 청킹 옵션 (대용량)
-    chunk_size: int = 1000  # JSONL 청크 크기
-    max_file_size_mb: int = 100  # 단일 파일 최대 크기
+    # 직렬화 백엔드 ("auto" = orjson 설치 시 orjson)
+    serializer: SerializerName = "auto"
+
+    # 압축 (None | "gzip" | "zstd", 쓰는 동안 스트리밍 압축)
+    compression: Compression | None = None
+    compression_level: int | None = None  # None = 압축 방식별 기본값
+
+    # 청킹 옵션 (대용량, JSONL 샤드 분할 기준 / 0 = 제한 없음)
+    chunk_size: int = 1000  # JSONL 샤드당 최대 Asset 수
+    max_file_size_mb: int = 100  # JSONL 샤드 최대 크기 (압축 전 기준)
+
+
+@dataclass
+class ExportStats:
+    """내보내기 중 누적 통계 (Asset 목록을 다시 순회하지 않고 요약 생성)"""
+
+    total_assets: int = 0
+    total_segments: int = 0
+    total_duration_sec: float = 0.0
+    brand_counts: dict[str, int] = field(default_factory=dict)
+    asset_type_counts: dict[str, int] = field(default_factory=dict)
+
+    def add(self, asset: Asset):
+        """Asset 하나 반영"""
+        self.total_assets += 1
+        self.total_segments += len(asset.segments)
+
+        # 브랜드 카운트 (event_context에서 가져옴)
+        brand = str(asset.event_context.brand) if asset.event_context else "unknown"
+        self.brand_counts[brand] = self.brand_counts.get(brand, 0) + 1
+
+        # Asset Type 카운트 (use_enum_values=True이므로 이미 문자열)
+        asset_type = str(asset.asset_type) if asset.asset_type else "unknown"
+        self.asset_type_counts[asset_type] = self.asset_type_counts.get(asset_type, 0) + 1
+
+        # Duration
+        if asset.tech_spec and asset.tech_spec.duration_sec:
+            self.total_duration_sec += asset.tech_spec.duration_sec
 
 
 @dataclass
@@ -46,6 +86,23 @@ class ExportResult:
     file_size_bytes: int = 0
     export_duration_sec: float = 0.0
     errors: list[str] = field(default_factory=list)
+    stats: ExportStats | None = None
+    manifest_file: str | None = None  # JSONL 샤드 매니페스트
+
+
+def export_filename(prefix: str, include_timestamp: bool = True) -> str:
+    """내보내기 파일명 (확장자 제외): {prefix} 또는 {prefix}_{YYYYmmdd_HHMMSS}"""
+    parts = [prefix]
+
+    if include_timestamp:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        parts.append(timestamp)
+
+    return "_".join(parts)
+
+
+# 스트리밍 JSON 헤더에서 나중에 채울 값의 자리 (숫자 + 공백 패딩)
+_PLACEHOLDER_WIDTH = 20
 
 
 class JsonExporter:
@@ -57,18 +114,25 @@ class JsonExporter:
             config: 내보내기 설정
         """
         self.config = config or ExportConfig()
+        self.serializer = get_serializer(self.config.serializer)
 
     def export(
         self,
-        assets: list[Asset],
+        assets: Iterable[Asset],
         metadata: dict | None = None,
+        checkpoint: "RunCheckpoint | None" = None,
     ) -> ExportResult:
         """
         Asset 목록을 JSON으로 내보내기
 
+        이터레이터를 넘기면 한 번만 순회하며 한 건씩 기록하므로
+        Asset 수와 관계없이 메모리 사용량이 일정합니다.
+
         Args:
-            assets: Asset 목록
+            assets: Asset 목록 또는 이터레이터
             metadata: 추가 메타데이터
+            checkpoint: JSONL 샤드가 닫힐 때마다 진행 상황을 저장할 체크포인트
+                (run_id가 파일명, 저장된 샤드가 있으면 그 다음부터 이어서 기록)
 
         Returns:
             ExportResult
@@ -77,101 +141,258 @@ class JsonExporter:
         start_time = time.time()
 
         result = ExportResult()
-        result.total_assets = len(assets)
-        result.total_segments = sum(len(a.segments) for a in assets)
+        stats = ExportStats()
 
         try:
             # 출력 디렉토리 생성
             output_dir = Path(self.config.output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # 파일명 생성
-            filename = self._generate_filename()
+            # 파일명 생성 (이어서 실행하면 같은 run id)
+            filename = (
+                checkpoint.run_id if checkpoint is not None
+                else export_filename(self.config.filename_prefix, self.config.include_timestamp)
+            )
+
+            if checkpoint is not None and self.config.format != "jsonl":
+                raise ValueError("Checkpointed export requires the jsonl format")
 
             if self.config.format == "json":
-                output_file = self._export_json(assets, metadata, output_dir, filename)
+                output_files = [self._export_json(assets, metadata, output_dir, filename, stats)]
             else:
-                output_file = self._export_jsonl(assets, output_dir, filename)
+                output_files, manifest_file = self._export_jsonl(
+                    assets, output_dir, filename, stats, metadata, checkpoint,
+                )
+                result.manifest_file = str(manifest_file)
 
-            result.output_files.append(str(output_file))
-            result.file_size_bytes = output_file.stat().st_size
+            result.output_files.extend(str(f) for f in output_files)
+            result.file_size_bytes = sum(f.stat().st_size for f in output_files)
             result.success = True
 
         except Exception as e:
             result.errors.append(str(e))
             result.success = False
 
+        result.stats = stats
+        result.total_assets = stats.total_assets
+        result.total_segments = stats.total_segments
         result.export_duration_sec = time.time() - start_time
 
         return result
 
-    def _generate_filename(self) -> str:
-        """파일명 생성"""
-        parts = [self.config.filename_prefix]
-
-        if self.config.include_timestamp:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            parts.append(timestamp)
-
-        return "_".join(parts)
+    def _dump_asset(self, asset: Asset, indent: int | None = None) -> bytes:
+        """Asset 하나를 JSON bytes로 직렬화"""
+        return self.serializer.dumps(
+            asset.model_dump(mode="json", exclude_none=True),
+            indent=indent,
+            ensure_ascii=self.config.ensure_ascii,
+        )
 
     def _export_json(
         self,
-        assets: list[Asset],
+        assets: Iterable[Asset],
         metadata: dict | None,
         output_dir: Path,
         filename: str,
+        stats: ExportStats | None = None,
     ) -> Path:
-        """단일 JSON 파일로 내보내기 (배치 형식)"""
+        """
+        단일 JSON 파일로 내보내기 (배치 형식, 스트리밍)
+
+        _metadata 헤더를 먼저 쓰고 Asset을 한 건씩 기록한 뒤,
+        전체 수는 헤더의 예약 자리로 돌아가 채웁니다.
+
+        압축 시에는 되돌아가 고칠 수 없으므로 _metadata를 assets 뒤에 기록합니다.
+        """
+        stats = stats if stats is not None else ExportStats()
+        indent = self.config.indent
+        compression = self.config.compression
+
         # 배치 내보내기용 구조 (UDMDocument는 단일 Asset용)
-        export_data = {
-            "_metadata": {
-                "version": "3.1.0",
-                "generated_at": datetime.now().isoformat(),
-                "source": "nas_extractor",
-                "total_assets": len(assets),
-                "total_segments": sum(len(a.segments) for a in assets),
-                "custom": metadata or {},
-            },
-            "assets": [
-                asset.model_dump(mode="json", exclude_none=True)
-                for asset in assets
-            ],
+        header_metadata = {
+            "version": "3.1.0",
+            "generated_at": datetime.now().isoformat(),
+            "source": "nas_extractor",
+            "total_assets": "@@total_assets@@",
+            "total_segments": "@@total_segments@@",
+            "custom": metadata or {},
         }
 
-        # JSON 직렬화
-        output_file = output_dir / f"{filename}.json"
+        # json.dump와 같은 레이아웃 (indent=None이면 한 줄)
+        if indent is None:
+            newline, pad, item_sep = b"", b"", b", "
+        else:
+            newline, pad, item_sep = b"\n", b" " * indent, b","
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(
-                export_data,
-                f,
-                indent=self.config.indent,
+        def metadata_member() -> bytes:
+            header_json = self.serializer.dumps(
+                header_metadata,
+                indent=indent,
                 ensure_ascii=self.config.ensure_ascii,
-                default=str,
             )
+            return b'"_metadata": ' + header_json.replace(b"\n", b"\n" + pad)
+
+        output_file = output_dir / f"{filename}.json{compression_suffix(compression)}"
+        asset_prefix = newline + pad * 2
+        placeholders = {}
+
+        if compression is None:
+            header = (
+                b"{" + newline + pad + metadata_member()
+                + b"," + (newline or b" ") + pad + b'"assets": ['
+            )
+            for key in ("total_assets", "total_segments"):
+                token = f'"@@{key}@@"'.encode()
+                placeholders[key] = header.index(token)
+                header = header.replace(token, b"0".ljust(_PLACEHOLDER_WIDTH))
+            f = open(output_file, "wb")
+        else:
+            header = b"{" + newline + pad + b'"assets": ['
+            f = CompressedWriter(output_file, compression, self.config.compression_level)
+
+        try:
+            with f:
+                f.write(header)
+
+                for asset in assets:
+                    data = self._dump_asset(asset, indent)
+                    if indent is not None:
+                        data = data.replace(b"\n", asset_prefix)
+                    f.write((item_sep if stats.total_assets else b"") + asset_prefix + data)
+                    stats.add(asset)
+
+                if stats.total_assets:
+                    f.write(newline + pad)
+
+                if compression is None:
+                    f.write(b"]" + newline + b"}")
+
+                    # 헤더 예약 자리 채우기
+                    for key, offset in placeholders.items():
+                        f.seek(offset)
+                        f.write(str(getattr(stats, key)).ljust(_PLACEHOLDER_WIDTH).encode())
+                else:
+                    header_metadata["total_assets"] = stats.total_assets
+                    header_metadata["total_segments"] = stats.total_segments
+                    f.write(
+                        b"]," + (newline or b" ") + pad + metadata_member() + newline + b"}"
+                    )
+        except Exception:
+            # 중단된 파일은 남기지 않음 (자리 표시자 0 / 잘린 압축 스트림)
+            output_file.unlink(missing_ok=True)
+            raise
 
         return output_file
 
     def _export_jsonl(
         self,
-        assets: list[Asset],
+        assets: Iterable[Asset],
         output_dir: Path,
         filename: str,
-    ) -> Path:
-        """JSONL (JSON Lines) 형식으로 내보내기"""
-        output_file = output_dir / f"{filename}.jsonl"
+        stats: ExportStats | None = None,
+        metadata: dict | None = None,
+        checkpoint: "RunCheckpoint | None" = None,
+    ) -> tuple[list[Path], Path]:
+        """
+        JSONL (JSON Lines) 샤드 파일로 내보내기
 
-        with open(output_file, "w", encoding="utf-8") as f:
+        chunk_size(Asset 수) 또는 max_file_size_mb(바이트)에 도달하면 다음 샤드
+        ({filename}_0001.jsonl, _0002, ...)로 넘어가고, 샤드별 Asset 수/크기/SHA-256을
+        {filename}_manifest.json에 기록합니다. 체크섬은 쓰는 동안 계산합니다.
+
+        압축 시 샤드는 .jsonl.gz / .jsonl.zst이며, 매니페스트의 bytes/sha256은
+        디스크에 기록된 압축 파일 기준, 샤드 분할 기준은 압축 전 크기입니다.
+
+        checkpoint가 있으면 샤드가 닫힐 때마다 저장하고, 저장된 샤드가 있으면
+        그 샤드들을 유지한 채 다음 번호부터 기록합니다.
+
+        Returns:
+            (샤드 파일 목록, 매니페스트 파일)
+        """
+        stats = stats if stats is not None else ExportStats()
+        max_assets = self.config.chunk_size or None
+        max_bytes = self.config.max_file_size_mb * 1024 * 1024 or None
+        compression = self.config.compression
+        suffix = f".jsonl{compression_suffix(compression)}"
+
+        shards: list[dict] = []
+        shard_files: list[Path] = []
+        f: CompressedWriter | None = None
+        shard: dict = {}
+
+        if checkpoint is not None:
+            shards = list(checkpoint.shards)
+            shard_files = [output_dir / s["file"] for s in shards]
+            for path, saved in zip(shard_files, shards):
+                if not path.exists() or path.stat().st_size != saved["bytes"]:
+                    raise ValueError(f"Checkpointed shard {path.name} is missing or truncated")
+            checkpoint.restore_stats(stats)
+            # 중단 시점에 쓰던 샤드 (체크포인트 이후 번호) 정리
+            for stale in output_dir.glob(f"{filename}_[0-9][0-9][0-9][0-9]{suffix}"):
+                if stale not in shard_files:
+                    stale.unlink()
+
+        def close_shard():
+            f.close()
+            shard["bytes"] = f.bytes_written
+            shard["sha256"] = f.sha256
+            if compression is not None:
+                shard["uncompressed_bytes"] = f.raw_bytes
+            shards.append(shard)
+            if checkpoint is not None:
+                checkpoint.commit(shards, stats)
+
+        try:
             for asset in assets:
-                line = json.dumps(
-                    asset.model_dump(mode="json", exclude_none=True),
-                    ensure_ascii=self.config.ensure_ascii,
-                    default=str,
-                )
-                f.write(line + "\n")
+                line = self._dump_asset(asset) + b"\n"
+
+                if f is not None and (
+                    (max_assets and shard["assets"] >= max_assets)
+                    or (max_bytes and f.raw_bytes + len(line) > max_bytes)
+                ):
+                    close_shard()
+                    f = None
+
+                if f is None:
+                    path = output_dir / f"{filename}_{len(shard_files) + 1:04d}{suffix}"
+                    shard_files.append(path)
+                    f = CompressedWriter(path, compression, self.config.compression_level)
+                    shard = {"file": path.name, "assets": 0, "segments": 0}
+
+                f.write(line)
+                shard["assets"] += 1
+                shard["segments"] += len(asset.segments)
+                stats.add(asset)
+                if checkpoint is not None:
+                    checkpoint.track(asset)
+
+            if f is not None:
+                close_shard()
+                f = None
+        finally:
+            if f is not None:
+                f.close()
+
+        manifest = {
+            "version": "3.1.0",
+            "generated_at": datetime.now().isoformat(),
+            "source": "nas_extractor",
+            "format": "jsonl",
+            "compression": compression,
+            "total_assets": stats.total_assets,
+            "total_segments": stats.total_segments,
+            "total_bytes": sum(s["bytes"] for s in shards),
+            "chunk_size": self.config.chunk_size,
+            "max_file_size_mb": self.config.max_file_size_mb,
+            "custom": metadata or {},
+            "shards": shards,
+        }
 
-        return output_file
+        manifest_file = output_dir / f"{filename}_manifest.json"
+        with open(manifest_file, "w", encoding="utf-8") as mf:
+            json.dump(manifest, mf, indent=2, ensure_ascii=False)
+
+        return shard_files, manifest_file
 
     def export_schema(self, output_dir: str | None = None) -> Path:
         """JSON Schema 내보내기"""
@@ -194,42 +415,34 @@ class JsonExporter:
 
     def export_summary(
         self,
-        assets: list[Asset],
+        assets: Iterable[Asset] | None = None,
         output_dir: str | None = None,
+        stats: ExportStats | None = None,
     ) -> Path:
-        """요약 통계 내보내기"""
+        """
+        요약 통계 내보내기
+
+        Args:
+            assets: Asset 목록 (stats가 없을 때 통계 계산용)
+            output_dir: 출력 디렉토리
+            stats: export()에서 누적한 통계 (있으면 Asset 재순회 없음)
+        """
         output_dir = Path(output_dir or self.config.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # 통계 계산
-        brand_counts: dict[str, int] = {}
-        asset_type_counts: dict[str, int] = {}
-        total_segments = 0
-        total_duration = 0.0
-
-        for asset in assets:
-            # 브랜드 카운트 (event_context에서 가져옴)
-            brand = str(asset.event_context.brand) if asset.event_context else "unknown"
-            brand_counts[brand] = brand_counts.get(brand, 0) + 1
-
-            # Asset Type 카운트 (use_enum_values=True이므로 이미 문자열)
-            asset_type = str(asset.asset_type) if asset.asset_type else "unknown"
-            asset_type_counts[asset_type] = asset_type_counts.get(asset_type, 0) + 1
-
-            # Segment 카운트
-            total_segments += len(asset.segments)
-
-            # Duration
-            if asset.tech_spec and asset.tech_spec.duration_sec:
-                total_duration += asset.tech_spec.duration_sec
+        if stats is None:
+            stats = ExportStats()
+            for asset in assets or []:
+                stats.add(asset)
 
         summary = {
             "generated_at": datetime.now().isoformat(),
-            "total_assets": len(assets),
-            "total_segments": total_segments,
-            "total_duration_hours": round(total_duration / 3600, 2),
-            "brand_distribution": brand_counts,
-            "asset_type_distribution": asset_type_counts,
+            "total_assets": stats.total_assets,
+            "total_segments": stats.total_segments,
+            "total_duration_hours": round(stats.total_duration_sec / 3600, 2),
+            "brand_distribution": stats.brand_counts,
+            "asset_type_distribution": stats.asset_type_counts,
         }
 
         output_file = output_dir / "export_summary.json"
@@ -240,6 +453,37 @@ class JsonExporter:
         return output_file
 
 
+def verify_export_manifest(manifest_file: str | Path) -> list[str]:
+    """
+    JSONL 샤드 매니페스트 검증 (전송 재개 시 다시 받아야 할 샤드 확인)
+
+    Args:
+        manifest_file: {filename}_manifest.json 경로
+
+    Returns:
+        없거나 크기/체크섬이 다른 샤드 파일명 목록 (모두 정상이면 빈 목록)
+    """
+    manifest_file = Path(manifest_file)
+    with open(manifest_file, encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    invalid = []
+    for shard in manifest["shards"]:
+        path = manifest_file.parent / shard["file"]
+        if not path.exists() or path.stat().st_size != shard["bytes"]:
+            invalid.append(shard["file"])
+            continue
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as sf:
+            for block in iter(lambda: sf.read(1024 * 1024), b""):
+                digest.update(block)
+        if digest.hexdigest() != shard["sha256"]:
+            invalid.append(shard["file"])
+
+    return invalid
+
+
 class NasToUdmPipeline:
     """NAS → UDM 변환 파이프라인 (편의 클래스)"""
 
@@ -248,69 +492,317 @@ class NasToUdmPipeline:
         nas_root: str,
         output_dir: str = "./output",
         include_tech_spec: bool = False,
-        export_format: Literal["json", "jsonl"] = "json",
+        export_format: Literal["json", "jsonl", "parquet", "arrow"] = "json",
+        scan_workers: int | None = None,
+        validate: bool = False,
+        transform_workers: int = 1,
+        compression: Compression | None = None,
+        delta: bool = False,
+        streaming: bool = False,
+        queue_size: int = 16,
+        batch_size: int = 256,
+        checkpoint: bool = True,
+        probe_workers: int = 4,
     ):
         """
         Args:
             nas_root: NAS 루트 경로
             output_dir: 출력 디렉토리
             include_tech_spec: FFprobe로 기술 메타데이터 추출 여부
-            export_format: 출력 형식
+                (결과는 output_dir의 프로브 캐시에 저장, 바뀌지 않은 파일은 다시 프로브하지 않음)
+            export_format: 출력 형식 (parquet/arrow는 pyarrow 필요)
+            scan_workers: 디렉토리 목록 조회 스레드 수 (None이면 스캐너 기본값)
+            validate: 변환 후 Pydantic 일괄 검증 실행 여부
+                (스캐너 결과는 신뢰 입력이므로 기본은 검증 없이 생성)
+            transform_workers: 변환 프로세스 수 (1 = 순차, 0 = CPU 코어 수)
+            compression: 출력 압축 (None | "gzip" | "zstd")
+            delta: 이전 실행의 Asset 인덱스 대비 변경셋만 내보내기
+                (export_format 대신 {prefix}_changeset.jsonl, 인덱스는 output_dir에 유지)
+            streaming: 스캔/변환/내보내기를 제한 큐로 연결해 동시에 실행
+                (전체 파일 목록을 만들지 않으므로 첫 출력이 빠르고 메모리가 일정)
+            queue_size: 단계 사이 큐의 최대 배치 수 (streaming)
+            batch_size: 큐 배치당 항목 수 (streaming)
+            checkpoint: JSONL 내보내기 중 샤드마다 체크포인트 저장
+                ({run_id}_checkpoint.json, 성공하면 삭제 / run(resume=run_id)로 이어서 실행)
+            probe_workers: 동시에 실행할 ffprobe 프로세스 수 (include_tech_spec)
         """
         from .nas_scanner import NasScanner
+        from .tech_spec import PROBE_CACHE_FILENAME
         from .udm_transformer import UdmTransformer
 
-        self.scanner = NasScanner(nas_root)
-        self.transformer = UdmTransformer(include_tech_spec=include_tech_spec)
+        if scan_workers is None:
+            scan_workers = NasScanner.DEFAULT_WORKERS
+
+        self.scanner = NasScanner(nas_root, workers=scan_workers)
+        self.transformer = UdmTransformer(
+            include_tech_spec=include_tech_spec,
+            trusted=True,
+            tech_spec_cache=str(Path(output_dir) / PROBE_CACHE_FILENAME) if include_tech_spec else None,
+            probe_workers=probe_workers,
+        )
+        self.validate = validate
+        self.transform_workers = transform_workers
+        self.streaming = streaming
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.checkpoint = checkpoint
+        # 스키마/요약은 항상 JSON
         self.exporter = JsonExporter(
             ExportConfig(
                 output_dir=output_dir,
-                format=export_format,
+                format=export_format if export_format in ("json", "jsonl") else "json",
+                compression=compression,
             )
         )
+        self.data_exporter = self.exporter
+        if delta:
+            from .delta_exporter import DeltaExporter
+
+            self.data_exporter = DeltaExporter(self.exporter.config)
+        elif export_format in ("parquet", "arrow"):
+            from .columnar_exporter import ColumnarExportConfig, ColumnarExporter
+
+            self.data_exporter = ColumnarExporter(
+                ColumnarExportConfig(output_dir=output_dir, format=export_format)
+            )
 
     def run(
         self,
         video_only: bool = True,
         max_files: int | None = None,
+        resume: str | None = None,
     ) -> dict:
         """
         전체 파이프라인 실행
 
+        Args:
+            video_only: 비디오 파일만
+            max_files: 최대 파일 수 (테스트용)
+            resume: 이어서 실행할 run id (중단된 JSONL 실행의 체크포인트)
+
         Returns:
-            실행 결과 요약
+            실행 결과 요약 (streaming이면 단계별 처리량/큐 깊이 "pipeline" 포함)
+            이어서 실행한 경우 transform 카운트는 이번 실행분만 포함
         """
-        # 1. 스캔
+        from .udm_transformer import TransformResult
+
+        checkpoint = self._open_checkpoint(resume, video_only, max_files)
+
+        if self.streaming:
+            return self._run_streaming(video_only, max_files, checkpoint)
+
+        # 1. 스캔 (이어서 실행하면 이미 기록된 파일 제외)
         files, scan_result = self.scanner.scan_with_stats(
             video_only=video_only,
             max_files=max_files,
         )
+        if checkpoint is not None and checkpoint.shards:
+            files = list(checkpoint.skip_exported(files))
+
+        # 2. 변환 (스트리밍: 내보내기와 함께 한 건씩 처리)
+        transform_result = TransformResult()
+        assets = self.transformer.iter_transform(
+            files,
+            transform_result,
+            workers=self.transform_workers,
+        )
 
-        # 2. 변환
-        assets, transform_result = self.transformer.transform_batch(files)
+        # 2-1. 검증 (선택)
+        validation_result = None
+        if self.validate:
+            validation_result = TransformResult()
+            assets = self.transformer.iter_validate(assets, validation_result)
 
         # 3. 내보내기
-        export_result = self.exporter.export(
+        export_result = self._export(
             assets,
-            metadata={
-                "scan": {
-                    "total_files": scan_result.total_files,
-                    "video_files": scan_result.video_files,
-                    "folders_scanned": scan_result.folders_scanned,
-                },
-            },
+            {"scan": self._scan_metadata(scan_result)},
+            checkpoint,
+            scan_result,
         )
 
-        # 4. 스키마 & 요약 내보내기
-        schema_file = self.exporter.export_schema()
-        summary_file = self.exporter.export_summary(assets)
+        return self._summarize(
+            scan_result, transform_result, validation_result, export_result, checkpoint,
+        )
+
+    def _open_checkpoint(
+        self,
+        resume: str | None,
+        video_only: bool,
+        max_files: int | None,
+    ):
+        """
+        체크포인트 준비 (JSONL 샤드 내보내기에서만)
+
+        Raises:
+            ValueError: JSONL이 아닌데 resume 지정, 또는 설정이 중단된 실행과 다름
+            FileNotFoundError: resume할 체크포인트 없음
+        """
+        from .checkpoint import RunCheckpoint
+
+        config = self.exporter.config
+        if self.data_exporter is not self.exporter or config.format != "jsonl":
+            if resume:
+                raise ValueError("Resume is only supported for jsonl exports")
+            return None
+        if not (self.checkpoint or resume):
+            return None
+
+        nas_root = str(self.scanner.root_path)
+        settings = {
+            "chunk_size": config.chunk_size,
+            "max_file_size_mb": config.max_file_size_mb,
+            "compression": config.compression,
+            "compression_level": config.compression_level,
+            "video_only": video_only,
+            "max_files": max_files,
+        }
+
+        if resume:
+            checkpoint = RunCheckpoint.load(config.output_dir, resume)
+            if checkpoint.nas_root != nas_root or checkpoint.settings != settings:
+                raise ValueError(
+                    f"Run '{resume}' was started with different settings: "
+                    f"{checkpoint.nas_root} {checkpoint.settings}"
+                )
+            return checkpoint
+
+        checkpoint = RunCheckpoint(
+            run_id=export_filename(config.filename_prefix, config.include_timestamp),
+            nas_root=nas_root,
+            output_dir=config.output_dir,
+            settings=settings,
+        )
+        Path(config.output_dir).mkdir(parents=True, exist_ok=True)
+        checkpoint.save()
+        return checkpoint
+
+    @staticmethod
+    def _require_complete_scan(assets, scan_result):
+        """
+        Asset을 그대로 전달하고, 끝에서 목록 조회에 실패한 디렉토리가 있으면 예외
+
+        SMB 끊김 등으로 일부 트리가 빠진 스캔을 성공으로 기록하지 않도록
+        내보내기를 실패시킵니다 (체크포인트는 남으므로 연결 복구 후 --resume).
+        """
+        from .nas_scanner import IncompleteScanError
+
+        yield from assets
+        if scan_result.errors:
+            raise IncompleteScanError(
+                f"{len(scan_result.errors)} directories could not be listed "
+                f"(first: {scan_result.errors[0]})"
+            )
+
+    def _export(self, assets, metadata: dict, checkpoint, scan_result) -> ExportResult:
+        """내보내기 (스캔 누락 시 실패, 체크포인트가 있으면 전달하고 성공하면 삭제)"""
+        assets = self._require_complete_scan(assets, scan_result)
+        if checkpoint is None:
+            return self.data_exporter.export(assets, metadata=metadata)
+
+        export_result = self.data_exporter.export(assets, metadata=metadata, checkpoint=checkpoint)
+        if export_result.success:
+            checkpoint.remove()
+        return export_result
+
+    def _run_streaming(
+        self,
+        video_only: bool,
+        max_files: int | None,
+        checkpoint=None,
+    ) -> dict:
+        """
+        스캔 → 변환 → 내보내기 동시 실행
+
+        스캔과 변환은 각각 스레드에서, 내보내기는 현재 스레드에서 실행하며
+        단계 사이는 제한 큐로 연결합니다 (뒤 단계가 느리면 앞 단계가 대기).
+        단계에서 발생한 예외는 내보내기를 중단시킨 뒤 다시 발생합니다.
+
+        Note:
+            내보내기 시작 시점에는 스캔 통계가 없으므로 비압축 JSON 헤더의
+            custom.scan은 비어 있습니다 (끝에 기록되는 JSONL 매니페스트,
+            델타 인덱스, 압축 JSON에는 포함).
+        """
+        from .nas_scanner import ScanResult
+        from .streaming import StageRunner
+        from .udm_transformer import TransformResult
+
+        runner = StageRunner()
+        scanned = runner.channel("scan_to_transform", self.queue_size, self.batch_size)
+        transformed = runner.channel("transform_to_export", self.queue_size, self.batch_size)
+
+        scan_result = ScanResult()
+        transform_result = TransformResult()
+        validation_result = TransformResult() if self.validate else None
+
+        def scan(stats):
+            files = self.scanner.iter_scan_with_stats(
+                scan_result, video_only=video_only, max_files=max_files,
+            )
+            if checkpoint is not None and checkpoint.shards:
+                files = checkpoint.skip_exported(files)
+            return files
+
+        runner.start("scan", scan, scanned)
 
+        def transform(stats):
+            assets = self.transformer.iter_transform(
+                scanned.consume(stats),
+                transform_result,
+                workers=self.transform_workers,
+            )
+            if validation_result is not None:
+                assets = self.transformer.iter_validate(assets, validation_result)
+            return assets
+
+        runner.start("transform", transform, transformed)
+
+        metadata = {"scan": {}}
+
+        def assets():
+            yield from runner.consume("export", transformed)
+            # 입력이 끝났으면 스캔도 끝난 상태
+            metadata["scan"].update(self._scan_metadata(scan_result))
+
+        try:
+            export_result = self._export(assets(), metadata, checkpoint, scan_result)
+        finally:
+            runner.join()
+
+        summary = self._summarize(
+            scan_result, transform_result, validation_result, export_result, checkpoint,
+        )
+        summary["pipeline"] = runner.report()
+        return summary
+
+    @staticmethod
+    def _scan_metadata(scan_result) -> dict:
+        """내보내기 메타데이터용 스캔 통계"""
         return {
+            "total_files": scan_result.total_files,
+            "video_files": scan_result.video_files,
+            "folders_scanned": scan_result.folders_scanned,
+        }
+
+    def _summarize(
+        self,
+        scan_result,
+        transform_result,
+        validation_result,
+        export_result: ExportResult,
+        checkpoint=None,
+    ) -> dict:
+        """스키마/요약 파일 내보내기 후 실행 결과 요약"""
+        schema_file = self.exporter.export_schema()
+        summary_file = self.exporter.export_summary(stats=export_result.stats)
+
+        summary = {
             "scan": {
                 "total_files": scan_result.total_files,
                 "video_files": scan_result.video_files,
                 "total_size_gb": round(scan_result.total_size_gb, 2),
                 "duration_sec": round(scan_result.scan_duration_sec, 2),
+                "errors": list(scan_result.errors),
             },
             "transform": {
                 "success": transform_result.success,
@@ -319,8 +811,47 @@ class NasToUdmPipeline:
             },
             "export": {
                 "success": export_result.success,
-                "files": export_result.output_files + [str(schema_file), str(summary_file)],
+                "files": (
+                    export_result.output_files
+                    + ([export_result.manifest_file] if export_result.manifest_file else [])
+                    + [str(schema_file), str(summary_file)]
+                ),
                 "size_bytes": export_result.file_size_bytes,
                 "duration_sec": round(export_result.export_duration_sec, 2),
             },
         }
+
+        if checkpoint is not None:
+            # 실패한 실행만 체크포인트가 남음 (resume 대상)
+            summary["run"] = {
+                "run_id": checkpoint.run_id,
+                "checkpoint": str(checkpoint.path) if checkpoint.path.exists() else None,
+            }
+
+        if hasattr(export_result, "changes"):
+            summary["delta"] = {
+                "base_generated_at": export_result.base_generated_at,
+                "added": export_result.changes.added,
+                "changed": export_result.changes.changed,
+                "removed": export_result.changes.removed,
+                "unchanged": export_result.changes.unchanged,
+            }
+
+        if self.transformer.include_tech_spec:
+            probe_stats = self.transformer.tech_spec_service.stats
+            summary["tech_spec"] = {
+                "cache_hits": probe_stats.cache_hits,
+                "probed": probe_stats.probed,
+                "failed": probe_stats.failed,
+                "errors": probe_stats.errors,
+            }
+            self.transformer.close()
+
+        if validation_result is not None:
+            summary["validation"] = {
+                "success": validation_result.success,
+                "failed": validation_result.failed,
+                "errors": validation_result.errors[:20],
+            }
+
+        return summary
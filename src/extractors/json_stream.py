@@ -0,0 +1,172 @@
+"""
+증분 JSON 읽기
+
+UDM 내보내기({"_metadata": {...}, "assets": [...]}) 같은 큰 JSON 문서를
+전체를 메모리에 올리지 않고 배열 요소 하나씩 파싱합니다 (ijson과 같은 방식).
+
+- 청크 단위로 읽으며 요소 하나는 표준 json의 C 스캐너(raw_decode)로 파싱
+  (문서 전체 대신 요소 하나만큼의 버퍼만 유지)
+- 요소마다 스트림 내 바이트 위치/길이를 함께 반환
+  → 압축하지 않은 파일이면 나중에 seek으로 해당 요소만 다시 읽을 수 있음
+- 배열 외 최상위 멤버(_metadata 등)는 순서와 관계없이 members에 모음
+"""
+
+import codecs
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Iterator
+
+# 한 번에 읽는 바이트 수
+CHUNK_SIZE = 1024 * 1024
+
+# 요소 하나의 최대 크기 (손상된 파일에서 끝까지 버퍼링하지 않도록)
+MAX_ITEM_CHARS = 64 * 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonStreamError(ValueError):
+    """JSON 문서 구조 오류"""
+
+
+@dataclass
+class ArrayItem:
+    """배열 요소 하나"""
+
+    value: Any
+    offset: int  # 스트림 내 바이트 위치
+    length: int  # 바이트 길이
+
+
+class JsonArrayReader:
+    """
+    최상위 객체의 배열 멤버 하나를 요소 단위로 읽는 리더
+
+    사용법:
+        reader = JsonArrayReader(stream, "assets")
+        for item in reader:
+            ...
+        metadata = reader.members.get("_metadata")
+    """
+
+    def __init__(self, stream: BinaryIO, array_key: str = "assets", chunk_size: int = CHUNK_SIZE):
+        """
+        Args:
+            stream: 바이너리 읽기 스트림 (UTF-8 JSON)
+            array_key: 요소 단위로 읽을 최상위 배열 키
+            chunk_size: 한 번에 읽는 바이트 수
+        """
+        self.stream = stream
+        self.array_key = array_key
+        self.chunk_size = chunk_size
+        self.members: dict[str, Any] = {}  # 배열 외 최상위 멤버
+
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._offset = 0  # _buffer[_pos]의 바이트 위치
+        self._eof = False
+
+    @property
+    def offset(self) -> int:
+        """지금까지 처리한 바이트 수"""
+        return self._offset
+
+    # -------------------------------------------------------------------------
+    # 버퍼
+    # -------------------------------------------------------------------------
+
+    def _fill(self) -> bool:
+        """다음 청크 읽기 (처리한 앞부분은 버림) → EOF면 False"""
+        if self._eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+        text = self._decoder.decode(chunk, final=self._eof)
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return bool(chunk) or bool(text)
+
+    def _advance(self, end: int):
+        segment = self._buffer[self._pos:end]
+        self._offset += len(segment) if segment.isascii() else len(segment.encode("utf-8"))
+        self._pos = end
+
+    def _peek(self) -> str:
+        """공백을 건너뛴 다음 문자 ("" = 문서 끝)"""
+        while True:
+            self._advance(_WHITESPACE.match(self._buffer, self._pos).end())
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise JsonStreamError(
+                f"Expected one of {chars!r} at byte {self._offset}, got {char or 'EOF'!r}"
+            )
+        self._advance(self._pos + 1)
+        return char
+
+    def _value(self) -> tuple[Any, int, int]:
+        """다음 값 하나 파싱 → (값, 바이트 위치, 바이트 길이)"""
+        if not self._peek():
+            raise JsonStreamError(f"Unexpected end of document at byte {self._offset}")
+        start = self._offset
+
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                # 청크 경계에 걸친 값이면 더 읽고 다시 시도
+                if len(self._buffer) - self._pos < MAX_ITEM_CHARS and self._fill():
+                    continue
+                raise JsonStreamError(f"Invalid JSON value at byte {start}: {e.msg}") from e
+            # 버퍼 끝에서 끝난 값(숫자 등)은 다음 청크에서 이어질 수 있음
+            if end == len(self._buffer) and self._fill():
+                continue
+            break
+
+        self._advance(end)
+        return value, start, self._offset - start
+
+    # -------------------------------------------------------------------------
+    # 문서 순회
+    # -------------------------------------------------------------------------
+
+    def __iter__(self) -> Iterator[ArrayItem]:
+        """배열 요소 순회 (끝까지 순회하면 members에 나머지 멤버도 채워짐)"""
+        self._expect("{")
+        if self._peek() == "}":
+            self._advance(self._pos + 1)
+        else:
+            while True:
+                key, _, _ = self._value()
+                if not isinstance(key, str):
+                    raise JsonStreamError(f"Expected object key at byte {self._offset}")
+                self._expect(":")
+                if key == self.array_key:
+                    yield from self._iter_array()
+                else:
+                    self.members[key], _, _ = self._value()
+                if self._expect(",}") == "}":
+                    break
+
+        if self._peek():
+            raise JsonStreamError(f"Unexpected data after document at byte {self._offset}")
+
+    def _iter_array(self) -> Iterator[ArrayItem]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._advance(self._pos + 1)
+            return
+        while True:
+            value, offset, length = self._value()
+            yield ArrayItem(value, offset, length)
+            if self._expect(",]") == "]":
+                return
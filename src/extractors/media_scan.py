@@ -0,0 +1,519 @@
+"""
+미디어 정보 스캔
+
+nas_footage.db files 테이블에서 아직 스캔하지 않은 파일의 미디어 정보
+(재생 시간, 비디오/오디오 코덱, 해상도, 비트레이트, fps)를 수집하여 같은 행에 기록
+
+- MP4/MOV는 헤더 리더(mp4_reader)로 직접 읽고, 그 외는 asyncio 서브프로세스로 ffprobe 실행
+- 동시 실행 수는 AIMD로 조절 (AdaptiveLimiter):
+  최근 지연 시간 중앙값이 기준의 latency_tolerance배를 넘거나 오류율이 max_error_rate를
+  넘으면 절반으로 줄이고, 아니면 1씩 늘림 (NAS/SMB가 감당하는 만큼만 동시에 읽음)
+- 결과는 batch_size개 또는 flush_interval초마다 executemany로 기록
+  → 중단돼도 기록된 파일은 media_scanned로 건너뛰고 이어서 스캔
+
+media_scanned 값:
+    0 = 스캔 전 (시간 초과 등 일시적 오류도 0으로 남아 다음 실행에서 다시 시도)
+    1 = 완료
+   -1 = 읽을 수 없음 (비디오 스트림 없음 / ffprobe 실패, retry_failed로 다시 시도)
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from .mp4_reader import MP4_EXTENSIONS, Mp4ParseError, read_mp4_info
+from .tech_spec import parse_probe_output
+
+# files 테이블에 추가하는 미디어 정보 컬럼
+MEDIA_COLUMNS = [
+    ("duration_sec", "REAL"),
+    ("video_codec", "TEXT"),
+    ("audio_codec", "TEXT"),
+    ("resolution", "TEXT"),
+    ("bitrate", "INTEGER"),
+    ("fps", "REAL"),
+    ("media_scanned", "INTEGER DEFAULT 0"),
+]
+
+
+# =============================================================================
+# DB
+# =============================================================================
+
+
+def ensure_media_columns(conn: sqlite3.Connection) -> list[str]:
+    """
+    files 테이블에 미디어 정보 컬럼 추가 (이미 있으면 무시)
+
+    Returns:
+        추가된 컬럼 이름
+    """
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+    added = []
+    for name, column_type in MEDIA_COLUMNS:
+        if name not in existing:
+            conn.execute(f"ALTER TABLE files ADD COLUMN {name} {column_type}")
+            added.append(name)
+    conn.commit()
+    return added
+
+
+def media_scan_stats(conn: sqlite3.Connection) -> dict:
+    """스캔 진행 통계"""
+    total, scanned, failed, with_duration = conn.execute("""
+        SELECT
+            COUNT(*),
+            COALESCE(SUM(media_scanned = 1), 0),
+            COALESCE(SUM(media_scanned = -1), 0),
+            COALESCE(SUM(duration_sec IS NOT NULL), 0)
+        FROM files
+    """).fetchone()
+    return {
+        "total": total,
+        "scanned": scanned,
+        "failed": failed,
+        "with_duration": with_duration,
+        "remaining": total - scanned - failed,
+    }
+
+
+def pending_files(
+    conn: sqlite3.Connection,
+    folder_filter: str | None = None,
+    limit: int | None = None,
+    retry_failed: bool = False,
+) -> list[tuple[int, str, str]]:
+    """
+    스캔할 파일 목록
+
+    Returns:
+        (id, path, filename) 목록 (최근 연도 먼저)
+    """
+    states = (0, -1) if retry_failed else (0,)
+    query = (
+        "SELECT id, path, filename FROM files "
+        f"WHERE media_scanned IN ({', '.join('?' * len(states))})"
+    )
+    params: list = list(states)
+
+    if folder_filter:
+        query += " AND path LIKE ?"
+        params.append(f"%{folder_filter}%")
+
+    query += " ORDER BY year DESC, filename"
+
+    if limit:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    return conn.execute(query, params).fetchall()
+
+
+# =============================================================================
+# 동시 실행 제한 (AIMD)
+# =============================================================================
+
+
+class AdaptiveLimiter:
+    """
+    지연 시간 / 오류율에 따라 동시 실행 수를 조절하는 제한기
+
+    window개 결과마다 한 번 조절합니다. 기준 지연 시간은 지금까지의 최소 중앙값이며,
+    환경이 계속 느려진 경우에도 회복하도록 조절할 때마다 BASELINE_DRIFT배까지 올라갑니다.
+    """
+
+    BASELINE_DRIFT = 1.1
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        window: int = 16,
+        latency_tolerance: float = 2.0,
+        max_error_rate: float = 0.1,
+    ):
+        """
+        Args:
+            initial: 시작 동시 실행 수
+            min_limit: 최소 동시 실행 수
+            max_limit: 최대 동시 실행 수
+            window: 조절 주기 (결과 수)
+            latency_tolerance: 기준 대비 허용 지연 배수
+            max_error_rate: 허용 오류율 (시간 초과 / 실행 실패)
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(max(initial, self.min_limit), self.max_limit)
+        self.window = max(1, window)
+        self.latency_tolerance = latency_tolerance
+        self.max_error_rate = max_error_rate
+
+        self.baseline: float | None = None
+        self.history: list[int] = [self.limit]  # 조절 후 동시 실행 수
+
+        self._in_flight = 0
+        self._latencies: list[float] = []
+        self._errors = 0
+        self._condition: asyncio.Condition | None = None
+        self._notify_task: asyncio.Task | None = None
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _cond(self) -> asyncio.Condition:
+        # 실행 중인 이벤트 루프에서 생성
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self):
+        """실행 슬롯 얻기 (동시 실행 수가 limit 미만이 될 때까지 대기)"""
+        async with self._cond():
+            await self._cond().wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self):
+        """실행 슬롯 반환"""
+        async with self._cond():
+            self._in_flight -= 1
+            self._cond().notify_all()
+
+    def record(self, latency: float, error: bool = False):
+        """결과 하나 기록 (window개가 모이면 조절)"""
+        self._latencies.append(latency)
+        self._errors += error
+        if len(self._latencies) >= self.window:
+            self._adjust()
+
+    def _adjust(self):
+        median = statistics.median(self._latencies)
+        error_rate = self._errors / len(self._latencies)
+        self._latencies = []
+        self._errors = 0
+
+        if self.baseline is None:
+            self.baseline = median
+        else:
+            self.baseline = min(median, self.baseline * self.BASELINE_DRIFT)
+
+        if error_rate > self.max_error_rate or median > self.baseline * self.latency_tolerance:
+            self.limit = max(self.min_limit, self.limit // 2)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1)
+        self.history.append(self.limit)
+
+        # 늘어난 슬롯만큼 대기 중인 작업 깨우기
+        if self._condition is not None:
+            self._notify_task = asyncio.get_running_loop().create_task(self._notify())
+
+    async def _notify(self):
+        async with self._cond():
+            self._cond().notify_all()
+
+
+# =============================================================================
+# 스캐너
+# =============================================================================
+
+
+@dataclass
+class MediaInfo:
+    """files 테이블 미디어 정보 컬럼"""
+
+    duration_sec: float | None = None
+    video_codec: str | None = None
+    audio_codec: str | None = None
+    resolution: str | None = None
+    bitrate: int | None = None
+    fps: float | None = None
+
+    @classmethod
+    def from_probe(cls, info: dict) -> "MediaInfo":
+        """parse_probe_output() / read_mp4_info() 결과에서 생성"""
+        width, height = info.get("width"), info.get("height")
+        fps = info.get("fps")
+        return cls(
+            duration_sec=info.get("duration_sec"),
+            video_codec=info.get("codec"),
+            audio_codec=info.get("audio_codec"),
+            resolution=f"{width}x{height}" if width and height else None,
+            bitrate=info.get("bit_rate"),
+            fps=round(fps, 2) if fps else None,
+        )
+
+
+@dataclass
+class MediaProbe:
+    """파일 하나의 스캔 결과"""
+
+    file_id: int
+    path: str
+    filename: str
+    info: MediaInfo | None = None  # None = 읽을 수 없음 또는 오류
+    method: str | None = None  # "native" | "ffprobe"
+    error: str | None = None  # 일시적 오류 (다음 실행에서 다시 시도)
+    latency_sec: float = 0.0
+
+
+@dataclass
+class MediaScanStats:
+    """스캔 통계"""
+
+    total: int = 0
+    scanned: int = 0
+    native: int = 0  # scanned 중 헤더 리더로 읽은 수
+    failed: int = 0  # 읽을 수 없음 (media_scanned = -1)
+    errors: int = 0  # 일시적 오류 (media_scanned = 0 유지)
+    flushes: int = 0
+    duration_sec: float = 0.0
+    limit_history: list[int] = field(default_factory=list)
+
+    @property
+    def files_per_sec(self) -> float:
+        done = self.scanned + self.failed + self.errors
+        return done / self.duration_sec if self.duration_sec > 0 else 0.0
+
+
+class MediaInfoScanner:
+    """적응형 동시 실행 미디어 정보 스캐너"""
+
+    def __init__(
+        self,
+        db_path: str,
+        limiter: AdaptiveLimiter | None = None,
+        ffprobe: str = "ffprobe",
+        timeout: float = 30,
+        native: bool = True,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+    ):
+        """
+        Args:
+            db_path: nas_footage.db 경로 (files 테이블)
+            limiter: 동시 실행 제한기 (None = 기본 AdaptiveLimiter)
+            ffprobe: ffprobe 실행 파일
+            timeout: 파일당 ffprobe 제한 시간 (초)
+            native: MP4/MOV는 헤더를 직접 읽기
+            batch_size: 이 개수만큼 모이면 DB에 기록
+            flush_interval: 마지막 기록 후 이 시간(초)이 지나면 기록
+        """
+        self.db_path = Path(db_path)
+        self.limiter = limiter or AdaptiveLimiter()
+        self.ffprobe = ffprobe
+        self.timeout = timeout
+        self.native = native
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+    # -------------------------------------------------------------------------
+    # 프로브
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _read_native(path: str) -> dict | None:
+        """헤더 리더 (비트레이트는 파일 크기 / 재생 시간, ffprobe format.bit_rate와 같은 정의)"""
+        info = read_mp4_info(path)
+        if info is not None and info.get("duration_sec"):
+            info["bit_rate"] = int(os.path.getsize(path) * 8 / info["duration_sec"])
+        return info
+
+    async def _run_ffprobe(self, path: str) -> dict | None:
+        """
+        ffprobe 서브프로세스 실행
+
+        Raises:
+            asyncio.TimeoutError: 시간 초과 (프로세스 종료 후)
+            OSError: 실행 실패
+        """
+        process = await asyncio.create_subprocess_exec(
+            self.ffprobe,
+            "-v", "quiet",
+            "-print_format", "json",
+            "-show_format",
+            "-show_streams",
+            path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), self.timeout)
+        except BaseException:
+            # 시간 초과 / 취소: 프로세스를 남기지 않음
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+
+        if process.returncode != 0:
+            return None
+        try:
+            return parse_probe_output(json.loads(stdout))
+        except ValueError:
+            return None
+
+    async def probe(self, file_id: int, path: str, filename: str) -> MediaProbe:
+        """파일 하나 스캔 (헤더 리더 → ffprobe)"""
+        result = MediaProbe(file_id, path, filename)
+        start = time.perf_counter()
+
+        try:
+            info = None
+            if self.native and Path(path).suffix.lower() in MP4_EXTENSIONS:
+                try:
+                    info = await asyncio.to_thread(self._read_native, path)
+                    result.method = "native"
+                except Mp4ParseError:
+                    pass  # ffprobe로 다시 시도
+            if result.method is None:
+                info = await self._run_ffprobe(path)
+                result.method = "ffprobe"
+            if info is not None:
+                result.info = MediaInfo.from_probe(info)
+        except asyncio.TimeoutError:
+            result.method = None
+            result.error = "timeout"
+        except OSError as e:
+            result.method = None
+            result.error = str(e)
+
+        result.latency_sec = time.perf_counter() - start
+        return result
+
+    # -------------------------------------------------------------------------
+    # 실행
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _collect(probe: MediaProbe, done: list[MediaProbe], stats: MediaScanStats):
+        """결과 집계 (일시적 오류는 기록하지 않음)"""
+        if probe.error is not None:
+            stats.errors += 1
+            return
+        done.append(probe)
+        if probe.info is None:
+            stats.failed += 1
+        else:
+            stats.scanned += 1
+            stats.native += probe.method == "native"
+
+    def _flush(
+        self,
+        conn: sqlite3.Connection,
+        done: list[MediaProbe],
+        stats: MediaScanStats,
+    ):
+        """완료된 결과 기록 (단일 트랜잭션)"""
+        if not done:
+            return
+        with conn:
+            conn.executemany(
+                "UPDATE files SET duration_sec = ?, video_codec = ?, audio_codec = ?, "
+                "resolution = ?, bitrate = ?, fps = ?, media_scanned = 1 WHERE id = ?",
+                [
+                    (
+                        p.info.duration_sec, p.info.video_codec, p.info.audio_codec,
+                        p.info.resolution, p.info.bitrate, p.info.fps, p.file_id,
+                    )
+                    for p in done if p.info is not None
+                ],
+            )
+            conn.executemany(
+                "UPDATE files SET media_scanned = -1 WHERE id = ?",
+                [(p.file_id,) for p in done if p.info is None],
+            )
+        stats.flushes += 1
+        done.clear()
+
+    async def scan(
+        self,
+        files: list[tuple[int, str, str]],
+        progress: Callable[[int, int, MediaProbe], None] | None = None,
+    ) -> MediaScanStats:
+        """
+        파일 목록 스캔
+
+        Args:
+            files: pending_files() 결과 [(id, path, filename)]
+            progress: (완료 수, 전체 수, MediaProbe) 콜백
+
+        Returns:
+            MediaScanStats (중단되어도 그때까지 완료된 결과는 기록됨)
+        """
+        stats = MediaScanStats(total=len(files))
+        start = time.perf_counter()
+        results: asyncio.Queue[MediaProbe] = asyncio.Queue()
+        running: set[asyncio.Task] = set()
+
+        async def probe_one(file_id: int, path: str, filename: str):
+            try:
+                results.put_nowait(await self.probe(file_id, path, filename))
+            finally:
+                await self.limiter.release()
+
+        async def produce():
+            for file_id, path, filename in files:
+                await self.limiter.acquire()
+                task = asyncio.create_task(probe_one(file_id, path, filename))
+                running.add(task)
+                task.add_done_callback(running.discard)
+
+        conn = sqlite3.connect(str(self.db_path))
+        producer = asyncio.create_task(produce())
+        done: list[MediaProbe] = []
+        last_flush = time.monotonic()
+        completed = 0
+
+        try:
+            while completed < len(files):
+                try:
+                    probe = await asyncio.wait_for(results.get(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    probe = None
+                    if producer.done():
+                        if producer.exception() is not None:
+                            raise producer.exception()
+                        if not running and results.empty():
+                            break  # 결과를 내지 못하고 끝난 작업 (예기치 않은 예외)
+
+                if probe is not None:
+                    completed += 1
+                    self.limiter.record(probe.latency_sec, error=probe.error is not None)
+                    self._collect(probe, done, stats)
+                    if progress is not None:
+                        progress(completed, len(files), probe)
+
+                if len(done) >= self.batch_size or (
+                    done and time.monotonic() - last_flush >= self.flush_interval
+                ):
+                    self._flush(conn, done, stats)
+                    last_flush = time.monotonic()
+        finally:
+            producer.cancel()
+            for task in list(running):
+                task.cancel()
+            await asyncio.gather(producer, *running, return_exceptions=True)
+            # 중단되었어도 이미 끝난 결과는 기록
+            while not results.empty():
+                self._collect(results.get_nowait(), done, stats)
+            self._flush(conn, done, stats)
+            conn.close()
+            stats.duration_sec = time.perf_counter() - start
+            stats.limit_history = list(self.limiter.history)
+
+        return stats
+
+    def run(
+        self,
+        files: list[tuple[int, str, str]],
+        progress: Callable[[int, int, MediaProbe], None] | None = None,
+    ) -> MediaScanStats:
+        """scan() 동기 실행"""
+        return asyncio.run(self.scan(files, progress))
@@ -0,0 +1,302 @@
+"""
+MP4 / MOV 헤더 리더
+
+ISO-BMFF(MP4, MOV, M4V) 파일의 moov 박스만 읽어 기술 메타데이터 추출
+(ffprobe 프로세스를 띄우지 않으므로 SMB 위에서도 파일당 몇 번의 읽기로 끝남)
+
+- 최상위 박스는 헤더만 읽고 seek으로 건너뜀 (mdat 내용은 읽지 않음, moov가 끝에 있어도 동일)
+- moov 안에서 필요한 박스만 해석
+    mvhd: 전체 재생 시간
+    trak/tkhd: 트랙 표시 크기 (stsd에 크기가 없을 때)
+    trak/mdia/hdlr: 트랙 종류 (vide / soun)
+    trak/mdia/mdhd: 트랙 timescale / 재생 시간
+    trak/mdia/minf/stbl/stsd: 비디오/오디오 코덱 (sample entry 4CC) / 코딩 크기
+    trak/mdia/minf/stbl/stts: 샘플 수 → fps
+
+결과는 tech_spec.parse_probe_output()과 같은 형식 (codec은 ffprobe codec_name)이므로
+그대로 TechSpec 변환과 프로브 캐시에 사용합니다.
+"""
+
+import struct
+from typing import BinaryIO, Iterator
+
+# 네이티브 리더로 읽는 확장자 (그 외 MXF/AVI 등은 ffprobe)
+MP4_EXTENSIONS = frozenset({".mp4", ".mov", ".m4v"})
+
+# sample entry 4CC → ffprobe codec_name
+SAMPLE_ENTRY_CODECS = {
+    b"avc1": "h264",
+    b"avc3": "h264",
+    b"hvc1": "hevc",
+    b"hev1": "hevc",
+    b"apco": "prores",
+    b"apcs": "prores",
+    b"apcn": "prores",
+    b"apch": "prores",
+    b"ap4h": "prores",
+    b"ap4x": "prores",
+    b"AVdn": "dnxhd",
+    b"AVdh": "dnxhd",
+    b"mp4v": "mpeg4",
+    b"xd5c": "mpeg2video",
+    b"xdvc": "mpeg2video",
+    b"av01": "av1",
+    b"vp09": "vp9",
+}
+
+# 오디오 sample entry 4CC → ffprobe codec_name
+AUDIO_SAMPLE_ENTRY_CODECS = {
+    b"mp4a": "aac",
+    b"ac-3": "ac3",
+    b"ec-3": "eac3",
+    b"Opus": "opus",
+    b"fLaC": "flac",
+    b"sowt": "pcm_s16le",
+    b"twos": "pcm_s16be",
+    b"in24": "pcm_s24be",
+    b"in32": "pcm_s32be",
+    b"lpcm": "pcm_s16le",
+}
+
+# moov 최대 크기 (이보다 크면 손상된 파일로 보고 ffprobe로 넘김)
+MAX_MOOV_BYTES = 64 * 1024 * 1024
+
+# moov를 찾을 때까지 확인할 최상위 박스 수
+MAX_TOP_LEVEL_BOXES = 64
+
+_CONTAINER_BOXES = {b"trak", b"mdia", b"minf", b"stbl"}
+
+
+class Mp4ParseError(Exception):
+    """ISO-BMFF로 읽을 수 없는 파일 (ffprobe로 다시 시도)"""
+
+
+# =============================================================================
+# 박스 순회
+# =============================================================================
+
+
+def _read_header(f: BinaryIO, offset: int, file_size: int) -> tuple[bytes, int, int]:
+    """
+    최상위 박스 헤더 읽기
+
+    Returns:
+        (타입, 박스 크기, 헤더 크기)
+    """
+    f.seek(offset)
+    header = f.read(8)
+    if len(header) < 8:
+        raise Mp4ParseError(f"Truncated box header at {offset}")
+
+    size, box_type = struct.unpack(">I4s", header)
+    header_size = 8
+    if size == 1:
+        large = f.read(8)
+        if len(large) < 8:
+            raise Mp4ParseError(f"Truncated box header at {offset}")
+        (size,) = struct.unpack(">Q", large)
+        header_size = 16
+    elif size == 0:
+        size = file_size - offset  # 파일 끝까지
+
+    if size < header_size or offset + size > file_size:
+        raise Mp4ParseError(f"Invalid {box_type!r} box size {size} at {offset}")
+    return box_type, size, header_size
+
+
+def _iter_boxes(data: memoryview) -> Iterator[tuple[bytes, memoryview]]:
+    """메모리의 박스 목록 순회 → (타입, 내용)"""
+    offset = 0
+    end = len(data)
+    while offset + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", data, offset)
+        header_size = 8
+        if size == 1:
+            if offset + 16 > end:
+                break
+            (size,) = struct.unpack_from(">Q", data, offset + 8)
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size or offset + size > end:
+            raise Mp4ParseError(f"Invalid {bytes(box_type)!r} box size {size}")
+        yield bytes(box_type), data[offset + header_size:offset + size]
+        offset += size
+
+
+def _find_moov(f: BinaryIO, file_size: int) -> memoryview:
+    """최상위 박스를 건너뛰며 moov 내용 읽기"""
+    offset = 0
+    for _ in range(MAX_TOP_LEVEL_BOXES):
+        if offset >= file_size:
+            break
+        box_type, size, header_size = _read_header(f, offset, file_size)
+        if box_type == b"moov":
+            if size > MAX_MOOV_BYTES:
+                raise Mp4ParseError(f"moov box too large ({size} bytes)")
+            payload = f.read(size - header_size)
+            if len(payload) < size - header_size:
+                raise Mp4ParseError("Truncated moov box")
+            return memoryview(payload)
+        offset += size
+    raise Mp4ParseError("No moov box")
+
+
+# =============================================================================
+# 박스 해석
+# =============================================================================
+
+
+def _parse_time_header(data: memoryview) -> tuple[int, int]:
+    """mvhd / mdhd → (timescale, duration)"""
+    version = data[0]
+    if version == 1:
+        timescale, duration = struct.unpack_from(">IQ", data, 20)
+    else:
+        timescale, duration = struct.unpack_from(">II", data, 12)
+    if duration in (0xFFFFFFFF, 0xFFFFFFFFFFFFFFFF):
+        duration = 0  # 알 수 없음
+    return timescale, duration
+
+
+def _parse_tkhd(data: memoryview) -> tuple[int, int]:
+    """tkhd → 표시 크기 (16.16 고정소수점의 정수부)"""
+    offset = 88 if data[0] == 1 else 76
+    width, height = struct.unpack_from(">II", data, offset)
+    return width >> 16, height >> 16
+
+
+def _parse_stsd(data: memoryview) -> tuple[bytes, int, int] | None:
+    """stsd 첫 sample entry → (4CC, 코딩 너비, 코딩 높이)"""
+    (entry_count,) = struct.unpack_from(">I", data, 4)
+    if entry_count == 0 or len(data) < 8 + 36:
+        return None
+    fourcc = bytes(data[12:16])
+    # VisualSampleEntry: SampleEntry(8) + pre_defined/reserved(16) 다음 width, height
+    width, height = struct.unpack_from(">HH", data, 8 + 8 + 8 + 16)
+    return fourcc, width, height
+
+
+def _parse_stts(data: memoryview) -> tuple[int, int]:
+    """stts → (샘플 수, 전체 길이 (timescale 단위))"""
+    (entry_count,) = struct.unpack_from(">I", data, 4)
+    samples = duration = 0
+    for i in range(min(entry_count, (len(data) - 8) // 8)):
+        count, delta = struct.unpack_from(">II", data, 8 + i * 8)
+        samples += count
+        duration += count * delta
+    return samples, duration
+
+
+def _collect_track_boxes(trak: memoryview) -> dict[bytes, memoryview]:
+    """trak 아래 필요한 박스 모으기 (컨테이너 박스는 펼침, 같은 타입은 처음 것)"""
+    boxes: dict[bytes, memoryview] = {}
+
+    def collect(data: memoryview):
+        for box_type, payload in _iter_boxes(data):
+            if box_type in _CONTAINER_BOXES:
+                collect(payload)
+            elif box_type not in boxes:
+                boxes[box_type] = payload
+
+    collect(trak)
+    return boxes
+
+
+def _handler(boxes: dict[bytes, memoryview]) -> bytes | None:
+    hdlr = boxes.get(b"hdlr")
+    return bytes(hdlr[8:12]) if hdlr is not None else None
+
+
+def _parse_video_track(boxes: dict[bytes, memoryview]) -> dict:
+    """비디오 트랙 정보"""
+    track = {"codec": None, "width": None, "height": None, "fps": None}
+
+    if b"tkhd" in boxes:
+        track["width"], track["height"] = _parse_tkhd(boxes[b"tkhd"])
+
+    if b"stsd" in boxes:
+        entry = _parse_stsd(boxes[b"stsd"])
+        if entry is not None:
+            fourcc, width, height = entry
+            track["codec"] = SAMPLE_ENTRY_CODECS.get(fourcc, fourcc.decode("latin-1").strip())
+            if width and height:
+                track["width"], track["height"] = width, height
+
+    if b"mdhd" in boxes and b"stts" in boxes:
+        timescale, _ = _parse_time_header(boxes[b"mdhd"])
+        samples, duration = _parse_stts(boxes[b"stts"])
+        if timescale and samples and duration:
+            track["fps"] = round(samples * timescale / duration, 3)
+
+    return track
+
+
+def _parse_audio_codec(boxes: dict[bytes, memoryview]) -> str | None:
+    """오디오 트랙 코덱 (stsd 첫 sample entry)"""
+    stsd = boxes.get(b"stsd")
+    if stsd is None or len(stsd) < 16 or struct.unpack_from(">I", stsd, 4)[0] == 0:
+        return None
+    fourcc = bytes(stsd[12:16])
+    return AUDIO_SAMPLE_ENTRY_CODECS.get(fourcc, fourcc.decode("latin-1").strip())
+
+
+def parse_moov(moov: memoryview) -> dict | None:
+    """
+    moov 내용 → 프로브 정보
+
+    Returns:
+        {"width", "height", "fps", "duration_sec", "codec", "audio_codec"}
+        또는 None (비디오 트랙 없음)
+    """
+    duration_sec = None
+    video = None
+    audio_codec = None
+
+    for box_type, payload in _iter_boxes(moov):
+        if box_type == b"mvhd":
+            timescale, duration = _parse_time_header(payload)
+            if timescale and duration:
+                duration_sec = duration / timescale
+        elif box_type == b"trak":
+            boxes = _collect_track_boxes(payload)
+            handler = _handler(boxes)
+            if handler == b"vide" and video is None:
+                video = _parse_video_track(boxes)
+            elif handler == b"soun" and audio_codec is None:
+                audio_codec = _parse_audio_codec(boxes)
+        elif box_type == b"mvex":
+            # fragmented MP4: 샘플 정보가 moof에 있으므로 ffprobe 사용
+            raise Mp4ParseError("Fragmented MP4")
+
+    if video is None:
+        return None
+
+    return {
+        "width": video["width"] or None,
+        "height": video["height"] or None,
+        "fps": video["fps"],
+        "duration_sec": duration_sec,
+        "codec": video["codec"],
+        "audio_codec": audio_codec,
+    }
+
+
+def read_mp4_info(path: str) -> dict | None:
+    """
+    MP4/MOV 파일의 기술 메타데이터 읽기
+
+    Returns:
+        parse_moov() 결과 (None = 비디오 트랙 없음)
+
+    Raises:
+        Mp4ParseError: ISO-BMFF가 아니거나 손상된 파일
+        OSError: 파일 읽기 실패
+    """
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        file_size = f.tell()
+        try:
+            return parse_moov(_find_moov(f, file_size))
+        except (struct.error, IndexError) as e:
+            raise Mp4ParseError(f"Malformed box: {e}") from e
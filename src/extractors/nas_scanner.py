@@ -5,12 +5,18 @@ NAS 파일시스템 스캐너
 """
 
 import os
+import time
 import hashlib
+from contextlib import closing
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator
 from dataclasses import dataclass, field
 
+from .path_inference import KeywordRules, PathInference, PathInferenceEngine
+from .scan_manifest import ManifestFile, ManifestState, ScanManifest
 
 
 @dataclass
@@ -32,6 +38,9 @@ class NasFileInfo:
     # 해시 (선택적)
     file_hash: str | None = None
 
+    # 파일시스템 inode (이동 감지용, 미지원 시 0)
+    inode: int | None = None
+
     @property
     def size_mb(self) -> float:
         """파일 크기 (MB)"""
@@ -43,6 +52,10 @@ class NasFileInfo:
         return self.size_bytes / (1024 * 1024 * 1024)
 
 
+class IncompleteScanError(OSError):
+    """일부 디렉토리 목록 조회 실패로 스캔 결과가 불완전함"""
+
+
 @dataclass
 class ScanResult:
     """스캔 결과 요약"""
@@ -72,6 +85,90 @@ class ScanResult:
         return self.total_size_bytes / (1024 * 1024 * 1024)
 
 
+@dataclass
+class ScanDelta:
+    """매니페스트 대비 증분 스캔 결과"""
+
+    added: list[NasFileInfo] = field(default_factory=list)
+    modified: list[NasFileInfo] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)  # 상대 경로
+    moved: list[tuple[str, NasFileInfo]] = field(default_factory=list)  # (이전 상대 경로, 새 파일)
+
+    unchanged_files: int = 0
+    dirs_scanned: int = 0  # 다시 목록 조회한 디렉토리
+    dirs_skipped: int = 0  # mtime 변화 없어 건너뛴 디렉토리
+    dirs_failed: int = 0  # 목록 조회 실패 (매니페스트 기록 유지)
+    errors: list[str] = field(default_factory=list)
+    scan_duration_sec: float = 0.0
+
+    @property
+    def has_changes(self) -> bool:
+        """변경 사항 존재 여부"""
+        return bool(self.added or self.modified or self.deleted or self.moved)
+
+
+@dataclass
+class ScanProgress:
+    """
+    스캔 진행 상황 (스캔 스레드가 갱신, 다른 스레드는 읽기만)
+
+    files_per_sec는 목록 조회로 확인한 파일 수 기준입니다.
+    """
+
+    started_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    dirs_scanned: int = 0
+    dirs_skipped: int = 0
+    files_seen: int = 0
+
+    @property
+    def elapsed_sec(self) -> float:
+        return (self.finished_at or time.time()) - self.started_at
+
+    @property
+    def files_per_sec(self) -> float:
+        elapsed = self.elapsed_sec
+        return self.files_seen / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self.finished_at is None
+
+    def finish(self):
+        self.finished_at = time.time()
+
+
+@dataclass
+class _DirListing:
+    """단일 디렉토리 scandir 결과 (워커 스레드에서 생성)"""
+
+    dir_path: str
+    relative_dir: str
+    # (filename, path, extension, stat_result)
+    files: list[tuple[str, str, str, os.stat_result]] = field(default_factory=list)
+    subdirs: list[str] = field(default_factory=list)
+
+    # 증분 스캔용: 디렉토리 mtime (None = 사라진 디렉토리), 목록 조회 생략 여부
+    mtime_ns: int | None = None
+    unchanged: bool = False
+
+    # 목록 조회 실패 (SMB 끊김, 권한 등) → 빈 목록이 아니라 알 수 없는 상태
+    error: str | None = None
+
+
+def _path_suffix(filename: str) -> str:
+    """Path.suffix와 동일한 규칙으로 확장자 추출 (Path 객체 생성 없이)"""
+    i = filename.rfind(".")
+    if 0 < i < len(filename) - 1:
+        return filename[i:]
+    return ""
+
+
+def _is_under(rel_dir: str, parent: str) -> bool:
+    """rel_dir이 parent 자신 또는 하위 디렉토리인지 (상대 경로, "" = 루트)"""
+    return not parent or rel_dir == parent or rel_dir.startswith(parent + os.sep)
+
+
 class NasScanner:
     """NAS 파일시스템 스캐너"""
 
@@ -95,29 +192,43 @@ class NasScanner:
         "EPISODE": ["EPISODE", "EPISODES", "EP", "eps"],
     }
 
+    # 디렉토리 목록 조회 동시성 기본값 (SMB 왕복 지연 상쇄용)
+    DEFAULT_WORKERS = 8
+
     def __init__(
         self,
         root_path: str,
         include_hidden: bool = False,
         compute_hash: bool = False,
+        workers: int = DEFAULT_WORKERS,
     ):
         """
         Args:
             root_path: NAS 루트 경로 (예: \\\\10.10.100.122\\docker\\GGPNAs\\ARCHIVE)
             include_hidden: 숨김 파일 포함 여부
             compute_hash: 파일 해시 계산 여부 (느려짐)
+            workers: 디렉토리 목록 조회 스레드 수 (1이면 순차 스캔)
         """
         self.root_path = Path(root_path)
         self.include_hidden = include_hidden
         self.compute_hash = compute_hash
+        self.workers = max(1, workers)
 
         if not self.root_path.exists():
             raise FileNotFoundError(f"Root path not found: {root_path}")
 
+        # 브랜드/Asset Type 추론 엔진 (키워드 사전 컴파일 + 폴더 캐시)
+        self._inference = PathInferenceEngine(
+            brand=KeywordRules(self.BRAND_FOLDERS),
+            asset_type=KeywordRules(self.ASSET_TYPE_FOLDERS),
+        )
+
     def scan(
         self,
         video_only: bool = True,
         max_files: int | None = None,
+        progress: ScanProgress | None = None,
+        errors: list[str] | None = None,
     ) -> Iterator[NasFileInfo]:
         """
         NAS 파일시스템 스캔
@@ -125,73 +236,413 @@ class NasScanner:
         Args:
             video_only: 비디오 파일만 반환
             max_files: 최대 파일 수 (테스트용)
+            progress: 진행 상황 기록 대상 (선택)
+            errors: 목록 조회에 실패한 디렉토리 기록 대상 (선택, 해당 하위 트리는 누락)
 
         Yields:
             NasFileInfo 객체
         """
         count = 0
 
-        for root, dirs, files in os.walk(self.root_path):
-            # 숨김 폴더 제외
-            if not self.include_hidden:
-                dirs[:] = [d for d in dirs if not d.startswith(".")]
+        visit = partial(self._list_dir, video_only=video_only)
 
-            for filename in files:
-                # 숨김 파일 제외
-                if not self.include_hidden and filename.startswith("."):
-                    continue
+        with closing(self._walk(visit)) as listings:
+            for listing in listings:
+                if listing.error is not None and errors is not None:
+                    errors.append(listing.error)
+                if progress is not None:
+                    progress.dirs_scanned += 1
+                    progress.files_seen += len(listing.files)
+
+                for filename, path, ext, stat in listing.files:
+                    yield self._make_file_info(listing, filename, path, ext, stat)
+
+                    count += 1
+                    if max_files and count >= max_files:
+                        return
+
+    def _make_file_info(
+        self,
+        listing: _DirListing,
+        filename: str,
+        path: str,
+        ext: str,
+        stat: os.stat_result,
+    ) -> NasFileInfo:
+        """scandir 결과로 NasFileInfo 생성"""
+        if listing.relative_dir:
+            rel_path = os.path.join(listing.relative_dir, filename)
+        else:
+            rel_path = filename
+
+        # 파일 해시 (선택적)
+        file_hash = None
+        if self.compute_hash:
+            file_hash = self._compute_hash(Path(path))
+
+        inference = self._inference.infer(rel_path)
+
+        return NasFileInfo(
+            path=path,
+            filename=filename,
+            extension=ext,
+            size_bytes=stat.st_size,
+            modified_at=datetime.fromtimestamp(stat.st_mtime),
+            folder_path=listing.dir_path,
+            relative_path=rel_path,
+            inferred_brand=inference.brand,
+            inferred_asset_type=inference.asset_type,
+            file_hash=file_hash,
+            inode=stat.st_ino,
+        )
+
+    def _walk(
+        self,
+        visit: Callable[[str, str], _DirListing],
+    ) -> Iterator[_DirListing]:
+        """
+        디렉토리 트리 순회 (os.walk top-down과 동일한 순서)
+
+        하위 디렉토리 목록 조회는 스레드 풀에 미리 제출하고, 결과는
+        깊이 우선 순서대로 소비합니다. 대기 중인 작업은 현재 경로상의
+        형제 디렉토리로 한정되므로 메모리 사용량이 트리 전체로 커지지 않습니다.
+        """
+        root = str(self.root_path)
+
+        if self.workers == 1:
+            stack = [root]
+            while stack:
+                listing = visit(stack.pop(), root)
+                yield listing
+                stack.extend(reversed(listing.subdirs))
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="nas-scan",
+        )
+        try:
+            pending: list[Future] = [
+                executor.submit(visit, root, root)
+            ]
+            while pending:
+                listing = pending.pop().result()
+                yield listing
+                children = [
+                    executor.submit(visit, subdir, root)
+                    for subdir in listing.subdirs
+                ]
+                pending.extend(reversed(children))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _list_dir(self, dir_path: str, root: str, video_only: bool = True) -> _DirListing:
+        """
+        단일 디렉토리 조회 (스레드 풀에서 실행)
 
-                file_path = Path(root) / filename
-                ext = file_path.suffix.lower()
+        DirEntry.stat()은 Windows/SMB에서 디렉토리 목록 조회 시 받은
+        정보를 재사용하므로 파일별 추가 왕복이 발생하지 않습니다.
+        """
+        relative_dir = "" if dir_path == root else os.path.relpath(dir_path, root)
+        listing = _DirListing(dir_path=dir_path, relative_dir=relative_dir)
 
-                # 비디오 파일 필터링
-                if video_only and ext not in self.VIDEO_EXTENSIONS:
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except FileNotFoundError:
+            # 조회 중 삭제된 폴더
+            return listing
+        except OSError as e:
+            # 접근 불가 폴더 건너뛰기 (호출 측에서 오류로 기록)
+            listing.error = f"{dir_path}: {e}"
+            return listing
+
+        for entry in entries:
+            name = entry.name
+
+            # 숨김 파일/폴더 제외
+            if not self.include_hidden and name.startswith("."):
+                continue
+
+            try:
+                if entry.is_dir():
+                    # 심볼릭 링크 폴더는 따라가지 않음 (os.walk followlinks=False)
+                    if not entry.is_symlink():
+                        listing.subdirs.append(entry.path)
                     continue
+            except OSError:
+                pass
 
-                try:
-                    stat = file_path.stat()
+            ext = _path_suffix(name).lower()
 
-                    # 상대 경로 계산
-                    rel_path = file_path.relative_to(self.root_path)
+            # 비디오 파일 필터링
+            if video_only and ext not in self.VIDEO_EXTENSIONS:
+                continue
 
-                    # 브랜드/Asset Type 추론
-                    inferred_brand = self._infer_brand(str(rel_path))
-                    inferred_asset_type = self._infer_asset_type(str(rel_path))
+            try:
+                stat = entry.stat()
+            except OSError:
+                # 접근 불가 파일 건너뛰기
+                continue
 
-                    # 파일 해시 (선택적)
-                    file_hash = None
-                    if self.compute_hash:
-                        file_hash = self._compute_hash(file_path)
+            listing.files.append((name, entry.path, ext, stat))
 
-                    info = NasFileInfo(
-                        path=str(file_path),
-                        filename=filename,
-                        extension=ext,
-                        size_bytes=stat.st_size,
-                        modified_at=datetime.fromtimestamp(stat.st_mtime),
-                        folder_path=str(file_path.parent),
-                        relative_path=str(rel_path),
-                        inferred_brand=inferred_brand,
-                        inferred_asset_type=inferred_asset_type,
-                        file_hash=file_hash,
-                    )
+        return listing
 
-                    yield info
+    def _visit_delta(
+        self,
+        dir_path: str,
+        root: str,
+        state: ManifestState,
+        verify_files: bool,
+        verify_dirs: frozenset[str] = frozenset(),
+    ) -> _DirListing:
+        """
+        증분 스캔용 디렉토리 방문 (스레드 풀에서 실행)
 
-                    count += 1
-                    if max_files and count >= max_files:
-                        return
+        디렉토리 mtime이 매니페스트와 같으면 직접 항목(파일/하위 폴더)이
+        바뀌지 않았으므로 목록 조회를 생략하고 기록된 하위 폴더만 방문합니다.
+        """
+        relative_dir = "" if dir_path == root else os.path.relpath(dir_path, root)
 
-                except (OSError, PermissionError):
-                    # 접근 불가 파일 건너뛰기
+        try:
+            # 목록 조회 전에 mtime을 읽어야 조회 중 변경이 다음 스캔에 반영됨
+            mtime_ns = os.stat(dir_path).st_mtime_ns
+        except FileNotFoundError:
+            return _DirListing(dir_path=dir_path, relative_dir=relative_dir)
+        except OSError as e:
+            return _DirListing(dir_path=dir_path, relative_dir=relative_dir, error=f"{dir_path}: {e}")
+
+        if (
+            not verify_files
+            and relative_dir not in verify_dirs
+            and state.dirs.get(relative_dir) == mtime_ns
+        ):
+            return _DirListing(
+                dir_path=dir_path,
+                relative_dir=relative_dir,
+                subdirs=[
+                    os.path.join(dir_path, name)
+                    for name in state.children.get(relative_dir, ())
+                ],
+                mtime_ns=mtime_ns,
+                unchanged=True,
+            )
+
+        listing = self._list_dir(dir_path, root, video_only=False)
+        listing.mtime_ns = mtime_ns
+        return listing
+
+    def scan_delta(
+        self,
+        manifest: ScanManifest,
+        video_only: bool = True,
+        verify_files: bool = False,
+        verify_dirs: set[str] | None = None,
+        progress: ScanProgress | None = None,
+    ) -> ScanDelta:
+        """
+        매니페스트 기반 증분 스캔
+
+        mtime이 바뀌지 않은 디렉토리는 목록 조회 없이 건너뛰고, 바뀐
+        디렉토리만 다시 조회하여 추가/수정/삭제 파일을 계산합니다.
+        스캔 결과는 매니페스트에 반영됩니다.
+
+        Note:
+            디렉토리 mtime은 항목 추가/삭제/이름 변경 시에만 바뀝니다.
+            제자리에서 덮어쓴 파일까지 검사하려면 verify_files=True를 사용합니다.
+
+            목록 조회에 실패한 디렉토리(SMB 끊김, 권한 등)는 하위 트리 전체의
+            매니페스트 기록과 mtime을 그대로 두고 delta.errors에 기록하므로,
+            다음 스캔에서 다시 조회됩니다 (삭제로 처리하지 않음).
+
+        Args:
+            manifest: 스캔 매니페스트
+            video_only: 비디오 파일만 결과에 포함 (매니페스트는 전체 파일 기록)
+            verify_files: 모든 디렉토리를 다시 조회하여 파일 size/mtime 비교
+            verify_dirs: mtime과 무관하게 다시 조회할 상대 디렉토리 경로
+                (파일 감시에서 쓰기 완료 이벤트가 발생한 디렉토리)
+            progress: 진행 상황 기록 대상 (선택)
+
+        Returns:
+            ScanDelta
+        """
+        start_time = time.time()
+
+        state = manifest.load()
+        delta = ScanDelta()
+
+        def wanted(filename: str) -> bool:
+            return not video_only or _path_suffix(filename).lower() in self.VIDEO_EXTENSIONS
+
+        def join(rel_dir: str, filename: str) -> str:
+            return os.path.join(rel_dir, filename) if rel_dir else filename
+
+        seen_dirs: set[str] = set()
+        failed_dirs: list[str] = []
+        dir_updates: list[tuple[str, int]] = []
+        file_updates: list[tuple[str, str, str, str, int, int, int]] = []
+        removed_files: list[str] = []
+
+        visit = partial(
+            self._visit_delta,
+            state=state,
+            verify_files=verify_files,
+            verify_dirs=frozenset(verify_dirs or ()),
+        )
+
+        with closing(self._walk(visit)) as listings:
+            for listing in listings:
+                if listing.error is not None:
+                    # 알 수 없는 상태 -> 하위 트리 기록 유지, 다음 스캔에서 다시 조회
+                    failed_dirs.append(listing.relative_dir)
+                    delta.dirs_failed += 1
+                    delta.errors.append(listing.error)
+                    continue
+
+                if listing.mtime_ns is None:
+                    # 조회 중 사라진 디렉토리 -> 아래에서 삭제 처리
+                    continue
+
+                rel_dir = listing.relative_dir
+                seen_dirs.add(rel_dir)
+                known = state.files.get(rel_dir, {})
+
+                if progress is not None:
+                    if listing.unchanged:
+                        progress.dirs_skipped += 1
+                    else:
+                        progress.dirs_scanned += 1
+                        progress.files_seen += len(listing.files)
+
+                if listing.unchanged:
+                    delta.dirs_skipped += 1
+                    delta.unchanged_files += sum(1 for name in known if wanted(name))
                     continue
 
+                delta.dirs_scanned += 1
+                dir_updates.append((rel_dir, listing.mtime_ns))
+
+                current: set[str] = set()
+                for filename, path, ext, stat in listing.files:
+                    current.add(filename)
+                    entry = ManifestFile(stat.st_size, stat.st_mtime_ns, stat.st_ino)
+                    previous = known.get(filename)
+
+                    if previous == entry:
+                        if wanted(filename):
+                            delta.unchanged_files += 1
+                        continue
+
+                    rel_path = join(rel_dir, filename)
+                    file_updates.append((
+                        rel_path, rel_dir, filename, ext,
+                        entry.size, entry.mtime_ns, entry.inode,
+                    ))
+
+                    if wanted(filename):
+                        info = self._make_file_info(listing, filename, path, ext, stat)
+                        if previous is None:
+                            delta.added.append(info)
+                        else:
+                            delta.modified.append(info)
+
+                for filename in known.keys() - current:
+                    rel_path = join(rel_dir, filename)
+                    removed_files.append(rel_path)
+                    if wanted(filename):
+                        delta.deleted.append(rel_path)
+
+        # 방문하지 못한 기록 디렉토리 = 삭제된 하위 트리 (조회 실패한 하위 트리 제외)
+        removed_dirs = sorted(
+            rel_dir for rel_dir in state.dirs.keys() - seen_dirs
+            if not any(_is_under(rel_dir, failed) for failed in failed_dirs)
+        )
+        for rel_dir in removed_dirs:
+            for filename in state.files.get(rel_dir, {}):
+                rel_path = join(rel_dir, filename)
+                removed_files.append(rel_path)
+                if wanted(filename):
+                    delta.deleted.append(rel_path)
+
+        self._pair_moves(delta, state)
+
+        manifest.apply(dir_updates, removed_dirs, file_updates, removed_files)
+
+        delta.scan_duration_sec = time.time() - start_time
+        return delta
+
+    def _pair_moves(self, delta: ScanDelta, state: ManifestState):
+        """
+        삭제/추가 쌍을 inode + size로 매칭하여 이동(이름 변경)으로 분류
+
+        inode를 제공하지 않는 파일시스템(st_ino == 0)은 매칭하지 않습니다.
+        """
+        if not delta.deleted or not delta.added:
+            return
+
+        deleted_by_inode: dict[tuple[int, int], str] = {}
+        for rel_path in delta.deleted:
+            rel_dir, filename = os.path.split(rel_path)
+            entry = state.files.get(rel_dir, {}).get(filename)
+            if entry is not None and entry.inode:
+                deleted_by_inode[(entry.inode, entry.size)] = rel_path
+
+        if not deleted_by_inode:
+            return
+
+        moved_from: set[str] = set()
+        added: list[NasFileInfo] = []
+        for info in delta.added:
+            old_path = None
+            if info.inode:
+                old_path = deleted_by_inode.pop((info.inode, info.size_bytes), None)
+            if old_path is None:
+                added.append(info)
+            else:
+                delta.moved.append((old_path, info))
+                moved_from.add(old_path)
+
+        delta.added = added
+        delta.deleted = [p for p in delta.deleted if p not in moved_from]
+
+    def files_from_manifest(
+        self,
+        manifest: ScanManifest,
+        video_only: bool = True,
+    ) -> list[NasFileInfo]:
+        """
+        매니페스트에 기록된 파일 목록을 NasFileInfo로 복원 (NAS 접근 없음)
+
+        재시작 직후 전체 스캔 없이 파일 목록을 제공하는 용도입니다.
+        """
+        root = str(self.root_path)
+        extensions = self.VIDEO_EXTENSIONS if video_only else None
+
+        files = []
+        for rel_path, rel_dir, filename, ext, size, mtime_ns in manifest.list_files(extensions):
+            inference = self._inference.infer(rel_path)
+            files.append(NasFileInfo(
+                path=os.path.join(root, rel_path),
+                filename=filename,
+                extension=ext,
+                size_bytes=size,
+                modified_at=datetime.fromtimestamp(mtime_ns / 1_000_000_000),
+                folder_path=os.path.join(root, rel_dir) if rel_dir else root,
+                relative_path=rel_path,
+                inferred_brand=inference.brand,
+                inferred_asset_type=inference.asset_type,
+            ))
+
+        return files
+
     def scan_with_stats(
         self,
         video_only: bool = True,
         max_files: int | None = None,
         since: datetime | None = None,
         known_files: set[str] | None = None,
+        progress: ScanProgress | None = None,
     ) -> tuple[list[NasFileInfo], ScanResult]:
         """
         스캔 + 통계 수집
@@ -201,21 +652,54 @@ class NasScanner:
             max_files: 최대 파일 수 (테스트용)
             since: 이 시간 이후 수정된 파일만 반환 (증분 스캔)
             known_files: 이미 알려진 파일 경로 집합 (새 파일 감지용)
+            progress: 진행 상황 기록 대상 (선택)
 
         Returns:
             (파일 목록, 스캔 결과)
         """
-        import time
+        result = ScanResult()
+        files = list(self.iter_scan_with_stats(
+            result,
+            video_only=video_only,
+            max_files=max_files,
+            since=since,
+            known_files=known_files,
+            progress=progress,
+        ))
+        return files, result
+
+    def iter_scan_with_stats(
+        self,
+        result: ScanResult,
+        video_only: bool = True,
+        max_files: int | None = None,
+        since: datetime | None = None,
+        known_files: set[str] | None = None,
+        progress: ScanProgress | None = None,
+    ) -> Iterator[NasFileInfo]:
+        """
+        스트리밍 스캔 + 통계 수집 (scan_with_stats의 이터레이터 버전)
+
+        파일을 찾는 즉시 반환하고 통계는 result에 누적합니다.
+        scan_duration_sec는 순회가 끝나면 기록됩니다.
+
+        Args:
+            result: 통계를 누적할 ScanResult
+            (나머지는 scan_with_stats와 같음)
+
+        Yields:
+            조건에 맞는 NasFileInfo
+        """
         start_time = time.time()
 
-        files: list[NasFileInfo] = []
-        result = ScanResult()
         result.scan_mode = "incremental" if since else "full"
 
         folders_seen = set()
         known_files = known_files or set()
 
-        for file_info in self.scan(video_only=False, max_files=max_files):
+        for file_info in self.scan(
+            video_only=False, max_files=max_files, progress=progress, errors=result.errors,
+        ):
             result.total_files += 1
             result.total_size_bytes += file_info.size_bytes
 
@@ -252,37 +736,25 @@ class NasScanner:
                     result.brand_counts[brand] = result.brand_counts.get(brand, 0) + 1
 
                 if video_only and include_file:
-                    files.append(file_info)
+                    yield file_info
             else:
                 result.other_files += 1
                 if not video_only and include_file:
-                    files.append(file_info)
+                    yield file_info
 
         result.scan_duration_sec = time.time() - start_time
 
-        return files, result
+    def infer_path(self, relative_path: str) -> PathInference:
+        """경로에서 브랜드/Asset Type 추론 (폴더 단위 캐시)"""
+        return self._inference.infer(relative_path)
 
     def _infer_brand(self, relative_path: str) -> str | None:
         """경로에서 브랜드 추론"""
-        path_upper = relative_path.upper()
-
-        for brand, folders in self.BRAND_FOLDERS.items():
-            for folder in folders:
-                if folder.upper() in path_upper:
-                    return brand
-
-        return None
+        return self._inference.infer(relative_path).brand
 
     def _infer_asset_type(self, relative_path: str) -> str | None:
         """경로에서 Asset Type 추론"""
-        path_upper = relative_path.upper()
-
-        for asset_type, folders in self.ASSET_TYPE_FOLDERS.items():
-            for folder in folders:
-                if folder.upper() in path_upper:
-                    return asset_type
-
-        return None
+        return self._inference.infer(relative_path).asset_type
 
     def _compute_hash(self, file_path: Path, chunk_size: int = 8192) -> str:
         """파일 MD5 해시 계산 (첫 1MB만)"""
@@ -0,0 +1,345 @@
+"""
+NAS 파일시스템 감시
+
+NAS 폴더의 변경을 감지하여 콜백을 호출합니다.
+- inotify: Linux 로컬 파일시스템 (ctypes, 추가 의존성 없음)
+- polling: 네트워크 마운트(SMB/NFS) 등 inotify 이벤트가 오지 않는 환경
+
+감시기는 "어느 디렉토리가 바뀌었는지"만 알려주고, 실제 변경 내역은
+NasScanner.scan_delta()가 매니페스트와 비교하여 계산합니다.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Literal
+
+WatchBackend = Literal["auto", "inotify", "polling"]
+
+# 변경 콜백: 변경된 상대 디렉토리 집합 (None = 범위 불명, 전체 증분 스캔)
+ChangeCallback = Callable[[set[str] | None], None]
+
+# 네트워크 파일시스템 (원격 변경이 inotify로 전달되지 않음)
+NETWORK_FS_TYPES = {
+    "cifs", "smb3", "smbfs", "nfs", "nfs4", "afs", "9p",
+    "fuse.sshfs", "fuse.rclone", "davfs", "ncpfs",
+}
+
+# inotify 이벤트 마스크 (linux/inotify.h)
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _load_libc():
+    """inotify 함수를 제공하는 libc 로드 (미지원 시 None)"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+        libc.inotify_rm_watch
+    except (OSError, AttributeError):
+        return None
+
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    return libc
+
+
+def get_fs_type(path: str) -> str | None:
+    """경로가 속한 마운트의 파일시스템 종류 (/proc/mounts 기준, 확인 불가 시 None)"""
+    try:
+        target = os.path.realpath(path)
+        best_mount, best_type = "", None
+        with open("/proc/mounts", "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) < 3:
+                    continue
+                mount_point = parts[1].replace("\\040", " ")
+                if (
+                    target == mount_point
+                    or target.startswith(mount_point.rstrip("/") + "/")
+                ) and len(mount_point) >= len(best_mount):
+                    best_mount, best_type = mount_point, parts[2]
+        return best_type
+    except OSError:
+        return None
+
+
+def inotify_supported(path: str) -> bool:
+    """해당 경로에 inotify 감시를 사용할 수 있는지 여부"""
+    if _load_libc() is None:
+        return False
+    return get_fs_type(path) not in NETWORK_FS_TYPES
+
+
+class NasWatcher:
+    """NAS 변경 감시기 (백그라운드 스레드)"""
+
+    DEFAULT_POLL_INTERVAL = 30.0
+    DEFAULT_DEBOUNCE = 1.0
+
+    def __init__(
+        self,
+        root_path: str,
+        on_change: ChangeCallback,
+        backend: WatchBackend = "auto",
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        debounce_sec: float = DEFAULT_DEBOUNCE,
+        include_hidden: bool = False,
+    ):
+        """
+        Args:
+            root_path: 감시할 NAS 루트 경로
+            on_change: 변경 콜백 (감시 스레드에서 호출)
+            backend: "auto" | "inotify" | "polling"
+            poll_interval: polling 주기 (초)
+            debounce_sec: inotify 이벤트를 모으는 시간 (초)
+            include_hidden: 숨김 폴더 감시 여부
+        """
+        self.root_path = Path(root_path)
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.debounce_sec = debounce_sec
+        self.include_hidden = include_hidden
+
+        if backend == "auto":
+            backend = "inotify" if inotify_supported(str(self.root_path)) else "polling"
+        elif backend == "inotify" and _load_libc() is None:
+            raise RuntimeError("inotify is not available on this platform")
+        self.backend: WatchBackend = backend
+
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+        # inotify 상태
+        self._libc = None
+        self._fd = -1
+        self._wd_to_dir: dict[int, str] = {}  # watch descriptor -> 상대 디렉토리
+        self._dir_to_wd: dict[str, int] = {}
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """감시 시작"""
+        if self.is_running:
+            return
+
+        self._stop.clear()
+        if self.backend == "inotify":
+            try:
+                self._open_inotify()
+            except OSError as e:
+                print(f"inotify watch failed ({e}), falling back to polling")
+                self._close_inotify()
+                self.backend = "polling"
+
+        target = self._run_inotify if self.backend == "inotify" else self._run_polling
+
+        self._thread = threading.Thread(target=target, name="nas-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """감시 중지"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._close_inotify()
+
+    def _notify(self, dirs: set[str] | None):
+        """콜백 호출 (예외가 감시 스레드를 종료시키지 않도록 보호)"""
+        try:
+            self.on_change(dirs)
+        except Exception as e:
+            print(f"NAS watch callback failed: {e}")
+
+    # =========================================================================
+    # Polling
+    # =========================================================================
+
+    def _run_polling(self):
+        """
+        주기적으로 콜백 호출
+
+        디렉토리 mtime 비교는 scan_delta()가 매니페스트로 수행하므로
+        변경이 없는 주기에는 디렉토리 stat만 발생합니다.
+        """
+        while not self._stop.wait(self.poll_interval):
+            self._notify(None)
+
+    # =========================================================================
+    # inotify
+    # =========================================================================
+
+    def _open_inotify(self):
+        """inotify 인스턴스 생성 및 전체 디렉토리 감시 등록"""
+        self._libc = _load_libc()
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+        self._add_tree("")
+
+    def _close_inotify(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._wd_to_dir.clear()
+        self._dir_to_wd.clear()
+
+    def _add_watch(self, rel_dir: str) -> bool:
+        """단일 디렉토리 감시 등록"""
+        path = os.path.join(str(self.root_path), rel_dir) if rel_dir else str(self.root_path)
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                # fs.inotify.max_user_watches 초과
+                raise OSError(err, "inotify watch limit reached (fs.inotify.max_user_watches)")
+            return False
+
+        self._wd_to_dir[wd] = rel_dir
+        self._dir_to_wd[rel_dir] = wd
+        return True
+
+    def _add_tree(self, rel_dir: str):
+        """하위 트리 전체 감시 등록 (새로 생성/이동된 폴더 포함)"""
+        root = str(self.root_path)
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            if current in self._dir_to_wd or not self._add_watch(current):
+                continue
+
+            path = os.path.join(root, current) if current else root
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if not self.include_hidden and entry.name.startswith("."):
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(os.path.join(current, entry.name) if current else entry.name)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+    def _forget_tree(self, rel_dir: str):
+        """삭제/이동된 하위 트리 감시 정보 정리"""
+        prefix = rel_dir + os.sep
+        for d in [d for d in self._dir_to_wd if d == rel_dir or d.startswith(prefix)]:
+            wd = self._dir_to_wd.pop(d)
+            self._wd_to_dir.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _read_events(self) -> tuple[set[str], bool]:
+        """
+        대기 중인 이벤트 읽기
+
+        Returns:
+            (변경된 상대 디렉토리, 큐 오버플로 여부)
+        """
+        changed: set[str] = set()
+        overflow = False
+
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(errors="surrogateescape")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+
+                rel_dir = self._wd_to_dir.get(wd)
+                if rel_dir is None:
+                    continue
+
+                if mask & IN_IGNORED:
+                    self._wd_to_dir.pop(wd, None)
+                    self._dir_to_wd.pop(rel_dir, None)
+                    continue
+
+                if not self.include_hidden and name.startswith("."):
+                    continue
+
+                changed.add(rel_dir)
+
+                if mask & IN_ISDIR and name:
+                    child = os.path.join(rel_dir, name) if rel_dir else name
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._add_tree(child)
+                    elif mask & (IN_DELETE | IN_MOVED_FROM):
+                        self._forget_tree(child)
+
+        return changed, overflow
+
+    def _run_inotify(self):
+        """inotify 이벤트 루프 (debounce 후 변경 디렉토리 묶음으로 콜백)"""
+        pending: set[str] = set()
+        overflow = False
+
+        try:
+            while not self._stop.is_set():
+                timeout = self.debounce_sec if (pending or overflow) else 0.5
+                readable, _, _ = select.select([self._fd], [], [], timeout)
+
+                if readable:
+                    changed, lost = self._read_events()
+                    pending |= changed
+                    overflow |= lost
+                    continue
+
+                # debounce 시간 동안 새 이벤트가 없으면 콜백
+                if pending or overflow:
+                    self._notify(None if overflow else pending)
+                    pending, overflow = set(), False
+        except OSError as e:
+            # 감시 한도 초과 등: polling으로 전환
+            print(f"inotify watch failed ({e}), falling back to polling")
+            self._close_inotify()
+            self.backend = "polling"
+            self._notify(None)
+            self._run_polling()
@@ -0,0 +1,182 @@
+"""
+경로 기반 메타데이터 추론 엔진
+
+NAS 경로/파일명에서 브랜드, Asset Type, 이벤트 타입을 한 번에 추론합니다.
+
+- 키워드는 생성 시 한 번만 대문자로 변환하여 규칙 우선순위 순서로 보관
+- 폴더 부분의 결과는 LRU 캐시 (같은 폴더의 파일들은 재계산 없음)
+- 파일명은 폴더 결과보다 우선순위가 높은 규칙만 검사
+
+Note:
+    단일 alternation 정규식과 순수 Python Aho-Corasick도 측정했으나
+    (scripts/bench_path_inference.py), 키워드 수십 개 규모에서는
+    C로 구현된 str.__contains__ 반복이 더 빨라 이 방식을 사용합니다.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Literal, Mapping, Sequence
+
+# 규칙 적용 범위
+#   path: 폴더 + 파일명 어디든 (첫 번째로 매칭되는 규칙)
+#   filename: 파일명만
+#   filename_first: 파일명에서 먼저 찾고, 없으면 폴더에서
+RuleScope = Literal["path", "filename", "filename_first"]
+
+RuleSet = Mapping[str, Iterable[str]] | Sequence[tuple[str, Iterable[str]]]
+
+
+class KeywordRules:
+    """우선순위가 있는 키워드 규칙 (먼저 선언된 규칙이 우선)"""
+
+    def __init__(
+        self,
+        rules: RuleSet,
+        scope: RuleScope = "path",
+        default: str | None = None,
+    ):
+        """
+        Args:
+            rules: {label: [keyword, ...]} 또는 [(label, [keyword, ...]), ...]
+            scope: 규칙 적용 범위
+            default: 매칭되는 규칙이 없을 때 값
+        """
+        items = rules.items() if isinstance(rules, Mapping) else rules
+
+        self.labels: tuple[str, ...] = tuple(label for label, _ in items)
+        self.keywords: tuple[tuple[str, ...], ...] = tuple(
+            tuple(kw.upper() for kw in keywords) for _, keywords in items
+        )
+        self.scope = scope
+        self.default = default
+
+    def first_index(self, text_upper: str) -> int | None:
+        """
+        text_upper에 키워드가 포함된 첫 번째 규칙 인덱스
+
+        Args:
+            text_upper: 대문자로 변환된 텍스트
+
+        Returns:
+            규칙 인덱스 또는 None
+        """
+        for index, keywords in enumerate(self.keywords):
+            for kw in keywords:
+                if kw in text_upper:
+                    return index
+        return None
+
+    def match(self, text: str) -> str | None:
+        """단일 텍스트 매칭 (캐시 없음)"""
+        index = self.first_index(text.upper())
+        return self.default if index is None else self.labels[index]
+
+
+@dataclass(slots=True)
+class PathInference:
+    """경로 추론 결과"""
+
+    brand: str | None = None
+    asset_type: str | None = None
+    event_type: str | None = None
+
+
+# 폴더별 사전 계산: (파일명에서 검사할 (label, keywords) 목록, 파일명 미매칭 시 값)
+_FolderPlan = tuple[tuple[tuple[str, tuple[str, ...]], ...], str | None]
+
+
+def _split_path(path: str) -> tuple[str, str]:
+    """(폴더, 파일명) 분리 (/, \\ 구분자 모두 지원)"""
+    cut = max(path.rfind("/"), path.rfind("\\"))
+    if cut < 0:
+        return "", path
+    return path[:cut], path[cut + 1:]
+
+
+def _first_label(plan: _FolderPlan, filename_upper: str) -> str | None:
+    """폴더 계획에 따라 파일명 검사 후 최종 값 반환"""
+    pairs, fallback = plan
+    for label, keywords in pairs:
+        for kw in keywords:
+            if kw in filename_upper:
+                return label
+    return fallback
+
+
+class PathInferenceEngine:
+    """브랜드 / Asset Type / 이벤트 타입 통합 추론 엔진"""
+
+    DEFAULT_CACHE_SIZE = 16384
+
+    def __init__(
+        self,
+        brand: KeywordRules | None = None,
+        asset_type: KeywordRules | None = None,
+        event_type: KeywordRules | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Args:
+            brand: 브랜드 규칙
+            asset_type: Asset Type 규칙
+            event_type: 이벤트 타입 규칙
+            cache_size: 폴더 결과 LRU 캐시 크기
+        """
+        empty = KeywordRules(())
+        self._rules = (brand or empty, asset_type or empty, event_type or empty)
+        self._folder_plans = lru_cache(maxsize=cache_size)(self._plan_folder)
+
+    def _plan_folder(self, folder: str) -> tuple[_FolderPlan, _FolderPlan, _FolderPlan]:
+        """
+        폴더 부분을 한 번 검사하여 카테고리별 파일명 검사 계획 작성
+
+        - path: 폴더 결과보다 우선순위가 높은 규칙만 파일명에서 검사
+        - filename_first: 모든 규칙을 파일명에서 검사, 없으면 폴더 결과
+        - filename: 모든 규칙을 파일명에서 검사, 없으면 기본값
+        """
+        folder_upper = folder.upper()
+        plans = []
+
+        for rules in self._rules:
+            pairs = tuple(zip(rules.labels, rules.keywords))
+
+            if rules.scope == "filename":
+                plans.append((pairs, rules.default))
+                continue
+
+            index = rules.first_index(folder_upper)
+            folder_label = rules.default if index is None else rules.labels[index]
+
+            if rules.scope == "path" and index is not None:
+                pairs = pairs[:index]
+            plans.append((pairs, folder_label))
+
+        return tuple(plans)
+
+    def infer(self, path: str) -> PathInference:
+        """
+        경로 추론
+
+        Args:
+            path: 상대/절대 경로 (파일명 포함)
+
+        Returns:
+            PathInference
+        """
+        folder, filename = _split_path(path)
+        brand_plan, asset_type_plan, event_type_plan = self._folder_plans(folder)
+        filename_upper = filename.upper()
+
+        return PathInference(
+            brand=_first_label(brand_plan, filename_upper),
+            asset_type=_first_label(asset_type_plan, filename_upper),
+            event_type=_first_label(event_type_plan, filename_upper),
+        )
+
+    def cache_info(self):
+        """폴더 캐시 통계 (functools.lru_cache 형식)"""
+        return self._folder_plans.cache_info()
+
+    def cache_clear(self):
+        """폴더 캐시 초기화"""
+        self._folder_plans.cache_clear()
@@ -0,0 +1,230 @@
+"""
+NAS 스캔 매니페스트
+
+증분 스캔을 위해 마지막 스캔 시점의 파일/디렉토리 상태를 SQLite에 저장
+(상대 경로 기준: 파일 size/mtime/inode, 디렉토리 mtime)
+"""
+
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class ManifestFile:
+    """매니페스트에 기록된 파일 상태"""
+
+    size: int
+    mtime_ns: int
+    inode: int
+
+
+@dataclass
+class ManifestState:
+    """매니페스트 메모리 스냅샷 (스캔 워커 스레드에서 읽기 전용으로 사용)"""
+
+    # 상대 디렉토리 경로 -> mtime_ns ("" = 루트)
+    dirs: dict[str, int] = field(default_factory=dict)
+
+    # 상대 디렉토리 경로 -> 하위 디렉토리 이름 목록
+    children: dict[str, list[str]] = field(default_factory=dict)
+
+    # 상대 디렉토리 경로 -> {파일명: ManifestFile}
+    files: dict[str, dict[str, ManifestFile]] = field(default_factory=dict)
+
+
+class ScanManifest:
+    """SQLite 기반 스캔 매니페스트"""
+
+    SCHEMA_VERSION = "1"
+
+    def __init__(self, db_path: str, root_path: str | None = None):
+        """
+        Args:
+            db_path: 매니페스트 SQLite 파일 경로
+            root_path: NAS 루트 경로 (다른 루트로 기록된 매니페스트는 초기화)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._create_schema()
+
+        if root_path is not None and self.get_meta("root_path") != str(root_path):
+            self.clear()
+            self.set_meta("root_path", str(root_path))
+
+    def _create_schema(self):
+        """테이블 생성"""
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS dirs (
+                rel_dir TEXT PRIMARY KEY,
+                parent TEXT,
+                mtime_ns INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS files (
+                rel_path TEXT PRIMARY KEY,
+                rel_dir TEXT NOT NULL,
+                filename TEXT NOT NULL,
+                extension TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                inode INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_files_rel_dir ON files (rel_dir);
+        """)
+        if self.get_meta("schema_version") is None:
+            self.set_meta("schema_version", self.SCHEMA_VERSION)
+        self._conn.commit()
+
+    def close(self):
+        """연결 종료"""
+        self._conn.close()
+
+    # =========================================================================
+    # Meta
+    # =========================================================================
+
+    def get_meta(self, key: str) -> str | None:
+        """메타 값 조회"""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        """메타 값 저장"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, value),
+        )
+        self._conn.commit()
+
+    @property
+    def last_scan_at(self) -> datetime | None:
+        """마지막 스캔 완료 시각"""
+        value = self.get_meta("last_scan_at")
+        return datetime.fromisoformat(value) if value else None
+
+    @property
+    def is_empty(self) -> bool:
+        """기록된 디렉토리가 없는지 여부"""
+        return self._conn.execute("SELECT 1 FROM dirs LIMIT 1").fetchone() is None
+
+    def clear(self):
+        """모든 기록 삭제"""
+        self._conn.execute("DELETE FROM dirs")
+        self._conn.execute("DELETE FROM files")
+        self._conn.execute("DELETE FROM meta WHERE key = 'last_scan_at'")
+        self._conn.commit()
+
+    # =========================================================================
+    # Load / Save
+    # =========================================================================
+
+    def load(self) -> ManifestState:
+        """전체 상태를 메모리로 로드"""
+        state = ManifestState()
+
+        for rel_dir, parent, mtime_ns in self._conn.execute(
+            "SELECT rel_dir, parent, mtime_ns FROM dirs"
+        ):
+            state.dirs[rel_dir] = mtime_ns
+            if parent is not None:
+                state.children.setdefault(parent, []).append(os.path.basename(rel_dir))
+
+        for rel_dir, filename, size, mtime_ns, inode in self._conn.execute(
+            "SELECT rel_dir, filename, size, mtime_ns, inode FROM files"
+        ):
+            state.files.setdefault(rel_dir, {})[filename] = ManifestFile(size, mtime_ns, inode)
+
+        for names in state.children.values():
+            names.sort()
+
+        return state
+
+    def apply(
+        self,
+        dirs: list[tuple[str, int]],
+        removed_dirs: list[str],
+        files: list[tuple[str, str, str, str, int, int, int]],
+        removed_files: list[str],
+    ):
+        """
+        스캔 결과 반영 (단일 트랜잭션)
+
+        Args:
+            dirs: (rel_dir, mtime_ns) 갱신 목록
+            removed_dirs: 삭제된 디렉토리 상대 경로
+            files: (rel_path, rel_dir, filename, extension, size, mtime_ns, inode) 갱신 목록
+            removed_files: 삭제된 파일 상대 경로
+        """
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM dirs WHERE rel_dir = ?",
+                ((d,) for d in removed_dirs),
+            )
+            self._conn.executemany(
+                "DELETE FROM files WHERE rel_path = ?",
+                ((f,) for f in removed_files),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO dirs (rel_dir, parent, mtime_ns) VALUES (?, ?, ?)",
+                (
+                    (rel_dir, os.path.dirname(rel_dir) if rel_dir else None, mtime_ns)
+                    for rel_dir, mtime_ns in dirs
+                ),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files "
+                "(rel_path, rel_dir, filename, extension, size, mtime_ns, inode) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                files,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_scan_at', ?)",
+                (datetime.now().isoformat(),),
+            )
+
+    def list_files(
+        self,
+        extensions: set[str] | None = None,
+    ) -> list[tuple[str, str, str, str, int, int]]:
+        """
+        기록된 파일 목록
+
+        Returns:
+            (rel_path, rel_dir, filename, extension, size, mtime_ns) 목록
+        """
+        rows = self._conn.execute(
+            "SELECT rel_path, rel_dir, filename, extension, size, mtime_ns "
+            "FROM files ORDER BY rel_path"
+        ).fetchall()
+        if extensions is None:
+            return rows
+        return [row for row in rows if row[3] in extensions]
+
+    def summary(self) -> dict:
+        """
+        전체 파일 통계 (SQL 집계)
+
+        Returns:
+            total_files, total_size_bytes, folders, extension_counts
+        """
+        total_files, total_size, folders = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COUNT(DISTINCT rel_dir) FROM files"
+        ).fetchone()
+        extension_counts = dict(self._conn.execute(
+            "SELECT extension, COUNT(*) FROM files GROUP BY extension"
+        ).fetchall())
+
+        return {
+            "total_files": total_files,
+            "total_size_bytes": total_size,
+            "folders": folders,
+            "extension_counts": extension_counts,
+        }
@@ -0,0 +1,106 @@
+"""
+JSON 직렬화 백엔드
+
+내보내기/대시보드 API에서 공통으로 사용하는 JSON 직렬화 추상화
+- orjson: 설치되어 있으면 기본 사용 (표준 json 대비 수 배 빠름)
+- stdlib: 표준 json (orjson 미설치 또는 orjson이 지원하지 않는 옵션)
+
+두 백엔드 모두 UTF-8 bytes를 반환합니다.
+"""
+
+import json
+from typing import Any, Literal
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+SerializerName = Literal["auto", "orjson", "stdlib"]
+
+
+class JsonSerializer:
+    """표준 json 백엔드"""
+
+    name = "stdlib"
+
+    def dumps(
+        self,
+        obj: Any,
+        indent: int | None = None,
+        ensure_ascii: bool = False,
+    ) -> bytes:
+        """
+        JSON 직렬화
+
+        Args:
+            obj: 직렬화할 객체 (JSON 타입이 아닌 값은 str() 변환)
+            indent: 들여쓰기 (None = 한 줄)
+            ensure_ascii: 비 ASCII 문자 이스케이프 여부
+
+        Returns:
+            UTF-8 JSON bytes
+        """
+        return json.dumps(
+            obj,
+            indent=indent,
+            ensure_ascii=ensure_ascii,
+            default=str,
+        ).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        """JSON 역직렬화"""
+        return json.loads(data)
+
+
+class OrjsonSerializer(JsonSerializer):
+    """
+    orjson 백엔드
+
+    orjson은 들여쓰기 2칸만 지원하고 ASCII 이스케이프가 없으므로,
+    그 외 옵션은 표준 json으로 처리합니다.
+    한 줄 출력은 구분자 뒤 공백이 없습니다 ({"a":1}).
+    """
+
+    name = "orjson"
+
+    def dumps(
+        self,
+        obj: Any,
+        indent: int | None = None,
+        ensure_ascii: bool = False,
+    ) -> bytes:
+        if ensure_ascii or indent not in (None, 2):
+            return super().dumps(obj, indent, ensure_ascii)
+
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+def orjson_available() -> bool:
+    """orjson 설치 여부"""
+    return orjson is not None
+
+
+def get_serializer(name: SerializerName = "auto") -> JsonSerializer:
+    """
+    직렬화 백엔드 선택
+
+    Args:
+        name: "auto" (orjson 우선) | "orjson" | "stdlib"
+
+    Returns:
+        JsonSerializer
+    """
+    if name == "stdlib":
+        return JsonSerializer()
+    if name == "orjson":
+        if orjson is None:
+            raise ImportError("orjson is not installed (pip install orjson)")
+        return OrjsonSerializer()
+    return OrjsonSerializer() if orjson is not None else JsonSerializer()
@@ -0,0 +1,264 @@
+"""
+스트리밍 파이프라인 단계
+
+스캔 → 변환 → 내보내기를 동시에 실행하기 위한 스레드 단계와 제한 큐
+- 단계 사이는 배치 단위 제한 큐 (가득 차면 앞 단계가 대기 = backpressure)
+- 앞 단계의 예외는 큐를 통해 다음 단계의 순회에서 다시 발생
+- 단계별 처리량, 대기 시간과 큐 깊이를 기록
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator
+
+# 큐 종료 표시
+_DONE = object()
+
+# 정지 신호 확인 주기 (가득 찬 큐에서 대기 중일 때)
+_POLL_INTERVAL_SEC = 0.1
+
+
+@dataclass
+class StageStats:
+    """단계별 통계"""
+
+    name: str
+    items: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: float | None = None
+    first_item_sec: float | None = None  # 시작 후 첫 항목까지 걸린 시간
+    blocked_sec: float = 0.0  # 출력 큐가 가득 차 기다린 시간 (backpressure)
+    starved_sec: float = 0.0  # 입력 큐가 비어 기다린 시간
+
+    @property
+    def elapsed_sec(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def items_per_sec(self) -> float:
+        elapsed = self.elapsed_sec
+        return self.items / elapsed if elapsed > 0 else 0.0
+
+    def count(self, n: int = 1):
+        if self.first_item_sec is None and n:
+            self.first_item_sec = time.perf_counter() - self.started_at
+        self.items += n
+
+    def finish(self):
+        if self.finished_at is None:
+            self.finished_at = time.perf_counter()
+
+    def to_dict(self) -> dict:
+        return {
+            "items": self.items,
+            "duration_sec": round(self.elapsed_sec, 3),
+            "items_per_sec": round(self.items_per_sec, 1),
+            "first_item_sec": None if self.first_item_sec is None else round(self.first_item_sec, 3),
+            "blocked_sec": round(self.blocked_sec, 3),
+            "starved_sec": round(self.starved_sec, 3),
+        }
+
+
+@dataclass
+class QueueStats:
+    """큐 깊이 통계 (배치 단위, 넣을 때마다 표본)"""
+
+    name: str
+    maxsize: int
+    max_depth: int = 0
+    depth_total: int = 0
+    samples: int = 0
+
+    @property
+    def mean_depth(self) -> float:
+        return self.depth_total / self.samples if self.samples else 0.0
+
+    def sample(self, depth: int):
+        self.samples += 1
+        self.depth_total += depth
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def to_dict(self) -> dict:
+        return {
+            "maxsize": self.maxsize,
+            "max_depth": self.max_depth,
+            "mean_depth": round(self.mean_depth, 2),
+        }
+
+
+class BoundedChannel:
+    """
+    단계 사이 제한 큐
+
+    생산자는 put_all()로 배치 단위로 넣고 close()로 끝을 알리며,
+    소비자는 채널을 순회하여 항목을 하나씩 받습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        batch_size: int,
+        stop: threading.Event,
+    ):
+        """
+        Args:
+            name: 큐 이름 (통계용)
+            maxsize: 최대 배치 수
+            batch_size: 배치당 항목 수
+            stop: 정지 신호 (설정되면 대기 중인 생산자 종료)
+        """
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+        self.batch_size = max(1, batch_size)
+        self.stats = QueueStats(name, self._queue.maxsize)
+        self._stop = stop
+        self._error: BaseException | None = None
+
+    def _put(self, item: Any, producer: StageStats) -> bool:
+        """하나 넣기 (가득 차면 대기, 정지 신호 시 False)"""
+        start = time.perf_counter()
+        while True:
+            try:
+                self._queue.put(item, timeout=_POLL_INTERVAL_SEC)
+                break
+            except queue.Full:
+                if self._stop.is_set():
+                    return False
+        producer.blocked_sec += time.perf_counter() - start
+        self.stats.sample(self._queue.qsize())
+        return True
+
+    def put_all(self, items: Iterable, producer: StageStats) -> bool:
+        """
+        항목을 배치로 묶어 넣기
+
+        Returns:
+            끝까지 넣었으면 True, 정지 신호로 중단되면 False
+        """
+        batch = []
+        for item in items:
+            batch.append(item)
+            producer.count()
+            if len(batch) >= self.batch_size:
+                if not self._put(batch, producer):
+                    return False
+                batch = []
+        return not batch or self._put(batch, producer)
+
+    def close(self, error: BaseException | None = None, producer: StageStats | None = None):
+        """종료 표시 (error가 있으면 소비자 순회에서 다시 발생)"""
+        self._error = error
+        self._put(_DONE, producer or StageStats("close"))
+
+    def consume(self, consumer: StageStats) -> Iterator:
+        """항목 순회 (입력 대기 시간을 consumer에 기록)"""
+        while True:
+            start = time.perf_counter()
+            try:
+                batch = self._queue.get(timeout=_POLL_INTERVAL_SEC)
+            except queue.Empty:
+                consumer.starved_sec += time.perf_counter() - start
+                if self._stop.is_set():
+                    return
+                continue
+            consumer.starved_sec += time.perf_counter() - start
+
+            if batch is _DONE:
+                if self._error is not None:
+                    raise self._error
+                return
+            yield from batch
+
+
+class StageRunner:
+    """스레드 단계 실행 / 정지 / 예외 전달"""
+
+    def __init__(self):
+        self.stop = threading.Event()
+        self.stages: dict[str, StageStats] = {}
+        self.channels: list[BoundedChannel] = []
+        self._threads: list[threading.Thread] = []
+        self._errors: list[BaseException] = []
+
+    def channel(self, name: str, maxsize: int, batch_size: int) -> BoundedChannel:
+        """단계 사이 큐 생성"""
+        channel = BoundedChannel(name, maxsize, batch_size, self.stop)
+        self.channels.append(channel)
+        return channel
+
+    def stage(self, name: str) -> StageStats:
+        """단계 통계 생성"""
+        stats = StageStats(name)
+        self.stages[name] = stats
+        return stats
+
+    def start(
+        self,
+        name: str,
+        produce: Callable[[StageStats], Iterable],
+        output: BoundedChannel,
+    ):
+        """
+        생산 단계를 스레드로 시작
+
+        Args:
+            name: 단계 이름
+            produce: StageStats → 항목 이터레이터
+            output: 결과를 넣을 큐
+        """
+        stats = self.stage(name)
+
+        def run():
+            error = None
+            items = None
+            try:
+                items = produce(stats)
+                output.put_all(items, stats)
+            except BaseException as e:
+                error = e
+                self._errors.append(e)
+            finally:
+                # 중단된 경우에도 생성기 정리 (프로세스 풀 종료 등)
+                close = getattr(items, "close", None)
+                if close is not None:
+                    close()
+                stats.finish()
+                output.close(error, stats)
+
+        thread = threading.Thread(target=run, name=f"pipeline-{name}", daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def consume(self, name: str, channel: BoundedChannel) -> Iterator:
+        """
+        마지막 단계 (호출한 스레드에서 실행)용 순회
+
+        Args:
+            name: 단계 이름
+            channel: 입력 큐
+        """
+        stats = self.stage(name)
+        try:
+            for item in channel.consume(stats):
+                stats.count()
+                yield item
+        finally:
+            stats.finish()
+
+    def join(self):
+        """모든 단계 정지 후 대기, 단계에서 발생한 첫 예외를 다시 발생"""
+        self.stop.set()
+        for thread in self._threads:
+            thread.join()
+        if self._errors:
+            raise self._errors[0]
+
+    def report(self) -> dict:
+        """단계별 처리량 / 큐 깊이"""
+        return {
+            "stages": {name: stats.to_dict() for name, stats in self.stages.items()},
+            "queues": {c.stats.name: c.stats.to_dict() for c in self.channels},
+        }
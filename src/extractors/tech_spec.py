@@ -0,0 +1,420 @@
+"""
+기술 메타데이터 추출 (FFprobe)
+
+- MP4/MOV는 moov 박스를 직접 읽고 (mp4_reader), 그 외 형식이나 읽지 못한 파일만 ffprobe
+- ffprobe 프로세스를 제한된 수만큼 동시에 실행 (스레드 풀, 입력 순서로 결과 반환)
+- 프로브 결과를 SQLite 캐시에 저장 (경로, 크기, 수정 시각이 같으면 다시 실행하지 않음)
+- ffprobe 출력 → TechSpec 필드 (fps, resolution, duration_sec, file_size_mb, codec) 변환
+
+캐시에는 TechSpec이 아닌 ffprobe 원본에서 뽑은 값을 저장하므로
+TechSpec 변환 규칙이 바뀌어도 다시 프로브할 필요가 없습니다.
+"""
+
+import json
+import sqlite3
+import subprocess
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from pydantic import ValidationError
+
+from ..models.udm import TechSpec
+from .mp4_reader import MP4_EXTENSIONS, Mp4ParseError, read_mp4_info
+from .nas_scanner import NasFileInfo
+
+# 출력 디렉토리의 프로브 캐시 (NasToUdmPipeline)
+PROBE_CACHE_FILENAME = "udm_probe_cache.db"
+
+# 높이 → TechSpec 해상도 표기 (그 외는 WIDTHxHEIGHT)
+RESOLUTION_LABELS = {
+    480: "480p",
+    720: "720p",
+    1080: "1080p",
+    1440: "1440p",
+    2160: "4K",
+    4320: "8K",
+}
+
+# ffprobe codec_name → 표시 이름 (그 외는 codec_name 그대로)
+CODEC_NAMES = {
+    "h264": "H.264",
+    "hevc": "H.265",
+    "prores": "ProRes",
+    "dnxhd": "DNxHD",
+    "mpeg2video": "MPEG-2",
+    "mpeg4": "MPEG-4",
+    "vp9": "VP9",
+    "av1": "AV1",
+}
+
+
+# =============================================================================
+# ffprobe 실행 / 출력 해석
+# =============================================================================
+
+
+class ProbeTimeout(Exception):
+    """ffprobe 시간 초과 (일시적 오류로 보고 캐시하지 않음)"""
+
+
+def _parse_rate(value: str | None) -> float | None:
+    """"30000/1001" → 29.97 (0/0, 잘못된 값은 None)"""
+    if not value:
+        return None
+    try:
+        num, _, den = value.partition("/")
+        rate = float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return round(rate, 3) if rate > 0 else None
+
+
+def _parse_float(value) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_probe_output(data: dict) -> dict | None:
+    """
+    ffprobe JSON 출력 → 프로브 정보
+
+    Returns:
+        {"width", "height", "fps", "duration_sec", "codec", "audio_codec", "bit_rate"}
+        또는 None (비디오 스트림 없음)
+    """
+    streams = data.get("streams", [])
+    video_stream = next((s for s in streams if s.get("codec_type") == "video"), None)
+    if video_stream is None:
+        return None
+    audio_stream = next((s for s in streams if s.get("codec_type") == "audio"), None)
+
+    format_info = data.get("format", {})
+    duration = _parse_float(format_info.get("duration"))
+    if duration is None:
+        duration = _parse_float(video_stream.get("duration"))
+
+    return {
+        "width": video_stream.get("width"),
+        "height": video_stream.get("height"),
+        "fps": (
+            _parse_rate(video_stream.get("r_frame_rate"))
+            or _parse_rate(video_stream.get("avg_frame_rate"))
+        ),
+        "duration_sec": duration,
+        "codec": video_stream.get("codec_name"),
+        "audio_codec": audio_stream.get("codec_name") if audio_stream else None,
+        "bit_rate": int(bit_rate) if (bit_rate := _parse_float(format_info.get("bit_rate"))) else None,
+    }
+
+
+def run_ffprobe(path: str, ffprobe: str = "ffprobe", timeout: float = 30) -> dict | None:
+    """
+    ffprobe 실행
+
+    Returns:
+        parse_probe_output() 결과 또는 None (읽을 수 없는 파일 / 비디오 스트림 없음)
+
+    Raises:
+        ProbeTimeout: 시간 초과
+        OSError: ffprobe 실행 실패 (미설치 등)
+    """
+    try:
+        result = subprocess.run(
+            [
+                ffprobe,
+                "-v", "quiet",
+                "-print_format", "json",
+                "-show_format",
+                "-show_streams",
+                path,
+            ],
+            capture_output=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise ProbeTimeout(path) from e
+
+    if result.returncode != 0:
+        return None
+
+    try:
+        data = json.loads(result.stdout)
+    except ValueError:
+        return None
+    return parse_probe_output(data)
+
+
+def to_tech_spec(info: dict | None, file_info: NasFileInfo) -> TechSpec | None:
+    """
+    프로브 정보 → TechSpec
+
+    Args:
+        info: parse_probe_output() 결과 (None = 프로브 실패)
+        file_info: 파일 정보 (file_size_mb)
+    """
+    if info is None:
+        return None
+
+    fields = {"file_size_mb": round(file_info.size_mb, 2)}
+
+    width, height = info.get("width"), info.get("height")
+    if width and height:
+        fields["resolution"] = RESOLUTION_LABELS.get(height, f"{width}x{height}")
+    if info.get("fps"):
+        fields["fps"] = info["fps"]  # 없으면 TechSpec 기본값
+    if info.get("duration_sec") is not None:
+        fields["duration_sec"] = round(info["duration_sec"], 3)
+    if info.get("codec"):
+        fields["codec"] = CODEC_NAMES.get(info["codec"], info["codec"])
+
+    try:
+        return TechSpec(**fields)
+    except ValidationError:
+        return None
+
+
+# =============================================================================
+# 프로브 캐시
+# =============================================================================
+
+
+def _mtime_us(file_info: NasFileInfo) -> int:
+    """캐시 키용 수정 시각 (마이크로초 정수)"""
+    return round(file_info.modified_at.timestamp() * 1_000_000)
+
+
+class ProbeCache:
+    """SQLite 프로브 캐시 ((경로, 크기, 수정 시각) → 프로브 정보, 한 스레드에서 사용)"""
+
+    SCHEMA_VERSION = "1"
+
+    # 저장 대기 결과가 이만큼 쌓이면 기록
+    FLUSH_SIZE = 200
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: 캐시 SQLite 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 스트리밍 파이프라인에서는 변환 스레드에서 사용
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._pending: list[tuple] = []
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS probes (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_us INTEGER NOT NULL,
+                info TEXT,
+                probed_at TEXT NOT NULL
+            );
+        """)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+            (self.SCHEMA_VERSION,),
+        )
+        self._conn.commit()
+
+    def get(self, file_info: NasFileInfo) -> tuple[bool, dict | None]:
+        """
+        캐시 조회
+
+        Returns:
+            (hit, 프로브 정보) - 파일 크기나 수정 시각이 바뀌었으면 miss
+        """
+        row = self._conn.execute(
+            "SELECT size, mtime_us, info FROM probes WHERE path = ?",
+            (file_info.path,),
+        ).fetchone()
+        if row is None or row[0] != file_info.size_bytes or row[1] != _mtime_us(file_info):
+            return False, None
+        return True, json.loads(row[2]) if row[2] is not None else None
+
+    def put(self, file_info: NasFileInfo, info: dict | None):
+        """결과 저장 (FLUSH_SIZE개씩 모아서 기록, None = 비디오 스트림 없음/읽기 실패)"""
+        self._pending.append((
+            file_info.path,
+            file_info.size_bytes,
+            _mtime_us(file_info),
+            json.dumps(info) if info is not None else None,
+            datetime.now().isoformat(),
+        ))
+        if len(self._pending) >= self.FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """저장 대기 결과 기록"""
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO probes (path, size, mtime_us, info, probed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                self._pending,
+            )
+        self._pending = []
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM probes").fetchone()[0]
+
+    def close(self):
+        """기록 후 연결 종료"""
+        self.flush()
+        self._conn.close()
+
+
+# =============================================================================
+# TechSpec 서비스
+# =============================================================================
+
+
+@dataclass
+class ProbeStats:
+    """프로브 통계"""
+
+    cache_hits: int = 0
+    probed: int = 0
+    native: int = 0  # probed 중 MP4 헤더 리더로 읽은 수
+    failed: int = 0  # 비디오 스트림 없음 / 읽기 실패 (캐시됨)
+    errors: int = 0  # 시간 초과 / 실행 실패 (캐시하지 않음)
+
+
+class TechSpecService:
+    """캐시 + 병렬 ffprobe 기술 메타데이터 추출"""
+
+    def __init__(
+        self,
+        cache_path: str | None = None,
+        workers: int = 4,
+        timeout: float = 30,
+        ffprobe: str = "ffprobe",
+        native: bool = True,
+    ):
+        """
+        Args:
+            cache_path: 프로브 캐시 SQLite 경로 (None = 캐시 없음)
+            workers: 동시에 실행할 프로브 수 (헤더 읽기 / ffprobe 프로세스)
+            timeout: 파일당 ffprobe 제한 시간 (초)
+            ffprobe: ffprobe 실행 파일
+            native: MP4/MOV는 헤더를 직접 읽기 (False = 모두 ffprobe)
+        """
+        self.cache = ProbeCache(cache_path) if cache_path else None
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.ffprobe = ffprobe
+        self.native = native
+        self.stats = ProbeStats()
+
+    def _probe(self, file_info: NasFileInfo) -> tuple[str | None, dict | None]:
+        """
+        프로브 실행 (풀 스레드에서 실행, 상태를 바꾸지 않음)
+
+        Returns:
+            (방식 "native" | "ffprobe", 프로브 정보) - 시간 초과/실행 실패는 (None, None)
+        """
+        if self.native and file_info.extension.lower() in MP4_EXTENSIONS:
+            try:
+                return "native", read_mp4_info(file_info.path)
+            except Mp4ParseError:
+                pass  # fragmented / 손상된 파일은 ffprobe로 다시 시도
+            except OSError:
+                return None, None
+
+        try:
+            return "ffprobe", run_ffprobe(file_info.path, self.ffprobe, self.timeout)
+        except (ProbeTimeout, OSError):
+            return None, None
+
+    def _record(self, file_info: NasFileInfo, method: str | None, info: dict | None) -> dict | None:
+        """프로브 결과 통계/캐시 반영 (일시적 오류는 캐시하지 않음)"""
+        if method is None:
+            self.stats.errors += 1
+            return None
+
+        self.stats.probed += 1
+        if method == "native":
+            self.stats.native += 1
+        if info is None:
+            self.stats.failed += 1
+        if self.cache is not None:
+            self.cache.put(file_info, info)
+        return info
+
+    def _cached(self, file_info: NasFileInfo) -> tuple[bool, dict | None]:
+        if self.cache is None:
+            return False, None
+        hit, info = self.cache.get(file_info)
+        if hit:
+            self.stats.cache_hits += 1
+        return hit, info
+
+    def get(self, file_info: NasFileInfo) -> TechSpec | None:
+        """파일 하나의 TechSpec (캐시 → ffprobe)"""
+        hit, info = self._cached(file_info)
+        if not hit:
+            info = self._record(file_info, *self._probe(file_info))
+        return to_tech_spec(info, file_info)
+
+    def iter_tech_specs(
+        self,
+        files: Iterable[NasFileInfo],
+    ) -> Iterator[tuple[NasFileInfo, TechSpec | None]]:
+        """
+        (파일, TechSpec) 순회 (입력 순서)
+
+        캐시에 없는 파일만 스레드 풀에서 ffprobe로 실행하며,
+        소비 측이 느려도 쌓이지 않도록 미리 읽는 파일 수는 workers * 4개로 제한합니다.
+        """
+        max_pending = self.workers * 4
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="ffprobe",
+        ) as executor:
+            # (파일, 캐시 결과 또는 Future)
+            pending: deque[tuple[NasFileInfo, dict | None | Future]] = deque()
+            it = iter(files)
+            exhausted = False
+
+            try:
+                while True:
+                    while not exhausted and len(pending) < max_pending:
+                        file_info = next(it, None)
+                        if file_info is None:
+                            exhausted = True
+                            break
+                        hit, info = self._cached(file_info)
+                        if not hit:
+                            info = executor.submit(self._probe, file_info)
+                        pending.append((file_info, info))
+
+                    if not pending:
+                        break
+
+                    file_info, info = pending.popleft()
+                    if isinstance(info, Future):
+                        info = self._record(file_info, *info.result())
+                    yield file_info, to_tech_spec(info, file_info)
+            finally:
+                # 중단된 경우 아직 시작하지 않은 프로브 취소
+                for _, info in pending:
+                    if isinstance(info, Future):
+                        info.cancel()
+                if self.cache is not None:
+                    self.cache.flush()
+
+    def close(self):
+        """캐시 기록 후 종료"""
+        if self.cache is not None:
+            self.cache.close()
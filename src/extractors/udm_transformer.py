@@ -4,10 +4,18 @@ UDM 변환기
 NAS 파일 정보 → UDM Asset 변환
 """
 
+import multiprocessing
+import os
 import uuid
 import hashlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator, Sequence
+
+from pydantic import ValidationError
 
 from ..models.udm import (
     Asset,
@@ -16,11 +24,13 @@ from ..models.udm import (
     TechSpec,
     FileNameMeta,
     EventContext,
+    construct_trusted,
     parse_filename,
     infer_brand_from_path,
     infer_asset_type_from_path,
 )
 from .nas_scanner import NasFileInfo
+from .tech_spec import TechSpecService
 
 
 @dataclass
@@ -36,6 +46,30 @@ class TransformResult:
     def total(self) -> int:
         return self.success + self.failed + self.skipped
 
+    def merge(self, other: "TransformResult"):
+        """다른 변환 결과 합산 (오류 순서 유지)"""
+        self.success += other.success
+        self.failed += other.failed
+        self.skipped += other.skipped
+        self.errors.extend(other.errors)
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[list]:
+    """size개씩 나눈 목록 (이터레이터도 한 번만 순회)"""
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _transform_chunk(
+    transformer: "UdmTransformer",
+    items: list[tuple[NasFileInfo, TechSpec | None]],
+) -> tuple[list[Asset], TransformResult]:
+    """프로세스 풀 작업 단위 (pickle 가능하도록 모듈 최상위 함수)"""
+    result = TransformResult()
+    assets = list(transformer._iter_items(items, result))
+    return assets, result
+
 
 class UdmTransformer:
     """NAS 파일 → UDM Asset 변환기"""
@@ -45,16 +79,49 @@ class UdmTransformer:
         default_brand: str | None = None,
         default_asset_type: str = "SUBCLIP",
         include_tech_spec: bool = False,
+        trusted: bool = False,
+        tech_spec_cache: str | None = None,
+        probe_workers: int = 4,
     ):
         """
         Args:
             default_brand: 기본 브랜드 (추론 실패 시)
             default_asset_type: 기본 Asset Type
             include_tech_spec: FFprobe로 기술 메타데이터 추출 여부
+            trusted: 검증 없이 생성 (NasScanner 결과처럼 신뢰할 수 있는 입력용,
+                필요 시 validate_assets()로 일괄 검증)
+            tech_spec_cache: 프로브 캐시 SQLite 경로 (None = 캐시 없음)
+            probe_workers: 동시에 실행할 ffprobe 프로세스 수
         """
         self.default_brand = default_brand
         self.default_asset_type = default_asset_type
         self.include_tech_spec = include_tech_spec
+        self.trusted = trusted
+        self.tech_spec_cache = tech_spec_cache
+        self.probe_workers = probe_workers
+        self._tech_spec_service: TechSpecService | None = None
+
+    def __getstate__(self):
+        # 프로세스 풀 워커에는 프로브 결과만 넘기므로 서비스 (SQLite 연결) 제외
+        state = self.__dict__.copy()
+        state["_tech_spec_service"] = None
+        return state
+
+    @property
+    def tech_spec_service(self) -> TechSpecService:
+        """기술 메타데이터 추출 서비스 (처음 사용할 때 생성)"""
+        if self._tech_spec_service is None:
+            self._tech_spec_service = TechSpecService(
+                cache_path=self.tech_spec_cache,
+                workers=self.probe_workers,
+            )
+        return self._tech_spec_service
+
+    def close(self):
+        """프로브 캐시 기록 후 종료"""
+        if self._tech_spec_service is not None:
+            self._tech_spec_service.close()
+            self._tech_spec_service = None
 
     def transform(self, file_info: NasFileInfo) -> Asset | None:
         """
@@ -66,9 +133,14 @@ class UdmTransformer:
         Returns:
             Asset 객체 또는 None (변환 실패 시)
         """
+        tech_spec = self._extract_tech_spec(file_info) if self.include_tech_spec else None
+        return self._transform(file_info, tech_spec)
+
+    def _transform(self, file_info: NasFileInfo, tech_spec: TechSpec | None) -> Asset | None:
+        """변환 (기술 메타데이터는 미리 추출한 값 사용)"""
         try:
             # 1. UUID 생성 (파일 경로 기반 deterministic)
-            asset_uuid = self._generate_uuid(file_info.path)
+            asset_uuid = self._uuid_for_path(file_info.path)
 
             # 2. 파일명 파싱
             filename_meta = self._parse_filename(file_info.filename)
@@ -79,10 +151,7 @@ class UdmTransformer:
             # 4. Asset Type 결정
             asset_type = self._determine_asset_type(file_info, filename_meta)
 
-            # 5. Tech Spec 생성 (선택적)
-            tech_spec = None
-            if self.include_tech_spec:
-                tech_spec = self._extract_tech_spec(file_info)
+            # 5. Tech Spec은 호출 측에서 추출 (선택적)
 
             # 6. Event Context 생성 (필수)
             event_context = self._create_event_context(filename_meta, brand)
@@ -91,6 +160,12 @@ class UdmTransformer:
             source_origin = self._create_source_origin_str(file_info, brand)
 
             # 8. Asset 생성
+            if self.trusted:
+                return self._construct_asset(
+                    asset_uuid, file_info, asset_type, event_context,
+                    tech_spec, filename_meta, source_origin,
+                )
+
             asset = Asset(
                 asset_uuid=asset_uuid,
                 file_name=file_info.filename,
@@ -109,40 +184,238 @@ class UdmTransformer:
         except Exception:
             return None
 
+    # 병렬 변환 청크 크기 범위 (자동 계산 시)
+    MIN_CHUNK_SIZE = 500
+    MAX_CHUNK_SIZE = 5000
+
     def transform_batch(
         self,
         files: list[NasFileInfo],
+        workers: int = 1,
+        chunk_size: int | None = None,
     ) -> tuple[list[Asset], TransformResult]:
         """
         배치 변환
 
         Args:
             files: NAS 파일 목록
+            workers: 변환 프로세스 수 (1 = 현재 프로세스, 0 = CPU 코어 수)
+            chunk_size: 프로세스에 한 번에 넘길 파일 수 (None = 자동)
 
         Returns:
-            (Asset 목록, 변환 결과)
+            (Asset 목록, 변환 결과) - 병렬 변환도 입력 순서 유지
         """
-        assets: list[Asset] = []
         result = TransformResult()
 
-        for file_info in files:
-            asset = self.transform(file_info)
+        assets = list(self.iter_transform(files, result, workers, chunk_size))
+
+        return assets, result
+
+    def iter_transform(
+        self,
+        files: Iterable[NasFileInfo],
+        result: TransformResult | None = None,
+        workers: int = 1,
+        chunk_size: int | None = None,
+    ) -> Iterator[Asset]:
+        """
+        스트리밍 변환 (전체 Asset 목록을 메모리에 두지 않음)
+
+        Args:
+            files: NAS 파일 목록 또는 이터레이터 (스캔 결과를 그대로 흘려보낼 수 있음)
+            result: 변환 결과 카운터 (순회하면서 갱신)
+            workers: 변환 프로세스 수 (1 = 현재 프로세스, 0 = CPU 코어 수)
+            chunk_size: 프로세스에 한 번에 넘길 파일 수
+                (None = 목록은 크기에 따라 자동, 이터레이터는 MIN_CHUNK_SIZE)
+
+        Yields:
+            Asset (입력 순서)
+        """
+        if result is None:
+            result = TransformResult()
+
+        if workers == 0:
+            workers = os.cpu_count() or 1
+
+        # 기술 메타데이터는 현재 프로세스에서 병렬 프로브 후 파일과 함께 전달
+        if self.include_tech_spec:
+            items = self.tech_spec_service.iter_tech_specs(files)
+        else:
+            items = ((file_info, None) for file_info in files)
+
+        if workers > 1:
+            if not isinstance(files, Sequence):
+                # 크기를 모르는 입력: 청크가 찰 때마다 제출
+                chunk_size = chunk_size or self.MIN_CHUNK_SIZE
+                yield from self._iter_parallel(_chunked(items, chunk_size), result, workers)
+                return
+
+            if chunk_size is None:
+                # 코어당 4개 정도의 청크: 느린 청크가 있어도 부하가 고르게 분산
+                chunk_size = -(-len(files) // (workers * 4))
+                chunk_size = max(self.MIN_CHUNK_SIZE, min(self.MAX_CHUNK_SIZE, chunk_size))
+            if len(files) > chunk_size:
+                workers = min(workers, -(-len(files) // chunk_size))
+                yield from self._iter_parallel(_chunked(items, chunk_size), result, workers)
+                return
+
+        yield from self._iter_items(items, result)
+
+    def _iter_items(
+        self,
+        items: Iterable[tuple[NasFileInfo, TechSpec | None]],
+        result: TransformResult,
+    ) -> Iterator[Asset]:
+        """(파일, 기술 메타데이터) 순차 변환"""
+        for file_info, tech_spec in items:
+            asset = self._transform(file_info, tech_spec)
 
             if asset:
-                assets.append(asset)
                 result.success += 1
+                yield asset
             else:
                 result.failed += 1
                 result.errors.append(f"Failed to transform: {file_info.filename}")
 
-        return assets, result
+    def _iter_parallel(
+        self,
+        chunks: Iterator[list[tuple[NasFileInfo, TechSpec | None]]],
+        result: TransformResult,
+        workers: int,
+    ) -> Iterator[Asset]:
+        """
+        프로세스 풀 병렬 변환
+
+        파일 청크를 제출하고 제출 순서대로 결과를 내보내므로
+        출력 순서는 순차 변환과 같습니다. 소비 측이 느려도 메모리가
+        늘어나지 않도록 미리 제출하는 청크 수는 workers * 2개로 제한합니다.
+        부모 프로세스에는 결과 역직렬화 비용이 남으므로 (Asset당 변환 비용의
+        약 절반) 이것이 병렬 처리량의 상한이 됩니다.
+        """
+        max_pending = workers * 2
+
+        # ffprobe 스레드가 subprocess를 띄우는 중에 fork하면 워커가 exec 상태 파이프를
+        # 물려받아 프로브가 멈추므로, 프로브와 함께 쓸 때는 spawn 워커 사용
+        mp_context = multiprocessing.get_context("spawn") if self.include_tech_spec else None
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+            pending: deque[Future] = deque()
+            exhausted = False
+
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    pending.append(executor.submit(_transform_chunk, self, chunk))
+
+                if not pending:
+                    break
+
+                chunk_assets, chunk_result = pending.popleft().result()
+                result.merge(chunk_result)
+                yield from chunk_assets
+
+    def validate_assets(
+        self,
+        assets: list[Asset],
+    ) -> tuple[list[Asset], TransformResult]:
+        """
+        일괄 검증 (trusted 모드로 생성한 Asset의 지연 검증)
+
+        Args:
+            assets: Asset 목록
+
+        Returns:
+            (검증된 Asset 목록, 검증 결과)
+        """
+        result = TransformResult()
+
+        validated = list(self.iter_validate(assets, result))
+
+        return validated, result
+
+    def iter_validate(
+        self,
+        assets: Iterable[Asset],
+        result: TransformResult | None = None,
+    ) -> Iterator[Asset]:
+        """
+        스트리밍 검증 (검증 실패 Asset은 건너뛰고 result에 기록)
+
+        Args:
+            assets: Asset 이터러블
+            result: 검증 결과 카운터 (순회하면서 갱신)
+
+        Yields:
+            검증된 Asset
+        """
+        if result is None:
+            result = TransformResult()
+
+        for asset in assets:
+            try:
+                # model_validate(asset)는 인스턴스를 그대로 통과시키므로 dict로 재검증
+                validated = Asset.model_validate(asset.model_dump())
+            except ValidationError as e:
+                result.failed += 1
+                result.errors.append(
+                    f"Validation failed: {asset.file_name} ({e.error_count()} errors)"
+                )
+                continue
+
+            result.success += 1
+            yield validated
+
+    # =========================================================================
+    # Trusted fast path (검증 없는 생성)
+    # =========================================================================
+
+    def _construct_asset(
+        self,
+        asset_uuid: uuid.UUID,
+        file_info: NasFileInfo,
+        asset_type: AssetType,
+        event_context: EventContext,
+        tech_spec: TechSpec | None,
+        filename_meta: FileNameMeta | None,
+        source_origin: str,
+    ) -> Asset | None:
+        """
+        검증 없이 Asset 생성
+
+        검증 경로와 같은 결과가 되도록 공백 제거와
+        use_enum_values 변환은 직접 적용합니다.
+        """
+        file_name = file_info.filename.strip()
+        if not file_name:
+            return None
+
+        return construct_trusted(
+            Asset,
+            asset_uuid=asset_uuid,
+            file_name=file_name,
+            file_path_rel=file_info.relative_path.strip(),
+            file_path_nas=file_info.path.strip(),
+            asset_type=asset_type.value,
+            event_context=event_context,
+            tech_spec=tech_spec,
+            file_name_meta=filename_meta,
+            source_origin=source_origin,
+            segments=[],
+        )
 
     def _generate_uuid(self, path: str) -> str:
         """경로 기반 deterministic UUID 생성"""
+        return str(self._uuid_for_path(path))
+
+    def _uuid_for_path(self, path: str) -> uuid.UUID:
+        """경로 기반 deterministic UUID (문자열 변환 없이)"""
         # 경로를 정규화하여 일관된 UUID 생성
         normalized = path.replace("\\", "/").lower()
         hash_bytes = hashlib.sha256(normalized.encode()).digest()[:16]
-        return str(uuid.UUID(bytes=hash_bytes))
+        return uuid.UUID(bytes=hash_bytes)
 
     def _parse_filename(self, filename: str) -> FileNameMeta | None:
         """파일명 파싱"""
@@ -241,58 +514,8 @@ class UdmTransformer:
         return f"NAS_{brand_str}_{year}"
 
     def _extract_tech_spec(self, file_info: NasFileInfo) -> TechSpec | None:
-        """기술 메타데이터 추출 (FFprobe)"""
-        try:
-            import subprocess
-            import json
-
-            result = subprocess.run(
-                [
-                    "ffprobe",
-                    "-v", "quiet",
-                    "-print_format", "json",
-                    "-show_format",
-                    "-show_streams",
-                    file_info.path,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            if result.returncode != 0:
-                return None
-
-            data = json.loads(result.stdout)
-
-            # 비디오 스트림 찾기
-            video_stream = None
-            audio_stream = None
-
-            for stream in data.get("streams", []):
-                if stream.get("codec_type") == "video" and not video_stream:
-                    video_stream = stream
-                elif stream.get("codec_type") == "audio" and not audio_stream:
-                    audio_stream = stream
-
-            if not video_stream:
-                return None
-
-            # TechSpec 생성
-            duration = float(data.get("format", {}).get("duration", 0))
-
-            return TechSpec(
-                duration_sec=duration,
-                fps=eval(video_stream.get("r_frame_rate", "30/1")),
-                width=video_stream.get("width", 0),
-                height=video_stream.get("height", 0),
-                codec=video_stream.get("codec_name", "unknown"),
-                audio_codec=audio_stream.get("codec_name") if audio_stream else None,
-                bitrate_kbps=int(data.get("format", {}).get("bit_rate", 0)) // 1000,
-            )
-
-        except Exception:
-            return None
+        """기술 메타데이터 추출 (프로브 캐시 → FFprobe)"""
+        return self.tech_spec_service.get(file_info)
 
     def _create_event_context(
         self,
@@ -325,6 +548,16 @@ class UdmTransformer:
             if filename_meta.season:
                 season = filename_meta.season
 
+        # trusted 모드: 범위 밖 연도만 검증 경로로 보내 동일하게 실패 처리
+        if self.trusted and 1970 <= year <= 2100:
+            return construct_trusted(
+                EventContext,
+                year=year,
+                brand=brand.value,
+                season=season,
+                episode=episode,
+            )
+
         return EventContext(
             year=year,
             brand=brand,
@@ -28,8 +28,14 @@ from .udm import (
     UDMMetadata,
     # Utility functions
     parse_filename,
+    parse_filename_with_pattern,
+    parse_filenames,
+    parse_filename_cache_info,
+    clear_parse_filename_cache,
+    match_filename_pattern,
     generate_json_schema,
     generate_minimal_asset,
+    construct_trusted,
     infer_brand_from_path,
     infer_asset_type_from_path,
     # Google Sheets 파싱 헬퍼 (Issue #7)
@@ -70,8 +76,14 @@ __all__ = [
     "UDMMetadata",
     # Utility functions
     "parse_filename",
+    "parse_filename_with_pattern",
+    "parse_filenames",
+    "parse_filename_cache_info",
+    "clear_parse_filename_cache",
+    "match_filename_pattern",
     "generate_json_schema",
     "generate_minimal_asset",
+    "construct_trusted",
     "infer_brand_from_path",
     "infer_asset_type_from_path",
     # Google Sheets 파싱 헬퍼 (Issue #7)
@@ -16,7 +16,8 @@ from __future__ import annotations
 import re
 from datetime import datetime
 from enum import Enum
-from typing import Annotated, Any, Optional
+from functools import lru_cache
+from typing import Annotated, Any, Iterable, Optional
 from uuid import UUID, uuid4
 
 from pydantic import (
@@ -988,12 +989,304 @@ FILENAME_PATTERNS: dict[str, str] = {
 }
 
 
+def _normalize_filename(filename: str) -> str:
+    """유니코드 정규화 (v3.2.0)"""
+    normalized = filename
+    normalized = normalized.replace('\u2013', '-')  # en-dash → hyphen
+    normalized = normalized.replace('\u2014', '-')  # em-dash → hyphen
+    normalized = normalized.replace('\u20ac', 'E')  # Euro sign € → E
+    return normalized
+
+
+def _is_optional_quantifier(rest: str) -> bool:
+    """요소 바로 뒤가 0회를 허용하는 수량자인지 (?, *, {0,n}, {,n})"""
+    return rest[:1] in ("?", "*") or rest.startswith("{0") or rest.startswith("{,")
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """그룹 / 문자 클래스 밖의 | 포함 여부 (예: ^WSOP|^HCL)"""
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+            if pattern[i + 1:i + 2] == "]":
+                i += 1  # 클래스 첫 글자 ]는 리터럴
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _leading_chars(pattern: str) -> frozenset[str] | None:
+    """
+    패턴이 매칭할 수 있는 첫 글자 집합 (소문자, ASCII)
+
+    ^ 다음의 리터럴 / \\d / 이스케이프 없는 단순 문자 클래스 / 이름 있는 그룹만 해석하고,
+    그 외(최상위 / 그룹 내 alternation, 선택적 요소, 클래스 안 이스케이프 등)는
+    None(모든 글자 가능)으로 보수적으로 처리합니다.
+    """
+    if not pattern.startswith("^") or _has_top_level_alternation(pattern):
+        return None
+    rest = pattern[1:]
+
+    # 선행 그룹 진입: (?P<name>... / (?:...
+    while True:
+        if rest.startswith("(?P<"):
+            end = rest.find(">")
+            group_body = rest[end + 1:]
+        elif rest.startswith("(?:"):
+            group_body = rest[3:]
+        else:
+            break
+        # 그룹 내부 최상위 alternation은 해석하지 않음
+        depth = 0
+        close = None
+        for i, ch in enumerate(group_body):
+            if ch == "(":
+                depth += 1
+            elif ch == ")":
+                if depth == 0:
+                    close = i
+                    break
+                depth -= 1
+            elif ch == "|" and depth == 0:
+                return None
+        # 그룹 전체가 선택적이면 ((...)?, (...)*, (...){0,n}) 그룹 뒤 글자로 시작할 수 있음
+        if close is None or _is_optional_quantifier(group_body[close + 1:]):
+            return None
+        rest = group_body
+
+    if not rest:
+        return None
+
+    if rest.startswith("\\d"):
+        chars = frozenset("0123456789")
+        rest = rest[2:]
+    elif rest.startswith("\\") and len(rest) > 1 and not rest[1].isalnum():
+        chars = frozenset(rest[1])
+        rest = rest[2:]
+    elif rest[0] == "[":
+        end = rest.find("]", 1)
+        body = rest[1:end]
+        # 클래스 안 이스케이프(\\d, \\s, \\w, \\] 등)는 글자 집합으로 해석하지 않음
+        if end < 0 or not body or "\\" in body or "-" in body or body.startswith("^"):
+            return None
+        chars = frozenset(body)
+        rest = rest[end + 1:]
+    elif rest[0].isalnum() or rest[0] in "#_ ":
+        chars = frozenset(rest[0])
+        rest = rest[1:]
+    else:
+        return None
+
+    # 첫 요소가 선택적이면 (?, *, {0,) 첫 글자를 단정할 수 없음
+    if _is_optional_quantifier(rest):
+        return None
+    if not all(ch.isascii() for ch in chars):
+        return None
+
+    return frozenset(ch.lower() for ch in chars)
+
+
+# 컴파일된 패턴 디스패치 테이블
+_dispatch_size: int = -1
+_dispatch_version: int = 0
+_dispatch_all: tuple[tuple[str, re.Pattern], ...] = ()
+_dispatch_buckets: dict[str, tuple[tuple[str, re.Pattern], ...]] = {}
+_dispatch_wildcard: tuple[tuple[str, re.Pattern], ...] = ()
+
+
+def reload_filename_patterns() -> int:
+    """
+    FILENAME_PATTERNS로부터 디스패치 테이블 재생성
+
+    패턴 추가/삭제는 자동으로 감지되지만, 기존 패턴의 정규식을 교체한
+    경우에는 이 함수를 직접 호출해야 합니다.
+
+    Returns:
+        새 패턴 세트 버전
+    """
+    global _dispatch_size, _dispatch_version, _dispatch_all, _dispatch_buckets, _dispatch_wildcard
+
+    source = list(FILENAME_PATTERNS.items())
+    compiled = [(name, re.compile(pattern, re.IGNORECASE)) for name, pattern in source]
+    leading = [_leading_chars(pattern) for _, pattern in source]
+
+    keys = set()
+    for chars in leading:
+        if chars:
+            keys |= chars
+
+    # 각 버킷은 선언 순서를 유지하므로 순차 매칭과 동일한 패턴이 선택됨
+    _dispatch_buckets = {
+        key: tuple(
+            entry for entry, chars in zip(compiled, leading)
+            if chars is None or key in chars
+        )
+        for key in keys
+    }
+    _dispatch_all = tuple(compiled)
+    _dispatch_wildcard = tuple(entry for entry, chars in zip(compiled, leading) if chars is None)
+    _dispatch_size = len(source)
+    _dispatch_version += 1
+    return _dispatch_version
+
+
+def filename_patterns_version() -> int:
+    """현재 패턴 세트 버전 (디스패치 테이블 재생성 시 증가)"""
+    if len(FILENAME_PATTERNS) != _dispatch_size:
+        reload_filename_patterns()
+    return _dispatch_version
+
+
+def _candidate_patterns(normalized: str) -> tuple[tuple[str, re.Pattern], ...]:
+    """정규화된 파일명의 첫 글자로 후보 패턴 선택"""
+    if len(FILENAME_PATTERNS) != _dispatch_size:
+        reload_filename_patterns()
+
+    first = normalized[:1]
+    if not first.isascii():
+        # IGNORECASE는 유니코드 대소문자 변환을 적용하므로 (예: ſ -> S, K -> K)
+        # 비 ASCII 첫 글자는 전체 패턴을 순서대로 시도
+        return _dispatch_all
+    return _dispatch_buckets.get(first.lower(), _dispatch_wildcard)
+
+
+def match_filename_pattern(filename: str) -> tuple[str, re.Match] | None:
+    """
+    파일명에 처음으로 매칭되는 패턴 찾기
+
+    FILENAME_PATTERNS 선언 순서대로 시도한 결과와 동일하지만, 첫 글자로
+    매칭 가능한 패턴만 후보로 좁혀 미리 컴파일된 정규식으로 검사합니다.
+
+    Args:
+        filename: 파일명 (확장자 포함)
+
+    Returns:
+        (패턴 이름, Match) 또는 None
+    """
+    normalized = _normalize_filename(filename)
+
+    for pattern_name, pattern in _candidate_patterns(normalized):
+        match = pattern.match(normalized)
+        if match:
+            return pattern_name, match
+    return None
+
+
+def _build_filename_meta(filename: str) -> tuple[Optional[str], FileNameMeta]:
+    """파일명 파싱 (캐시 없음) -> (패턴 이름, FileNameMeta)"""
+    matched = match_filename_pattern(filename)
+    if matched:
+        pattern_name, match = matched
+        groups = match.groupdict()
+
+        # 기본 필드 추출
+        meta = FileNameMeta(
+            code_prefix=groups.get("code"),
+            year_code=groups.get("year") or (
+                groups.get("date", "")[:2] if groups.get("date") else None
+            ),
+            sequence_num=(
+                int(groups["num"])
+                if groups.get("num")
+                else None
+            ),
+            clip_type=groups.get("type"),
+            raw_description=(
+                groups.get("desc") or
+                groups.get("player") or
+                groups.get("tags")
+            ),
+            # PAD 전용 필드
+            season=(
+                int(groups["season"])
+                if groups.get("season")
+                else None
+            ),
+            episode=(
+                int(groups["episode"])
+                if groups.get("episode")
+                else None
+            ),
+            # WSOP mastered 전용 필드
+            event_number=(
+                int(groups["event"])
+                if groups.get("event")
+                else None
+            ),
+            buyin_code=groups.get("buyin"),
+            game_code=groups.get("game"),
+        )
+
+        # PAD 패턴인 경우 code_prefix와 clip_type 설정
+        if pattern_name == "pad_episode":
+            meta.code_prefix = "PAD"
+            meta.clip_type = "EP"
+
+        # GOG 에피소드 패턴인 경우 code_prefix 설정
+        if pattern_name == "gog_episode":
+            meta.code_prefix = "GOG"
+
+        # GGMillions 패턴인 경우 code_prefix 설정
+        if pattern_name in ("ggmillions", "ggmillions_no_date"):
+            meta.code_prefix = "GGMillions"
+
+        # Hand Clip 패턴인 경우 code_prefix 설정
+        if pattern_name == "hand_clip":
+            meta.code_prefix = "WSOP"
+
+        return pattern_name, meta
+    return None, FileNameMeta()
+
+
+# 파싱 결과 LRU 캐시 크기 (NAS 전체 파일명 수 기준)
+PARSE_FILENAME_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=PARSE_FILENAME_CACHE_SIZE)
+def _parse_normalized(normalized: str, patterns_version: int) -> tuple[Optional[str], FileNameMeta]:
+    """정규화된 파일명 + 패턴 세트 버전 기준 캐시 (패턴 변경 시 자동 무효화)"""
+    return _build_filename_meta(normalized)
+
+
+def parse_filename_with_pattern(filename: str) -> tuple[Optional[str], FileNameMeta]:
+    """
+    파일명 파싱 + 매칭된 패턴 이름
+
+    Args:
+        filename: 파일명 (확장자 포함)
+
+    Returns:
+        (패턴 이름 또는 None, FileNameMeta)
+    """
+    pattern_name, meta = _parse_normalized(
+        _normalize_filename(filename),
+        filename_patterns_version(),
+    )
+    # 캐시된 인스턴스가 호출 측 수정에 오염되지 않도록 복사본 반환
+    return pattern_name, _shallow_copy(meta)
+
+
 def parse_filename(filename: str) -> FileNameMeta:
     """
     파일명 파싱 (v3.2.0 - 유니코드 정규화 포함)
 
     NAS 파일명 패턴을 분석하여 FileNameMeta 반환
     24개 패턴으로 98.4% 매칭률 달성
+    같은 파일명은 LRU 캐시에서 반환합니다.
 
     Args:
         filename: 파일명 (확장자 포함)
@@ -1001,74 +1294,45 @@ def parse_filename(filename: str) -> FileNameMeta:
     Returns:
         FileNameMeta: 파싱된 메타데이터
     """
-    # 유니코드 정규화 (v3.2.0)
-    normalized = filename
-    normalized = normalized.replace('\u2013', '-')  # en-dash → hyphen
-    normalized = normalized.replace('\u2014', '-')  # em-dash → hyphen
-    normalized = normalized.replace('\u20ac', 'E')  # Euro sign € → E
+    return parse_filename_with_pattern(filename)[1]
 
-    for pattern_name, pattern in FILENAME_PATTERNS.items():
-        match = re.match(pattern, normalized, re.IGNORECASE)
-        if match:
-            groups = match.groupdict()
-
-            # 기본 필드 추출
-            meta = FileNameMeta(
-                code_prefix=groups.get("code"),
-                year_code=groups.get("year") or (
-                    groups.get("date", "")[:2] if groups.get("date") else None
-                ),
-                sequence_num=(
-                    int(groups["num"])
-                    if groups.get("num")
-                    else None
-                ),
-                clip_type=groups.get("type"),
-                raw_description=(
-                    groups.get("desc") or
-                    groups.get("player") or
-                    groups.get("tags")
-                ),
-                # PAD 전용 필드
-                season=(
-                    int(groups["season"])
-                    if groups.get("season")
-                    else None
-                ),
-                episode=(
-                    int(groups["episode"])
-                    if groups.get("episode")
-                    else None
-                ),
-                # WSOP mastered 전용 필드
-                event_number=(
-                    int(groups["event"])
-                    if groups.get("event")
-                    else None
-                ),
-                buyin_code=groups.get("buyin"),
-                game_code=groups.get("game"),
-            )
 
-            # PAD 패턴인 경우 code_prefix와 clip_type 설정
-            if pattern_name == "pad_episode":
-                meta.code_prefix = "PAD"
-                meta.clip_type = "EP"
+def parse_filenames(filenames: Iterable[str]) -> list[FileNameMeta]:
+    """
+    파일명 일괄 파싱
 
-            # GOG 에피소드 패턴인 경우 code_prefix 설정
-            if pattern_name == "gog_episode":
-                meta.code_prefix = "GOG"
+    패턴 세트 버전을 한 번만 확인하고, 배치 내 중복 파일명은
+    한 번만 파싱합니다.
+
+    Args:
+        filenames: 파일명 목록
+
+    Returns:
+        입력 순서와 같은 FileNameMeta 목록
+    """
+    version = filename_patterns_version()
+    results = []
+    for filename in filenames:
+        _, meta = _parse_normalized(_normalize_filename(filename), version)
+        results.append(_shallow_copy(meta))
+    return results
 
-            # GGMillions 패턴인 경우 code_prefix 설정
-            if pattern_name in ("ggmillions", "ggmillions_no_date"):
-                meta.code_prefix = "GGMillions"
 
-            # Hand Clip 패턴인 경우 code_prefix 설정
-            if pattern_name == "hand_clip":
-                meta.code_prefix = "WSOP"
+def parse_filename_cache_info() -> dict[str, int]:
+    """파싱 캐시 통계 (hits, misses, size, maxsize, patterns_version)"""
+    info = _parse_normalized.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "patterns_version": filename_patterns_version(),
+    }
 
-            return meta
-    return FileNameMeta()
+
+def clear_parse_filename_cache():
+    """파싱 캐시 초기화"""
+    _parse_normalized.cache_clear()
 
 
 # NAS 경로 기반 브랜드 매핑
@@ -1201,6 +1465,98 @@ def generate_minimal_asset(
     )
 
 
+# =============================================================================
+# 검증 없는 생성 (신뢰 입력용)
+# =============================================================================
+
+# 모델별 생성 템플릿: (필드 순서의 기본값 dict, default_factory 목록, 필수 필드) / None = 사용 불가
+_CONSTRUCT_TEMPLATES: dict[type, Optional[tuple[dict[str, Any], tuple, tuple[str, ...]]]] = {}
+
+_IMMUTABLE_DEFAULT_TYPES = (type(None), bool, int, float, str, Enum, UUID, tuple, frozenset)
+
+
+def _construct_template(
+    model_cls: type[BaseModel],
+) -> Optional[tuple[dict[str, Any], tuple, tuple[str, ...]]]:
+    """모델 기본값 템플릿 작성 (가변 기본값/alias/post_init이 있으면 None)"""
+    if model_cls.__pydantic_post_init__ or model_cls.model_config.get("extra") == "allow":
+        return None
+
+    # 직렬화 시 키 순서가 검증 경로와 같도록 모든 필드를 선언 순서로 배치
+    defaults: dict[str, Any] = {}
+    factories = []
+    required = []
+    for name, field_info in model_cls.model_fields.items():
+        if field_info.alias is not None or field_info.validation_alias is not None:
+            return None
+        if field_info.default_factory is not None:
+            defaults[name] = None  # 필드 순서 유지용 자리
+            factories.append((name, field_info.default_factory))
+        elif field_info.is_required():
+            defaults[name] = None  # 값이 없으면 생성 시 제거
+            required.append(name)
+        else:
+            if not isinstance(field_info.default, _IMMUTABLE_DEFAULT_TYPES):
+                return None
+            defaults[name] = field_info.default
+
+    return defaults, tuple(factories), tuple(required)
+
+
+def _shallow_copy(instance: BaseModel) -> BaseModel:
+    """model_copy()와 같은 얕은 복사 (extra/private 없는 모델 전용 경량판)"""
+    if instance.__pydantic_extra__ is not None or instance.__pydantic_private__ is not None:
+        return instance.model_copy()
+
+    copied = instance.__class__.__new__(instance.__class__)
+    object.__setattr__(copied, "__dict__", instance.__dict__.copy())
+    object.__setattr__(copied, "__pydantic_fields_set__", instance.__pydantic_fields_set__.copy())
+    object.__setattr__(copied, "__pydantic_extra__", None)
+    object.__setattr__(copied, "__pydantic_private__", None)
+    return copied
+
+
+def construct_trusted(model_cls: type[BaseModel], **values: Any) -> BaseModel:
+    """
+    검증 없이 모델 생성 (model_construct 경량판)
+
+    model_construct()는 호출마다 모든 필드의 기본값을 다시 계산하므로,
+    기본값을 모델별로 한 번만 준비해 두고 복사합니다.
+    값은 검증된 결과와 같은 형태(UUID, use_enum_values 문자열 등)로 전달해야 합니다.
+
+    Args:
+        model_cls: Pydantic 모델 클래스
+        **values: 필드 값 (model_fields_set이 됨)
+
+    Returns:
+        모델 인스턴스
+    """
+    try:
+        template = _CONSTRUCT_TEMPLATES[model_cls]
+    except KeyError:
+        template = _CONSTRUCT_TEMPLATES[model_cls] = _construct_template(model_cls)
+
+    if template is None:
+        return model_cls.model_construct(**values)
+
+    defaults, factories, required = template
+    fields = defaults.copy()
+    for name, factory in factories:
+        if name not in values:
+            fields[name] = factory()
+    fields.update(values)
+    for name in required:
+        if name not in values:
+            del fields[name]
+
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", fields)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
 # =============================================================================
 # Google Sheets 파싱 헬퍼 (Issue #7)
 # =============================================================================
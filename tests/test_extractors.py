@@ -7,13 +7,20 @@ Tests for:
 - JsonExporter: JSON 내보내기
 """
 
+import os
+import shutil
+import struct
+import sys
 import pytest
 import tempfile
 import json
 from pathlib import Path
 from datetime import datetime
 
-from src.extractors.nas_scanner import NasScanner, NasFileInfo, ScanResult
+from src.extractors.nas_scanner import NasScanner, NasFileInfo, ScanProgress, ScanResult
+from src.extractors.nas_watcher import NasWatcher, inotify_supported
+from src.extractors.path_inference import KeywordRules, PathInferenceEngine
+from src.extractors.scan_manifest import ScanManifest
 from src.extractors.udm_transformer import UdmTransformer, TransformResult
 from src.extractors.json_exporter import JsonExporter, ExportConfig, NasToUdmPipeline
 
@@ -84,6 +91,65 @@ class TestNasScanner:
 
         assert len(files) == 3
 
+    def test_scan_parallel_matches_sequential(self, temp_nas_structure):
+        """병렬 스캔 결과가 순차 스캔과 동일 (순서 포함)"""
+        sequential = list(NasScanner(str(temp_nas_structure), workers=1).scan(video_only=False))
+        parallel = list(NasScanner(str(temp_nas_structure), workers=4).scan(video_only=False))
+
+        assert [f.relative_path for f in parallel] == [f.relative_path for f in sequential]
+        assert [f.size_bytes for f in parallel] == [f.size_bytes for f in sequential]
+
+    def test_scan_matches_os_walk(self, temp_nas_structure):
+        """scandir 기반 스캔이 os.walk와 같은 파일 정보를 반환"""
+        import os
+
+        expected = {}
+        for root, _, names in os.walk(temp_nas_structure):
+            for name in names:
+                file_path = Path(root) / name
+                expected[str(file_path.relative_to(temp_nas_structure))] = (
+                    str(file_path),
+                    str(file_path.parent),
+                    file_path.stat().st_size,
+                )
+
+        files = list(NasScanner(str(temp_nas_structure)).scan(video_only=False))
+
+        assert {
+            f.relative_path: (f.path, f.folder_path, f.size_bytes) for f in files
+        } == expected
+
+    def test_scan_skips_hidden(self, temp_nas_structure):
+        """숨김 폴더/파일 제외"""
+        hidden = temp_nas_structure / ".snapshot"
+        hidden.mkdir()
+        (hidden / "WCLA24-99.mp4").write_bytes(b"hidden")
+        (temp_nas_structure / "HCL" / ".HCL_2024_EP99.mp4").write_bytes(b"hidden")
+
+        files = list(NasScanner(str(temp_nas_structure)).scan())
+        assert len(files) == 7
+
+        files = list(NasScanner(str(temp_nas_structure), include_hidden=True).scan())
+        assert len(files) == 9
+
+    def test_scan_max_files_parallel(self, temp_nas_structure):
+        """병렬 스캔에서도 최대 파일 수 제한"""
+        scanner = NasScanner(str(temp_nas_structure), workers=4)
+        files = list(scanner.scan(max_files=3))
+
+        assert len(files) == 3
+
+    def test_scan_progress(self, temp_nas_structure):
+        """진행 상황 기록"""
+        progress = ScanProgress()
+        files = list(NasScanner(str(temp_nas_structure)).scan(video_only=False, progress=progress))
+        progress.finish()
+
+        assert progress.files_seen == len(files) == 9
+        assert progress.dirs_scanned == 6
+        assert not progress.is_running
+        assert progress.files_per_sec > 0
+
     def test_scan_with_stats(self, temp_nas_structure):
         """통계와 함께 스캔"""
         scanner = NasScanner(str(temp_nas_structure))
@@ -95,6 +161,23 @@ class TestNasScanner:
         assert result.folders_scanned > 0
         assert result.total_size_bytes > 0
 
+    def test_scan_with_stats_records_listing_errors(self, temp_nas_structure, monkeypatch):
+        """목록 조회 실패 디렉토리는 ScanResult.errors에 기록"""
+        scandir = os.scandir
+        hcl = str(temp_nas_structure / "HCL")
+
+        def failing(path):
+            if os.fspath(path) == hcl:
+                raise PermissionError(13, "Permission denied")
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", failing)
+
+        files, result = NasScanner(str(temp_nas_structure), workers=2).scan_with_stats()
+
+        assert len(files) == 5
+        assert len(result.errors) == 1 and hcl in result.errors[0]
+
     def test_brand_inference(self, temp_nas_structure):
         """브랜드 추론 테스트"""
         scanner = NasScanner(str(temp_nas_structure))
@@ -149,6 +232,314 @@ class TestNasScanner:
         assert len(tree["children"]) > 0
 
 
+class TestScanDelta:
+    """매니페스트 기반 증분 스캔 테스트"""
+
+    @pytest.fixture
+    def nas(self, tmp_path):
+        root = tmp_path / "nas"
+        (root / "WSOP" / "STREAM").mkdir(parents=True)
+        (root / "WSOP" / "STREAM" / "STREAM_01.mp4").write_bytes(b"a" * 100)
+        (root / "WSOP" / "STREAM" / "STREAM_02.mp4").write_bytes(b"b" * 100)
+        (root / "HCL").mkdir()
+        (root / "HCL" / "HCL_2024_EP01.mp4").write_bytes(b"c" * 100)
+        (root / "HCL" / "notes.txt").write_text("notes")
+        return root
+
+    @pytest.fixture
+    def manifest(self, tmp_path, nas):
+        m = ScanManifest(str(tmp_path / "manifest.db"), root_path=str(nas))
+        yield m
+        m.close()
+
+    def _bump_mtime(self, path: Path):
+        """디렉토리 mtime을 확실히 변경 (파일시스템 해상도 대비)"""
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000_000))
+
+    def test_first_scan_adds_all(self, nas, manifest):
+        delta = NasScanner(str(nas), workers=2).scan_delta(manifest)
+
+        assert len(delta.added) == 3
+        assert delta.modified == []
+        assert delta.deleted == []
+        assert delta.dirs_skipped == 0
+        assert manifest.summary()["total_files"] == 4
+
+    def test_rescan_skips_unchanged_dirs(self, nas, manifest):
+        scanner = NasScanner(str(nas), workers=2)
+        scanner.scan_delta(manifest)
+
+        delta = scanner.scan_delta(manifest)
+
+        assert not delta.has_changes
+        assert delta.dirs_scanned == 0
+        assert delta.dirs_skipped == 4
+        assert delta.unchanged_files == 3
+
+    def test_added_modified_deleted(self, nas, manifest):
+        scanner = NasScanner(str(nas), workers=2)
+        scanner.scan_delta(manifest)
+
+        stream = nas / "WSOP" / "STREAM"
+        (stream / "STREAM_03.mp4").write_bytes(b"d" * 100)
+        (stream / "STREAM_01.mp4").unlink()
+        (stream / "STREAM_02.mp4").write_bytes(b"b" * 200)
+        self._bump_mtime(stream)
+
+        delta = scanner.scan_delta(manifest)
+
+        assert [f.filename for f in delta.added] == ["STREAM_03.mp4"]
+        assert [f.filename for f in delta.modified] == ["STREAM_02.mp4"]
+        assert delta.deleted == [os.path.join("WSOP", "STREAM", "STREAM_01.mp4")]
+        assert delta.dirs_scanned == 1
+
+    def test_in_place_overwrite_needs_verify(self, nas, manifest):
+        scanner = NasScanner(str(nas), workers=2)
+        scanner.scan_delta(manifest)
+
+        # 기존 파일 덮어쓰기는 디렉토리 mtime을 바꾸지 않음
+        hcl_dir_mtime = (nas / "HCL").stat().st_mtime_ns
+        (nas / "HCL" / "HCL_2024_EP01.mp4").write_bytes(b"c" * 300)
+        os.utime(nas / "HCL", ns=(hcl_dir_mtime, hcl_dir_mtime))
+
+        assert not scanner.scan_delta(manifest).has_changes
+
+        delta = scanner.scan_delta(manifest, verify_files=True)
+        assert [f.filename for f in delta.modified] == ["HCL_2024_EP01.mp4"]
+        assert delta.modified[0].size_bytes == 300
+
+    def test_deleted_subtree(self, nas, manifest):
+        scanner = NasScanner(str(nas), workers=2)
+        scanner.scan_delta(manifest)
+
+        shutil.rmtree(nas / "WSOP")
+
+        delta = scanner.scan_delta(manifest)
+
+        assert sorted(delta.deleted) == [
+            os.path.join("WSOP", "STREAM", "STREAM_01.mp4"),
+            os.path.join("WSOP", "STREAM", "STREAM_02.mp4"),
+        ]
+        assert "WSOP" not in manifest.load().dirs
+        assert manifest.summary()["total_files"] == 2
+
+    def test_listing_failure_keeps_manifest(self, nas, manifest, monkeypatch):
+        """목록 조회 실패(SMB 끊김)는 삭제가 아니라 오류 → 다음 스캔에서 다시 조회"""
+        scanner = NasScanner(str(nas), workers=2)
+        scanner.scan_delta(manifest)
+
+        wsop = nas / "WSOP"
+        (wsop / "STREAM" / "STREAM_03.mp4").write_bytes(b"d" * 100)
+        self._bump_mtime(wsop)
+        self._bump_mtime(wsop / "STREAM")
+        before = manifest.load()
+
+        scandir = os.scandir
+
+        def failing(path):
+            if os.fspath(path) == str(wsop):
+                raise OSError(112, "The specified network name is no longer available")
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", failing)
+        delta = scanner.scan_delta(manifest)
+
+        assert delta.deleted == [] and delta.added == []
+        assert delta.dirs_failed == 1
+        assert len(delta.errors) == 1 and str(wsop) in delta.errors[0]
+        after = manifest.load()
+        assert after.dirs["WSOP"] == before.dirs["WSOP"]
+        assert after.files[os.path.join("WSOP", "STREAM")] == before.files[os.path.join("WSOP", "STREAM")]
+
+        # 연결 복구 후 다시 조회되어 변경이 반영됨
+        monkeypatch.setattr(os, "scandir", scandir)
+        delta = scanner.scan_delta(manifest)
+        assert [f.filename for f in delta.added] == ["STREAM_03.mp4"]
+        assert delta.deleted == [] and delta.errors == []
+
+    def test_verify_dirs_relists_only_given_dirs(self, nas, manifest):
+        scanner = NasScanner(str(nas), workers=2)
+        scanner.scan_delta(manifest)
+
+        hcl_dir_mtime = (nas / "HCL").stat().st_mtime_ns
+        (nas / "HCL" / "HCL_2024_EP01.mp4").write_bytes(b"c" * 300)
+        os.utime(nas / "HCL", ns=(hcl_dir_mtime, hcl_dir_mtime))
+
+        delta = scanner.scan_delta(manifest, verify_dirs={"HCL"})
+
+        assert [f.filename for f in delta.modified] == ["HCL_2024_EP01.mp4"]
+        assert delta.dirs_scanned == 1
+
+    def test_rename_detected_as_move(self, nas, manifest):
+        scanner = NasScanner(str(nas), workers=2)
+        scanner.scan_delta(manifest)
+
+        (nas / "HCL" / "HCL_2024_EP01.mp4").rename(nas / "WSOP" / "HCL_2024_EP01.mp4")
+
+        delta = scanner.scan_delta(manifest)
+
+        assert delta.added == []
+        assert delta.deleted == []
+        assert len(delta.moved) == 1
+        old_path, info = delta.moved[0]
+        assert old_path == os.path.join("HCL", "HCL_2024_EP01.mp4")
+        assert info.relative_path == os.path.join("WSOP", "HCL_2024_EP01.mp4")
+
+    def test_moved_directory(self, nas, manifest):
+        scanner = NasScanner(str(nas), workers=2)
+        scanner.scan_delta(manifest)
+
+        (nas / "WSOP" / "STREAM").rename(nas / "WSOP" / "LIVE")
+
+        delta = scanner.scan_delta(manifest)
+
+        assert delta.added == [] and delta.deleted == []
+        assert sorted(info.relative_path for _, info in delta.moved) == [
+            os.path.join("WSOP", "LIVE", "STREAM_01.mp4"),
+            os.path.join("WSOP", "LIVE", "STREAM_02.mp4"),
+        ]
+
+    def test_files_from_manifest(self, nas, manifest):
+        scanner = NasScanner(str(nas), workers=2)
+        scanner.scan_delta(manifest)
+
+        restored = scanner.files_from_manifest(manifest)
+        scanned = list(scanner.scan())
+
+        key = lambda f: (f.relative_path, f.size_bytes, f.inferred_brand, f.folder_path)
+        assert sorted(map(key, restored)) == sorted(map(key, scanned))
+
+    def test_manifest_reset_on_root_change(self, tmp_path, nas, manifest):
+        NasScanner(str(nas)).scan_delta(manifest)
+        manifest.close()
+
+        other = ScanManifest(str(tmp_path / "manifest.db"), root_path=str(tmp_path / "other"))
+        assert other.is_empty
+        other.close()
+
+
+class TestNasWatcher:
+    """NasWatcher 테스트"""
+
+    def _wait_for(self, events, timeout=5.0):
+        import time
+        deadline = time.time() + timeout
+        while not events and time.time() < deadline:
+            time.sleep(0.05)
+        return events
+
+    def test_polling_invokes_callback(self, tmp_path):
+        events = []
+        watcher = NasWatcher(str(tmp_path), events.append, backend="polling", poll_interval=0.05)
+        watcher.start()
+        try:
+            assert self._wait_for(events)
+            assert events[0] is None
+        finally:
+            watcher.stop()
+        assert not watcher.is_running
+
+    @pytest.mark.skipif(not inotify_supported("/tmp"), reason="inotify not available")
+    def test_inotify_reports_changed_dirs(self, tmp_path):
+        (tmp_path / "WSOP").mkdir()
+        events = []
+        watcher = NasWatcher(str(tmp_path), events.append, backend="inotify", debounce_sec=0.1)
+        watcher.start()
+        try:
+            (tmp_path / "WSOP" / "new.mp4").write_bytes(b"x")
+            assert self._wait_for(events)
+            assert "WSOP" in events[0]
+        finally:
+            watcher.stop()
+
+    @pytest.mark.skipif(not inotify_supported("/tmp"), reason="inotify not available")
+    def test_inotify_watches_new_directories(self, tmp_path):
+        events = []
+        watcher = NasWatcher(str(tmp_path), events.append, backend="inotify", debounce_sec=0.1)
+        watcher.start()
+        try:
+            (tmp_path / "NEW").mkdir()
+            assert self._wait_for(events)
+            events.clear()
+
+            (tmp_path / "NEW" / "clip.mp4").write_bytes(b"x")
+            assert self._wait_for(events)
+            assert "NEW" in set().union(*events)
+        finally:
+            watcher.stop()
+
+
+class TestPathInference:
+    """PathInferenceEngine 테스트"""
+
+    @staticmethod
+    def _reference(rules: dict, text: str):
+        """기존 방식 (키워드마다 upper + in)"""
+        text_upper = text.upper()
+        for label, keywords in rules.items():
+            for kw in keywords:
+                if kw.upper() in text_upper:
+                    return label
+        return None
+
+    @pytest.fixture
+    def corpus(self):
+        folders = [
+            "WSOP/WSOP ARCHIVE/1973", "WSOP/STREAM", "WSOPE/SUBCLIP/2024",
+            "HCL/Season 1", "HustlerCasinoLive/EPISODES", "PAD/eps", "GGM/RAW",
+            "GOG/GameOfGold/Mastered", "MPP/Clean", "misc/sub folder", "",
+        ]
+        names = [
+            "WCLA24-15.mp4", "HCL_2024_EP10.mp4", "PAD_S13_EP01.mp4", "random.mov",
+            "GGMillions_Main_Event.mp4", "gog_ep02.mp4", "wsop_stream_day1.mxf",
+            "subclip_final.mp4", "notes.txt",
+        ]
+        return [f"{folder}/{name}" if folder else name for folder in folders for name in names]
+
+    def test_matches_reference_loop(self, corpus):
+        engine = PathInferenceEngine(
+            brand=KeywordRules(NasScanner.BRAND_FOLDERS),
+            asset_type=KeywordRules(NasScanner.ASSET_TYPE_FOLDERS),
+        )
+        for path in corpus:
+            result = engine.infer(path)
+            assert result.brand == self._reference(NasScanner.BRAND_FOLDERS, path), path
+            assert result.asset_type == self._reference(NasScanner.ASSET_TYPE_FOLDERS, path), path
+
+    def test_priority_filename_before_folder_rule(self):
+        """파일명의 우선순위 높은 규칙이 폴더의 낮은 규칙보다 우선"""
+        engine = PathInferenceEngine(brand=KeywordRules({"WSOP": ["WSOP"], "HCL": ["HCL"]}))
+        assert engine.infer("HCL/WSOP_2024.mp4").brand == "WSOP"
+        assert engine.infer("WSOP/HCL_2024.mp4").brand == "WSOP"
+
+    def test_filename_first_scope(self):
+        engine = PathInferenceEngine(
+            brand=KeywordRules({"WSOP": ["WSOP"], "HCL": ["HCL"]}, scope="filename_first"),
+        )
+        assert engine.infer("WSOP/HCL_2024.mp4").brand == "HCL"
+        assert engine.infer("WSOP/clip.mp4").brand == "WSOP"
+
+    def test_filename_scope_and_default(self):
+        engine = PathInferenceEngine(
+            event_type=KeywordRules({"CIRCUIT": ["WCLA"]}, scope="filename", default="OTHER"),
+        )
+        assert engine.infer("WCLA/clip.mp4").event_type == "OTHER"
+        assert engine.infer("x/WCLA24-01.mp4").event_type == "CIRCUIT"
+
+    def test_windows_separators(self):
+        engine = PathInferenceEngine(brand=KeywordRules({"PAD": ["PAD"]}))
+        assert engine.infer("Z:\\ARCHIVE\\PAD\\clip.mp4").brand == "PAD"
+
+    def test_folder_cache(self):
+        engine = PathInferenceEngine(brand=KeywordRules({"WSOP": ["WSOP"]}))
+        for i in range(10):
+            engine.infer(f"WSOP/STREAM/clip_{i}.mp4")
+        info = engine.cache_info()
+        assert info.misses == 1
+        assert info.hits == 9
+
+
 class TestUdmTransformer:
     """UdmTransformer 테스트"""
 
@@ -263,6 +654,527 @@ class TestUdmTransformer:
         # PAD_S13_EP01 패턴은 parse_filename에서 season/episode를 추출해야 함
         # 현재는 파싱 실패 시 None이 될 수 있음
 
+    def test_trusted_matches_validated(self, sample_file_info):
+        """trusted(검증 없는 생성) 결과가 검증 경로와 동일"""
+        files = [
+            sample_file_info,
+            NasFileInfo(
+                path="/ARCHIVE/PAD/PAD_S13_EP01_GGPoker-001.mp4",
+                filename="PAD_S13_EP01_GGPoker-001.mp4",
+                extension=".mp4",
+                size_bytes=1000,
+                modified_at=datetime.now(),
+                folder_path="/ARCHIVE/PAD",
+                relative_path="PAD/PAD_S13_EP01_GGPoker-001.mp4",
+                inferred_brand="PAD",
+            ),
+            NasFileInfo(
+                path="/unknown/WCLA24-15.mp4",
+                filename="WCLA24-15.mp4",
+                extension=".mp4",
+                size_bytes=1000,
+                modified_at=datetime.now(),
+                folder_path="/unknown",
+                relative_path="unknown/WCLA24-15.mp4",
+            ),
+        ]
+
+        validated, _ = UdmTransformer().transform_batch(files)
+        trusted, result = UdmTransformer(trusted=True).transform_batch(files)
+
+        assert result.success == len(files)
+        for expected, actual in zip(validated, trusted):
+            assert actual.model_dump() == expected.model_dump()
+            assert actual.model_fields_set == expected.model_fields_set
+            assert actual.event_context.model_fields_set == expected.event_context.model_fields_set
+
+    def test_transform_batch_parallel(self):
+        """프로세스 풀 변환: 순차 변환과 결과/순서 동일"""
+        files = [
+            NasFileInfo(
+                path=f"/ARCHIVE/WSOP/WCLA24-{i:02d}.mp4",
+                filename=f"WCLA24-{i:02d}.mp4" if i != 3 else "",
+                extension=".mp4",
+                size_bytes=1000,
+                modified_at=datetime.now(),
+                folder_path="/ARCHIVE/WSOP",
+                relative_path=f"WSOP/WCLA24-{i:02d}.mp4",
+                inferred_brand="WSOP",
+            )
+            for i in range(7)
+        ]
+        transformer = UdmTransformer(trusted=True)
+
+        expected, expected_result = transformer.transform_batch(files)
+        actual, result = transformer.transform_batch(files, workers=2, chunk_size=2)
+
+        assert [a.model_dump() for a in actual] == [a.model_dump() for a in expected]
+        assert result.success == expected_result.success == 6
+        assert result.failed == 1
+        assert result.errors == expected_result.errors
+
+        # 크기를 모르는 이터레이터 입력 (스트리밍 파이프라인)
+        streamed_result = TransformResult()
+        streamed = list(transformer.iter_transform(iter(files), streamed_result, workers=2, chunk_size=3))
+        assert [a.model_dump() for a in streamed] == [a.model_dump() for a in expected]
+        assert streamed_result.failed == 1
+
+    def test_validate_assets(self, sample_file_info):
+        """trusted Asset 일괄 검증"""
+        transformer = UdmTransformer(trusted=True)
+        good = transformer.transform(sample_file_info)
+
+        bad = transformer.transform(sample_file_info)
+        bad.event_context.__dict__["year"] = 1800  # 검증 없이 잘못된 값 주입
+
+        validated, result = transformer.validate_assets([good, bad])
+
+        assert result.success == 1
+        assert result.failed == 1
+        assert len(validated) == 1
+        assert "Validation failed" in result.errors[0]
+
+
+def _box(box_type: bytes, *payloads: bytes) -> bytes:
+    payload = b"".join(payloads)
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def _build_mp4(
+    handler: bytes = b"vide",
+    fourcc: bytes = b"avc1",
+    size: tuple[int, int] = (1920, 1080),
+    moov_at_end: bool = False,
+    fragmented: bool = False,
+    audio: bytes | None = None,
+) -> bytes:
+    """테스트용 최소 MP4 (30000/1001 fps 300프레임, 10.01초)"""
+    width, height = size
+    stbl = _box(
+        b"stbl",
+        _box(b"stsd", bytes(4), struct.pack(">I", 1), _box(
+            fourcc, bytes(6), struct.pack(">H", 1), bytes(16),
+            struct.pack(">HH", width, height), bytes(50),
+        )),
+        _box(b"stts", bytes(4), struct.pack(">III", 1, 300, 1001)),
+    )
+    trak = _box(
+        b"trak",
+        _box(b"tkhd", bytes(76), struct.pack(">II", width << 16, height << 16)),
+        _box(
+            b"mdia",
+            _box(b"mdhd", bytes(4), struct.pack(">IIII", 0, 0, 30000, 300300), bytes(4)),
+            _box(b"hdlr", bytes(8), handler, bytes(13)),
+            _box(b"minf", stbl),
+        ),
+    )
+    audio_trak = _box(b"trak", _box(
+        b"mdia",
+        _box(b"hdlr", bytes(8), b"soun", bytes(13)),
+        _box(b"minf", _box(b"stbl", _box(
+            b"stsd", bytes(4), struct.pack(">I", 1), _box(audio, bytes(28)),
+        ))),
+    )) if audio else b""
+    moov = _box(
+        b"moov",
+        _box(b"mvhd", bytes(4), struct.pack(">IIII", 0, 0, 1000, 10010), bytes(80)),
+        audio_trak,
+        trak,
+        _box(b"mvex") if fragmented else b"",
+    )
+    # 64비트 크기 헤더의 mdat
+    media = b"\x00" * 4096
+    mdat = struct.pack(">I4sQ", 1, b"mdat", 16 + len(media)) + media
+    ftyp = _box(b"ftyp", b"isom", bytes(4), b"isomavc1")
+    return ftyp + (mdat + moov if moov_at_end else moov + mdat)
+
+
+class TestMp4Reader:
+    """MP4 헤더 리더 테스트"""
+
+    @pytest.mark.parametrize("moov_at_end", [False, True])
+    def test_read_video_info(self, tmp_path, moov_at_end):
+        """moov 위치와 관계없이 같은 결과 (ffprobe codec_name 형식)"""
+        from src.extractors.mp4_reader import read_mp4_info
+
+        path = tmp_path / "clip.mp4"
+        path.write_bytes(_build_mp4(moov_at_end=moov_at_end, audio=b"mp4a"))
+
+        assert read_mp4_info(str(path)) == {
+            "width": 1920,
+            "height": 1080,
+            "fps": 29.97,
+            "duration_sec": 10.01,
+            "codec": "h264",
+            "audio_codec": "aac",
+        }
+
+    def test_prores_and_audio_only(self, tmp_path):
+        from src.extractors.mp4_reader import read_mp4_info
+
+        path = tmp_path / "clip.mov"
+        path.write_bytes(_build_mp4(fourcc=b"apch", size=(3840, 2160)))
+        info = read_mp4_info(str(path))
+        assert (info["codec"], info["width"], info["height"]) == ("prores", 3840, 2160)
+
+        path.write_bytes(_build_mp4(handler=b"soun"))
+        assert read_mp4_info(str(path)) is None
+
+    @pytest.mark.parametrize("data", [
+        b"RIFF\x00\x00\x00\x00AVI LIST",
+        _build_mp4(fragmented=True),
+        _build_mp4(moov_at_end=True)[:-100],
+    ], ids=["avi", "fragmented", "truncated"])
+    def test_unreadable(self, tmp_path, data):
+        """ISO-BMFF가 아니거나 손상된 파일 / fragmented MP4"""
+        from src.extractors.mp4_reader import Mp4ParseError, read_mp4_info
+
+        path = tmp_path / "clip.mp4"
+        path.write_bytes(data)
+        with pytest.raises(Mp4ParseError):
+            read_mp4_info(str(path))
+
+    def test_service_falls_back_to_ffprobe(self, tmp_path):
+        """MP4는 헤더 리더, 그 외 형식과 읽지 못한 MP4만 ffprobe"""
+        from src.extractors.tech_spec import TechSpecService
+
+        log = tmp_path / "ffprobe.log"
+        script = tmp_path / "ffprobe"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import json, sys\n"
+            f"open({str(log)!r}, 'a').write(sys.argv[-1] + '\\n')\n"
+            "print(json.dumps({'streams': [{'codec_type': 'video', 'codec_name': 'mpeg2video',"
+            " 'width': 1920, 'height': 1080, 'r_frame_rate': '25/1'}], 'format': {}}))\n"
+        )
+        script.chmod(0o755)
+
+        files = []
+        for name, data in [
+            ("a.mp4", _build_mp4()),
+            ("b.mxf", b"mxf"),
+            ("c.mov", _build_mp4(moov_at_end=True)),
+            ("d.mp4", _build_mp4(fragmented=True)),
+        ]:
+            path = tmp_path / name
+            path.write_bytes(data)
+            files.append(NasFileInfo(
+                path=str(path), filename=name, extension=path.suffix,
+                size_bytes=len(data), modified_at=datetime.now(),
+                folder_path=str(tmp_path), relative_path=name,
+            ))
+
+        service = TechSpecService(workers=2, ffprobe=str(script))
+        specs = [spec for _, spec in service.iter_tech_specs(files)]
+
+        assert [s.codec for s in specs] == ["H.264", "MPEG-2", "H.264", "MPEG-2"]
+        assert specs[0].fps == 29.97 and specs[0].duration_sec == 10.01
+        assert (service.stats.probed, service.stats.native) == (4, 2)
+        assert sorted(Path(p).name for p in log.read_text().splitlines()) == ["b.mxf", "d.mp4"]
+
+
+class TestTechSpecService:
+    """TechSpecService 테스트 (ffprobe 대신 호출을 기록하는 스크립트 사용)"""
+
+    @pytest.fixture
+    def fake_ffprobe(self, tmp_path):
+        """파일 내용이 b"audio"면 비디오 스트림 없음, 그 외는 1080p H.264"""
+        log = tmp_path / "ffprobe.log"
+        script = tmp_path / "ffprobe"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import json, sys\n"
+            "path = sys.argv[-1]\n"
+            f"open({str(log)!r}, 'a').write(path + '\\n')\n"
+            "if open(path, 'rb').read() == b'audio':\n"
+            "    streams = [{'codec_type': 'audio', 'codec_name': 'aac'}]\n"
+            "else:\n"
+            "    streams = [{'codec_type': 'video', 'codec_name': 'h264', 'width': 1920,\n"
+            "                'height': 1080, 'r_frame_rate': '30000/1001'}]\n"
+            "print(json.dumps({'streams': streams, 'format': {'duration': '3600.5'}}))\n"
+        )
+        script.chmod(0o755)
+        return script, log
+
+    @pytest.fixture
+    def media_files(self, tmp_path):
+        files = []
+        for i in range(6):
+            path = tmp_path / "nas" / f"clip_{i}.mp4"
+            path.parent.mkdir(exist_ok=True)
+            path.write_bytes(b"audio" if i == 4 else b"video" * (i + 1))
+            stat = path.stat()
+            files.append(NasFileInfo(
+                path=str(path),
+                filename=path.name,
+                extension=".mp4",
+                size_bytes=stat.st_size,
+                modified_at=datetime.fromtimestamp(stat.st_mtime),
+                folder_path=str(path.parent),
+                relative_path=path.name,
+            ))
+        return files
+
+    def test_parse_probe_output(self):
+        """ffprobe 출력 → TechSpec 필드"""
+        from src.extractors.tech_spec import parse_probe_output, to_tech_spec
+
+        info = parse_probe_output({
+            "streams": [
+                {"codec_type": "audio", "codec_name": "aac"},
+                {"codec_type": "video", "codec_name": "prores", "width": 3840,
+                 "height": 2160, "r_frame_rate": "0/0", "avg_frame_rate": "25/1",
+                 "duration": "12.5"},
+            ],
+            "format": {},
+        })
+        file_info = NasFileInfo(
+            path="/ARCHIVE/a.mov", filename="a.mov", extension=".mov",
+            size_bytes=50 * 1024 * 1024, modified_at=datetime.now(),
+            folder_path="/ARCHIVE", relative_path="a.mov",
+        )
+
+        spec = to_tech_spec(info, file_info)
+
+        assert spec.model_dump() == {
+            "fps": 25.0,
+            "resolution": "4K",
+            "duration_sec": 12.5,
+            "file_size_mb": 50.0,
+            "codec": "ProRes",
+        }
+        assert to_tech_spec({"width": 1000, "height": 562}, file_info).resolution == "1000x562"
+        assert parse_probe_output({"streams": [{"codec_type": "audio"}]}) is None
+
+    def test_parallel_probe_and_cache(self, fake_ffprobe, media_files, tmp_path):
+        """병렬 프로브 (입력 순서 유지) 후 다시 실행하면 바뀐 파일만 프로브"""
+        from src.extractors.tech_spec import TechSpecService
+
+        script, log = fake_ffprobe
+        cache_path = str(tmp_path / "probe_cache.db")
+
+        service = TechSpecService(cache_path, workers=3, ffprobe=str(script))
+        results = list(service.iter_tech_specs(media_files))
+        service.close()
+
+        assert [f for f, _ in results] == media_files
+        specs = [spec for _, spec in results]
+        assert specs[4] is None
+        assert specs[0].model_dump(exclude={"file_size_mb"}) == {
+            "fps": 29.97, "resolution": "1080p", "duration_sec": 3600.5, "codec": "H.264",
+        }
+        assert (service.stats.probed, service.stats.failed, service.stats.cache_hits) == (6, 1, 0)
+        assert len(log.read_text().splitlines()) == 6
+
+        # 크기가 바뀐 파일 하나만 다시 프로브 (비디오 스트림 없음 결과도 캐시)
+        changed = Path(media_files[2].path)
+        changed.write_bytes(b"video" * 10)
+        media_files[2].size_bytes = changed.stat().st_size
+
+        service = TechSpecService(cache_path, workers=3, ffprobe=str(script))
+        again = [spec for _, spec in service.iter_tech_specs(media_files)]
+        service.close()
+
+        assert again[:2] == specs[:2] and again[3:] == specs[3:]
+        assert (service.stats.probed, service.stats.cache_hits) == (1, 5)
+        assert log.read_text().splitlines()[-1] == str(changed)
+
+    def test_probe_errors_not_cached(self, media_files, tmp_path):
+        """ffprobe 실행 실패는 캐시하지 않음"""
+        from src.extractors.tech_spec import TechSpecService
+
+        service = TechSpecService(str(tmp_path / "probe_cache.db"), ffprobe=str(tmp_path / "missing"))
+        assert service.get(media_files[0]) is None
+        service.cache.flush()
+
+        assert service.stats.errors == 1
+        assert len(service.cache) == 0
+        service.close()
+
+    def test_transformer_tech_spec(self, fake_ffprobe, media_files, tmp_path):
+        """변환 결과에 TechSpec 포함 (병렬 변환 워커에는 프로브 결과 전달)"""
+        script, log = fake_ffprobe
+        transformer = UdmTransformer(
+            include_tech_spec=True, trusted=True, tech_spec_cache=str(tmp_path / "probe_cache.db"),
+        )
+        transformer.tech_spec_service.ffprobe = str(script)
+
+        assets, result = transformer.transform_batch(media_files, workers=2, chunk_size=2)
+        transformer.close()
+
+        assert result.success == 6
+        assert [a.tech_spec is None for a in assets] == [False] * 4 + [True, False]
+        assert assets[0].tech_spec.resolution == "1080p"
+        assert len(log.read_text().splitlines()) == 6
+
+
+class TestMediaInfoScanner:
+    """미디어 정보 스캔 (files 테이블 + 적응형 동시 실행) 테스트"""
+
+    @pytest.fixture
+    def footage_db(self, tmp_path):
+        """MP4 2개 (moov 앞/뒤), ffprobe로 읽는 MXF 2개, 읽을 수 없는 MXF 1개"""
+        import sqlite3
+
+        nas = tmp_path / "nas"
+        nas.mkdir()
+        entries = [
+            ("a.mp4", _build_mp4(audio=b"mp4a")),
+            ("b.mov", _build_mp4(moov_at_end=True)),
+            ("c.mxf", b"video"),
+            ("d.mxf", b"audio"),
+            ("e.mxf", b"video" * 2),
+        ]
+        db_path = tmp_path / "nas_footage.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT, filename TEXT, year INTEGER)")
+        for i, (name, data) in enumerate(entries, 1):
+            (nas / name).write_bytes(data)
+            conn.execute(
+                "INSERT INTO files VALUES (?, ?, ?, ?)", (i, str(nas / name), name, 2020 + i),
+            )
+        conn.commit()
+        conn.close()
+        return str(db_path)
+
+    @pytest.fixture
+    def fake_ffprobe(self, tmp_path):
+        """파일 내용이 b"audio"면 비디오 스트림 없음, 그 외는 MPEG-2 + PCM"""
+        log = tmp_path / "ffprobe.log"
+        script = tmp_path / "ffprobe"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import json, sys\n"
+            "path = sys.argv[-1]\n"
+            f"open({str(log)!r}, 'a').write(path + '\\n')\n"
+            "streams = [{'codec_type': 'audio', 'codec_name': 'pcm_s24le'}]\n"
+            "if open(path, 'rb').read() != b'audio':\n"
+            "    streams.append({'codec_type': 'video', 'codec_name': 'mpeg2video', 'width': 1920,\n"
+            "                    'height': 1080, 'r_frame_rate': '25/1'})\n"
+            "print(json.dumps({'streams': streams,\n"
+            "                  'format': {'duration': '60.0', 'bit_rate': '50000000'}}))\n"
+        )
+        script.chmod(0o755)
+        return script, log
+
+    @staticmethod
+    def _pending(db_path):
+        import sqlite3
+        from src.extractors.media_scan import ensure_media_columns, pending_files
+
+        conn = sqlite3.connect(db_path)
+        ensure_media_columns(conn)
+        files = pending_files(conn)
+        conn.close()
+        return files
+
+    def test_scan_and_resume(self, footage_db, fake_ffprobe):
+        """결과가 files 행에 기록되고, 다시 실행하면 스캔할 파일 없음"""
+        import sqlite3
+        from src.extractors.media_scan import MediaInfoScanner, media_scan_stats
+
+        script, log = fake_ffprobe
+        files = self._pending(footage_db)
+        assert [f[2] for f in files] == ["e.mxf", "d.mxf", "c.mxf", "b.mov", "a.mp4"]
+
+        stats = MediaInfoScanner(footage_db, ffprobe=str(script)).run(files)
+
+        assert (stats.total, stats.scanned, stats.native, stats.failed, stats.errors) == (5, 4, 2, 1, 0)
+        assert sorted(Path(p).name for p in log.read_text().splitlines()) == ["c.mxf", "d.mxf", "e.mxf"]
+
+        conn = sqlite3.connect(footage_db)
+        rows = {
+            row[0]: row[1:]
+            for row in conn.execute(
+                "SELECT filename, duration_sec, video_codec, audio_codec, resolution, "
+                "bitrate, fps, media_scanned FROM files"
+            )
+        }
+        mp4_size = len(_build_mp4(audio=b"mp4a"))
+        assert rows["a.mp4"] == (10.01, "h264", "aac", "1920x1080", int(mp4_size * 8 / 10.01), 29.97, 1)
+        assert rows["c.mxf"] == (60.0, "mpeg2video", "pcm_s24le", "1920x1080", 50000000, 25.0, 1)
+        assert rows["d.mxf"][-1] == -1
+        assert media_scan_stats(conn) == {
+            "total": 5, "scanned": 4, "failed": 1, "with_duration": 4, "remaining": 0,
+        }
+        conn.close()
+
+        assert self._pending(footage_db) == []
+
+    def test_interrupted_scan_keeps_results(self, footage_db, fake_ffprobe, tmp_path):
+        """중단돼도 완료된 결과는 기록되고, 실행 실패는 다음 실행에서 다시 시도"""
+        from src.extractors.media_scan import AdaptiveLimiter, MediaInfoScanner
+
+        script, _ = fake_ffprobe
+        files = self._pending(footage_db)
+
+        def interrupt(done, total, probe):
+            if done == 3:
+                raise KeyboardInterrupt
+
+        scanner = MediaInfoScanner(
+            footage_db, limiter=AdaptiveLimiter(initial=1), ffprobe=str(script), batch_size=2,
+        )
+        with pytest.raises(KeyboardInterrupt):
+            scanner.run(files, progress=interrupt)
+
+        remaining = self._pending(footage_db)
+        assert [f[2] for f in remaining] == ["b.mov", "a.mp4"]
+
+        # ffprobe 실행 실패 (일시적 오류): media_scanned = 0 유지
+        stats = MediaInfoScanner(footage_db, ffprobe=str(tmp_path / "missing"), native=False).run(remaining)
+        assert (stats.scanned, stats.errors) == (0, 2)
+        assert self._pending(footage_db) == remaining
+
+        stats = MediaInfoScanner(footage_db, ffprobe=str(script)).run(remaining)
+        assert (stats.scanned, stats.native) == (2, 2)
+        assert self._pending(footage_db) == []
+
+    def test_adaptive_limiter(self):
+        """지연/오류가 기준 이내면 1씩 증가, 넘으면 절반"""
+        from src.extractors.media_scan import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter(initial=4, max_limit=6, window=4)
+        for _ in range(3 * 4):
+            limiter.record(0.1)
+        assert limiter.history == [4, 5, 6, 6]
+
+        for _ in range(4):
+            limiter.record(0.5)  # 기준(0.1)의 2배 초과
+        assert limiter.limit == 3
+
+        for latency, error in [(0.1, True), (0.1, False), (0.1, False), (0.1, False)]:
+            limiter.record(latency, error)  # 오류율 25%
+        assert limiter.limit == 1
+
+        for _ in range(4):
+            limiter.record(0.1)
+        assert limiter.history[-1] == 2
+
+    def test_limiter_bounds_concurrency(self):
+        """동시에 실행되는 작업 수가 limit을 넘지 않음"""
+        import asyncio
+        from src.extractors.media_scan import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter(initial=3)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            await limiter.acquire()
+            try:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+            finally:
+                await limiter.release()
+
+        async def main():
+            await asyncio.gather(*(work() for _ in range(12)))
+
+        asyncio.run(main())
+        assert peak == 3
+        assert limiter.in_flight == 0
+
 
 class TestJsonExporter:
     """JsonExporter 테스트"""
@@ -347,6 +1259,207 @@ class TestJsonExporter:
             data = json.loads(line)
             assert "asset_uuid" in data
 
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_export_json_streaming_layout(self, sample_assets, tmp_path, indent):
+        """스트리밍 JSON: json.dump 결과와 같은 내용, 헤더 전체 수 채움"""
+        config = ExportConfig(
+            output_dir=str(tmp_path),
+            format="json",
+            include_timestamp=False,
+            indent=indent,
+        )
+        exporter = JsonExporter(config)
+
+        # 이터레이터로 전달 (목록 없이 한 번만 순회)
+        result = exporter.export(iter(sample_assets), metadata={"note": "한글"})
+
+        assert result.success
+        assert result.total_assets == 2
+        assert result.stats.brand_counts == {"WSOP": 1, "HCL": 1}
+
+        with open(result.output_files[0], encoding="utf-8") as f:
+            data = json.load(f)
+
+        assert data["_metadata"]["total_assets"] == 2
+        assert data["_metadata"]["total_segments"] == 0
+        assert data["_metadata"]["custom"] == {"note": "한글"}
+        assert data["assets"] == [
+            a.model_dump(mode="json", exclude_none=True) for a in sample_assets
+        ]
+
+    def test_export_json_empty(self, tmp_path):
+        """Asset이 없을 때도 올바른 JSON"""
+        exporter = JsonExporter(ExportConfig(output_dir=str(tmp_path), include_timestamp=False))
+
+        result = exporter.export(iter([]))
+
+        with open(result.output_files[0], encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["assets"] == []
+        assert data["_metadata"]["total_assets"] == 0
+
+    def test_export_jsonl_shards(self, sample_assets, tmp_path):
+        """chunk_size 기준 JSONL 샤드 분할 + 매니페스트"""
+        from src.extractors.json_exporter import verify_export_manifest
+
+        config = ExportConfig(
+            output_dir=str(tmp_path),
+            format="jsonl",
+            include_timestamp=False,
+            chunk_size=2,
+        )
+        exporter = JsonExporter(config)
+
+        result = exporter.export(sample_assets * 3)
+
+        assert result.success
+        assert [Path(f).name for f in result.output_files] == [
+            "udm_export_0001.jsonl", "udm_export_0002.jsonl", "udm_export_0003.jsonl",
+        ]
+
+        with open(result.manifest_file, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        assert manifest["total_assets"] == 6
+        assert [s["assets"] for s in manifest["shards"]] == [2, 2, 2]
+        assert sum(s["bytes"] for s in manifest["shards"]) == result.file_size_bytes
+        assert verify_export_manifest(result.manifest_file) == []
+
+        # 손상된 샤드 감지
+        Path(result.output_files[1]).write_text("{}\n")
+        assert verify_export_manifest(result.manifest_file) == ["udm_export_0002.jsonl"]
+
+    def test_export_jsonl_size_limit(self, sample_assets, tmp_path):
+        """max_file_size_mb 기준 샤드 분할"""
+        config = ExportConfig(
+            output_dir=str(tmp_path),
+            format="jsonl",
+            include_timestamp=False,
+            chunk_size=0,
+            max_file_size_mb=1,
+        )
+        exporter = JsonExporter(config)
+        line_size = len(exporter._dump_asset(sample_assets[0])) + 1
+        count = (1024 * 1024 // line_size) + 10
+
+        result = exporter.export([sample_assets[0]] * count)
+
+        assert len(result.output_files) == 2
+        for f in result.output_files:
+            assert Path(f).stat().st_size <= 1024 * 1024
+
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_export_json_gzip(self, sample_assets, tmp_path, indent):
+        """gzip 압축 JSON: 투명 읽기 시 같은 내용, _metadata는 assets 뒤"""
+        from src.extractors.compression import read_compressed
+
+        config = ExportConfig(
+            output_dir=str(tmp_path),
+            format="json",
+            include_timestamp=False,
+            indent=indent,
+            compression="gzip",
+        )
+        result = JsonExporter(config).export(iter(sample_assets))
+
+        assert result.success
+        output_file = Path(result.output_files[0])
+        assert output_file.name == "udm_export.json.gz"
+
+        data = json.loads(read_compressed(output_file))
+        assert list(data) == ["assets", "_metadata"]
+        assert data["_metadata"]["total_assets"] == 2
+        assert data["assets"] == [
+            a.model_dump(mode="json", exclude_none=True) for a in sample_assets
+        ]
+
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_export_json_failure_removes_file(self, sample_assets, tmp_path, compression):
+        """이터레이터가 중간에 실패하면 잘린 파일을 남기지 않음"""
+        config = ExportConfig(
+            output_dir=str(tmp_path),
+            format="json",
+            include_timestamp=False,
+            compression=compression,
+        )
+
+        def failing_assets():
+            yield sample_assets[0]
+            raise RuntimeError("source failed")
+
+        result = JsonExporter(config).export(failing_assets())
+
+        assert not result.success
+        assert result.errors == ["source failed"]
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_stream_read_export(self, sample_assets, tmp_path, compression):
+        """내보낸 파일을 Asset 단위로 다시 읽기 (바이트 위치로 원본 재조회)"""
+        from src.extractors.compression import open_compressed
+        from src.extractors.json_stream import JsonArrayReader
+
+        config = ExportConfig(
+            output_dir=str(tmp_path), format="json", include_timestamp=False, compression=compression,
+        )
+        output_file = JsonExporter(config).export(iter(sample_assets)).output_files[0]
+
+        with open_compressed(output_file) as f:
+            reader = JsonArrayReader(f, "assets", chunk_size=64)
+            items = list(reader)
+
+        expected = [a.model_dump(mode="json", exclude_none=True) for a in sample_assets]
+        assert [item.value for item in items] == expected
+        assert reader.members["_metadata"]["total_assets"] == 2
+        if compression is None:
+            data = Path(output_file).read_bytes()
+            assert [json.loads(data[i.offset:i.offset + i.length]) for i in items] == expected
+
+    def test_export_jsonl_gzip_shards(self, sample_assets, tmp_path):
+        """gzip 압축 JSONL 샤드: 매니페스트는 압축 파일 기준으로 검증"""
+        from src.extractors.compression import read_compressed
+        from src.extractors.json_exporter import verify_export_manifest
+
+        config = ExportConfig(
+            output_dir=str(tmp_path),
+            format="jsonl",
+            include_timestamp=False,
+            chunk_size=2,
+            compression="gzip",
+        )
+        result = JsonExporter(config).export(sample_assets * 2)
+
+        assert [Path(f).name for f in result.output_files] == [
+            "udm_export_0001.jsonl.gz", "udm_export_0002.jsonl.gz",
+        ]
+        lines = read_compressed(result.output_files[0]).splitlines()
+        assert [json.loads(line)["file_name"] for line in lines] == [
+            "STREAM_01.mp4", "HCL_2024_EP01.mp4",
+        ]
+
+        with open(result.manifest_file, encoding="utf-8") as f:
+            manifest = json.load(f)
+        assert manifest["compression"] == "gzip"
+        assert sum(s["bytes"] for s in manifest["shards"]) == result.file_size_bytes
+        assert all(s["uncompressed_bytes"] > 0 for s in manifest["shards"])
+        assert verify_export_manifest(result.manifest_file) == []
+
+    def test_export_jsonl_zstd(self, sample_assets, tmp_path):
+        """zstd 압축 JSONL (zstandard 설치 시)"""
+        pytest.importorskip("zstandard")
+        from src.extractors.compression import read_compressed
+
+        config = ExportConfig(
+            output_dir=str(tmp_path),
+            format="jsonl",
+            include_timestamp=False,
+            compression="zstd",
+        )
+        result = JsonExporter(config).export(sample_assets)
+
+        assert Path(result.output_files[0]).name == "udm_export_0001.jsonl.zst"
+        assert len(read_compressed(result.output_files[0]).splitlines()) == 2
+
     def test_export_schema(self, tmp_path):
         """스키마 내보내기 테스트"""
         config = ExportConfig(output_dir=str(tmp_path))
@@ -378,6 +1491,270 @@ class TestJsonExporter:
         assert "WSOP" in summary["brand_distribution"]
 
 
+class TestSerializer:
+    """JSON 직렬화 백엔드 테스트"""
+
+    SAMPLE = {"name": "한글", "count": 3, "nested": {"items": [1, 2.5, None, True]}, 7: "int key"}
+
+    def test_stdlib_roundtrip(self):
+        """표준 json 백엔드"""
+        from src.extractors.serializer import get_serializer
+
+        serializer = get_serializer("stdlib")
+        data = serializer.dumps(self.SAMPLE)
+
+        assert isinstance(data, bytes)
+        assert "한글".encode() in data
+        assert serializer.loads(data)["7"] == "int key"
+
+    def test_orjson_matches_stdlib(self):
+        """orjson 백엔드: 표준 json과 같은 내용"""
+        pytest.importorskip("orjson")
+        from src.extractors.serializer import get_serializer
+
+        stdlib = get_serializer("stdlib")
+        fast = get_serializer("orjson")
+
+        for indent in (None, 2, 4):
+            assert fast.loads(fast.dumps(self.SAMPLE, indent=indent)) == stdlib.loads(
+                stdlib.dumps(self.SAMPLE, indent=indent)
+            )
+        # orjson 미지원 옵션은 표준 json으로 처리
+        assert fast.dumps(self.SAMPLE, ensure_ascii=True) == stdlib.dumps(self.SAMPLE, ensure_ascii=True)
+
+    @pytest.mark.parametrize("backend", ["stdlib", "orjson"])
+    def test_export_with_backend(self, backend, tmp_path):
+        """백엔드와 관계없이 같은 내보내기 결과"""
+        if backend == "orjson":
+            pytest.importorskip("orjson")
+        from src.models.udm import Brand, generate_minimal_asset
+
+        assets = [generate_minimal_asset("a.mp4", 2024, Brand.WSOP, "NAS_WSOP_2024")]
+        config = ExportConfig(output_dir=str(tmp_path), include_timestamp=False, serializer=backend)
+
+        result = JsonExporter(config).export(assets)
+
+        with open(result.output_files[0], encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["assets"] == [assets[0].model_dump(mode="json", exclude_none=True)]
+        assert data["_metadata"]["total_assets"] == 1
+
+
+class TestJsonArrayReader:
+    """증분 JSON 읽기 테스트"""
+
+    DOC = {
+        "_metadata": {"total_assets": 3},
+        "assets": [{"file_name": "한글_1.mp4", "n": 1.5e3}, {"file_name": "a\"b\\c"}, {"x": [None, True]}],
+        "tail": 12345,
+    }
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+    def test_chunk_boundaries(self, chunk_size):
+        """값/멀티바이트 문자가 청크 경계에 걸쳐도 같은 결과"""
+        import io
+        from src.extractors.json_stream import JsonArrayReader
+
+        data = json.dumps(self.DOC, ensure_ascii=False, indent=2).encode("utf-8")
+        reader = JsonArrayReader(io.BytesIO(data), "assets", chunk_size=chunk_size)
+        items = list(reader)
+
+        assert [item.value for item in items] == self.DOC["assets"]
+        assert [json.loads(data[i.offset:i.offset + i.length]) for i in items] == self.DOC["assets"]
+        assert reader.members == {"_metadata": {"total_assets": 3}, "tail": 12345}
+        assert reader.offset == len(data)
+
+    @pytest.mark.parametrize("data", [
+        b'{"assets": [{"a": 1},',
+        b'{"assets": [1 2]}',
+        b'[{"a": 1}]',
+        b'{"assets": []} {}',
+    ], ids=["truncated", "missing-comma", "not-object", "trailing"])
+    def test_invalid_document(self, data):
+        import io
+        from src.extractors.json_stream import JsonArrayReader, JsonStreamError
+
+        with pytest.raises(JsonStreamError):
+            list(JsonArrayReader(io.BytesIO(data), "assets", chunk_size=4))
+
+
+class TestDeltaExporter:
+    """델타(변경셋) 내보내기 테스트"""
+
+    @staticmethod
+    def _asset(name: str, year: int = 2024):
+        from src.extractors.udm_transformer import UdmTransformer
+        from src.models.udm import Brand, generate_minimal_asset
+
+        asset = generate_minimal_asset(name, year, Brand.WSOP, "NAS_WSOP")
+        asset.asset_uuid = UdmTransformer()._uuid_for_path(f"/ARCHIVE/{name}")
+        return asset
+
+    @staticmethod
+    def _read(result) -> list[dict]:
+        with open(result.output_files[0], encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_added_changed_removed(self, tmp_path):
+        """첫 실행은 전체 추가, 이후에는 바뀐 Asset만"""
+        from src.extractors.delta_exporter import DeltaExporter
+
+        config = ExportConfig(output_dir=str(tmp_path), include_timestamp=False)
+
+        first = DeltaExporter(config).export([self._asset("a.mp4"), self._asset("b.mp4")])
+        assert first.success
+        assert first.base_generated_at is None
+        assert [line["op"] for line in self._read(first)] == ["added", "added"]
+
+        # 같은 내용 → 변경 없음 (빈 변경셋)
+        same = DeltaExporter(config).export([self._asset("a.mp4"), self._asset("b.mp4")])
+        assert same.changes.unchanged == 2
+        assert same.changes.total_changes == 0
+        assert self._read(same) == []
+
+        # a 변경, b 삭제, c 추가
+        changed_a = self._asset("a.mp4", year=2023)
+        delta = DeltaExporter(config).export([changed_a, self._asset("c.mp4")])
+        lines = {line["op"]: line for line in self._read(delta)}
+
+        assert (delta.changes.added, delta.changes.changed, delta.changes.removed) == (1, 1, 1)
+        assert lines["changed"]["asset"]["event_context"]["year"] == 2023
+        assert lines["added"]["asset"]["file_name"] == "c.mp4"
+        assert lines["removed"]["asset_uuid"] == str(self._asset("b.mp4").asset_uuid)
+        assert delta.base_generated_at is not None
+
+        with open(delta.manifest_file, encoding="utf-8") as f:
+            index = json.load(f)
+        assert index["total_assets"] == 2
+        assert index["changes"] == {"added": 1, "changed": 1, "removed": 1, "unchanged": 0}
+
+    def test_failed_run_keeps_index(self, tmp_path):
+        """중간에 실패하면 인덱스를 바꾸지 않고 변경셋도 남기지 않음"""
+        from src.extractors.delta_exporter import DeltaExporter
+
+        config = ExportConfig(output_dir=str(tmp_path), include_timestamp=False)
+        exporter = DeltaExporter(config)
+        exporter.export([self._asset("a.mp4")])
+        index_before = exporter.index_file.read_bytes()
+
+        def failing():
+            yield self._asset("b.mp4")
+            raise RuntimeError("scan aborted")
+
+        result = exporter.export(failing())
+
+        assert not result.success
+        assert exporter.index_file.read_bytes() == index_before
+        # 첫 실행의 변경셋만 남음 (실패한 실행의 파일은 삭제)
+        assert [p.name for p in tmp_path.glob("*_changeset.jsonl")] == ["udm_export_changeset.jsonl"]
+
+    @pytest.mark.parametrize("include_timestamp", [False, True])
+    def test_back_to_back_exports_keep_changesets(self, tmp_path, include_timestamp):
+        """같은 초에 연속 실행해도 이전 변경셋을 덮어쓰지 않음"""
+        from src.extractors.delta_exporter import DeltaExporter
+
+        config = ExportConfig(output_dir=str(tmp_path), include_timestamp=include_timestamp)
+        first = DeltaExporter(config).export([self._asset("a.mp4")])
+        second = DeltaExporter(config).export([self._asset("a.mp4"), self._asset("b.mp4")])
+        third = DeltaExporter(config).export([self._asset("b.mp4")])
+
+        files = [r.output_files[0] for r in (first, second, third)]
+        assert len(set(files)) == 3
+        assert [[line["op"] for line in self._read(r)] for r in (first, second, third)] == [
+            ["added"], ["added"], ["removed"],
+        ]
+
+        with open(third.manifest_file, encoding="utf-8") as f:
+            assert json.load(f)["changeset"] == Path(files[2]).name
+
+
+class TestColumnarExporter:
+    """Parquet / Arrow IPC 내보내기 테스트 (pyarrow 설치 시)"""
+
+    @pytest.fixture
+    def sample_assets(self):
+        """세그먼트가 있는 Asset 포함 샘플"""
+        from uuid import uuid4
+        from src.models.udm import (
+            Asset, AssetType, Brand, EventContext, PlayerInHand, Segment, SituationFlags,
+        )
+
+        asset_uuid = uuid4()
+        return [
+            Asset(
+                asset_uuid=asset_uuid,
+                file_name="WSOP_2024_ME01.mp4",
+                asset_type=AssetType.STREAM,
+                event_context=EventContext(year=2024, brand=Brand.WSOP, season=3),
+                source_origin="NAS_WSOP_2024",
+                segments=[
+                    Segment(
+                        parent_asset_uuid=asset_uuid,
+                        time_in_sec=10.0,
+                        time_out_sec=95.5,
+                        players=[PlayerInHand(name="Phil Ivey", is_winner=True)],
+                        tags_action=["bluff", "hero-call"],
+                        situation_flags=SituationFlags(is_cooler=True),
+                    ),
+                ],
+            ),
+            Asset(
+                asset_uuid=uuid4(),
+                file_name="HCL_2024_EP01.mp4",
+                asset_type=AssetType.SUBCLIP,
+                event_context=EventContext(year=2024, brand=Brand.HCL),
+                source_origin="NAS_HCL_2024",
+            ),
+        ]
+
+    @pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+    def test_export_tables(self, sample_assets, tmp_path, fmt):
+        """assets / segments 평탄화 테이블, Enum은 딕셔너리 인코딩"""
+        pa = pytest.importorskip("pyarrow")
+        from src.extractors.columnar_exporter import (
+            ColumnarExportConfig, ColumnarExporter, read_columnar,
+        )
+
+        config = ColumnarExportConfig(
+            format=fmt, output_dir=str(tmp_path), include_timestamp=False, batch_size=1,
+        )
+        result = ColumnarExporter(config).export(iter(sample_assets), metadata={"note": "한글"})
+
+        assert result.success, result.errors
+        assert [Path(f).name for f in result.output_files] == [
+            f"udm_export_assets.{fmt}", f"udm_export_segments.{fmt}",
+        ]
+        assert result.total_assets == 2
+        assert result.total_segments == 1
+
+        assets = read_columnar(result.output_files[0], columns=["event_context.brand", "segment_count"])
+        assert assets.column_names == ["event_context.brand", "segment_count"]
+        assert pa.types.is_dictionary(assets.schema.field("event_context.brand").type)
+        assert assets.to_pydict() == {"event_context.brand": ["WSOP", "HCL"], "segment_count": [1, 0]}
+        assert json.loads(assets.schema.metadata[b"udm_metadata"])["custom"] == {"note": "한글"}
+
+        (segment,) = read_columnar(result.output_files[1]).to_pylist()
+        assert segment["parent_asset_uuid"] == str(sample_assets[0].asset_uuid)
+        assert (segment["time_in_sec"], segment["time_out_sec"]) == (10.0, 95.5)
+        assert segment["players"][0]["name"] == "Phil Ivey"
+        assert segment["tags_action"] == ["bluff", "hero-call"]
+        assert segment["situation_flags.is_cooler"] is True
+
+    def test_empty_export(self, tmp_path):
+        """Asset이 없어도 스키마가 있는 빈 테이블"""
+        pytest.importorskip("pyarrow")
+        from src.extractors.columnar_exporter import (
+            ColumnarExportConfig, ColumnarExporter, read_columnar,
+        )
+
+        config = ColumnarExportConfig(output_dir=str(tmp_path), include_timestamp=False)
+        result = ColumnarExporter(config).export([])
+
+        table = read_columnar(result.output_files[0])
+        assert table.num_rows == 0
+        assert "tech_spec.duration_sec" in table.column_names
+
+
 class TestNasToUdmPipeline:
     """전체 파이프라인 테스트"""
 
@@ -427,6 +1804,170 @@ class TestNasToUdmPipeline:
         output_files = list(output_dir.glob("*.json"))
         assert len(output_files) >= 2  # export + schema + summary
 
+    def test_pipeline_delta(self, temp_nas_and_output):
+        """delta 모드: 두 번째 실행은 새 파일만 변경셋에 기록"""
+        nas_dir, output_dir = temp_nas_and_output
+
+        first = NasToUdmPipeline(str(nas_dir), str(output_dir), delta=True).run()
+        assert first["delta"]["added"] == 3
+
+        (nas_dir / "HCL" / "HCL_2024_EP02.mp4").write_bytes(b"video" * 10)
+        second = NasToUdmPipeline(str(nas_dir), str(output_dir), delta=True).run()
+
+        assert second["delta"]["added"] == 1
+        assert second["delta"]["unchanged"] == 3
+        assert second["delta"]["removed"] == 0
+
+    @pytest.mark.parametrize("export_format", ["json", "jsonl"])
+    def test_pipeline_streaming_matches_sequential(self, temp_nas_and_output, tmp_path, export_format):
+        """streaming 모드: 순차 실행과 같은 Asset, 단계별 통계 포함"""
+        nas_dir, output_dir = temp_nas_and_output
+
+        def exported(out, **kwargs):
+            pipeline = NasToUdmPipeline(str(nas_dir), str(out), export_format=export_format, **kwargs)
+            result = pipeline.run()
+            assets = []
+            for path in result["export"]["files"]:
+                if path.endswith(".jsonl"):
+                    assets += [json.loads(line) for line in Path(path).read_text().splitlines()]
+                elif "udm_export" in path and path.endswith(".json") and "manifest" not in path:
+                    assets += json.loads(Path(path).read_text())["assets"]
+            return result, sorted(assets, key=lambda a: a["asset_uuid"])
+
+        sequential, expected = exported(output_dir / "seq")
+        streaming, actual = exported(output_dir / "stream", streaming=True, batch_size=1, queue_size=1)
+
+        assert len(actual) == 3
+        assert actual == expected
+        assert streaming["transform"] == sequential["transform"]
+        assert streaming["scan"]["video_files"] == 3
+
+        stages = streaming["pipeline"]["stages"]
+        assert [stages[name]["items"] for name in ("scan", "transform", "export")] == [3, 3, 3]
+        assert streaming["pipeline"]["queues"]["scan_to_transform"]["max_depth"] <= 1
+
+    def test_pipeline_streaming_propagates_errors(self, temp_nas_and_output, monkeypatch):
+        """streaming 모드: 스캔 단계 예외가 run()에서 다시 발생"""
+        nas_dir, output_dir = temp_nas_and_output
+        pipeline = NasToUdmPipeline(str(nas_dir), str(output_dir), streaming=True)
+
+        def broken_scan(result, **kwargs):
+            yield from []
+            raise OSError("NAS unreachable")
+
+        monkeypatch.setattr(pipeline.scanner, "iter_scan_with_stats", broken_scan)
+
+        with pytest.raises(OSError, match="NAS unreachable"):
+            pipeline.run()
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_pipeline_resume(self, tmp_path, monkeypatch, streaming):
+        """중단 후 resume: 중단 없이 실행한 것과 같은 매니페스트"""
+        nas_dir = tmp_path / "nas"
+        for folder in ("WSOP/STREAM", "WSOP/SUBCLIP", "HCL/2024", "PAD"):
+            (nas_dir / folder).mkdir(parents=True)
+            for i in range(3):
+                (nas_dir / folder / f"clip_{i}.mp4").write_bytes(b"video" * (i + 1))
+
+        def pipeline(out):
+            p = NasToUdmPipeline(
+                str(nas_dir), str(out), export_format="jsonl", streaming=streaming, batch_size=1,
+            )
+            p.exporter.config.chunk_size = 2
+            return p
+
+        def manifest(result) -> dict:
+            path = next(f for f in result["export"]["files"] if f.endswith("_manifest.json"))
+            data = json.loads(Path(path).read_text())
+            for shard in data["shards"]:
+                shard["file"] = shard["file"][-10:]  # run id 제외 (_0001.jsonl)
+            return {k: data[k] for k in ("total_assets", "total_segments", "total_bytes", "custom", "shards")}
+
+        expected = manifest(pipeline(tmp_path / "full").run())
+
+        # 7번째 Asset에서 중단
+        interrupted = pipeline(tmp_path / "out")
+        original = interrupted.transformer.iter_transform
+
+        def failing(files, *args, **kwargs):
+            for i, asset in enumerate(original(files, *args, **kwargs)):
+                if i == 6:
+                    raise OSError("SMB connection lost")
+                yield asset
+
+        monkeypatch.setattr(interrupted.transformer, "iter_transform", failing)
+        if streaming:
+            with pytest.raises(OSError):
+                interrupted.run()
+            from src.extractors.checkpoint import pending_runs
+            (run_id,) = pending_runs(tmp_path / "out")
+        else:
+            first = interrupted.run()
+            assert not first["export"]["success"]
+            run_id = first["run"]["run_id"]
+            assert first["run"]["checkpoint"]
+
+        resumed = pipeline(tmp_path / "out").run(resume=run_id)
+
+        assert resumed["export"]["success"]
+        assert resumed["run"] == {"run_id": run_id, "checkpoint": None}
+        assert resumed["transform"]["success"] == 12 - 4  # 닫힌 샤드 2개(4건) 이후만 변환
+        assert manifest(resumed) == expected
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_pipeline_scan_errors_keep_checkpoint(self, tmp_path, monkeypatch, streaming):
+        """목록 조회 실패(SMB 끊김)가 있으면 실패 처리하고 체크포인트 유지 → resume으로 복구"""
+        nas_dir = tmp_path / "nas"
+        for folder in ("WSOP", "HCL", "PAD"):
+            (nas_dir / folder).mkdir(parents=True)
+            for i in range(2):
+                (nas_dir / folder / f"clip_{i}.mp4").write_bytes(b"video" * (i + 1))
+
+        def pipeline():
+            return NasToUdmPipeline(
+                str(nas_dir), str(tmp_path / "out"), export_format="jsonl", streaming=streaming,
+            )
+
+        scandir = os.scandir
+
+        def failing(path):
+            if os.fspath(path) == str(nas_dir / "HCL"):
+                raise PermissionError(13, "Permission denied")
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", failing)
+        first = pipeline().run()
+
+        assert not first["export"]["success"]
+        assert len(first["scan"]["errors"]) == 1
+        assert first["run"]["checkpoint"]
+
+        monkeypatch.setattr(os, "scandir", scandir)
+        resumed = pipeline().run(resume=first["run"]["run_id"])
+
+        assert resumed["export"]["success"]
+        assert resumed["scan"]["errors"] == []
+        assert resumed["run"]["checkpoint"] is None
+        manifest = next(f for f in resumed["export"]["files"] if f.endswith("_manifest.json"))
+        assert json.loads(Path(manifest).read_text())["total_assets"] == 6
+
+    def test_pipeline_resume_errors(self, temp_nas_and_output):
+        """이어서 실행할 수 없는 경우"""
+        nas_dir, output_dir = temp_nas_and_output
+
+        with pytest.raises(FileNotFoundError):
+            NasToUdmPipeline(nas_dir, output_dir, export_format="jsonl").run(resume="udm_export_missing")
+        with pytest.raises(ValueError):
+            NasToUdmPipeline(nas_dir, output_dir, export_format="json").run(resume="udm_export_missing")
+
+        # 설정이 다르면 샤드 경계가 달라지므로 거부
+        from src.extractors.checkpoint import RunCheckpoint
+        pipeline = NasToUdmPipeline(nas_dir, output_dir, export_format="jsonl")
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        RunCheckpoint("udm_export_old", str(pipeline.scanner.root_path), str(output_dir)).save()
+        with pytest.raises(ValueError):
+            pipeline.run(resume="udm_export_old")
+
     def test_pipeline_with_max_files(self, temp_nas_and_output):
         """max_files 제한 테스트"""
         nas_dir, output_dir = temp_nas_and_output
@@ -12,6 +12,7 @@ Test Coverage:
 5. 관계 테스트: Asset-Segment 관계
 """
 
+import os
 from datetime import datetime
 from uuid import UUID
 
@@ -698,6 +699,259 @@ class TestParseFilename:
         assert meta.sequence_num is None
 
 
+class TestParseFilenameDispatch:
+    """첫 글자 디스패치 파서 vs 순차 매칭 차등 테스트"""
+
+    SAMPLE_FILENAMES = [
+        "WCLA24-15.mp4", "WP23-PE-01.mp4", "WP23-03.mp4", "PAD_S13_EP01_GGPoker-001.mp4",
+        "10-wsop-2024-be-ev-21-25k-nlh-hr-ft-description.mp4",
+        "250507_Super High Roller Poker FINAL TABLE with Tom Dwan.mp4",
+        "wsop-1973-me-nobug.mp4", "wsope-2008-me-final.mp4", "WSOP_2003-04.mxf", "WSOP_2003.mxf",
+        "2009 WSOP ME19.mov", "2004 World Series of Poker Day 1.mov",
+        "WSOP 2005 Lake Tahoe CC_1.mov", "1-wsop-2024-be-ev-01-opener.mp4",
+        "WS11_ME02_NB.mp4", "1213_Hand_09_Player1 vs Player2_Clean.mp4", "WSOP13_ME01_NB.mp4",
+        "ESPN 2007 WSOP SEASON 5 SHOW 1.mov", "1003_WSOPE_2024_50K_Diamond.mp4",
+        "WSOPE09_Episode_8_H264.mov", "WSOP - 1973.avi", "WSE13-ME01_EuroSprt_NB_TEXT.mp4",
+        "WE24-ME-01.mp4", "#WSOPE 2024 NLH MAIN EVENT DAY 1.mp4", "2003 2003 WSOP Best of.mov",
+        "42-wsop-2024-me-day1a-part2.mp4", "$1M GTD $1K PokerOK Mystery.mp4",
+        "HyperDeck_0009-002.mp4", "WSOPE NLH High Roller.mp4", "pad-s12-ep01-002.mp4",
+        "E09_GOG_final_edit_20231123.mp4", "Super High Roller Poker FINAL TABLE with Ivey.mp4",
+        "HCL_2024_EP10.mp4",
+        # 미매칭 / 경계 사례
+        "random_file_name.mp4", "", ".mp4", "clip", " WCLA24-15.mp4", "Day 1A Final.mov",
+        "WSOP 2024 \u2013 Main Event.mp4", "WSOP\u20ac 2024 Final.mp4",
+        "\u017fuper High Roller Poker FINAL TABLE with X.mp4",  # ſ (IGNORECASE로 S와 매칭)
+        "\u212aHCL.mp4", "\u0663\u0660-wsop-2024-me-x.mp4",  # 비 ASCII 숫자
+    ]
+
+    @staticmethod
+    def _reference_match(filename: str):
+        """기존 순차 매칭 구현"""
+        import re
+        from src.models import udm
+
+        normalized = udm._normalize_filename(filename)
+        for pattern_name, pattern in udm.FILENAME_PATTERNS.items():
+            match = re.match(pattern, normalized, re.IGNORECASE)
+            if match:
+                return pattern_name, match
+        return None
+
+    def _corpus(self) -> list[str]:
+        names = list(self.SAMPLE_FILENAMES)
+        names += [n.lower() for n in self.SAMPLE_FILENAMES]
+        names += [n.upper() for n in self.SAMPLE_FILENAMES]
+        names += [n.swapcase() for n in self.SAMPLE_FILENAMES]
+
+        # 전체 NAS 파일명 목록 (한 줄에 하나, 선택)
+        corpus_file = os.environ.get("ARCHIVE_FILENAME_CORPUS")
+        if corpus_file:
+            with open(corpus_file, "r", encoding="utf-8") as f:
+                names += [line.rstrip("\n") for line in f]
+        return names
+
+    def test_match_identical_to_sequential(self):
+        """매칭 패턴/그룹이 순차 매칭과 동일"""
+        from src.models.udm import match_filename_pattern
+
+        for filename in self._corpus():
+            expected = self._reference_match(filename)
+            actual = match_filename_pattern(filename)
+            if expected is None:
+                assert actual is None, filename
+            else:
+                assert actual is not None, filename
+                assert actual[0] == expected[0], filename
+                assert actual[1].groupdict() == expected[1].groupdict(), filename
+
+    def test_parse_filename_identical_to_sequential(self, monkeypatch):
+        """FileNameMeta 결과가 순차 매칭 기반 결과와 동일"""
+        from src.models import udm
+
+        corpus = self._corpus()
+        actual = [parse_filename(name).model_dump() for name in corpus]
+
+        # 캐시를 거치지 않는 파싱 경로로 기준 결과 생성
+        monkeypatch.setattr(udm, "match_filename_pattern", self._reference_match)
+        expected = [udm._build_filename_meta(name)[1].model_dump() for name in corpus]
+
+        assert actual == expected
+
+    def test_leading_chars(self):
+        """패턴 첫 글자 분석"""
+        from src.models.udm import _leading_chars
+
+        assert _leading_chars(r"^(?P<code>WCLA)(?P<year>\d{2})") == frozenset("w")
+        assert _leading_chars(r"^(?P<num>\d+)-wsop") == frozenset("0123456789")
+        assert _leading_chars(r"^[$#](?P<prize>[\d.]+)") == frozenset("$#")
+        assert _leading_chars(r"^(World Series|WSOP)") is None
+        assert _leading_chars(r"^E?(?P<x>\d+)") is None
+        assert _leading_chars(r"WSOP") is None
+        # 선택적 그룹 뒤 글자로 시작할 수 있음
+        assert _leading_chars(r"^(?P<tag>WSOP)?_(?P<num>\d+)") is None
+        assert _leading_chars(r"^(?:ab)*c") is None
+        assert _leading_chars(r"^(?:(?P<a>W)S){0,1}x") is None
+        assert _leading_chars(r"^(?:ab){,2}c") is None
+        assert _leading_chars(r"^(?:ab){2}c") == frozenset("a")
+        assert _leading_chars(r"^(?:W(?P<s>S)?)x") == frozenset("w")
+        # 최상위 alternation / 클래스 안 이스케이프는 모든 글자 후보
+        assert _leading_chars(r"^WSOP|^HCL") is None
+        assert _leading_chars(r"^(?P<a>WSOP)_x|^HCL_x") is None
+        assert _leading_chars(r"^[\d.]+_x") is None
+        assert _leading_chars(r"^[\s_]x") is None
+        assert _leading_chars(r"^[\$](?P<prize>\d+)") is None
+        assert _leading_chars(r"^W[|]x") == frozenset("w")
+        assert _leading_chars(r"^W\|x") == frozenset("w")
+
+    def test_pattern_added_at_runtime(self, monkeypatch):
+        """FILENAME_PATTERNS에 패턴 추가 시 디스패치 테이블 재생성"""
+        from src.models import udm
+        from src.models.udm import match_filename_pattern
+
+        patterns = dict(udm.FILENAME_PATTERNS)
+        patterns["zz_test"] = r"^ZZ(?P<num>\d+)\.(?P<ext>\w+)$"
+        monkeypatch.setattr(udm, "FILENAME_PATTERNS", patterns)
+
+        assert match_filename_pattern("zz12.mp4")[0] == "zz_test"
+
+        monkeypatch.undo()
+        assert match_filename_pattern("zz12.mp4") is None
+
+    @pytest.mark.parametrize("pattern, filenames", [
+        (r"^(?P<num>[\d.]+)_ZZTEST\.(?P<ext>\w+)$", ["12_ZZTEST.mp4", "7_ZZTEST.mov", "d_ZZTEST.mp4"]),
+        (r"^ZZALT_(?P<n>\d+)|^QQALT_(?P<m>\d+)", ["ZZALT_1.mp4", "qqalt_2.mp4", "QQ_3.mp4"]),
+        (r"^[\s_]ZZSP(?P<n>\d+)", ["_ZZSP1.mp4", "sZZSP1.mp4"]),
+        (r"^[\w]ZZW(?P<n>\d+)", ["aZZW1.mp4", "7ZZW2.mp4", "_ZZW3.mp4"]),
+    ])
+    def test_conservative_dispatch_matches_sequential(self, monkeypatch, pattern, filenames):
+        """alternation / 클래스 이스케이프 패턴도 순차 re.match와 같은 결과"""
+        from src.models import udm
+        from src.models.udm import match_filename_pattern, parse_filename_with_pattern
+
+        patterns = {"zz_shape": pattern}
+        patterns.update(udm.FILENAME_PATTERNS)
+        monkeypatch.setattr(udm, "FILENAME_PATTERNS", patterns)
+        # 같은 개수의 다른 패턴 세트는 자동 감지되지 않음
+        udm.reload_filename_patterns()
+        udm.clear_parse_filename_cache()
+
+        for filename in filenames:
+            expected = self._reference_match(filename)
+            actual = match_filename_pattern(filename)
+            if expected is None:
+                assert actual is None, filename
+                continue
+            assert actual is not None, filename
+            assert actual[0] == expected[0], filename
+            assert actual[1].groupdict() == expected[1].groupdict(), filename
+            assert parse_filename_with_pattern(filename)[0] == "zz_shape", filename
+        udm.clear_parse_filename_cache()
+
+    def test_optional_leading_group_dispatch(self, monkeypatch):
+        """선택적 선행 그룹 패턴은 그룹 없이 시작하는 파일명에도 매칭"""
+        from src.models import udm
+        from src.models.udm import match_filename_pattern
+
+        patterns = {"zz_optional": r"^(?P<tag>ZZ)?_(?P<num>\d+)\.(?P<ext>\w+)$"}
+        patterns.update(udm.FILENAME_PATTERNS)
+        monkeypatch.setattr(udm, "FILENAME_PATTERNS", patterns)
+        udm.reload_filename_patterns()
+
+        for filename in ("ZZ_12.mp4", "_12.mp4"):
+            expected = self._reference_match(filename)
+            assert expected[0] == "zz_optional"
+            assert match_filename_pattern(filename)[0] == "zz_optional", filename
+
+
+class TestParseFilenameCache:
+    """파싱 캐시 / 일괄 파싱 테스트"""
+
+    def test_cache_hits(self):
+        """같은 파일명 재파싱 시 캐시 적중"""
+        from src.models.udm import clear_parse_filename_cache, parse_filename_cache_info
+
+        clear_parse_filename_cache()
+        parse_filename("WCLA24-15.mp4")
+        parse_filename("WCLA24-15.mp4")
+
+        info = parse_filename_cache_info()
+        assert info["misses"] == 1
+        assert info["hits"] == 1
+        assert info["size"] == 1
+
+    def test_returns_copies(self):
+        """반환값 수정이 캐시에 영향 없음"""
+        meta = parse_filename("WCLA24-15.mp4")
+        meta.code_prefix = "CHANGED"
+
+        assert parse_filename("WCLA24-15.mp4").code_prefix == "WCLA"
+
+    def test_parse_filenames_batch(self):
+        """일괄 파싱 결과가 단건 파싱과 동일 (입력 순서 유지)"""
+        from src.models.udm import parse_filenames
+
+        names = ["WCLA24-15.mp4", "random_file_name.mp4", "WCLA24-15.mp4", "WP23-03.mp4"]
+        results = parse_filenames(names)
+
+        assert [m.model_dump() for m in results] == [parse_filename(n).model_dump() for n in names]
+        assert results[0] is not results[2]
+
+    def test_with_pattern(self):
+        """패턴 이름 함께 반환"""
+        from src.models.udm import parse_filename_with_pattern
+
+        pattern_name, meta = parse_filename_with_pattern("WCLA24-15.mp4")
+        assert pattern_name is not None
+        assert meta.year_code == "24"
+
+        assert parse_filename_with_pattern("random_file_name.mp4")[0] is None
+
+    def test_pattern_change_invalidates(self, monkeypatch):
+        """패턴 세트가 바뀌면 캐시된 결과를 사용하지 않음"""
+        from src.models import udm
+
+        assert udm.parse_filename_with_pattern("zz12.mp4")[0] is None
+
+        patterns = dict(udm.FILENAME_PATTERNS)
+        patterns["zz_test"] = r"^ZZ(?P<num>\d+)\.(?P<ext>\w+)$"
+        monkeypatch.setattr(udm, "FILENAME_PATTERNS", patterns)
+
+        assert udm.parse_filename_with_pattern("zz12.mp4")[0] == "zz_test"
+
+
+class TestConstructTrusted:
+    """construct_trusted() 테스트"""
+
+    def test_matches_validated(self):
+        """검증된 형태의 값으로 생성 시 검증 경로와 동일"""
+        from src.models.udm import construct_trusted
+
+        context = EventContext(year=2024, brand=Brand.WSOP)
+        expected = Asset(file_name="a.mp4", event_context=context, source_origin="NAS_WSOP_2024")
+        actual = construct_trusted(
+            Asset,
+            asset_uuid=expected.asset_uuid,
+            file_name="a.mp4",
+            event_context=context,
+            source_origin="NAS_WSOP_2024",
+        )
+
+        assert actual.model_dump() == expected.model_dump()
+        assert list(actual.model_dump()) == list(expected.model_dump())  # 키 순서
+        assert actual.model_fields_set == {"asset_uuid", "file_name", "event_context", "source_origin"}
+
+    def test_default_factories_not_shared(self):
+        """default_factory 필드는 인스턴스마다 새로 생성"""
+        from src.models.udm import construct_trusted
+
+        context = EventContext(year=2024, brand=Brand.WSOP)
+        a = construct_trusted(Asset, file_name="a.mp4", event_context=context, source_origin="x")
+        b = construct_trusted(Asset, file_name="b.mp4", event_context=context, source_origin="x")
+
+        assert a.segments is not b.segments
+        assert a.asset_uuid != b.asset_uuid
+
+
 class TestInferBrandFromPath:
     """infer_brand_from_path() 함수 테스트"""
 
@@ -0,0 +1,700 @@
+"""
+UDM 뷰어 (대시보드 백엔드) 테스트
+
+Tests for:
+- UdmFileWatcher / UdmDataStore: 핫 리로드 (파일 교체, 델타 변경셋)
+- UdmIndex: 포스팅 / 3-gram 검색 / 필터 / 개수 (전수 비교)
+- UdmIndex 키셋 페이지: 커서 / 변경 반영 / 압축 후 순서
+- UdmColumns: 딕셔너리 인코딩 열 ↔ 행 (JSON / Arrow IPC)
+- NasRealTimeService: 증분 변경 리스너 (기준 스캔 제외)
+"""
+
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+# 대시보드 백엔드 패키지 (app.*) import
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "dashboard" / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.routers.udm_viewer import UdmDataStore
+from app.services.udm_columns import COLUMN_SPECS, UdmColumns, parse_fields, pyarrow_available
+from app.services.udm_index import NGRAM_SIZE, SORT_FIELDS, UdmIndex, decode_cursor
+from src.extractors.delta_exporter import DeltaExporter
+from src.extractors.json_exporter import ExportConfig
+from src.extractors.udm_transformer import UdmTransformer
+from src.models.udm import Brand, generate_minimal_asset
+
+
+def _asset(name: str, year: int = 2024):
+    """경로 기반 결정적 asset_uuid를 가진 최소 Asset"""
+    asset = generate_minimal_asset(name, year, Brand.WSOP, "NAS_WSOP")
+    asset.asset_uuid = UdmTransformer()._uuid_for_path(f"/ARCHIVE/{name}")
+    return asset
+
+
+def _raw_assets(count: int, seed: int = 7) -> list[dict]:
+    """필터/검색 조합을 고르게 덮는 원본 Asset (브랜드 대소문자 혼용, 값 없는 필드 포함)"""
+    rng = random.Random(seed)
+    words = ["main", "event", "final", "table", "day", "heads", "up", "wsop", "hcl", "episode"]
+    assets = []
+    for i in range(count):
+        name = "_".join(rng.sample(words, 3)) + f"_{i:04d}.mp4"
+        if rng.random() < 0.3:
+            name = name.upper()
+        assets.append({
+            "asset_uuid": str(uuid.UUID(int=rng.getrandbits(128))),
+            "file_name": name,
+            "asset_type": rng.choice(["STREAM", "SUBCLIP", "EPISODE", None]),
+            "event_context": {
+                "year": rng.choice([2022, 2023, 2024, None]),
+                "brand": rng.choice(["WSOP", "wsop", "HCL", "PAD", "GGMillions", None]),
+            },
+            "segments": [{}] * rng.randint(0, 2),
+        })
+    return assets
+
+
+def _brute_matches(
+    assets: list[dict],
+    brand: str | None = None,
+    asset_type: str | None = None,
+    year: int | None = None,
+    search: str | None = None,
+) -> list[int]:
+    """조건에 맞는 위치 (전수 비교 기준)"""
+    positions = []
+    for position, asset in enumerate(assets):
+        ctx = asset.get("event_context") or {}
+        if brand and (ctx.get("brand") or "").upper() != brand.upper():
+            continue
+        if asset_type and (asset.get("asset_type") or "").upper() != asset_type.upper():
+            continue
+        if year and ctx.get("year") != year:
+            continue
+        if search and search.lower() not in (asset.get("file_name") or "").lower():
+            continue
+        positions.append(position)
+    return positions
+
+
+# 구조 필터 / 짧은 검색어 / 3-gram 검색 / 결과 없음 조합
+INDEX_QUERIES = [
+    {},
+    {"brand": "WSOP"},
+    {"brand": "wsop"},
+    {"asset_type": "episode"},
+    {"year": 2023},
+    {"brand": "HCL", "asset_type": "STREAM"},
+    {"brand": "PAD", "year": 2022},
+    {"brand": "GGMillions", "asset_type": "SUBCLIP", "year": 2024},
+    {"search": "u"},
+    {"search": "up"},
+    {"search": "final"},
+    {"search": "FINAL_TABLE"},
+    {"search": "_00"},
+    {"brand": "wsop", "search": "event"},
+    {"asset_type": "EPISODE", "year": 2024, "search": "day"},
+    {"search": "zzz"},
+    {"brand": "unknown-brand"},
+    {"year": 1999},
+    {"brand": "HCL", "search": "no such name"},
+]
+
+
+def _sort_key(asset: dict, field: str) -> tuple:
+    """정렬 키 (정렬 값, asset_uuid) - 전수 비교 기준"""
+    ctx = asset.get("event_context") or {}
+    value = {
+        "file_name": lambda: (asset.get("file_name") or "").lower(),
+        "year": lambda: ctx.get("year") or 0,
+        "brand": lambda: (ctx.get("brand") or "").upper(),
+        "asset_type": lambda: (asset.get("asset_type") or "").upper(),
+        "asset_uuid": lambda: asset.get("asset_uuid") or "",
+    }[field]()
+    return value, asset["asset_uuid"]
+
+
+def _brute_order(assets: list[dict], sort: str, after: tuple | None = None, **query) -> list[str]:
+    """조건에 맞는 asset_uuid를 정렬 순서로 (after = 이 정렬 키 다음부터)"""
+    field, descending = sort.lstrip("-"), sort.startswith("-")
+    keyed = [(_sort_key(assets[p], field), assets[p]["asset_uuid"]) for p in _brute_matches(assets, **query)]
+    if after is not None:
+        keyed = [(key, u) for key, u in keyed if (key < after if descending else key > after)]
+    keyed.sort(reverse=descending)
+    return [u for _, u in keyed]
+
+
+def _walk_pages(index: UdmIndex, sort: str, limit: int, cursor: str | None = None, **query) -> list[str]:
+    """next_cursor가 없을 때까지 페이지를 이어 읽은 asset_uuid 목록"""
+    uuids: list[str] = []
+    while True:
+        page, cursor = index.page(sort=sort, cursor=cursor, limit=limit, **query)
+        assert len(page) <= limit
+        uuids += [a["asset_uuid"] for a in page]
+        if cursor is None:
+            return uuids
+
+
+def _write_udm(path: Path, assets: list) -> str:
+    """UDM JSON 파일 기록 (mtime을 앞당겨 같은 크기여도 교체로 인식되게 함)"""
+    generated_at = datetime.now().isoformat()
+    data = {
+        "_metadata": {
+            "version": "3.1.0",
+            "generated_at": generated_at,
+            "source": "test",
+            "total_assets": len(assets),
+        },
+        "assets": [a.model_dump(mode="json", exclude_none=True) for a in assets],
+    }
+    previous = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(json.dumps(data), encoding="utf-8")
+    mtime = max(path.stat().st_mtime_ns, previous + 1_000_000_000)
+    os.utime(path, ns=(mtime, mtime))
+    return generated_at
+
+
+class TestUdmHotReload:
+    """로드한 UDM 파일 / 델타 변경셋 핫 리로드 테스트"""
+
+    @pytest.fixture
+    def store(self):
+        store = UdmDataStore()
+        yield store
+        store.stop_watch()
+
+    @pytest.fixture
+    def delta(self, tmp_path):
+        return DeltaExporter(ExportConfig(output_dir=str(tmp_path), include_timestamp=False))
+
+    @staticmethod
+    def _watch(store: UdmDataStore, udm_file: Path):
+        """로드 후 감시 시작 (주기 확인은 하지 않고 check()를 직접 호출)"""
+        assert store.load_from_file(str(udm_file))
+        assert store.start_watch(interval=3600)
+        return store._watcher
+
+    @staticmethod
+    def _file_names(store: UdmDataStore) -> set[str]:
+        return {a["file_name"] for a in store.assets}
+
+    def test_file_replaced_reloads(self, store, tmp_path):
+        """파일 교체 후 두 번 연속 같은 상태면 다시 로드"""
+        udm_file = tmp_path / "udm.json"
+        _write_udm(udm_file, [_asset("a.mp4"), _asset("b.mp4")])
+        watcher = self._watch(store, udm_file)
+        version = store.version
+
+        baseline = _write_udm(udm_file, [_asset("c.mp4")])
+        watcher.check()  # 쓰는 중일 수 있으므로 대기
+        assert self._file_names(store) == {"a.mp4", "b.mp4"}
+
+        watcher.check()
+        assert self._file_names(store) == {"c.mp4"}
+        assert store.version != version
+        status = watcher.status()
+        assert status["reloads"] == 1
+        assert status["baseline_generated_at"] == baseline
+        assert status["last_error"] is None
+
+    def test_changesets_after_baseline_applied_in_order(self, store, tmp_path, delta):
+        """파일 생성 이후 변경셋만 순서대로 적용"""
+        assert delta.export([_asset("a.mp4"), _asset("b.mp4")]).success
+        udm_file = tmp_path / "udm.json"
+        _write_udm(udm_file, [_asset("a.mp4"), _asset("b.mp4")])
+
+        assert delta.export([_asset("a.mp4", year=2023), _asset("b.mp4"), _asset("c.mp4")]).success
+        last = delta.export([_asset("a.mp4", year=2023), _asset("c.mp4")])
+        assert last.success
+
+        watcher = self._watch(store, udm_file)
+        watcher.check()
+
+        assert self._file_names(store) == {"a.mp4", "c.mp4"}
+        a_uuid = str(_asset("a.mp4").asset_uuid)
+        assert store.get_asset(a_uuid)["event_context"]["year"] == 2023
+
+        status = watcher.status()
+        assert status["changesets_applied"] == 2
+        assert status["reloads"] == 0
+        assert status["last_error"] is None
+        with open(last.manifest_file, encoding="utf-8") as f:
+            assert status["delta_generated_at"] == json.load(f)["generated_at"]
+
+        # 다음 델타 실행만 추가로 적용
+        version = store.version
+        watcher.check()
+        assert store.version == version
+        assert delta.export([_asset("c.mp4")]).success
+        watcher.check()
+        assert self._file_names(store) == {"c.mp4"}
+        assert watcher.status()["changesets_applied"] == 3
+
+    def test_base_mismatch_reloads_file(self, store, tmp_path, delta):
+        """파일 기준점과 이어지지 않는 변경셋은 적용하지 않고 파일을 다시 로드"""
+        udm_file = tmp_path / "udm.json"
+        _write_udm(udm_file, [_asset("a.mp4"), _asset("b.mp4")])
+        watcher = self._watch(store, udm_file)
+
+        # 첫 델타 실행 (base 없음): 파일과 이어지지 않음
+        assert delta.export([_asset("a.mp4"), _asset("c.mp4")]).success
+        watcher.check()
+
+        assert self._file_names(store) == {"a.mp4", "b.mp4"}
+        status = watcher.status()
+        assert status["reloads"] == 1
+        assert status["changesets_applied"] == 0
+        assert "does not follow" in status["last_error"]
+
+        # 같은 인덱스로 다시 로드하지 않음
+        watcher.check()
+        assert watcher.status()["reloads"] == 1
+
+    def test_missing_changeset_reloads_file(self, store, tmp_path, delta):
+        """이력의 변경셋 파일이 없으면 파일을 다시 로드"""
+        assert delta.export([_asset("a.mp4")]).success
+        udm_file = tmp_path / "udm.json"
+        _write_udm(udm_file, [_asset("a.mp4")])
+        result = delta.export([_asset("a.mp4"), _asset("b.mp4")])
+        Path(result.output_files[0]).unlink()
+
+        watcher = self._watch(store, udm_file)
+        watcher.check()
+
+        assert self._file_names(store) == {"a.mp4"}
+        assert "missing" in watcher.status()["last_error"]
+
+    def test_load_during_check_does_not_deadlock(self, store, tmp_path, delta):
+        """변경셋 적용 중 다른 스레드의 파일 로드 (잠금 순서 고정)"""
+        assert delta.export([_asset("a.mp4")]).success
+        udm_file = tmp_path / "udm.json"
+        _write_udm(udm_file, [_asset("a.mp4")])
+        assert delta.export([_asset("a.mp4"), _asset("b.mp4")]).success
+        watcher = self._watch(store, udm_file)
+
+        entered = threading.Event()
+        release = threading.Event()
+        apply_changeset = watcher.on_changeset
+
+        def slow_apply(path):
+            entered.set()
+            release.wait(5)
+            apply_changeset(path)
+
+        watcher.on_changeset = slow_apply
+        checker = threading.Thread(target=watcher.check)
+        checker.start()
+        assert entered.wait(5)
+
+        loader = threading.Thread(target=store.load_from_file, args=(str(udm_file),))
+        loader.start()
+        time.sleep(0.05)
+        release.set()
+
+        checker.join(10)
+        loader.join(10)
+        assert not checker.is_alive()
+        assert not loader.is_alive()
+
+        # 로드가 확인 뒤에 실행되어 기준점이 초기화됨 → 다음 확인에서 다시 적용
+        assert self._file_names(store) == {"a.mp4"}
+        watcher.check()
+        assert self._file_names(store) == {"a.mp4", "b.mp4"}
+        assert watcher.status()["last_error"] is None
+
+    def test_parse_does_not_block_changes(self, store, tmp_path, monkeypatch):
+        """파일 파싱 중에도 변경 반영 가능 (쓰기 잠금은 교체할 때만)"""
+        from app.routers import udm_viewer
+
+        udm_file = tmp_path / "udm.json"
+        _write_udm(udm_file, [_asset("a.mp4")])
+        assert store.load_from_file(str(udm_file))
+
+        entered = threading.Event()
+        release = threading.Event()
+        load_udm_index = udm_viewer.load_udm_index
+
+        def slow_load(*args):
+            entered.set()
+            release.wait(5)
+            return load_udm_index(*args)
+
+        monkeypatch.setattr(udm_viewer, "load_udm_index", slow_load)
+        _write_udm(udm_file, [_asset("b.mp4")])
+        loader = threading.Thread(target=store.load_from_file, args=(str(udm_file),))
+        loader.start()
+        assert entered.wait(5)
+
+        upserts = [_asset("c.mp4").model_dump(mode="json", exclude_none=True)]
+        applier = threading.Thread(target=store.apply_changes, args=(upserts, set()))
+        applier.start()
+        applier.join(2)
+        finished = not applier.is_alive()
+        release.set()
+        loader.join(10)
+        applier.join(10)
+
+        assert finished
+        assert not loader.is_alive()
+        assert self._file_names(store) == {"b.mp4"}
+
+
+@pytest.fixture(scope="module")
+def assets():
+    return _raw_assets(400)
+
+
+@pytest.fixture(scope="module")
+def index(assets):
+    return UdmIndex({}, assets)
+
+
+class TestUdmIndex:
+    """UdmIndex 포스팅 / 검색 / 필터 / 개수 (전수 비교)"""
+
+    @pytest.mark.parametrize("query", INDEX_QUERIES, ids=str)
+    def test_matches_brute_force(self, index, assets, query):
+        """조건별 위치 / 개수가 전수 비교와 동일"""
+        expected = _brute_matches(assets, **query)
+
+        assert list(index.iter_matches(**query)) == expected
+        assert index.count(**query) == len(expected)
+        # 검색어 개수는 캐시에서 다시 읽어도 같음
+        assert index.count(**query) == len(expected)
+
+    def test_structure_postings(self, index, assets):
+        """브랜드 / 타입 / 연도 포스팅은 정렬된 위치 목록이며 값과 일치"""
+        for codes, postings, key in (
+            (index._brand_codes, index._brand_postings, lambda a: (a["event_context"]["brand"] or "").upper()),
+            (index._type_codes, index._type_postings, lambda a: (a["asset_type"] or "").upper()),
+        ):
+            for label, code in codes.items():
+                expected = [p for p, a in enumerate(assets) if key(a) == label]
+                assert list(postings.get(code, [])) == expected, label
+
+        for year, postings in index._year_postings.items():
+            assert list(postings) == [p for p, a in enumerate(assets) if a["event_context"]["year"] == year]
+
+        grouped = sorted(p for postings in index._group_postings.values() for p in postings)
+        assert grouped == list(range(len(assets)))
+        assert sum(index._group_counts.values()) == len(assets)
+
+    def test_ngram_postings(self, index, assets):
+        """3-gram 포스팅 = 그 3-gram을 포함하는 파일명 위치 전체"""
+        expected: dict[str, list[int]] = {}
+        for position, asset in enumerate(assets):
+            name = asset["file_name"].lower()
+            grams = {name[i:i + NGRAM_SIZE] for i in range(len(name) - NGRAM_SIZE + 1)}
+            for gram in grams:
+                expected.setdefault(gram, []).append(position)
+
+        assert {gram: list(postings) for gram, postings in index._ngram_postings.items()} == expected
+
+    def test_stats_match_assets(self, index, assets):
+        """분포 / 세그먼트 합계"""
+        brands: dict[str, int] = {}
+        for asset in assets:
+            brand = asset["event_context"]["brand"] or "unknown"
+            brands[brand] = brands.get(brand, 0) + 1
+
+        stats = index.stats()
+        assert stats["total_assets"] == len(assets)
+        assert stats["total_segments"] == sum(len(a["segments"]) for a in assets)
+        assert stats["brand_distribution"] == brands
+        assert sum(stats["year_distribution"].values()) == len(assets)
+
+
+class TestUdmIndexPagination:
+    """키셋 페이지 / 변경 반영 / 압축 테스트"""
+
+    SORTS = [*SORT_FIELDS, *(f"-{field}" for field in SORT_FIELDS)]
+
+    @staticmethod
+    def _changes(assets: list[dict], removed_count: int, seed: int = 3):
+        """삭제 / 추가 / 수정(파일명·연도 변경) 변경과 반영 후 기대 Asset 목록 (위치 순)"""
+        rng = random.Random(seed)
+        removed = {a["asset_uuid"] for a in rng.sample(assets, removed_count)}
+        survivors = [a for a in assets if a["asset_uuid"] not in removed]
+        modified = [
+            {**a, "file_name": "A_" + a["file_name"], "event_context": {**a["event_context"], "year": 2021}}
+            for a in rng.sample(survivors, 10)
+        ]
+        inserted = _raw_assets(30, seed=seed + 100)
+        upserts = modified + inserted
+
+        replaced = removed | {a["asset_uuid"] for a in upserts}
+        expected = [a for a in assets if a["asset_uuid"] not in replaced] + upserts
+        return upserts, removed, expected
+
+    @pytest.mark.parametrize("sort", SORTS)
+    @pytest.mark.parametrize("query", [{}, {"brand": "wsop"}, {"search": "final"}, {"brand": "PAD", "year": 2022}], ids=str)
+    def test_pages_match_sorted_brute_force(self, index, assets, sort, query):
+        """커서로 이어 읽은 전체 페이지 = 전수 정렬 결과 (중복/누락 없음)"""
+        expected = _brute_order(assets, sort, **query)
+        assert _walk_pages(index, sort, 17, **query) == expected
+        assert _walk_pages(index, sort, 1000, **query) == expected
+
+    @pytest.mark.parametrize("sort", ["file_name", "-year", "brand", "-asset_type"])
+    def test_cursor_continues_across_inserts_and_deletes(self, index, assets, sort):
+        """변경 전 커서로 변경 후 인덱스를 이어 읽으면 커서 키 다음 Asset부터"""
+        first, cursor = index.page(sort=sort, limit=50)
+        after = _sort_key(first[-1], sort.lstrip("-"))
+
+        upserts, removed, expected = self._changes(assets, 40)
+        changed = index.with_changes({}, upserts, removed)
+        assert changed._dead_count > 0  # 압축 전 (삭제 표시 상태)
+
+        assert _walk_pages(changed, sort, 13, cursor) == _brute_order(expected, sort, after)
+        # 이전 버전은 그대로
+        assert _walk_pages(index, sort, 13, cursor) == _brute_order(assets, sort, after)
+
+    @pytest.mark.parametrize("query", INDEX_QUERIES, ids=str)
+    def test_filtered_totals_after_changes(self, index, assets, query):
+        """변경 반영 후 조건별 위치 / 개수 = 변경 후 목록 전수 비교"""
+        upserts, removed, expected = self._changes(assets, 40)
+        changed = index.with_changes({}, upserts, removed)
+
+        matched = [changed.assets[p]["asset_uuid"] for p in changed.iter_matches(**query)]
+        assert matched == [expected[p]["asset_uuid"] for p in _brute_matches(expected, **query)]
+        assert changed.count(**query) == len(matched)
+        assert index.count(**query) == len(_brute_matches(assets, **query))
+        assert len(changed) == len(expected)
+
+    def test_compaction_keeps_order(self, index, assets):
+        """삭제 비율이 기준을 넘으면 압축하며 정렬 / 커서 / 필터 결과 유지"""
+        cursors = {sort: index.page(sort=sort, limit=60) for sort in self.SORTS}
+
+        upserts, removed, expected = self._changes(assets, 150)
+        changed = index.with_changes({}, upserts, removed)
+        assert changed._dead_count == 0
+        assert [a["asset_uuid"] for a in changed.assets] == [a["asset_uuid"] for a in expected]
+        assert len(changed.columns) == len(expected)
+
+        for sort, (first, cursor) in cursors.items():
+            assert _walk_pages(changed, sort, 19) == _brute_order(expected, sort)
+            after = _sort_key(first[-1], sort.lstrip("-"))
+            assert _walk_pages(changed, sort, 19, cursor) == _brute_order(expected, sort, after)
+        for query in INDEX_QUERIES:
+            assert changed.count(**query) == len(_brute_matches(expected, **query))
+
+    def test_invalid_cursor_and_sort(self, index):
+        """다른 정렬의 커서 / 잘못된 커서 / 알 수 없는 정렬 필드"""
+        _, cursor = index.page(sort="year", limit=5)
+        assert decode_cursor(cursor, "year")[1]
+
+        with pytest.raises(ValueError):
+            index.page(sort="-year", cursor=cursor)
+        with pytest.raises(ValueError):
+            index.page(sort="year", cursor="not-a-cursor")
+        with pytest.raises(ValueError):
+            index.page(sort="duration")
+
+
+@pytest.fixture(scope="module")
+def column_assets() -> list[dict]:
+    """모델 Asset (Enum / 중첩 / 세그먼트) + 모델에 없는 값 + 값 없는 필드"""
+    from src.models.udm import (
+        Asset, AssetType, EventContext, GameVariant, Location, Segment, TechSpec,
+    )
+
+    asset_uuid = uuid.uuid4()
+    modeled = [
+        Asset(
+            asset_uuid=asset_uuid,
+            file_name="WSOP_2024_ME01.mp4",
+            asset_type=AssetType.STREAM,
+            event_context=EventContext(
+                year=2024, brand=Brand.WSOP, location=Location.LAS_VEGAS,
+                game_variant=GameVariant.NLH, is_final_table=True, buyin_usd=10000,
+            ),
+            tech_spec=TechSpec(fps=29.97, resolution="1080p", duration_sec=3600.5),
+            source_origin="NAS_WSOP_2024",
+            segments=[Segment(parent_asset_uuid=asset_uuid, time_in_sec=10.0, time_out_sec=95.5)],
+        ),
+        Asset(
+            asset_uuid=uuid.uuid4(),
+            file_name="HCL_2024_EP01.mp4",
+            asset_type=AssetType.SUBCLIP,
+            event_context=EventContext(year=2024, brand=Brand.HCL),
+            source_origin="NAS_HCL_2024",
+        ),
+    ]
+    legacy = {
+        "asset_uuid": str(uuid.uuid4()),
+        "file_name": "legacy.mp4",
+        "event_context": {"year": 2001, "brand": "LEGACY_BRAND"},
+    }
+    return [
+        *(a.model_dump(mode="json", exclude_none=True) for a in modeled),
+        legacy,
+        *_raw_assets(20, seed=5),
+    ]
+
+
+class TestUdmColumns:
+    """열 저장소 ↔ 행 뷰 왕복 테스트"""
+
+    @staticmethod
+    def _row_value(asset: dict, name: str):
+        """행(원본 Asset)에서 읽은 열 값"""
+        if name == "segment_count":
+            return len(asset.get("segments") or [])
+        value = asset
+        for key in COLUMN_SPECS[name].path:
+            value = value.get(key) if isinstance(value, dict) else None
+        return value
+
+    @staticmethod
+    def _decode(projected: dict) -> dict[str, list]:
+        """딕셔너리 인코딩 열 → 값 목록"""
+        decoded = {}
+        for name, column in projected.items():
+            if isinstance(column, dict):
+                dictionary = column["dictionary"]
+                column = [None if i is None else dictionary[i] for i in column["indices"]]
+            decoded[name] = column
+        return decoded
+
+    def _assert_rows(self, columns: UdmColumns, rows: list[dict], positions: list[int]):
+        decoded = self._decode(columns.project(list(COLUMN_SPECS), positions))
+        for name in COLUMN_SPECS:
+            assert decoded[name] == [self._row_value(rows[p], name) for p in positions], name
+
+    def test_json_round_trip(self, column_assets):
+        """project()의 딕셔너리 인코딩 JSON을 풀면 행 값과 동일 (임의 위치 순서)"""
+        columns = UdmColumns.from_assets(column_assets)
+        positions = list(range(len(column_assets)))[::-1] + [0, 2]
+
+        self._assert_rows(columns, column_assets, positions)
+
+        projected = columns.project(["event_context.brand", "asset_type"], [2])
+        brand = projected["event_context.brand"]
+        members = list(COLUMN_SPECS["event_context.brand"].members)
+        assert brand["dictionary"][:len(members)] == members
+        assert brand["dictionary"].count("LEGACY_BRAND") == 1
+        assert brand["dictionary"][brand["indices"][0]] == "LEGACY_BRAND"
+        assert projected["asset_type"]["indices"] == [None]
+
+    def test_columns_follow_index_changes(self, column_assets):
+        """변경 반영 / 압축 후에도 열 위치 = 인덱스 위치"""
+        index = UdmIndex({}, column_assets)
+        removed = {a["asset_uuid"] for a in column_assets[3:12]}
+        updated = {**column_assets[1], "file_name": "HCL_2024_EP01_v2.mp4"}
+        inserted = _raw_assets(3, seed=9)
+
+        for changed in (
+            index.with_changes({}, [updated, *inserted], {column_assets[5]["asset_uuid"]}),
+            index.with_changes({}, [updated, *inserted], removed),  # 압축
+        ):
+            live = [p for p in range(len(changed.assets)) if not changed._dead[p]]
+            self._assert_rows(changed.columns, changed.assets, live)
+            positions, _ = changed.page_positions(sort="-file_name", limit=10)
+            self._assert_rows(changed.columns, changed.assets, positions)
+
+        # 이전 인덱스의 열은 그대로
+        self._assert_rows(index.columns, column_assets, list(range(len(column_assets))))
+
+    def test_parse_fields(self):
+        assert parse_fields(None) == list(COLUMN_SPECS)
+        assert parse_fields("file_name, event_context.brand,file_name") == ["file_name", "event_context.brand"]
+        with pytest.raises(ValueError):
+            parse_fields("file_name,duration")
+
+    def test_arrow_round_trip(self, column_assets):
+        """Arrow IPC 스트림 (딕셔너리 열 포함) ↔ 행 값"""
+        pa = pytest.importorskip("pyarrow")
+
+        columns = UdmColumns.from_assets(column_assets)
+        positions = [4, 0, 2, 1]
+        fields = list(COLUMN_SPECS)
+        table = pa.ipc.open_stream(columns.to_arrow_ipc(fields, positions)).read_all()
+
+        assert table.column_names == fields
+        assert pa.types.is_dictionary(table.schema.field("event_context.brand").type)
+        for name in fields:
+            expected = [self._row_value(column_assets[p], name) for p in positions]
+            if COLUMN_SPECS[name].kind == "string":
+                expected = [None if v is None else str(v) for v in expected]
+            assert table.column(name).to_pylist() == expected, name
+
+    def test_arrow_requires_pyarrow(self, column_assets):
+        if pyarrow_available():
+            pytest.skip("pyarrow installed")
+        with pytest.raises(ImportError):
+            UdmColumns.from_assets(column_assets).to_arrow_ipc(["file_name"], [0])
+
+
+class TestNasDeltaListeners:
+    """NAS 증분 변경 리스너: 기준 스캔은 전달하지 않음"""
+
+    @pytest.fixture
+    def nas(self, tmp_path):
+        root = tmp_path / "nas"
+        (root / "WSOP").mkdir(parents=True)
+        (root / "WSOP" / "WSOP_2024_01.mp4").write_bytes(b"a" * 100)
+        (root / "HCL").mkdir()
+        (root / "HCL" / "HCL_2024_EP01.mp4").write_bytes(b"b" * 100)
+        return root
+
+    def _service(self, nas, manifest_path: str | None = None):
+        from app.services.nas_service import NasRealTimeService
+
+        service = NasRealTimeService(nas_path=str(nas), manifest_path=manifest_path)
+        deltas = []
+        service.add_delta_listener(deltas.append)
+        return service, deltas
+
+    def test_baseline_scan_not_notified(self, tmp_path, nas):
+        service, deltas = self._service(nas, str(tmp_path / "manifest.db"))
+
+        service.refresh_scan(force=True, mode="incremental")
+        assert len(service.snapshot.files) == 2
+        assert deltas == []
+
+        (nas / "HCL" / "HCL_2024_EP02.mp4").write_bytes(b"c" * 100)
+        st = (nas / "HCL").stat()
+        os.utime(nas / "HCL", ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000_000))
+        service.refresh_scan(force=True, mode="incremental")
+
+        assert len(deltas) == 1
+        assert [f.filename for f in deltas[0].added] == ["HCL_2024_EP02.mp4"]
+        service.manifest.close()
+
+    def test_snapshot_bootstrap_not_notified(self, tmp_path, nas):
+        """재시작 후 매니페스트에서 복원하는 첫 스캔"""
+        manifest_path = str(tmp_path / "manifest.db")
+        first, _ = self._service(nas, manifest_path)
+        first.refresh_scan(force=True)
+        first.manifest.close()
+
+        (nas / "WSOP" / "WSOP_2024_01.mp4").unlink()
+        service, deltas = self._service(nas, manifest_path)
+        service.refresh_scan(force=True, mode="incremental")
+
+        assert [f.filename for f in service.snapshot.files] == ["HCL_2024_EP01.mp4"]
+        assert deltas == []
+        service.manifest.close()
+
+    def test_in_memory_manifest_after_full_scan(self, nas):
+        """매니페스트 없이 스캔한 뒤 감시용 메모리 매니페스트의 첫 스캔"""
+        from src.extractors.scan_manifest import ScanManifest
+
+        service, deltas = self._service(nas)
+        service.refresh_scan(force=True)
+        service._manifest = ScanManifest(":memory:", root_path=str(nas))
+
+        service._on_watch_change(None)
+
+        assert len(service.snapshot.files) == 2
+        assert deltas == []